@@ -35,7 +35,13 @@
       if (typeof StoryEngine !== 'undefined') {
       } else {
         console.warn('✗ StoryEngine not available');
-      \n      // Initialize Story Generation Control\n      if (typeof StoryGenerationControl !== 'undefined' && typeof StoryGenerationControl.initialize === 'function') {\n        StoryGenerationControl.initialize();\n      } else {\n        console.warn('\u2717 StoryGenerationControl not available');\n      }
+      }
+
+      // Initialize Story Generation Control
+      if (typeof StoryGenerationControl !== 'undefined' && typeof StoryGenerationControl.initialize === 'function') {
+        StoryGenerationControl.initialize();
+      } else {
+        console.warn('✗ StoryGenerationControl not available');
       }
       
       // Generate initial chapter and start the story
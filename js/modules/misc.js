@@ -152,7 +152,9 @@ const generateNewChapter = () => {
       updateStatsBar();
       updateDropdownStats();
       updateBadge();
-      updateAdminProgressInfo();
+      if (typeof StoryGenerationControl !== 'undefined') {
+        StoryGenerationControl.updateAdminProgressInfo();
+      }
 
       safeShowNotification('chapter-notif', '📖 New Chapter', `Ch. ${chapter.number}: ${chapter.title}`);
 
@@ -1109,7 +1111,6 @@ const closeSubModal = () => {
     updateStoryRulesList: updateStoryRulesList,
     removeStoryRule: removeStoryRule,
     getActiveRules: getActiveRules,
-    updateAdminProgressInfo: updateAdminProgressInfo,
     quickResetStory: quickResetStory,
     submitDirective: submitDirective,
     updateDirectiveList: updateDirectiveList,
@@ -1169,7 +1170,6 @@ const closeSubModal = () => {
     window.updateStoryRulesList = updateStoryRulesList;
     window.removeStoryRule = removeStoryRule;
     window.getActiveRules = getActiveRules;
-    window.updateAdminProgressInfo = updateAdminProgressInfo;
     window.quickResetStory = quickResetStory;
     window.submitDirective = submitDirective;
     window.updateDirectiveList = updateDirectiveList;
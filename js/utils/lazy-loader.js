@@ -10,45 +10,21 @@ const LazyLoader = (function() {
     
     // Module definitions
     const modules = {
-        admin: {
-            files: ['js/modules/admin.js', 'js/ui/admin-ui.js'],
-            css: ['css/admin.css']
-        },
         analytics: {
-            files: ['js/modules/analytics.js', 'js/ui/analytics-ui.js'],
+            files: ['js/ui/analytics-ui.js'],
             css: ['css/analytics.css']
         },
-        bookmarks: {
-            files: ['js/modules/bookmarks.js', 'js/ui/bookmarks-ui.js'],
-            css: ['css/bookmarks.css']
-        },
-        search: {
-            files: ['js/modules/search.js', 'js/ui/search-ui.js'],
-            css: ['css/search.css']
-        },
-        'save-load': {
-            files: ['js/modules/save-load.js', 'js/ui/save-load-ui.js'],
-            css: ['css/save-load.css']
-        },
-        'reading-history': {
-            files: ['js/modules/reading-history.js', 'js/ui/reading-history-ui.js'],
-            css: ['css/reading-history.css']
-        },
-        performance: {
-            files: ['js/modules/performance.js', 'js/ui/performance-ui.js'],
-            css: ['css/performance.css']
-        },
         'content-management': {
             files: ['js/modules/content-management.js', 'js/ui/content-management-ui.js'],
             css: ['css/content-management.css']
         },
         'user-features': {
             files: [
-                'js/modules/user-profiles.js',
-                'js/modules/user-preferences.js',
                 'js/modules/achievements.js',
-                'js/modules/social-features.js',
                 'js/modules/messaging.js',
+                'js/modules/social-features.js',
+                'js/modules/user-preferences.js',
+                'js/modules/user-profiles.js',
                 'js/ui/user-features-ui.js'
             ],
             css: ['css/user-features.css']
@@ -56,18 +32,6 @@ const LazyLoader = (function() {
         notifications: {
             files: ['js/modules/notifications.js', 'js/ui/notifications-ui.js'],
             css: ['css/notifications.css']
-        },
-        api: {
-            files: ['js/modules/api.js'],
-            css: []
-        },
-        branching: {
-            files: ['js/modules/branching-narrative.js'],
-            css: []
-        },
-        'dynamic-content': {
-            files: ['js/modules/dynamic-content.js'],
-            css: []
         }
     };
     
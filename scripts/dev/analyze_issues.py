@@ -2,110 +2,57 @@
 """
 Comprehensive issue analysis script for Story-Unending project
 Identifies potential bugs, errors, and code quality issues
+A view over the static_analysis.py findings for js/.
 """
 
-import os
-import re
 import json
-from pathlib import Path
 
-def analyze_file(filepath):
-    """Analyze a single JavaScript file for issues"""
-    issues = []
-    
-    with open(filepath, 'r', encoding='utf-8', errors='ignore') as f:
-        content = f.read()
-        lines = content.split('\n')
-        
-    # Check for nested IIFE patterns (double wrapping)
-    if content.count('(function() {') > 1:
-        issues.append({
-            'type': 'DOUBLE_IIFE',
-            'severity': 'HIGH',
-            'message': 'File has nested IIFE patterns - potential code duplication',
-            'line': 1
-        })
-    
-    # Check for duplicate window exports
-    window_exports = re.findall(r'window\.([A-Z][a-zA-Z]+)\s*=', content)
-    if len(window_exports) > len(set(window_exports)):
-        duplicates = [x for x in window_exports if window_exports.count(x) > 1]
-        issues.append({
-            'type': 'DUPLICATE_EXPORTS',
-            'severity': 'HIGH',
-            'message': f'Duplicate window exports: {set(duplicates)}',
-            'line': 1
-        })
-    
-    # Check for missing error handling in async functions
-    async_functions = re.finditer(r'async\s+function\s+(\w+)', content)
-    for match in async_functions:
-        func_name = match.group(1)
-        func_start = match.start()
-        # Find the function body
-        brace_count = 0
-        in_function = False
-        for i, line in enumerate(lines[content[:func_start].count('\n'):], start=1):
-            if 'async function' in line:
-                in_function = True
-            if in_function:
-                brace_count += line.count('{') - line.count('}')
-                if brace_count == 0 and i > content[:func_start].count('\n') + 1:
-                    # Check if function has try-catch
-                    func_content = '\n'.join(lines[content[:func_start].count('\n'):i])
-                    if 'try' not in func_content and 'catch' not in func_content:
-                        issues.append({
-                            'type': 'MISSING_ERROR_HANDLING',
-                            'severity': 'MEDIUM',
-                            'message': f'Async function {func_name} lacks error handling',
-                            'line': content[:func_start].count('\n') + 1
-                        })
-                    break
-    
-    # Check for console statements
-    console_matches = re.finditer(r'console\.(log|warn|debug|info)\(', content)
-    for match in console_matches:
-        line_num = content[:match.start()].count('\n') + 1
-        issues.append({
-            'type': 'CONSOLE_STATEMENT',
-            'severity': 'LOW',
-            'message': f'Console statement found: console.{match.group(1)}',
-            'line': line_num
-        })
-    
-    # Check for undefined variable references
-    undefined_refs = re.finditer(r'\b(undefined|null)\b', content)
-    for match in undefined_refs:
-        line_num = content[:match.start()].count('\n') + 1
-        # Check if it's a comparison (acceptable)
-        line_content = lines[line_num - 1]
-        if 'if' in line_content and match.group(1) in line_content:
-            continue  # Acceptable comparison
-        issues.append({
-            'type': 'UNDEFINED_REFERENCE',
-            'severity': 'LOW',
-            'message': f'Potential undefined/null reference: {match.group(1)}',
-            'line': line_num
+from static_analysis import analyze, select
+
+# Issue type -> static_analysis rule
+ISSUE_RULES = {
+    'DOUBLE_IIFE': 'double-iife',
+    'DUPLICATE_EXPORTS': 'duplicate-exports',
+    'MISSING_ERROR_HANDLING': 'async-without-try',
+    'CONSOLE_STATEMENT': ('console-log', 'console-warn', 'console-debug', 'console-info'),
+    'UNDEFINED_REFERENCE': 'undefined-reference',
+}
+SEVERITIES = {
+    'DOUBLE_IIFE': 'HIGH',
+    'DUPLICATE_EXPORTS': 'HIGH',
+    'MISSING_ERROR_HANDLING': 'MEDIUM',
+    'CONSOLE_STATEMENT': 'LOW',
+    'UNDEFINED_REFERENCE': 'LOW',
+}
+
+
+def collect_issues(report):
+    """Group the js/ findings by file as {'file', 'issues'} entries"""
+    rule_type = {}
+    for issue_type, rules in ISSUE_RULES.items():
+        for rule in (rules if isinstance(rules, tuple) else (rules,)):
+            rule_type[rule] = issue_type
+    by_file = {}
+    for finding in select(report, rule_type, under=['js']):
+        issue_type = rule_type[finding['rule']]
+        message = finding['message']
+        if issue_type == 'CONSOLE_STATEMENT':
+            message = f'Console statement found: {message}'
+        by_file.setdefault(finding['file'], []).append({
+            'type': issue_type,
+            'severity': SEVERITIES[issue_type],
+            'message': message,
+            'line': finding['line']
         })
-    
-    return issues
+    return [{'file': path, 'issues': issues} for path, issues in by_file.items()]
+
 
 def main():
     """Main analysis function"""
-    js_dir = Path('js')
-    
-    all_issues = []
-    file_count = 0
-    
-    for js_file in js_dir.rglob('*.js'):
-        file_count += 1
-        issues = analyze_file(js_file)
-        if issues:
-            all_issues.append({
-                'file': str(js_file),
-                'issues': issues
-            })
-    
+    findings = analyze()
+    file_count = sum(1 for path in findings['files'] if path.startswith('js/') and path.endswith('.js'))
+    all_issues = collect_issues(findings)
+
     # Generate report
     report = {
         'summary': {
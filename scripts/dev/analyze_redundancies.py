@@ -4,64 +4,28 @@ Analyze JavaScript files for redundancies and optimization opportunities
 """
 import re
 from pathlib import Path
-from collections import defaultdict
 
-def extract_functions(filepath):
-    """Extract function names and signatures from a file"""
-    functions = []
-    try:
-        with open(filepath, 'r', encoding='utf-8') as f:
-            content = f.read()
-        
-        # Match function declarations
-        patterns = [
-            r'function\s+(\w+)\s*\(',
-            r'const\s+(\w+)\s*=\s*(?:async\s+)?function',
-            r'const\s+(\w+)\s*=\s*\([^)]*\)\s*=>',
-            r'(\w+)\s*:\s*function',
-            r'(\w+)\s*:\s*\([^)]*\)\s*=>',
-        ]
-        
-        for pattern in patterns:
-            matches = re.finditer(pattern, content)
-            for match in matches:
-                func_name = match.group(1)
-                # Skip common patterns
-                if func_name not in ['if', 'for', 'while', 'switch', 'catch']:
-                    functions.append(func_name)
-    except Exception as e:
-        print(f"Error reading {filepath}: {e}")
-    
-    return functions
+from function_clones import analyze
 
 def analyze_files():
-    js_dir = Path('/workspace/js')
-    all_functions = defaultdict(list)
+    js_dir = Path('js')
     
     print("=" * 80)
     print("JAVASCRIPT CODE ANALYSIS")
     print("=" * 80)
     
-    # Analyze each file
-    for js_file in js_dir.rglob('*.js'):
-        relative_path = js_file.relative_to(js_dir)
-        functions = extract_functions(js_file)
-        
-        for func in functions:
-            all_functions[func].append(str(relative_path))
-    
-    # Find duplicates
+    # Find duplicated function bodies (not just repeated names)
+    functions, groups = analyze('.')
     print(f"\n📊 Total Files: {len(list(js_dir.rglob('*.js')))}")
-    print(f"📊 Total Functions Found: {len(all_functions)}")
-    
-    duplicates = {k: v for k, v in all_functions.items() if len(v) > 1}
+    print(f"📊 Total Functions Found: {len(functions)}")
     
-    print(f"\n🔍 DUPLICATE FUNCTIONS ({len(duplicates)}):")
-    if duplicates:
-        for func_name, files in sorted(duplicates.items()):
-            print(f"\n  {func_name}:")
-            for f in files:
-                print(f"    - {f}")
+    print(f"\n🔍 DUPLICATE FUNCTIONS ({len(groups)}):")
+    if groups:
+        for group in groups:
+            label = group['kind'] if group['kind'] != 'near' else f"near {group['similarity']:.0%}"
+            print(f"\n  {label} clone ({group['duplicate_bytes']} bytes duplicated):")
+            for key in group['members']:
+                print(f"    - {functions[key].location} {functions[key].name}")
     else:
         print("  No duplicate functions found!")
     
@@ -0,0 +1,318 @@
+#!/usr/bin/env python3
+"""
+Branch graph compiler for js/modules/branching-narrative.js.
+
+Compiles the branches object into an explicit choice graph and reports
+reachability, dead ends and playthrough counts.
+
+The graph follows the runtime rules in checkBranchConditions():
+  - branches are offered in chapter order, each at most once
+  - a locked branch is never offered
+  - once any path has been unlocked, minor branches are only offered when
+    their own id is in unlockedBranches (major branches stay available)
+
+Vertices are (branch, condition state) pairs, where the state only keeps the
+unlock/lock entries that can ever affect a branch. Edges are options and point
+at the next branch the player will be offered, or -1 when no further choice
+can ever be presented. The graph is stored in CSR form (edge_offsets indexes
+edge_option/edge_target) and path counts use memoized DP over vertex order,
+so a full compile and analysis stays in the low milliseconds.
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import sys
+import time
+
+from js_literals import read_literal
+
+BRANCHING_PATH = 'js/modules/branching-narrative.js'
+GRAPH_FORMAT = 1
+
+
+def load_branches(content):
+    """Return branch definitions in the order the runtime offers them"""
+    branches = read_literal(content, 'const branches =')
+    if branches is None:
+        raise ValueError("const branches = {...} not found")
+
+    ordered = []
+    for group in ('major', 'minor'):
+        for key, branch in branches.get(group, {}).items():
+            ordered.append(dict(branch, key=key, group=group))
+    # Stable sort keeps major-before-minor within a chapter, like getAvailableBranches()
+    ordered.sort(key=lambda b: b.get('chapter', 0))
+    return ordered
+
+
+def _is_available(branch, state):
+    """checkBranchConditions() evaluated against a compiled state"""
+    any_unlocked, unlocked, locked = state
+    if branch['key'] in locked:
+        return False
+    if any_unlocked and branch['group'] != 'major' and branch['key'] not in unlocked:
+        return False
+    return True
+
+
+def _apply(state, consequences, relevant):
+    """applyConsequences() restricted to entries that can change availability"""
+    any_unlocked, unlocked, locked = state
+    unlocks = consequences.get('unlocks') or []
+    locks = consequences.get('locks') or []
+    return (
+        any_unlocked or bool(unlocks),
+        unlocked | frozenset(u for u in unlocks if u in relevant),
+        locked | frozenset(l for l in locks if l in relevant),
+    )
+
+
+def compile_branch_graph(content, source=BRANCHING_PATH):
+    """Compile branching-narrative.js source into the CSR choice graph"""
+    branches = load_branches(content)
+    keys = [b['key'] for b in branches]
+    relevant = set(keys)
+    index_of = {key: i for i, key in enumerate(keys)}
+
+    def next_available(position, state):
+        for i in range(position, len(branches)):
+            if _is_available(branches[i], state):
+                return i
+        return -1
+
+    states = {}
+    state_list = []
+    vertices = {}
+    found_branch, found_state, found_edges = [], [], []
+
+    def state_id(state):
+        if state not in states:
+            states[state] = len(state_list)
+            state_list.append(state)
+        return states[state]
+
+    def vertex_id(branch, state):
+        key = (branch, state)
+        if key not in vertices:
+            vertices[key] = len(found_branch)
+            found_branch.append(branch)
+            found_state.append(state_id(state))
+        return vertices[key]
+
+    initial = (False, frozenset(), frozenset())
+    first = next_available(0, initial)
+    if first != -1:
+        vertex_id(first, initial)
+
+    current = 0
+    while current < len(found_branch):
+        branch = found_branch[current]
+        state = state_list[found_state[current]]
+        edges = []
+        for option_index, option in enumerate(branches[branch].get('options', [])):
+            after = _apply(state, option.get('consequences') or {}, relevant)
+            target = next_available(branch + 1, after)
+            edges.append((option_index, -1 if target == -1 else vertex_id(target, after)))
+        found_edges.append(edges)
+        current += 1
+
+    # Every edge leads to a later branch, so numbering vertices by branch
+    # index makes vertex order topological (the start vertex stays 0).
+    order = sorted(range(len(found_branch)), key=lambda v: (found_branch[v], found_state[v]))
+    renumber = {old: new for new, old in enumerate(order)}
+    vertex_branch = [found_branch[v] for v in order]
+    vertex_state = [found_state[v] for v in order]
+    edge_offsets, edge_option, edge_target = [0], [], []
+    for v in order:
+        for option_index, target in found_edges[v]:
+            edge_option.append(option_index)
+            edge_target.append(renumber.get(target, -1))
+        edge_offsets.append(len(edge_option))
+
+    state_table = [
+        [int(any_unlocked), sorted(index_of[k] for k in unlocked), sorted(index_of[k] for k in locked)]
+        for any_unlocked, unlocked, locked in state_list
+    ]
+
+    return {
+        'format': GRAPH_FORMAT,
+        'source': source,
+        'sha256': hashlib.sha256(content.encode('utf-8')).hexdigest(),
+        'branches': [
+            {
+                'id': b['key'],
+                'name': b.get('name', ''),
+                'group': b['group'],
+                'type': b.get('type', b['group']),
+                'category': b.get('category', ''),
+                'chapter': b.get('chapter', 0),
+                'options': [
+                    {
+                        'id': o.get('id', ''),
+                        'text': o.get('text', ''),
+                        'consequences': o.get('consequences') or {},
+                    }
+                    for o in b.get('options', [])
+                ],
+            }
+            for b in branches
+        ],
+        'states': state_table,
+        'vertex_branch': vertex_branch,
+        'vertex_state': vertex_state,
+        'edge_offsets': edge_offsets,
+        'edge_option': edge_option,
+        'edge_target': edge_target,
+    }
+
+
+def count_paths(graph):
+    """
+    Memoized path counts over the topologically ordered vertices.
+
+    Returns (paths from each vertex to an ending, paths from the start into it).
+    """
+    offsets = graph['edge_offsets']
+    targets = graph['edge_target']
+    vertex_count = len(graph['vertex_branch'])
+
+    paths_from = [0] * vertex_count
+    for v in range(vertex_count - 1, -1, -1):
+        paths_from[v] = sum(1 if t == -1 else paths_from[t] for t in targets[offsets[v]:offsets[v + 1]])
+
+    paths_to = [0] * vertex_count
+    if vertex_count:
+        paths_to[0] = 1
+    for v in range(vertex_count):
+        for t in targets[offsets[v]:offsets[v + 1]]:
+            if t != -1:
+                paths_to[t] += paths_to[v]
+    return paths_from, paths_to
+
+
+def analyze_branch_graph(graph):
+    """Reachability, dead ends, dangling references and path counts"""
+    branches = graph['branches']
+    offsets = graph['edge_offsets']
+    paths_from, paths_to = count_paths(graph)
+
+    reachable = set(graph['vertex_branch'])
+    through = [0] * len(branches)
+    for v, b in enumerate(graph['vertex_branch']):
+        through[b] += paths_to[v] * paths_from[v]
+
+    dead_ends = []
+    for v, b in enumerate(graph['vertex_branch']):
+        blocked = len(branches) - b - 1
+        if not blocked:
+            continue
+        for e in range(offsets[v], offsets[v + 1]):
+            if graph['edge_target'][e] == -1:
+                option = branches[b]['options'][graph['edge_option'][e]]
+                dead_ends.append({
+                    'branch': branches[b]['id'],
+                    'option': option['id'],
+                    'blocked_branches': blocked,
+                })
+    dead_ends = list({(d['branch'], d['option']): d for d in dead_ends}.values())
+
+    ids = {b['id'] for b in branches}
+    dangling = set()
+    for b in branches:
+        for option in b['options']:
+            for key in ('unlocks', 'locks'):
+                dangling.update(t for t in option['consequences'].get(key) or [] if t not in ids)
+
+    unreachable = []
+    for i, b in enumerate(branches):
+        if i in reachable:
+            continue
+        reason = 'locked on every path'
+        if b['group'] != 'major':
+            reason = 'minor branch never unlocked by id'
+        unreachable.append({'branch': b['id'], 'chapter': b['chapter'], 'group': b['group'], 'reason': reason})
+
+    return {
+        'branches': len(branches),
+        'options': sum(len(b['options']) for b in branches),
+        'vertices': len(graph['vertex_branch']),
+        'edges': len(graph['edge_option']),
+        'total_paths': paths_from[0] if paths_from else 0,
+        'paths_through': {branches[i]['id']: through[i] for i in range(len(branches)) if through[i]},
+        'unreachable': unreachable,
+        'dead_ends': dead_ends,
+        'dangling_targets': sorted(dangling),
+    }
+
+
+def load_or_compile(path=BRANCHING_PATH, graph_path=None):
+    """Reuse graph_path when it was compiled from the same source bytes"""
+    with open(path, 'r', encoding='utf-8') as f:
+        content = f.read()
+    digest = hashlib.sha256(content.encode('utf-8')).hexdigest()
+
+    if graph_path and os.path.exists(graph_path):
+        try:
+            with open(graph_path, 'r') as f:
+                cached = json.load(f)
+            if cached.get('format') == GRAPH_FORMAT and cached.get('sha256') == digest:
+                return cached, True
+        except (OSError, ValueError):
+            pass
+
+    graph = compile_branch_graph(content, path)
+    if graph_path:
+        with open(graph_path, 'w') as f:
+            json.dump(graph, f, separators=(',', ':'))
+    return graph, False
+
+
+def main():
+    """Main function"""
+    parser = argparse.ArgumentParser(description='Compile and analyze the branching narrative graph')
+    parser.add_argument('--file', default=BRANCHING_PATH, help='Path to branching-narrative.js')
+    parser.add_argument('--graph', help='Compiled graph file (reused while the source is unchanged)')
+    parser.add_argument('--json', help='Write the analysis report to this JSON file')
+    parser.add_argument('--strict', action='store_true',
+                        help='Exit non-zero when branches are unreachable or dead ends exist')
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    graph, cached = load_or_compile(args.file, args.graph)
+    report = analyze_branch_graph(graph)
+    elapsed = (time.perf_counter() - started) * 1000
+
+    print("=" * 60)
+    print("Branching Narrative Graph")
+    print("=" * 60)
+    print(f"  - Branches: {report['branches']} ({report['options']} options)")
+    print(f"  - Graph: {report['vertices']} vertices, {report['edges']} edges")
+    print(f"  - Distinct playthroughs: {report['total_paths']:,}")
+    print(f"  - {'Loaded cached graph' if cached else 'Compiled'} in {elapsed:.1f} ms")
+
+    if report['unreachable']:
+        print(f"\n⚠️  Unreachable branches: {len(report['unreachable'])}")
+        for item in report['unreachable']:
+            print(f"    {item['branch']} (chapter {item['chapter']}, {item['group']}): {item['reason']}")
+    if report['dead_ends']:
+        print(f"\n⚠️  Dead-end options: {len(report['dead_ends'])}")
+        for item in report['dead_ends']:
+            print(f"    {item['branch']}/{item['option']} ends choices with "
+                  f"{item['blocked_branches']} later branches left")
+    if report['dangling_targets']:
+        print(f"\nℹ️  Unlock/lock targets that name no branch: {len(report['dangling_targets'])}")
+
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump(report, f, indent=2)
+        print(f"\nReport written to {args.json}")
+
+    if args.strict and (report['unreachable'] or report['dead_ends']):
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
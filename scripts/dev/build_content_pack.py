@@ -0,0 +1,450 @@
+#!/usr/bin/env python3
+"""
+Content pack builder for story-engine.js.
+
+story-engine.js stays the authoring source (the expand_*.py scripts and
+import_content.py keep appending to its literals). This build step moves the
+content pools out of the engine's code into a data script:
+
+  story-content-pack.js     one string table plus an index of
+                            [start, end, kind] offsets per pool
+  story-engine.packed.js    story-engine.js with every packed pool replaced
+                            by a StoryContentPack lookup
+
+The table stores pools back to back - paragraph pools as entries separated by
+U+001E, structured pools as JSON - so it is a single string literal for the
+parser and compresses well with gzip/brotli. Nothing is decoded until a
+generator first asks for a pool; decoded pools are cached. Paragraph pools
+that interpolate ${char.name}-style property paths are filled from a scope
+object on every call, exactly like the template literals they replace.
+
+Pools stay inline when they are not const, are mutated or shadowed, or use
+template expressions other than plain property paths.
+
+The first chapter is generated on DOMContentLoaded, so index.html still loads
+the pack at startup: pack plus packed engine is slightly more bytes than the
+source engine. The saving is parse and decode work - the parser sees one
+string literal instead of thousands of array and object literals, and only
+the pools a chapter uses are ever decoded.
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import re
+import sys
+
+from content_pools import find_functions, find_pools
+from import_content import write_atomic
+from js_literals import find_matching, skip_comment, skip_string
+from module_graph import transfer_sizes
+
+ENGINE_PATH = 'story-engine.js'
+PACK_PATH = 'story-content-pack.js'
+PACKED_ENGINE_PATH = 'story-engine.packed.js'
+
+KIND_STRINGS = 0
+KIND_JSON = 1
+KIND_TEMPLATES = 2
+SEPARATOR = '\u001e'
+
+_IDENT = re.compile(r'[A-Za-z_$][\w$]*')
+_EXPRESSION = re.compile(r'\$\{([^}]*)\}')
+_MEMBER_PATH = re.compile(r'^\s*([A-Za-z_$][\w$]*)(?:\s*\.\s*[A-Za-z_$][\w$]*)*\s*$')
+_CONST_BEFORE = re.compile(r'\bconst\s+$')
+_MUTATING_METHODS = 'push|pop|shift|unshift|splice|sort|reverse|fill|copyWithin'
+
+PACK_RUNTIME = '''/**
+ * Story Content Pack
+ * Generated by scripts/dev/build_content_pack.py from %(source)s - do not edit.
+ * Pools are sliced out of TABLE and decoded on first use.
+ */
+const StoryContentPack = (function() {
+  'use strict';
+
+  const SOURCE_SHA256 = %(sha256)s;
+  const SEPARATOR = '\\u001e';
+  const KIND_STRINGS = %(kind_strings)d;
+  const KIND_JSON = %(kind_json)d;
+  const INDEX = %(index)s;
+  const TABLE = %(table)s;
+
+  const cache = Object.create(null);
+
+  function decode(name) {
+    const entry = INDEX[name];
+    if (!entry) {
+      throw new Error('Unknown content pool: ' + name);
+    }
+    const text = TABLE.slice(entry[0], entry[1]);
+    if (entry[2] === KIND_JSON) {
+      return JSON.parse(text);
+    }
+    const items = text.split(SEPARATOR);
+    if (entry[2] === KIND_STRINGS) {
+      return items;
+    }
+    // Templates: alternating literal text and dotted property paths
+    return items.map(item => item.split(/\\$\\{\\s*([^}]*?)\\s*\\}/).map(
+      (part, i) => (i %% 2 ? part.split(/\\s*\\.\\s*/) : part)
+    ));
+  }
+
+  function load(name) {
+    if (!(name in cache)) {
+      cache[name] = decode(name);
+    }
+    return cache[name];
+  }
+
+  function resolve(scope, path) {
+    let value = scope[path[0]];
+    for (let i = 1; i < path.length; i++) {
+      value = value[path[i]];
+    }
+    return value;
+  }
+
+  return {
+    // Shared pool value (arrays of strings or structured data)
+    pool: load,
+
+    // Template pool rendered against the caller's variables
+    fill: (name, scope) => load(name).map(parts => {
+      let out = '';
+      for (let i = 0; i < parts.length; i++) {
+        out += i %% 2 ? String(resolve(scope, parts[i])) : parts[i];
+      }
+      return out;
+    }),
+
+    names: () => Object.keys(INDEX),
+    loaded: () => Object.keys(cache),
+    sourceHash: () => SOURCE_SHA256
+  };
+})();
+
+// Export for both browser and Node.js
+if (typeof module !== 'undefined' && module.exports) {
+  module.exports = StoryContentPack;
+} else {
+  window.StoryContentPack = StoryContentPack;
+}
+'''
+
+PACKED_ENGINE_HEADER = '''/**
+ * Generated by scripts/dev/build_content_pack.py from %(source)s - do not edit.
+ * Content pools live in %(pack)s, which must be loaded first.
+ */
+'''
+
+PACKED_ENGINE_NODE_IMPORT = '''if (typeof StoryContentPack === 'undefined' && typeof require !== 'undefined') {
+  global.StoryContentPack = require('./%(pack_module)s');
+}
+'''
+
+
+def iter_identifiers(text, start=0, end=None):
+    """Yield (offset, name) for identifiers in code, including ${...} in templates"""
+    end = len(text) if end is None else end
+    i = start
+    while i < end:
+        ch = text[i]
+        if ch in '"\'':
+            i = skip_string(text, i)
+        elif ch == '`':
+            i += 1
+            while text[i] != '`':
+                if text[i] == '\\':
+                    i += 2
+                elif text.startswith('${', i):
+                    close = find_matching(text, i + 1)
+                    yield from iter_identifiers(text, i + 2, close)
+                    i = close + 1
+                else:
+                    i += 1
+            i += 1
+        elif ch == '/' and skip_comment(text, i) != i:
+            i = skip_comment(text, i)
+        elif ch.isalpha() or ch in '_$':
+            match = _IDENT.match(text, i)
+            if i == 0 or not (text[i - 1].isalnum() or text[i - 1] in '_$'):
+                yield i, match.group(0)
+            i = match.end()
+        elif ch.isdigit():
+            while i < end and (text[i].isalnum() or text[i] in '._'):
+                i += 1
+        else:
+            i += 1
+
+
+def _is_reference(text, offset, name):
+    """True when the identifier at offset is a variable read, not a property"""
+    before = offset - 1
+    while before >= 0 and text[before].isspace():
+        before -= 1
+    if before >= 0 and text[before] == '.' and not text.startswith('...', before - 2):
+        return False
+    after = offset + len(name)
+    while after < len(text) and text[after].isspace():
+        after += 1
+    # Object keys ({ name: ... }) are not references; ternaries (a ? name : b) are
+    if after < len(text) and text[after] == ':' and before >= 0 and text[before] in '{,':
+        return False
+    return True
+
+
+def _statement_span(content, pool):
+    """(start, end) of the `const name = literal;` statement declaring a top-level pool"""
+    keyword = content.rfind('\n', 0, pool.start) + 1
+    end = pool.end + 1
+    if content.startswith(';', end):
+        end += 1
+    if content.startswith('\n', end):
+        end += 1
+    return keyword, end
+
+
+def _is_mutated(content, name, declaration, scope_start, scope_end):
+    """Look for assignments or mutating calls on name inside its scope"""
+    pattern = re.compile(
+        r'(?<![\w$.])' + re.escape(name) +
+        r'(?:\s*(?:\.\s*[\w$]+|\[[^\]\n]*\]))*\s*'
+        r'(?:(?:[-+*/%]|\*\*|<<|>>|&|\||\^)?=(?!=)|\+\+|--|\.\s*(?:' + _MUTATING_METHODS + r')\s*\()'
+    )
+    for match in pattern.finditer(content, scope_start, scope_end):
+        if match.start() == declaration:
+            continue
+        return True
+    return False
+
+
+def plan_pack(content):
+    """Decide which pools to pack; returns (packed, skipped) lists of dicts"""
+    functions = find_functions(content)
+    by_name = {f[0]: f for f in functions}
+    pools = find_pools(content, ENGINE_PATH)
+    top_level = [p for p in pools if not any(o.start < p.start and p.end < o.end for o in pools)]
+
+    local_names = set()
+    for name, params, start, end in functions:
+        local_names.update(params)
+        local_names.update(m.group(1) for m in re.finditer(r'\b(?:const|let|var)\s+([A-Za-z_$][\w$]*)',
+                                                               content[start:end]))
+
+    packed, skipped = [], []
+    for pool in top_level:
+        variable = pool.name.split('.')[-1].split('#')[0]
+        declaration = content.rfind(variable, 0, pool.start)
+        if pool.function:
+            function = by_name[pool.function]
+            scope_start, scope_end = function[2], function[3]
+        else:
+            scope_start, scope_end = 0, len(content)
+
+        raw = content[pool.start:pool.end + 1]
+        strings = [s for s in _flatten(pool.value) if isinstance(s, str)]
+        expressions = [e for s in strings for e in _EXPRESSION.findall(s)]
+        reason = None
+        if not _CONST_BEFORE.search(content, max(0, declaration - 16), declaration):
+            reason = 'declared with let/var (runtime state)'
+        elif _is_mutated(content, variable, declaration, scope_start, scope_end):
+            reason = 'mutated at runtime'
+        elif pool.function is None and variable in local_names:
+            reason = 'shadowed inside a function'
+        elif '\\${' in raw or any(SEPARATOR in s for s in strings):
+            reason = 'contains escaped ${ or the separator character'
+        elif expressions and (pool.function is None or not pool.is_strings):
+            reason = 'template expressions outside a paragraph pool'
+        elif any(not _MEMBER_PATH.match(e) for e in expressions):
+            reason = 'template expressions are not simple property paths'
+
+        if reason:
+            skipped.append({'name': pool.name, 'reason': reason})
+            continue
+
+        if expressions:
+            kind = KIND_TEMPLATES
+        elif pool.is_strings:
+            kind = KIND_STRINGS
+        else:
+            kind = KIND_JSON
+        roots = []
+        for expression in expressions:
+            root = _MEMBER_PATH.match(expression).group(1)
+            if root not in roots:
+                roots.append(root)
+        packed.append({'pool': pool, 'variable': variable, 'kind': kind, 'roots': roots})
+    return packed, skipped
+
+
+def _flatten(value):
+    if isinstance(value, dict):
+        for item in value.values():
+            yield from _flatten(item)
+    elif isinstance(value, list):
+        for item in value:
+            yield from _flatten(item)
+    else:
+        yield value
+
+
+def _utf16_length(text):
+    return len(text.encode('utf-16-le')) // 2
+
+
+def build_pack(content, source=ENGINE_PATH, pack_path=PACK_PATH):
+    """Return (pack_js, packed_engine_js, report) for story-engine.js content"""
+    packed, skipped = plan_pack(content)
+    shared = {p['variable'] for p in packed if p['pool'].function is None}
+
+    def lookup(name):
+        return f'StoryContentPack.pool({json.dumps(name)})'
+
+    index = {}
+    chunks = []
+    offset = 0
+    for item in packed:
+        pool = item['pool']
+        if item['kind'] == KIND_JSON:
+            chunk = json.dumps(pool.value, ensure_ascii=False, separators=(',', ':'))
+        else:
+            chunk = SEPARATOR.join(pool.value)
+        length = _utf16_length(chunk)
+        index[pool.name] = [offset, offset + length, item['kind']]
+        chunks.append(chunk)
+        offset += length
+    table = ''.join(chunks)
+
+    edits = []
+    removed = []
+    for item in packed:
+        pool = item['pool']
+        if pool.function is None:
+            start, end = _statement_span(content, pool)
+            edits.append((start, end, ''))
+            removed.append((start, end))
+            continue
+        if item['kind'] == KIND_TEMPLATES:
+            scope = ', '.join(f'{root}: {lookup(root)}' if root in shared else root for root in item['roots'])
+            replacement = f'StoryContentPack.fill({json.dumps(pool.name)}, {{ {scope} }})'
+        else:
+            replacement = lookup(pool.name)
+        edits.append((pool.start, pool.end + 1, replacement))
+        removed.append((pool.start, pool.end + 1))
+
+    removed.sort()
+    references = 0
+    for offset, name in iter_identifiers(content):
+        if name not in shared or not _is_reference(content, offset, name):
+            continue
+        if any(start <= offset < end for start, end in removed):
+            continue
+        edits.append((offset, offset + len(name), lookup(name)))
+        references += 1
+
+    parts = []
+    cursor = 0
+    for start, end, replacement in sorted(edits):
+        parts.append(content[cursor:start])
+        parts.append(replacement)
+        cursor = end
+    parts.append(content[cursor:])
+
+    digest = hashlib.sha256(content.encode('utf-8')).hexdigest()
+    pack_module = os.path.splitext(os.path.basename(pack_path))[0]
+    engine = (PACKED_ENGINE_HEADER % {'source': source, 'pack': os.path.basename(pack_path)}
+              + PACKED_ENGINE_NODE_IMPORT % {'pack_module': pack_module}
+              + ''.join(parts))
+
+    index_js = '{\n' + ',\n'.join(f'    {json.dumps(name)}: {json.dumps(entry)}'
+                                   for name, entry in index.items()) + '\n  }'
+    pack = PACK_RUNTIME % {
+        'source': source,
+        'sha256': json.dumps(digest),
+        'kind_strings': KIND_STRINGS,
+        'kind_json': KIND_JSON,
+        'index': index_js,
+        'table': json.dumps(table, ensure_ascii=False),
+    }
+
+    report = {
+        'source_sha256': digest,
+        'packed': [{'name': p['pool'].name, 'kind': p['kind'],
+                    'entries': len(p['pool'].value)} for p in packed],
+        'skipped': skipped,
+        'references_rewritten': references,
+        'sizes': {
+            'source': transfer_sizes(content.encode('utf-8')),
+            'packed_engine': transfer_sizes(engine.encode('utf-8')),
+            'pack': transfer_sizes(pack.encode('utf-8')),
+        },
+    }
+    # What index.html downloads at startup: both scripts load before the first chapter
+    sizes = report['sizes']
+    sizes['startup'] = {key: sizes['packed_engine'][key] + sizes['pack'][key] for key in sizes['pack']}
+    return pack, engine, report
+
+
+def is_up_to_date(content, pack_path=PACK_PATH):
+    """True when pack_path was built from exactly this engine source"""
+    if not os.path.exists(pack_path):
+        return False
+    with open(pack_path, 'r', encoding='utf-8') as f:
+        head = f.read(2048)
+    digest = hashlib.sha256(content.encode('utf-8')).hexdigest()
+    return f'SOURCE_SHA256 = "{digest}"' in head
+
+
+def main():
+    """Main function"""
+    parser = argparse.ArgumentParser(description='Build the lazily decoded story content pack')
+    parser.add_argument('--source', default=ENGINE_PATH, help='Engine source to pack')
+    parser.add_argument('--pack', default=PACK_PATH, help='Output path for the content pack')
+    parser.add_argument('--engine', default=PACKED_ENGINE_PATH, help='Output path for the packed engine')
+    parser.add_argument('--check', action='store_true',
+                        help='Only verify the pack matches the source; exit 1 when stale')
+    parser.add_argument('--json', help='Write the build report to this JSON file')
+    args = parser.parse_args()
+
+    with open(args.source, 'r', encoding='utf-8') as f:
+        content = f.read()
+
+    if args.check:
+        if is_up_to_date(content, args.pack):
+            print(f"✅ {args.pack} is up to date with {args.source}")
+            return 0
+        print(f"❌ {args.pack} is stale - run scripts/dev/build_content_pack.py")
+        return 1
+
+    pack, engine, report = build_pack(content, args.source, args.pack)
+    write_atomic(args.pack, pack)
+    write_atomic(args.engine, engine)
+
+    sizes = report['sizes']
+    print("=" * 60)
+    print("Story Content Pack")
+    print("=" * 60)
+    print(f"  - Pools packed: {len(report['packed'])}")
+    print(f"  - Pools left inline: {len(report['skipped'])}")
+    for item in report['skipped']:
+        print(f"      {item['name']}: {item['reason']}")
+    print(f"  - Shared pool references rewritten: {report['references_rewritten']}")
+    for label, key in (('Source engine', 'source'), ('Packed engine', 'packed_engine'), ('Content pack', 'pack'),
+                       ('Startup (pack + packed engine)', 'startup')):
+        line = f"  - {label}: {sizes[key]['raw']:,} bytes, {sizes[key]['gzip']:,} gzip"
+        if 'brotli' in sizes[key]:
+            line += f", {sizes[key]['brotli']:,} brotli"
+        print(line)
+    print(f"  ✅ Wrote {args.pack} and {args.engine}")
+
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump(report, f, indent=2)
+        print(f"\nReport written to {args.json}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -1,31 +1,25 @@
 #!/usr/bin/env python3
 """
 Script to clean up global namespace by wrapping JavaScript files in IIFE
-and creating namespace objects. Improved version that handles indented functions.
+and creating namespace objects. Only top-level declarations are exported,
+whatever their indentation; nested ones stay private to their scope.
 """
 
 import os
-import re
 from pathlib import Path
 
+from scope_index import ScopeIndex
+
 def extract_declarations(content):
     """
-    Extract all function, const, and let declarations from content.
-    Handles both top-level and indented declarations.
+    Extract all top-level function, const, and let declarations from content.
+    Indentation does not matter; declarations inside functions, blocks,
+    strings and comments are not exported.
     """
+    index = ScopeIndex(content)
     declarations = []
-    
-    # Extract function declarations (with or without leading whitespace)
-    functions = re.findall(r'^\s*function\s+(\w+)\s*\(', content, re.MULTILINE)
-    declarations.extend(functions)
-    
-    # Extract const declarations
-    consts = re.findall(r'^\s*const\s+(\w+)\s*=', content, re.MULTILINE)
-    declarations.extend(consts)
-    
-    # Extract let declarations
-    lets = re.findall(r'^\s*let\s+(\w+)\s*=', content, re.MULTILINE)
-    declarations.extend(lets)
+    for kind in ('function', 'const', 'let'):
+        declarations.extend(index.top_level((kind,)))
     
     # Remove duplicates while preserving order
     seen = set()
@@ -2,44 +2,36 @@
 """
 Comprehensive issue analysis script.
 Identifies and categorizes all issues, separating real issues from false positives.
+A view over the static_analysis.py findings.
 """
 import re
 from pathlib import Path
 
-# Issue categories
+from static_analysis import analyze, select
+
+# Issue categories, as static_analysis rules
 issue_categories = {
     'CRITICAL': {
-        'patterns': [
-            r'eval\(',
-            r'document\.write\(',
-            r'innerHTML.*\+',
-        ],
+        'rules': ['eval', 'document-write', 'innerhtml-concat'],
         'description': 'Critical security or performance issues'
     },
     'HIGH': {
-        'patterns': [
-            r'prompt\(',
-            r'alert\(',
-        ],
+        'rules': ['prompt', 'alert'],
         'description': 'High priority - affects UX or security'
     },
     'MEDIUM': {
-        'patterns': [
-            r'console\.log\(',
-            r'console\.debug\(',
-            r'console\.warn\(',
-        ],
+        'rules': ['console-log', 'console-debug', 'console-warn'],
         'description': 'Medium priority - debugging code'
     },
     'LOW': {
-        'patterns': [
-            r'confirm\(',
-            r'console\.error\(',
-        ],
+        'rules': ['confirm', 'console-error'],
         'description': 'Low priority - acceptable in certain contexts'
     },
 }
 
+# Files and directories to scan
+scan_paths = ['js', 'css', 'index.html', 'story-engine.js', 'backstory-engine.js', 'styles.css']
+
 # Files to exclude
 exclude_files = [
     'tests/',
@@ -75,47 +67,23 @@ def is_acceptable_pattern(line):
             return True
     return False
 
-def analyze_file(filepath):
-    """Analyze a single file for issues."""
+def collect_issues(report):
+    """One issue per file, line and category from the findings file"""
+    rule_category = {r: c for c, info in issue_categories.items() for r in info['rules']}
     issues = []
-    
-    try:
-        with open(filepath, 'r', encoding='utf-8') as f:
-            content = f.read()
-            lines = content.split('\n')
-            
-        for i, line in enumerate(lines, 1):
-            line_stripped = line.strip()
-            
-            # Skip empty lines
-            if not line_stripped:
-                continue
-                
-            # Check if it's an acceptable pattern
-            if is_acceptable_pattern(line):
-                continue
-                
-            # Check each category
-            for category, info in issue_categories.items():
-                for pattern in info['patterns']:
-                    if re.search(pattern, line):
-                        # Extract context
-                        context = line.strip()
-                        if len(context) > 150:
-                            context = context[:150] + '...'
-                        
-                        issues.append({
-                            'file': str(filepath.relative_to('/workspace')),
-                            'line': i,
-                            'category': category,
-                            'pattern': pattern,
-                            'context': context
-                        })
-                        break  # Only record once per line per category
-                    
-    except Exception as e:
-        print(f"Error analyzing {filepath}: {e}")
-        
+    seen = set()
+    for finding in select(report, rule_category, under=scan_paths, exclude=exclude_files):
+        category = rule_category[finding['rule']]
+        if is_acceptable_pattern(finding['text']) or (finding['file'], finding['line'], category) in seen:
+            continue
+        seen.add((finding['file'], finding['line'], category))
+        issues.append({
+            'file': finding['file'],
+            'line': finding['line'],
+            'category': category,
+            'pattern': finding['rule'],
+            'context': finding['text']
+        })
     return issues
 
 def main():
@@ -123,33 +91,14 @@ def main():
     print("Comprehensive Issue Analysis\n")
     print("="*80)
     
-    # Scan all JS files
-    js_files = list(Path('/workspace/js').glob('**/*.js'))
-    css_files = list(Path('/workspace/css').glob('**/*.css'))
-    
-    # Also check main files
-    main_files = [
-        Path('/workspace/index.html'),
-        Path('/workspace/story-engine.js'),
-        Path('/workspace/backstory-engine.js'),
-        Path('/workspace/styles.css'),
-    ]
-    
-    all_files = js_files + css_files + main_files
-    
-    # Filter out excluded files
-    filtered_files = [f for f in all_files if not should_exclude_file(f)]
-    
+    report = analyze()
+    filtered_files = [f for f in report['files']
+                      if any(f == p or f.startswith(p + '/') for p in scan_paths) and not should_exclude_file(f)]
+
     print(f"Scanning {len(filtered_files)} files...\n")
-    
-    all_issues = []
-    
-    for filepath in filtered_files:
-        if filepath.exists():
-            issues = analyze_file(filepath)
-            if issues:
-                all_issues.extend(issues)
-    
+
+    all_issues = collect_issues(report)
+
     # Group issues by category
     issues_by_category = {}
     for issue in all_issues:
@@ -207,7 +156,7 @@ def main():
             report_lines.append("")
     
     # Write report
-    report_path = Path('/workspace/COMPREHENSIVE_ISSUE_ANALYSIS.md')
+    report_path = Path('COMPREHENSIVE_ISSUE_ANALYSIS.md')
     with open(report_path, 'w', encoding='utf-8') as f:
         f.write('\n'.join(report_lines))
     
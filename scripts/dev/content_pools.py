@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+"""
+Catalogue of the content pools inlined in the story engines.
+
+A pool is any `const name = [...]` / `const name = {...}` declaration whose
+value is plain data. Pools declared inside a generator function are named
+`function.variable` (for example generateSocialParagraphs.middles); arrays
+nested in an object pool are exposed as `object.key` (sensoryDetails.sight).
+"""
+
+import re
+import sys
+
+from js_literals import find_matching, parse_literal, skip_space
+
+ENGINE_FILES = ['story-engine.js', 'backstory-engine.js']
+
+_FUNCTION = re.compile(r'\bfunction\s+([A-Za-z_$][\w$]*)\s*\(([^)]*)\)\s*\{')
+_DECLARATION = re.compile(r'\b(?:const|let|var)\s+([A-Za-z_$][\w$]*)\s*=\s*([\[{])')
+_DECLARED_NAME = re.compile(r'\b(?:const|let|var)\s+([A-Za-z_$][\w$]*)')
+_PARAM_NAME = re.compile(r'[A-Za-z_$][\w$]*')
+
+
+class Pool:
+    """One content array (or object of arrays) and where it sits in its file"""
+
+    def __init__(self, name, path, function, start, end, value):
+        self.name = name
+        self.path = path
+        self.function = function
+        self.start = start          # offset of the opening bracket
+        self.end = end              # offset of the closing bracket
+        self.value = value
+
+    @property
+    def is_strings(self):
+        return isinstance(self.value, list) and all(isinstance(v, str) for v in self.value)
+
+    def __repr__(self):
+        return f"Pool({self.name!r}, {self.path!r}, entries={len(self.value)})"
+
+
+def find_functions(content):
+    """Return (name, params, body_start, body_end) for every named function"""
+    functions = []
+    for match in _FUNCTION.finditer(content):
+        open_brace = match.end() - 1
+        try:
+            close = find_matching(content, open_brace)
+        except ValueError:
+            continue
+        params = [p for p in _PARAM_NAME.findall(match.group(2))]
+        functions.append((match.group(1), params, open_brace, close))
+    return functions
+
+
+def enclosing_function(functions, offset):
+    """Innermost function whose body contains offset, or None"""
+    best = None
+    for function in functions:
+        if function[2] < offset < function[3]:
+            if best is None or function[2] > best[2]:
+                best = function
+    return best
+
+
+def scope_names(content, functions, function_name):
+    """Names a template literal inside function_name can reference"""
+    names = set()
+    # IIFE-level declarations (mcState, randomFrom, ...) are visible everywhere
+    for match in _DECLARED_NAME.finditer(content):
+        if enclosing_function(functions, match.start()) is None:
+            names.add(match.group(1))
+    names.update(f[0] for f in functions)
+    for name, params, start, end in functions:
+        if name == function_name:
+            names.update(params)
+            names.update(_DECLARED_NAME.findall(content, start, end))
+    return names
+
+
+def find_pools(content, path):
+    """Every plain-data declaration in content, in source order"""
+    functions = find_functions(content)
+    pools = []
+    seen = {}
+    for match in _DECLARATION.finditer(content):
+        start = match.end() - 1
+        try:
+            value, end = parse_literal(content, start)
+        except ValueError:
+            continue
+        if not value:
+            continue
+        function = enclosing_function(functions, start)
+        base = match.group(1) if function is None else f'{function[0]}.{match.group(1)}'
+        seen[base] = seen.get(base, 0) + 1
+        name = base if seen[base] == 1 else f'{base}#{seen[base]}'
+        pool = Pool(name, path, function[0] if function else None, start, end - 1, value)
+        pools.append(pool)
+
+        if isinstance(value, dict):
+            cursor = skip_space(content, start + 1)
+            for key, item in value.items():
+                if not (isinstance(item, list) and item and all(isinstance(v, str) for v in item)):
+                    continue
+                key_at = content.find(key, cursor, pool.end)
+                open_at = content.find('[', key_at, pool.end)
+                if key_at == -1 or open_at == -1:
+                    continue
+                close_at = find_matching(content, open_at)
+                pools.append(Pool(f'{name}.{key}', path, pool.function, open_at, close_at, item))
+                cursor = close_at
+    return pools
+
+
+def load_pools(paths=None):
+    """Map pool name -> Pool across the engine files (first file wins on clashes)"""
+    pools = {}
+    for path in paths or ENGINE_FILES:
+        with open(path, 'r', encoding='utf-8') as f:
+            content = f.read()
+        for pool in find_pools(content, path):
+            pools.setdefault(pool.name, pool)
+    return pools
+
+
+def main():
+    """List the pools found in the engine files"""
+    paths = sys.argv[1:] or ENGINE_FILES
+    for name, pool in load_pools(paths).items():
+        kind = 'strings' if pool.is_strings else type(pool.value).__name__
+        print(f"  {pool.path}:{name:55s} {len(pool.value):5d} {kind}")
+
+
+if __name__ == '__main__':
+    main()
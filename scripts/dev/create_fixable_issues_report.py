@@ -1,22 +1,22 @@
 #!/usr/bin/env python3
 """
 Script to create a report of fixable issues (excluding tests and acceptable patterns).
+A view over the static_analysis.py findings.
 """
-import re
+from collections import Counter
 from pathlib import Path
 
-# Patterns for fixable issues
-fixable_patterns = {
-    'eval(': r'eval\(',
-    'document.write': r'document\.write\(',
-    'prompt(': r'prompt\(',
+from static_analysis import analyze, select
+
+# Fixable issue type -> static_analysis rule
+fixable_rules = {
+    'eval(': 'eval',
+    'document.write': 'document-write',
+    'prompt(': 'prompt',
 }
 
-# Files to scan (exclude tests)
-code_dirs = [
-    '/workspace/js',
-    '/workspace/css',
-]
+# Files and directories to scan (exclude tests)
+scan_paths = ['js', 'css', 'index.html', 'story-engine.js', 'backstory-engine.js', 'styles.css']
 
 # Files to exclude
 exclude_files = [
@@ -25,100 +25,35 @@ exclude_files = [
     'security.test.js',  # Security tests with alert examples
 ]
 
-def should_exclude_file(filepath):
-    """Check if file should be excluded."""
-    filepath_str = str(filepath)
-    for exclude in exclude_files:
-        if exclude in filepath_str:
-            return True
-    return False
 
-def scan_file_for_issues(filepath):
-    """Scan a single file for fixable issues."""
+def collect_issues(report):
+    """One issue per line from the findings file"""
+    rule_type = {rule: name for name, rule in fixable_rules.items()}
     issues = []
-    
-    try:
-        with open(filepath, 'r', encoding='utf-8') as f:
-            content = f.read()
-            lines = content.split('\n')
-            
-        for i, line in enumerate(lines, 1):
-            line_stripped = line.strip()
-            
-            # Skip empty lines and comments
-            if not line_stripped:
-                continue
-            # Skip single-line comments
-            if line_stripped.startswith('//'):
-                continue
-            # Skip JSDoc comments (lines starting with *)
-            if line_stripped.startswith('*'):
-                continue
-            # Skip multi-line comment blocks
-            if line_stripped.startswith('/*') or line_stripped.startswith('*/'):
-                continue
-                
-            # Check for fixable issue patterns
-            for issue_type, pattern in fixable_patterns.items():
-                if re.search(pattern, line):
-                    # Extract context
-                    context = line.strip()
-                    if len(context) > 150:
-                        context = context[:150] + '...'
-                    
-                    issues.append({
-                        'file': str(filepath.relative_to('/workspace')),
-                        'line': i,
-                        'type': issue_type,
-                        'context': context
-                    })
-                    break  # Only record once per line
-                    
-    except Exception as e:
-        print(f"Error reading {filepath}: {e}")
-        
+    seen = set()
+    for finding in select(report, rule_type, under=scan_paths, exclude=exclude_files):
+        if (finding['file'], finding['line']) in seen:
+            continue
+        seen.add((finding['file'], finding['line']))
+        issues.append({
+            'file': finding['file'],
+            'line': finding['line'],
+            'type': rule_type[finding['rule']],
+            'context': finding['text']
+        })
     return issues
 
+
 def main():
     """Main function to scan all code files."""
     print("Scanning for FIXABLE code issues...\n")
     
-    all_issues = []
-    
-    for code_dir in code_dirs:
-        dir_path = Path(code_dir)
-        if not dir_path.exists():
-            continue
-            
-        # Get all JS and CSS files
-        js_files = list(dir_path.glob('**/*.js'))
-        css_files = list(dir_path.glob('**/*.css'))
-        
-        for file_path in js_files + css_files:
-            if should_exclude_file(file_path):
-                continue
-                
-            issues = scan_file_for_issues(file_path)
-            if issues:
-                all_issues.extend(issues)
-                print(f"Found {len(issues)} issues in {file_path.relative_to('/workspace')}")
-    
-    # Also check main files
-    main_files = [
-        '/workspace/index.html',
-        '/workspace/story-engine.js',
-        '/workspace/backstory-engine.js',
-        '/workspace/styles.css',
-    ]
-    
-    for filepath in main_files:
-        path = Path(filepath)
-        if path.exists():
-            issues = scan_file_for_issues(path)
-            if issues:
-                all_issues.extend(issues)
-                print(f"Found {len(issues)} issues in {path.name}")
-    
+    report = analyze()
+    all_issues = collect_issues(report)
+    for path, count in sorted(Counter(issue['file'] for issue in all_issues).items()):
+        print(f"Found {count} issues in {path}")
+    print(f"({report['stats']['scanned']} files analyzed, {report['stats']['reused']} from cache)")
+
     # Group issues by type
     issues_by_type = {}
     for issue in all_issues:
@@ -164,7 +99,7 @@ def main():
             report_lines.append("")
     
     # Write report
-    report_path = Path('/workspace/FIXABLE_ISSUES_REPORT.md')
+    report_path = Path('FIXABLE_ISSUES_REPORT.md')
     with open(report_path, 'w', encoding='utf-8') as f:
         f.write('\n'.join(report_lines))
     
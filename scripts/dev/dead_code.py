@@ -0,0 +1,384 @@
+#!/usr/bin/env python3
+"""
+Reachability report for the functions in js/.
+
+Every named function in js/ (declarations, `name = function/arrow`,
+`key: function`, methods) is a node. Anonymous functions (callbacks, IIFE
+bodies) belong to the node that contains them; code outside any named
+function is the load code of its file. A node's uses are the identifiers
+and property names in its own code plus the words inside its strings and
+templates (HTML built in JS calls handlers by name).
+
+Resolution is by name, which keeps the analysis conservative: once a name
+is used anywhere reachable, every function with that name is reachable.
+
+Exports are not uses. `window.X = Y` and `X: Y` / shorthand `X` members of
+objects built in load code only make Y reachable once X itself is used, so
+a namespace object listing every function of a module does not keep them
+all alive.
+
+Roots: the event handlers and inline scripts of index.html, tagged scripts
+outside js/ (story engine, content pack), and the load code of every js/
+script index.html tags, initialization.js among them. The load code of an
+untagged script (loaded lazily) runs once one of its globals is used.
+
+With --prune the unreachable function bodies are replaced by a throwing
+stub in a copy of js/, so a missed dynamic call fails loudly, and the raw
+and gzip size of the pruned build is reported.
+"""
+
+import argparse
+import json
+import os
+import re
+import sys
+from collections import defaultdict
+from types import SimpleNamespace
+
+from module_graph import HTML_PATH, _HANDLER, parse_script_tags, transfer_sizes
+from scope_index import ScopeIndex
+from static_analysis import check_syntax, tokenize
+
+JS_DIR = 'js'
+EXCLUDE_DIRS = {'node_modules', '.git', 'dist', 'coverage', 'archive'}
+_IDENT = re.compile(r'[A-Za-z_$][\w$]*')
+_ASSIGNED_MEMBER = re.compile(r'\.\s*([A-Za-z_$][\w$]*)\s*=\s*$')
+# Tokens after an `= Y` that make Y part of an expression rather than an alias
+_CONTINUES = {'(', '.', '?.', '[', '?', '&&', '||', '??', '+', '-', '*', '/', '%', '`', '==', '===', '!=',
+              '!==', '<', '>', '<=', '>=', 'instanceof', 'in'}
+_IIFE = re.compile(r'\s*\)?\s*\(')
+
+
+class Node:
+    """A named function, or the load code of one file"""
+
+    def __init__(self, path, name, start=None, end=None, line=None, body=None, parent=None):
+        self.path = path
+        self.name = name
+        self.start = start
+        self.end = end
+        self.line = line                  # 1-based
+        self.body = body                  # (open, close) of the braces, None for load code
+        self.parent = parent              # enclosing Node key, None at top level
+        self.uses = set()
+        self.aliases = []                 # (exported name, value name) found in load code
+        self.exports = {}                 # name -> line, for window.X and load-code object members
+        self.defines = set()              # globals of the file, for load code
+
+    @property
+    def bytes(self):
+        return self.end - self.start if self.body else 0
+
+
+def get_js_files(root, js_dir=JS_DIR):
+    files = []
+    for directory, dirs, names in os.walk(os.path.join(root, js_dir)):
+        dirs[:] = sorted(d for d in dirs if d not in EXCLUDE_DIRS)
+        for name in sorted(names):
+            if name.endswith('.js'):
+                files.append(os.path.relpath(os.path.join(directory, name), root).replace(os.sep, '/'))
+    return files
+
+
+def _node_name(index, fn):
+    """Name under which fn can be called, or None when it only runs where it is written"""
+    if fn.body[1] is None or fn.name == 'constructor':
+        return None
+    if _IIFE.match(index.code, fn.body[1] + 1):
+        return None
+    if fn.kind in ('declaration', 'method'):
+        return fn.name
+    before = index.code[max(0, fn.start - 200):fn.start].rstrip()
+    if not before.endswith(('=', ':')) or before.endswith(('==', '=>')):
+        return None
+    if fn.name:
+        return fn.name
+    member = _ASSIGNED_MEMBER.search(before)
+    return member.group(1) if member else None
+
+
+def scan_file(path, text):
+    """Nodes of one file keyed by (path, function index); the load code is (path, None)"""
+    index = ScopeIndex(text)
+    load = Node(path, '(load)')
+    nodes = {(path, None): load}
+    ranges = []
+    for i, fn in enumerate(index.functions):
+        name = _node_name(index, fn)
+        if name:
+            key = (path, i)
+            nodes[key] = Node(path, name, fn.start, fn.body[1] + 1, index.line_of(fn.start) + 1, fn.body)
+            ranges.append((fn.start, -(fn.body[1] + 1), key))
+    ranges.sort()
+
+    stack = []                            # (end, key) of the named functions around the cursor
+    brackets = []
+    consumed = set()                      # alias values, already accounted for
+    tokens = list(index.tokens(offsets=True))
+    r = 0
+    for t, (offset, token) in enumerate(tokens):
+        while stack and stack[-1][0] <= offset:
+            stack.pop()
+        while r < len(ranges) and ranges[r][0] <= offset:
+            start, end, key = ranges[r]
+            nodes[key].parent = stack[-1][1] if stack else None
+            stack.append((-end, key))
+            r += 1
+        while stack and stack[-1][0] <= offset:
+            stack.pop()
+        node = nodes[stack[-1][1]] if stack else load
+
+        if index.kind_at(offset) is not None:
+            if token[0] in 'st':
+                node.uses.update(_IDENT.findall(token[1:]))
+            continue
+        if token in '([{':
+            brackets.append(token)
+            continue
+        if token in ')]}':
+            if brackets:
+                brackets.pop()
+            continue
+        if not _IDENT.fullmatch(token) or t in consumed:
+            continue
+
+        prev = tokens[t - 1][1] if t > 0 else None
+        after = tokens[t + 1][1] if t + 1 < len(tokens) else None
+        in_object = brackets[-1:] == ['{'] and prev in ('{', ',')
+        if after == '=':
+            # Written, not read; `window.X = Y` exports Y under X
+            if prev == '.' and t > 1 and tokens[t - 2][1] == 'window':
+                node.exports.setdefault(token, index.line_of(offset) + 1)
+                load.defines.add(token)
+                value = tokens[t + 2][1] if t + 2 < len(tokens) else None
+                following = tokens[t + 3][1] if t + 3 < len(tokens) else None
+                if (value and _IDENT.fullmatch(value) and following not in _CONTINUES
+                        and index.kind_at(tokens[t + 2][0]) is None):
+                    node.aliases.append((token, value))
+                    consumed.add(t + 2)
+            continue
+        if in_object and after == ':':
+            value = tokens[t + 2][1] if t + 2 < len(tokens) else None
+            following = tokens[t + 3][1] if t + 3 < len(tokens) else None
+            if node is load and value and _IDENT.fullmatch(value) and following in (',', '}') \
+                    and index.kind_at(tokens[t + 2][0]) is None:
+                node.exports.setdefault(token, index.line_of(offset) + 1)
+                node.aliases.append((token, value))
+                consumed.add(t + 2)
+            continue
+        if in_object and after in (',', '}') and node is load:
+            node.exports.setdefault(token, index.line_of(offset) + 1)
+            node.aliases.append((token, token))
+            continue
+        node.uses.add(token)
+
+    load.defines.update(index.top_level())
+    return nodes
+
+
+def _code_uses(text):
+    """Identifiers and string words of code that always runs"""
+    index = ScopeIndex(text)
+    uses = set()
+    for offset, token in index.tokens(offsets=True):
+        if index.kind_at(offset) is None:
+            if _IDENT.fullmatch(token):
+                uses.add(token)
+        elif token[0] in 'st':
+            uses.update(_IDENT.findall(token[1:]))
+    return uses
+
+
+def build(root='.', html_path=HTML_PATH):
+    """(nodes, roots): every node of js/ and the node keys that run unconditionally"""
+    nodes = {}
+    for path in get_js_files(root):
+        with open(os.path.join(root, path), 'r', encoding='utf-8', errors='replace') as f:
+            nodes.update(scan_file(path, f.read()))
+
+    page = Node(html_path, '(page)')
+    roots = [(html_path, None)]
+    nodes[(html_path, None)] = page
+    html_file = os.path.join(root, html_path)
+    if os.path.exists(html_file):
+        with open(html_file, 'r', encoding='utf-8') as f:
+            html = f.read()
+        html_code, _ = tokenize(html, 'html')
+        for match in _HANDLER.finditer(html_code):
+            page.uses |= _code_uses(match.group(1) if match.group(1) is not None else match.group(2))
+        for src, inline, _ in parse_script_tags(html):
+            if src is None:
+                page.uses |= _code_uses(inline)
+                continue
+            path = src.lstrip('/')
+            if (path, None) in nodes:
+                roots.append((path, None))
+            elif not re.match(r'^(?:[a-z]+:)?//', src) and os.path.isfile(os.path.join(root, path)):
+                with open(os.path.join(root, path), 'r', encoding='utf-8', errors='replace') as f:
+                    page.uses |= _code_uses(f.read())
+    return nodes, roots
+
+
+def reachable(nodes, roots):
+    """(live node keys, live names) from the roots"""
+    by_name = defaultdict(list)
+    loaders = defaultdict(list)
+    for key, node in nodes.items():
+        if node.body:
+            by_name[node.name].append(key)
+        else:
+            for name in node.defines:
+                loaders[name].append(key)
+
+    live = set()
+    names = set()
+    pending = defaultdict(list)
+    work = [('node', key) for key in roots]
+    while work:
+        kind, item = work.pop()
+        if kind == 'node':
+            if item in live:
+                continue
+            live.add(item)
+            node = nodes[item]
+            work.extend(('name', name) for name in node.uses)
+            for exported, value in node.aliases:
+                if exported in names:
+                    work.append(('name', value))
+                else:
+                    pending[exported].append(value)
+        else:
+            if item in names:
+                continue
+            names.add(item)
+            work.extend(('node', key) for key in by_name.get(item, ()))
+            work.extend(('name', value) for value in pending.pop(item, ()))
+            work.extend(('node', key) for key in loaders.get(item, ()))
+    return live, names
+
+
+def analyze(root='.', html_path=HTML_PATH):
+    """Unreachable functions (outermost only) and unused exports, as a JSON-ready dict"""
+    nodes, roots = build(root, html_path)
+    live, names = reachable(nodes, roots)
+
+    dead = []
+    for key, node in nodes.items():
+        if node.body and key not in live and (node.parent is None or node.parent in live):
+            dead.append({'file': node.path, 'line': node.line, 'name': node.name, 'bytes': node.bytes,
+                         'start': node.start, 'end': node.end, 'body': list(node.body)})
+    dead.sort(key=lambda d: (d['file'], d['line']))
+
+    exports = []
+    for key, node in nodes.items():
+        if not node.body and key[0] != html_path:
+            exports.extend({'file': node.path, 'line': line, 'name': name}
+                           for name, line in sorted(node.exports.items(), key=lambda e: e[1])
+                           if name not in names)
+
+    per_file = defaultdict(lambda: {'functions': 0, 'bytes': 0})
+    for item in dead:
+        per_file[item['file']]['functions'] += 1
+        per_file[item['file']]['bytes'] += item['bytes']
+    functions = sum(1 for node in nodes.values() if node.body)
+    return {
+        'functions': functions,
+        'reachable': sum(1 for key in live if nodes[key].body),
+        'unreachable': dead,
+        'unreachable_bytes': sum(item['bytes'] for item in dead),
+        'unused_exports': exports,
+        'files': dict(sorted(per_file.items(), key=lambda e: -e[1]['bytes'])),
+        'unloaded': sorted(key[0] for key, node in nodes.items()
+                           if not node.body and key not in live and key[0] != html_path),
+    }
+
+
+def prune(root, report, out_dir):
+    """
+    Write every js/ file to out_dir with unreachable function bodies stubbed.
+    Returns {'before', 'after'} transfer sizes over all files and the list of
+    files node cannot parse (empty when node is not installed).
+    """
+    by_file = defaultdict(list)
+    for item in report['unreachable']:
+        by_file[item['file']].append(item)
+    before = defaultdict(int)
+    after = defaultdict(int)
+    written = []
+    for path in get_js_files(root):
+        with open(os.path.join(root, path), 'r', encoding='utf-8') as f:
+            text = f.read()
+        pruned = text
+        for item in sorted(by_file.get(path, []), key=lambda d: -d['body'][0]):
+            open_at, close = item['body']
+            stub = "{ throw new Error('pruned: %s'); }" % item['name']
+            pruned = pruned[:open_at] + stub + pruned[close + 1:]
+        target = os.path.join(out_dir, path)
+        os.makedirs(os.path.dirname(target), exist_ok=True)
+        with open(target, 'w', encoding='utf-8') as f:
+            f.write(pruned)
+        written.append(target)
+        for totals, content in ((before, text), (after, pruned)):
+            for key, value in transfer_sizes(content.encode('utf-8')).items():
+                totals[key] += value
+    broken = sorted(check_syntax([SimpleNamespace(path=path) for path in written]))
+    return {'before': dict(before), 'after': dict(after), 'broken': broken}
+
+
+def _kb(value):
+    return f"{value / 1024:.1f} KB"
+
+
+def main():
+    """Main function"""
+    parser = argparse.ArgumentParser(description='Report functions in js/ that index.html can never reach')
+    parser.add_argument('--root', default='.', help='Repository root')
+    parser.add_argument('--html', default=HTML_PATH, help='Page whose handlers and scripts are the roots')
+    parser.add_argument('--top', type=int, default=30, help='Functions to list (0 for all)')
+    parser.add_argument('--prune', metavar='DIR', help='Write a pruned copy of js/ to DIR')
+    parser.add_argument('--json', action='store_true', help='Print the report as JSON')
+    args = parser.parse_args()
+
+    report = analyze(args.root, args.html)
+    if args.prune:
+        if os.path.abspath(args.prune) == os.path.abspath(args.root):
+            print("❌ --prune must not write over the source tree")
+            return 2
+        report['pruned'] = prune(args.root, report, args.prune)
+
+    if args.json:
+        print(json.dumps(report, indent=2))
+        return 0
+
+    print("=" * 60)
+    print("DEAD CODE REPORT")
+    print("=" * 60)
+    print(f"  - Functions: {report['functions']} ({report['reachable']} reachable)")
+    print(f"  - Unreachable: {len(report['unreachable'])} functions, {_kb(report['unreachable_bytes'])}")
+    print(f"  - Unused exports: {len(report['unused_exports'])}")
+    if report['unloaded']:
+        print(f"  - Scripts never loaded: {', '.join(report['unloaded'])}")
+
+    if report['files']:
+        print("\n📈 By file:")
+        for path, totals in list(report['files'].items())[:args.top or None]:
+            print(f"  - {path}: {totals['functions']} functions, {_kb(totals['bytes'])}")
+        print("\n🔍 Largest unreachable functions:")
+        largest = sorted(report['unreachable'], key=lambda d: -d['bytes'])
+        for item in largest[:args.top or None]:
+            print(f"  - {item['file']}:{item['line']} {item['name']} ({item['bytes']:,} bytes)")
+    else:
+        print("\n✅ Every function is reachable from index.html")
+
+    if 'pruned' in report:
+        pruned = report['pruned']
+        print(f"\n✂️  Pruned build written to {args.prune}")
+        print(f"  - Raw: {_kb(pruned['before']['raw'])} -> {_kb(pruned['after']['raw'])}")
+        print(f"  - Gzip: {_kb(pruned['before']['gzip'])} -> {_kb(pruned['after']['gzip'])}")
+        for path in pruned['broken']:
+            print(f"  ❌ Does not parse: {path}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
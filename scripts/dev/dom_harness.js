@@ -0,0 +1,655 @@
+#!/usr/bin/env node
+/**
+ * Headless-free page harness: runs the index.html scripts in a Node vm
+ * context with DOM stubs, virtual timers and V8 precise coverage.
+ *
+ * Phases:
+ *   load        every <script> in page order (CDN scripts are skipped)
+ *   startup     DOMContentLoaded and load listeners, then timers due in
+ *               the first --startup-ms of virtual time
+ *   interaction --clicks clicks on --target (default #nextBtn)
+ *
+ * Coverage is taken after each script and after each phase, so a module is
+ * reported as used in a phase when one of its functions ran in that phase
+ * (a script's own top-level code and IIFEs while it loads do not count).
+ * Coverage cannot see data-only modules (window.AppState = {...}), so the
+ * configurable globals each script adds are also turned into accessors that
+ * record the first read from another script or from a later phase.
+ *
+ * Usage: node dom_harness.js <root> [--html index.html] [--clicks 1]
+ *                            [--target nextBtn] [--startup-ms 1000]
+ * Prints one JSON object. Also usable as a module: createPage(root, options).
+ */
+
+'use strict';
+
+const fs = require('fs');
+const inspector = require('inspector');
+const path = require('path');
+const vm = require('vm');
+
+const HANDLERS = 'index.html#handlers';
+
+// ----------------------------------------------------------------------
+// Virtual timers
+// ----------------------------------------------------------------------
+
+function createClock() {
+  let now = 0;
+  let nextId = 1;
+  const timers = new Map();
+  const clock = {
+    now: () => now,
+    setTimeout(callback, delay, ...args) {
+      const id = nextId++;
+      timers.set(id, { callback, args, at: now + Math.max(0, Number(delay) || 0), every: null });
+      return id;
+    },
+    setInterval(callback, delay, ...args) {
+      const id = nextId++;
+      const every = Math.max(1, Number(delay) || 0);
+      timers.set(id, { callback, args, at: now + every, every });
+      return id;
+    },
+    clear(id) {
+      timers.delete(id);
+    },
+    pending: () => timers.size,
+    // Run every timer due up to now + ms, in time order
+    advance(ms, onError) {
+      const until = now + ms;
+      for (;;) {
+        let dueId = null;
+        let due = null;
+        for (const [id, timer] of timers) {
+          if (timer.at <= until && (due === null || timer.at < due.at)) {
+            dueId = id;
+            due = timer;
+          }
+        }
+        if (due === null) break;
+        now = due.at;
+        if (due.every) due.at += due.every;
+        else timers.delete(dueId);
+        try {
+          if (typeof due.callback === 'function') due.callback(...due.args);
+        } catch (error) {
+          onError(error);
+        }
+      }
+      now = until;
+    },
+  };
+  return clock;
+}
+
+// ----------------------------------------------------------------------
+// DOM stubs
+// ----------------------------------------------------------------------
+
+class Storage {
+  constructor() { this._data = new Map(); }
+  get length() { return this._data.size; }
+  key(i) { return Array.from(this._data.keys())[i] ?? null; }
+  getItem(key) { return this._data.has(String(key)) ? this._data.get(String(key)) : null; }
+  setItem(key, value) { this._data.set(String(key), String(value)); }
+  removeItem(key) { this._data.delete(String(key)); }
+  clear() { this._data.clear(); }
+}
+
+class ClassList {
+  constructor() { this._set = new Set(); }
+  add(...names) { names.forEach((n) => this._set.add(n)); }
+  remove(...names) { names.forEach((n) => this._set.delete(n)); }
+  toggle(name, force) {
+    const on = force === undefined ? !this._set.has(name) : force;
+    if (on) this._set.add(name); else this._set.delete(name);
+    return on;
+  }
+  contains(name) { return this._set.has(name); }
+  replace(a, b) { if (this._set.delete(a)) this._set.add(b); }
+  toString() { return Array.from(this._set).join(' '); }
+}
+
+function nodeList(items) {
+  const list = Array.from(items);
+  list.item = (i) => list[i] ?? null;
+  return list;
+}
+
+function createDocument(page) {
+  const byId = new Map();
+
+  class EventTarget {
+    constructor() { this._listeners = {}; }
+    addEventListener(type, listener) {
+      (this._listeners[type] = this._listeners[type] || []).push(listener);
+      page.installed('listeners');
+    }
+    removeEventListener(type, listener) {
+      this._listeners[type] = (this._listeners[type] || []).filter((l) => l !== listener);
+    }
+    dispatchEvent(event) {
+      if (!event.target) event.target = this;
+      event.currentTarget = this;
+      for (const listener of (this._listeners[event.type] || []).slice()) {
+        page.guard(() => (typeof listener === 'function' ? listener.call(this, event) : listener.handleEvent(event)));
+      }
+      const handler = this['on' + event.type];
+      if (typeof handler === 'function') page.guard(() => handler.call(this, event));
+      return !event.defaultPrevented;
+    }
+  }
+
+  class Element extends EventTarget {
+    constructor(tagName, attributes) {
+      super();
+      this.tagName = String(tagName || 'div').toUpperCase();
+      this.nodeName = this.tagName;
+      this.nodeType = 1;
+      this.attributes = Object.assign({}, attributes || {});
+      this.style = { setProperty() {}, removeProperty() {}, getPropertyValue: () => '' };
+      this.classList = new ClassList();
+      this.dataset = {};
+      this.children = [];
+      this.childNodes = this.children;
+      this.parentNode = null;
+      this.parentElement = null;
+      this.textContent = '';
+      this.innerHTML = '';
+      this.value = '';
+      this.checked = false;
+      this.disabled = false;
+      this.hidden = false;
+      this.scrollTop = 0;
+      this.scrollHeight = 0;
+      this.clientHeight = 0;
+      this.offsetHeight = 0;
+      this.offsetWidth = 0;
+      this._id = '';
+      if (this.attributes.id) this.id = this.attributes.id;
+      if (this.attributes.class) this.attributes.class.split(/\s+/).forEach((c) => c && this.classList.add(c));
+    }
+    get id() { return this._id; }
+    set id(value) {
+      this._id = String(value);
+      if (this._id && !byId.has(this._id)) byId.set(this._id, this);
+    }
+    get className() { return this.classList.toString(); }
+    set className(value) {
+      this.classList = new ClassList();
+      String(value).split(/\s+/).forEach((c) => c && this.classList.add(c));
+    }
+    get firstChild() { return this.children[0] || null; }
+    get lastChild() { return this.children[this.children.length - 1] || null; }
+    get firstElementChild() { return this.firstChild; }
+    get childElementCount() { return this.children.length; }
+    setAttribute(name, value) {
+      this.attributes[name] = String(value);
+      if (name === 'id') this.id = value;
+    }
+    getAttribute(name) { return name in this.attributes ? this.attributes[name] : null; }
+    hasAttribute(name) { return name in this.attributes; }
+    removeAttribute(name) { delete this.attributes[name]; }
+    appendChild(child) {
+      if (child && child.isFragment) {
+        child.children.splice(0).forEach((c) => this.appendChild(c));
+        return child;
+      }
+      if (child && typeof child === 'object') {
+        this.children.push(child);
+        child.parentNode = this;
+        child.parentElement = this;
+      }
+      return child;
+    }
+    append(...nodes) { nodes.forEach((n) => this.appendChild(n)); }
+    prepend(...nodes) { nodes.reverse().forEach((n) => this.insertBefore(n, this.firstChild)); }
+    insertBefore(child, ref) {
+      const at = this.children.indexOf(ref);
+      if (at === -1) return this.appendChild(child);
+      this.children.splice(at, 0, child);
+      child.parentNode = this;
+      return child;
+    }
+    removeChild(child) {
+      const at = this.children.indexOf(child);
+      if (at !== -1) this.children.splice(at, 1);
+      return child;
+    }
+    replaceChild(next, old) { this.insertBefore(next, old); return this.removeChild(old); }
+    remove() { if (this.parentNode) this.parentNode.removeChild(this); }
+    cloneNode() { return new Element(this.tagName, this.attributes); }
+    contains(other) { return other === this || this.children.some((c) => c.contains && c.contains(other)); }
+    querySelector(selector) { return page.document.querySelector(selector); }
+    querySelectorAll() { return nodeList([]); }
+    getElementsByTagName() { return nodeList([]); }
+    getElementsByClassName() { return nodeList([]); }
+    closest() { return null; }
+    matches() { return false; }
+    insertAdjacentHTML() {}
+    insertAdjacentElement(_, element) { return this.appendChild(element); }
+    getBoundingClientRect() { return { top: 0, left: 0, right: 0, bottom: 0, width: 0, height: 0 }; }
+    getClientRects() { return []; }
+    scrollIntoView() {}
+    scrollTo() {}
+    scrollBy() {}
+    focus() { page.document.activeElement = this; }
+    blur() {}
+    select() {}
+    click() {
+      const event = new page.context.Event('click', { bubbles: true, cancelable: true });
+      if (!this.onclick && this.attributes.onclick) {
+        this.onclick = page.compileHandler(this.attributes.onclick);
+      }
+      return this.dispatchEvent(event);
+    }
+  }
+
+  const document = new EventTarget();
+  Object.assign(document, {
+    readyState: 'loading',
+    nodeType: 9,
+    cookie: '',
+    title: '',
+    referrer: '',
+    visibilityState: 'visible',
+    hidden: false,
+    activeElement: null,
+    documentElement: new Element('html'),
+    head: new Element('head'),
+    body: new Element('body'),
+    getElementById: (id) => byId.get(String(id)) || null,
+    querySelector(selector) {
+      const match = /^#([\w-]+)$/.exec(String(selector).trim());
+      if (match) return byId.get(match[1]) || null;
+      return null;
+    },
+    querySelectorAll: () => nodeList([]),
+    getElementsByTagName: (tag) => nodeList(String(tag).toLowerCase() === 'body' ? [document.body] : []),
+    getElementsByClassName: () => nodeList([]),
+    getElementsByName: () => nodeList([]),
+    createElement: (tag) => new Element(tag),
+    createElementNS: (_, tag) => new Element(tag),
+    createTextNode: (text) => ({ nodeType: 3, textContent: String(text) }),
+    createComment: (text) => ({ nodeType: 8, textContent: String(text) }),
+    createDocumentFragment() {
+      const fragment = new Element('#fragment');
+      fragment.isFragment = true;
+      return fragment;
+    },
+    createRange: () => ({ selectNodeContents() {}, setStart() {}, setEnd() {}, collapse() {} }),
+    execCommand: () => false,
+    hasFocus: () => true,
+  });
+  document.documentElement.appendChild(document.head);
+  document.documentElement.appendChild(document.body);
+
+  // Elements declared in the page markup, with their attributes (onclick, ...)
+  const markup = page.html.replace(/<!--[\s\S]*?-->/g, '');
+  const tag = /<([a-zA-Z][\w-]*)\b((?:[^>"']|"[^"]*"|'[^']*')*)>/g;
+  const attribute = /([:\w-]+)\s*=\s*("([^"]*)"|'([^']*)')/g;
+  let found;
+  while ((found = tag.exec(markup))) {
+    if (!/\bid\s*=/.test(found[2])) continue;
+    const attributes = {};
+    let attr;
+    while ((attr = attribute.exec(found[2]))) attributes[attr[1].toLowerCase()] = attr[3] ?? attr[4];
+    const element = new Element(found[1], attributes);
+    document.body.appendChild(element);
+  }
+
+  return { document, Element, EventTarget };
+}
+
+// ----------------------------------------------------------------------
+// Page
+// ----------------------------------------------------------------------
+
+function parseScripts(html) {
+  const scripts = [];
+  const markup = html.replace(/<!--[\s\S]*?-->/g, '');
+  const pattern = /<script\b([^>]*)>([\s\S]*?)<\/script\s*>/gi;
+  let match;
+  let inline = 0;
+  while ((match = pattern.exec(markup))) {
+    const src = /\bsrc\s*=\s*["']([^"']+)["']/i.exec(match[1]);
+    if (src) {
+      const file = src[1].split('?')[0].split('#')[0];
+      scripts.push(/^(?:[a-z]+:)?\/\//.test(file) ? { module: file, external: true } : { module: file.replace(/^\//, '') });
+    } else {
+      inline += 1;
+      scripts.push({ module: `index.html#script-${inline}`, source: match[2] });
+    }
+  }
+  return scripts;
+}
+
+function createPage(root, options = {}) {
+  const htmlPath = options.html || 'index.html';
+  const html = fs.readFileSync(path.join(root, htmlPath), 'utf8');
+  const clock = createClock();
+  const errors = [];
+  const consoleCounts = { log: 0, info: 0, warn: 0, error: 0, debug: 0 };
+  const consoleErrors = [];
+
+  const installs = {};
+  const page = {
+    root,
+    installs,
+    loading: null,
+    // Count listeners and timers a script sets up while it is being evaluated
+    installed(kind) {
+      if (page.loading === null) return;
+      const entry = installs[page.loading] = installs[page.loading] || { listeners: 0, timers: 0 };
+      entry[kind] += 1;
+    },
+    html,
+    clock,
+    errors,
+    consoleCounts,
+    consoleErrors,
+    guard(fn) {
+      try {
+        return fn();
+      } catch (error) {
+        errors.push(String(error && error.stack ? error.stack.split('\n').slice(0, 2).join(' ') : error));
+        return undefined;
+      }
+    },
+  };
+
+  const quietConsole = {};
+  for (const level of Object.keys(consoleCounts)) {
+    quietConsole[level] = (...args) => {
+      consoleCounts[level] += 1;
+      if (level === 'error' && consoleErrors.length < 20) consoleErrors.push(args.map(String).join(' ').slice(0, 200));
+      if (options.verbose) console.error(`[page ${level}]`, ...args);
+    };
+  }
+  quietConsole.group = quietConsole.groupEnd = quietConsole.table = quietConsole.time = quietConsole.timeEnd = () => {};
+
+  class Event {
+    constructor(type, init = {}) {
+      this.type = type;
+      this.bubbles = !!init.bubbles;
+      this.cancelable = !!init.cancelable;
+      this.detail = init.detail;
+      this.defaultPrevented = false;
+      this.target = null;
+      this.key = init.key;
+    }
+    preventDefault() { this.defaultPrevented = true; }
+    stopPropagation() {}
+    stopImmediatePropagation() {}
+  }
+
+  class Observer {
+    observe() {}
+    unobserve() {}
+    disconnect() {}
+    takeRecords() { return []; }
+  }
+
+  const sandbox = {
+    console: quietConsole,
+    Event,
+    CustomEvent: Event,
+    KeyboardEvent: Event,
+    MouseEvent: Event,
+    IntersectionObserver: Observer,
+    MutationObserver: Observer,
+    ResizeObserver: Observer,
+    PerformanceObserver: Object.assign(class extends Observer {}, { supportedEntryTypes: [] }),
+    setTimeout: (...args) => { page.installed('timers'); return clock.setTimeout(...args); },
+    setInterval: (...args) => { page.installed('timers'); return clock.setInterval(...args); },
+    clearTimeout: clock.clear,
+    clearInterval: clock.clear,
+    requestAnimationFrame: (callback) => clock.setTimeout(() => callback(clock.now()), 16),
+    cancelAnimationFrame: clock.clear,
+    requestIdleCallback: (callback) => clock.setTimeout(() => callback({ timeRemaining: () => 50, didTimeout: false }), 1),
+    cancelIdleCallback: clock.clear,
+    queueMicrotask,
+    localStorage: new Storage(),
+    sessionStorage: new Storage(),
+    navigator: {
+      userAgent: 'Mozilla/5.0 (dom_harness)',
+      language: 'en-US',
+      languages: ['en-US'],
+      onLine: true,
+      platform: 'node',
+      hardwareConcurrency: 4,
+      clipboard: { writeText: () => Promise.resolve(), readText: () => Promise.resolve('') },
+    },
+    location: { href: 'http://localhost/', origin: 'http://localhost', protocol: 'http:', host: 'localhost',
+      hostname: 'localhost', pathname: '/', search: '', hash: '', reload() {}, assign() {}, replace() {} },
+    history: { length: 1, state: null, pushState() {}, replaceState() {}, back() {}, forward() {} },
+    screen: { width: 1280, height: 800 },
+    innerWidth: 1280,
+    innerHeight: 800,
+    devicePixelRatio: 1,
+    matchMedia: () => ({ matches: false, media: '', addListener() {}, removeListener() {}, addEventListener() {}, removeEventListener() {} }),
+    getComputedStyle: () => ({ getPropertyValue: () => '' }),
+    scrollTo() {},
+    scrollBy() {},
+    alert() {},
+    confirm: () => false,
+    prompt: () => null,
+    open: () => null,
+    fetch: () => Promise.reject(new Error('network disabled in dom_harness')),
+    performance,
+    crypto: require('crypto').webcrypto,
+    TextEncoder,
+    TextDecoder,
+    URL,
+    URLSearchParams,
+    Blob: typeof Blob !== 'undefined' ? Blob : class {},
+    atob: (s) => Buffer.from(s, 'base64').toString('binary'),
+    btoa: (s) => Buffer.from(s, 'binary').toString('base64'),
+  };
+  const context = vm.createContext(sandbox);
+  page.context = context;
+  const dom = createDocument(page);
+  const windowTarget = new dom.EventTarget();
+  for (const method of ['addEventListener', 'removeEventListener', 'dispatchEvent']) {
+    sandbox[method] = windowTarget[method].bind(windowTarget);
+  }
+  sandbox._listeners = windowTarget._listeners;
+  sandbox.document = dom.document;
+  sandbox.window = context;
+  sandbox.self = context;
+  sandbox.globalThis = context;
+  sandbox.HTMLElement = dom.Element;
+  sandbox.Element = dom.Element;
+  sandbox.Node = dom.Element;
+  page.document = dom.document;
+  page.window = windowTarget;
+
+  page.compileHandler = (code) => page.guard(() => new vm.Script(
+    `(function (event) {\n${code}\n})`, { filename: HANDLERS }).runInContext(context));
+
+  page.scripts = parseScripts(html);
+
+  // Evaluate one script tag; returns { module, loaded, error }
+  page.runScript = (script) => {
+    if (script.external) return { module: script.module, loaded: false, external: true };
+    let source = script.source;
+    if (source === undefined) {
+      const file = path.join(root, script.module);
+      if (!fs.existsSync(file)) return { module: script.module, loaded: false, error: 'file not found' };
+      source = fs.readFileSync(file, 'utf8');
+    }
+    page.loading = script.module;
+    try {
+      const compiled = new vm.Script(source, { filename: script.module });
+      compiled.runInContext(context);
+      return { module: script.module, loaded: true };
+    } catch (error) {
+      return { module: script.module, loaded: false, error: `${error.name}: ${error.message}` };
+    } finally {
+      page.loading = null;
+    }
+  };
+
+  page.fire = (target, type) => target.dispatchEvent(new Event(type));
+
+  page.startup = (ms) => {
+    dom.document.readyState = 'interactive';
+    page.fire(dom.document, 'DOMContentLoaded');
+    dom.document.readyState = 'complete';
+    page.fire(windowTarget, 'load');
+    clock.advance(ms, (error) => page.guard(() => { throw error; }));
+  };
+
+  page.click = (id, ms = 100) => {
+    const element = dom.document.getElementById(id);
+    if (!element) throw new Error(`#${id} not found in ${htmlPath}`);
+    element.click();
+    clock.advance(ms, (error) => page.guard(() => { throw error; }));
+  };
+
+  return page;
+}
+
+// ----------------------------------------------------------------------
+// Coverage
+// ----------------------------------------------------------------------
+
+function createCoverage(modules) {
+  const session = new inspector.Session();
+  session.connect();
+  session.post('Profiler.enable');
+  session.post('Profiler.startPreciseCoverage', { callCount: true, detailed: false });
+  const known = new Set(modules);
+  return {
+    // Functions executed since the last call, as { module: count }
+    take() {
+      let result = null;
+      session.post('Profiler.takePreciseCoverage', (error, value) => { result = value; });
+      const executed = {};
+      for (const script of (result ? result.result : [])) {
+        if (!known.has(script.url)) continue;
+        const count = script.functions.filter((f) => f.functionName !== '' || f.ranges[0].startOffset !== 0)
+          .filter((f) => f.ranges[0].count > 0).length;
+        if (count) executed[script.url] = count;
+      }
+      return executed;
+    },
+    stop() {
+      session.post('Profiler.stopPreciseCoverage');
+      session.disconnect();
+    },
+  };
+}
+
+function flush() {
+  return new Promise((resolve) => setImmediate(resolve));
+}
+
+async function measure(root, options = {}) {
+  const page = createPage(root, options);
+  const modules = page.scripts.filter((s) => !s.external).map((s) => s.module).concat([HANDLERS]);
+  const coverage = createCoverage(modules);
+  const usage = {};
+  const use = (module, phase, by) => {
+    if (!usage[module]) usage[module] = by ? { phase, by } : { phase };
+  };
+  const rejections = [];
+  const onRejection = (reason) => rejections.push(String(reason && reason.message ? reason.message : reason));
+  process.on('unhandledRejection', onRejection);
+
+  let phase = 'load';
+  const watch = (module, known) => {
+    for (const name of Object.getOwnPropertyNames(page.context)) {
+      if (known.has(name)) continue;
+      const descriptor = Object.getOwnPropertyDescriptor(page.context, name);
+      if (!descriptor.configurable || !('value' in descriptor)) continue;
+      let value = descriptor.value;
+      Object.defineProperty(page.context, name, {
+        configurable: true,
+        enumerable: descriptor.enumerable,
+        get() {
+          if (phase !== 'load') use(module, phase);
+          else if (page.loading && page.loading !== module) use(module, 'load', page.loading);
+          return value;
+        },
+        set(next) { value = next; },
+      });
+    }
+  };
+
+  const scripts = [];
+  coverage.take();
+  for (const script of page.scripts) {
+    const known = new Set(Object.getOwnPropertyNames(page.context));
+    const started = process.hrtime.bigint();
+    const result = page.runScript(script);
+    result.ms = Number(process.hrtime.bigint() - started) / 1e6;
+    scripts.push(result);
+    watch(script.module, known);
+    for (const module of Object.keys(coverage.take())) {
+      if (module !== script.module) use(module, 'load', script.module);
+    }
+  }
+  await flush();
+  for (const module of Object.keys(coverage.take())) use(module, 'load');
+
+  phase = 'startup';
+  const timings = {};
+  let started = process.hrtime.bigint();
+  page.startup(options.startupMs ?? 1000);
+  await flush();
+  timings.startup = Number(process.hrtime.bigint() - started) / 1e6;
+  for (const module of Object.keys(coverage.take())) use(module, 'startup');
+
+  phase = 'interaction';
+  const clicks = options.clicks ?? 1;
+  started = process.hrtime.bigint();
+  for (let i = 0; i < clicks; i++) {
+    page.click(options.target || 'nextBtn');
+    await flush();
+  }
+  timings.interaction = Number(process.hrtime.bigint() - started) / 1e6;
+  for (const module of Object.keys(coverage.take())) use(module, 'interaction');
+
+  coverage.stop();
+  process.removeListener('unhandledRejection', onRejection);
+  return {
+    html: options.html || 'index.html',
+    scripts,
+    usage,
+    installs: page.installs,
+    timings,
+    errors: page.errors.slice(0, 50),
+    rejections: rejections.slice(0, 20),
+    console: page.consoleCounts,
+    consoleErrors: page.consoleErrors,
+    pendingTimers: page.clock.pending(),
+  };
+}
+
+function parseArgs(argv) {
+  const options = { root: argv[0] || '.' };
+  for (let i = 1; i < argv.length; i++) {
+    const value = argv[i + 1];
+    if (argv[i] === '--html') { options.html = value; i++; }
+    else if (argv[i] === '--clicks') { options.clicks = Number(value); i++; }
+    else if (argv[i] === '--target') { options.target = value; i++; }
+    else if (argv[i] === '--startup-ms') { options.startupMs = Number(value); i++; }
+    else if (argv[i] === '--verbose') { options.verbose = true; }
+  }
+  return options;
+}
+
+if (require.main === module) {
+  const options = parseArgs(process.argv.slice(2));
+  measure(path.resolve(options.root), options).then((report) => {
+    process.stdout.write(JSON.stringify(report) + '\n');
+    process.exit(0);
+  }, (error) => {
+    console.error(error.stack || String(error));
+    process.exit(1);
+  });
+}
+
+module.exports = { createPage, createClock, parseScripts, measure, HANDLERS };
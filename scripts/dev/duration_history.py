@@ -0,0 +1,219 @@
+#!/usr/bin/env python3
+"""
+Rolling test-duration history, slow-test flagging and duration-aware sharding.
+
+Durations are kept per test key (a run_tests id such as
+tests/test_cms.py::test_cms_features, or tester-check keys such as
+tests/python/test_comprehensive_features.py::FeatureTester::Page Load) in
+.test-history.json, the last WINDOW samples each. A test's expected duration
+is the median of its samples. A new sample is a regression when it is more
+than `factor` times the expected duration and at least MIN_SLOWDOWN seconds
+slower, once MIN_SAMPLES earlier samples exist.
+
+schedule() uses the expected durations to split work into shards that
+finish together: longest first, each onto the least-loaded shard.
+
+Several processes may record at once (run_tests workers, testers): save()
+merges new samples into the file under a lock instead of overwriting it.
+"""
+
+import argparse
+import contextlib
+import heapq
+import json
+import os
+import statistics
+import sys
+import time
+
+from import_content import write_atomic
+
+try:
+    import fcntl
+except ImportError:  # Windows: saves are not serialized
+    fcntl = None
+
+ROOT = os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
+HISTORY_PATH = '.test-history.json'
+HISTORY_FORMAT = 1
+WINDOW = 20
+REGRESSION_FACTOR = 2.0
+MIN_SAMPLES = 3
+MIN_SLOWDOWN = 0.05
+DEFAULT_EXPECTED = 1.0
+
+
+@contextlib.contextmanager
+def _locked(path):
+    if fcntl is None:
+        yield
+        return
+    with open(path + '.lock', 'a') as lock:
+        fcntl.flock(lock, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(lock, fcntl.LOCK_UN)
+
+
+def _read(path):
+    try:
+        with open(path) as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return data.get('tests', {}) if data.get('format') == HISTORY_FORMAT else {}
+
+
+class DurationHistory:
+    """Duration samples per test key, loaded from and merged back into path"""
+
+    def __init__(self, path=os.path.join(ROOT, HISTORY_PATH), window=WINDOW, factor=REGRESSION_FACTOR,
+                 min_samples=MIN_SAMPLES, min_slowdown=MIN_SLOWDOWN):
+        self.path = path
+        self.window = window
+        self.factor = factor
+        self.min_samples = min_samples
+        self.min_slowdown = min_slowdown
+        self.tests = _read(path) if path else {}
+        self.pending = {}
+        self.regressions = []
+
+    def expected(self, key, default=None):
+        """Median of the recorded samples of key, or default"""
+        samples = self.tests.get(key)
+        return statistics.median(samples) if samples else default
+
+    def default(self, keys=None):
+        """Expected duration for a test without history: the median over keys (default: all known tests)"""
+        keys = self.tests if keys is None else keys
+        known = [statistics.median(self.tests[key]) for key in keys if self.tests.get(key)]
+        return statistics.median(known) if known else DEFAULT_EXPECTED
+
+    def check(self, key, duration):
+        """{'key', 'duration', 'expected', 'factor'} when duration regressed against the history, else None"""
+        samples = self.tests.get(key, [])
+        if len(samples) < self.min_samples:
+            return None
+        expected = statistics.median(samples)
+        if duration > expected * self.factor and duration - expected >= self.min_slowdown:
+            return {'key': key, 'duration': round(duration, 4), 'expected': round(expected, 4),
+                    'factor': round(duration / expected, 1) if expected else None}
+        return None
+
+    def record(self, key, duration):
+        """Add a sample; returns the regression it shows, if any"""
+        regression = self.check(key, duration)
+        if regression:
+            self.regressions.append(regression)
+        duration = round(duration, 4)
+        self.tests[key] = (self.tests.get(key, []) + [duration])[-self.window:]
+        self.pending.setdefault(key, []).append(duration)
+        return regression
+
+    def save(self):
+        """Merge the samples recorded since loading into the history file"""
+        if not self.path or not self.pending:
+            return
+        with _locked(self.path):
+            tests = _read(self.path)
+            for key, samples in self.pending.items():
+                tests[key] = (tests.get(key, []) + samples)[-self.window:]
+            write_atomic(self.path, json.dumps({'format': HISTORY_FORMAT, 'tests': tests},
+                                               separators=(',', ':'), sort_keys=True) + '\n')
+            self.tests.update({key: tests[key] for key in self.pending})
+        self.pending = {}
+
+
+class CheckTimer:
+    """
+    Monotonic durations for a tester's log_test checks.
+
+    start() marks the beginning of a test method; lap(name) returns the time
+    since then (or since the previous lap) and records it under
+    "prefix::name". report() prints the slowest checks and any regressions
+    and saves the history.
+    """
+
+    def __init__(self, prefix, history=None, factor=REGRESSION_FACTOR):
+        self.prefix = prefix
+        self.history = history if history is not None else DurationHistory(factor=factor)
+        self.mark = time.monotonic()
+
+    def start(self):
+        self.mark = time.monotonic()
+
+    def lap(self, name):
+        now = time.monotonic()
+        duration = now - self.mark
+        self.mark = now
+        self.history.record(f'{self.prefix}::{name}', duration)
+        return round(duration, 4)
+
+    def report(self, results, top=5):
+        """Print the slowest of results (log_test dicts) and the regressions; save the history"""
+        timed = sorted((r for r in results if 'duration' in r), key=lambda r: -r['duration'])[:top]
+        if timed:
+            print(f"🐢 Slowest {len(timed)}:")
+            for result in timed:
+                print(f"  {result['duration'] * 1000:9.1f} ms  {result['test']}")
+            print()
+        if self.history.regressions:
+            print(f"⚠️  {len(self.history.regressions)} check(s) slower than {self.history.factor:g}x their usual time:")
+            for regression in self.history.regressions:
+                print(f"  {regression['key'].split('::')[-1]}: {regression['duration'] * 1000:.1f} ms "
+                      f"(usually {regression['expected'] * 1000:.1f} ms)")
+            print()
+        self.history.save()
+
+
+def schedule(items, cost, shards):
+    """
+    Split items into shards with even total cost.
+
+    Longest-processing-time first: items are taken in decreasing cost(item)
+    and each goes to the shard with the least total so far. Returns
+    (shards, totals), each shard in the order its items were assigned, which
+    is also the order that keeps a pool of `shards` workers evenly busy.
+    """
+    ordered = sorted(items, key=lambda item: -cost(item))
+    result = [[] for _ in range(shards)]
+    totals = [0.0] * shards
+    heap = [(0.0, index) for index in range(shards)]
+    for item in ordered:
+        total, index = heapq.heappop(heap)
+        result[index].append(item)
+        totals[index] = total + cost(item)
+        heapq.heappush(heap, (totals[index], index))
+    return result, totals
+
+
+def main():
+    """Main function"""
+    parser = argparse.ArgumentParser(description='Show expected test durations from the rolling history')
+    parser.add_argument('--history', default=os.path.join(ROOT, HISTORY_PATH), help='History file')
+    parser.add_argument('--top', type=int, default=20, help='Show the N slowest tests')
+    parser.add_argument('-k', dest='keyword', help='Only keys containing this')
+    args = parser.parse_args()
+
+    history = DurationHistory(args.history)
+    keys = [key for key in history.tests if not args.keyword or args.keyword in key]
+    if not keys:
+        print(f"❌ No history in {args.history}")
+        return 1
+
+    print("=" * 60)
+    print("Test Duration History")
+    print("=" * 60)
+    print(f"  - Tests: {len(keys)}, samples: {sum(len(history.tests[key]) for key in keys)}")
+    print(f"  - Expected total: {sum(history.expected(key) for key in keys):.2f}s")
+    print(f"\n🐢 Slowest {args.top}:")
+    for key in sorted(keys, key=lambda key: -history.expected(key))[:args.top]:
+        samples = history.tests[key]
+        print(f"  - {history.expected(key):8.3f}s  (min {min(samples):.3f}, max {max(samples):.3f}, "
+              f"{len(samples)} runs)  {key}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -1,109 +1,72 @@
 #!/usr/bin/env python3
 """
 Script to find ACTUAL code issues that need fixing.
+A view over the static_analysis.py findings.
 """
-import os
-import re
+from collections import Counter
 from pathlib import Path
 
-# Patterns for actual code issues
-actual_issue_patterns = {
-    'TODO': r'//\s*TODO:|/\*\s*TODO:|#\s*TODO:',
-    'FIXME': r'//\s*FIXME:|/\*\s*FIXME:|#\s*FIXME:',
-    'XXX': r'//\s*XXX:|/\*\s*XXX:|#\s*XXX:',
-    'HACK': r'//\s*HACK:|/\*\s*HACK:|#\s*HACK:',
-    'console.log': r'console\.log\(',
-    'console.debug': r'console\.debug\(',
-    'console.warn': r'console\.warn\(',
-    'alert(': r'alert\(',
-    'confirm(': r'confirm\(',
-    'prompt(': r'prompt\(',
-    'eval(': r'eval\(',
-    'innerHTML.*\+': r'innerHTML\s*\+=',
-    'document.write': r'document\.write\(',
+from static_analysis import analyze, select
+
+# Issue type -> static_analysis rule
+actual_issue_rules = {
+    'TODO': 'todo-comment',
+    'FIXME': 'todo-comment',
+    'XXX': 'todo-comment',
+    'HACK': 'todo-comment',
+    'console.log': 'console-log',
+    'console.debug': 'console-debug',
+    'console.warn': 'console-warn',
+    'alert(': 'alert',
+    'confirm(': 'confirm',
+    'prompt(': 'prompt',
+    'eval(': 'eval',
+    'innerHTML.*\\+': 'innerhtml-concat',
+    'document.write': 'document-write',
 }
 
-# Files to scan
-code_dirs = [
-    '/workspace/js',
-    '/workspace/css',
-    '/workspace/tests',
-]
+# Files and directories to scan
+scan_paths = ['js', 'css', 'tests', 'index.html', 'story-engine.js', 'backstory-engine.js', 'styles.css']
+
+
+def issue_type(finding):
+    """Report type for a finding, or None when this report does not track it"""
+    if finding['rule'] == 'todo-comment':
+        return finding['message'] if finding['message'] in actual_issue_rules else None
+    for name, rule in actual_issue_rules.items():
+        if rule == finding['rule']:
+            return name
+    return None
+
 
-def scan_file_for_issues(filepath):
-    """Scan a single file for actual code issues."""
+def collect_issues(report):
+    """One issue per line from the findings file"""
     issues = []
-    
-    try:
-        with open(filepath, 'r', encoding='utf-8') as f:
-            content = f.read()
-            lines = content.split('\n')
-            
-        for i, line in enumerate(lines, 1):
-            line_stripped = line.strip()
-            
-            # Skip empty lines
-            if not line_stripped:
-                continue
-                
-            # Check for actual issue patterns
-            for issue_type, pattern in actual_issue_patterns.items():
-                if re.search(pattern, line):
-                    # Extract context
-                    context = line.strip()
-                    if len(context) > 150:
-                        context = context[:150] + '...'
-                    
-                    issues.append({
-                        'file': str(filepath.relative_to('/workspace')),
-                        'line': i,
-                        'type': issue_type,
-                        'context': context
-                    })
-                    break  # Only record once per line
-                    
-    except Exception as e:
-        print(f"Error reading {filepath}: {e}")
-        
+    seen = set()
+    for finding in select(report, set(actual_issue_rules.values()), under=scan_paths):
+        kind = issue_type(finding)
+        if kind is None or (finding['file'], finding['line']) in seen:
+            continue
+        seen.add((finding['file'], finding['line']))
+        issues.append({
+            'file': finding['file'],
+            'line': finding['line'],
+            'type': kind,
+            'context': finding['text']
+        })
     return issues
 
+
 def main():
     """Main function to scan all code files."""
     print("Scanning for ACTUAL code issues...\n")
     
-    all_issues = []
-    
-    for code_dir in code_dirs:
-        dir_path = Path(code_dir)
-        if not dir_path.exists():
-            continue
-            
-        # Get all JS and CSS files
-        js_files = list(dir_path.glob('**/*.js'))
-        css_files = list(dir_path.glob('**/*.css'))
-        
-        for file_path in js_files + css_files:
-            issues = scan_file_for_issues(file_path)
-            if issues:
-                all_issues.extend(issues)
-                print(f"Found {len(issues)} issues in {file_path.relative_to('/workspace')}")
-    
-    # Also check main files
-    main_files = [
-        '/workspace/index.html',
-        '/workspace/story-engine.js',
-        '/workspace/backstory-engine.js',
-        '/workspace/styles.css',
-    ]
-    
-    for filepath in main_files:
-        path = Path(filepath)
-        if path.exists():
-            issues = scan_file_for_issues(path)
-            if issues:
-                all_issues.extend(issues)
-                print(f"Found {len(issues)} issues in {path.name}")
-    
+    report = analyze()
+    all_issues = collect_issues(report)
+    for path, count in sorted(Counter(issue['file'] for issue in all_issues).items()):
+        print(f"Found {count} issues in {path}")
+    print(f"({report['stats']['scanned']} files analyzed, {report['stats']['reused']} from cache)")
+
     # Group issues by type
     issues_by_type = {}
     for issue in all_issues:
@@ -143,7 +106,7 @@ def main():
         report_lines.append("")
     
     # Write report
-    report_path = Path('/workspace/ACTUAL_CODE_ISSUES.md')
+    report_path = Path('ACTUAL_CODE_ISSUES.md')
     with open(report_path, 'w', encoding='utf-8') as f:
         f.write('\n'.join(report_lines))
     
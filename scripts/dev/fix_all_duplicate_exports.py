@@ -4,7 +4,8 @@ Fix all duplicate window exports in JavaScript files
 """
 
 import re
-from pathlib import Path
+
+from symbol_index import build_index
 
 def fix_duplicate_exports_file(filepath):
     """Fix duplicate window exports in a single file"""
@@ -59,11 +60,12 @@ def fix_duplicate_exports_file(filepath):
 
 def main():
     """Main function"""
-    js_dir = Path('js')
+    # Only files the symbol index saw assigning a window export twice
+    candidates = [path for path in build_index().duplicate_exports() if path.startswith('js/')]
     
     fixed_files = []
     
-    for js_file in js_dir.rglob('*.js'):
+    for js_file in candidates:
         if fix_duplicate_exports_file(js_file):
             fixed_files.append(str(js_file))
             print(f"✅ Fixed: {js_file}")
@@ -7,7 +7,8 @@ Part 2: Reduce indentation in non-template deeply nested JS code by extracting h
 """
 
 import os
-import re
+
+from scope_index import ScopeIndex
 
 
 def get_js_files():
@@ -20,91 +21,15 @@ def get_js_files():
     return sorted(js_files)
 
 
-def find_closing_backtick(lines, start):
-    """Find the line containing the closing backtick."""
-    expr_depth = 0
-    for i in range(start, len(lines)):
-        raw = lines[i].rstrip('\n').rstrip('\r')
-        j = 0
-        while j < len(raw):
-            ch = raw[j]
-            if ch == '\\' and j + 1 < len(raw):
-                j += 2
-                continue
-            if ch == '$' and j + 1 < len(raw) and raw[j+1] == '{':
-                expr_depth += 1
-                j += 2
-                continue
-            if ch == '{' and expr_depth > 0:
-                expr_depth += 1
-            elif ch == '}' and expr_depth > 0:
-                expr_depth -= 1
-            elif ch == '`' and expr_depth == 0:
-                return i
-            j += 1
-    return None
-
-
-def find_all_templates(lines):
-    """Find all multi-line template literal regions."""
-    regions = []
-    i = 0
-    while i < len(lines):
-        raw = lines[i].rstrip('\n').rstrip('\r')
-        j = 0
-        in_sq = False
-        in_dq = False
-        
-        while j < len(raw):
-            ch = raw[j]
-            if ch == '\\' and j + 1 < len(raw):
-                j += 2
-                continue
-            if ch == "'" and not in_dq:
-                in_sq = not in_sq
-            elif ch == '"' and not in_sq:
-                in_dq = not in_dq
-            elif ch == '`' and not in_sq and not in_dq:
-                # Check if closes on same line
-                k = j + 1
-                closed = False
-                ed = 0
-                while k < len(raw):
-                    rch = raw[k]
-                    if rch == '\\' and k + 1 < len(raw):
-                        k += 2
-                        continue
-                    if rch == '$' and k + 1 < len(raw) and raw[k+1] == '{':
-                        ed += 1
-                        k += 2
-                        continue
-                    if rch == '{' and ed > 0:
-                        ed += 1
-                    elif rch == '}' and ed > 0:
-                        ed -= 1
-                    elif rch == '`' and ed == 0:
-                        closed = True
-                        break
-                    k += 1
-                
-                if not closed:
-                    backtick_indent = len(lines[i]) - len(lines[i].lstrip())
-                    end_line = find_closing_backtick(lines, i + 1)
-                    if end_line is not None:
-                        regions.append((i, end_line, backtick_indent))
-                        i = end_line
-                    break
-            j += 1
-        i += 1
-    return regions
+def find_all_templates(lines, index):
+    """Find all multi-line template literal regions as (start_line, end_line, backtick_indent)."""
+    return [(start, end, len(lines[start]) - len(lines[start].lstrip()))
+            for start, end in index.multiline_templates()]
 
 
-def is_in_template(line_num, regions):
-    """Check if a line number is inside any template region."""
-    for start, end, _ in regions:
-        if start < line_num <= end:
-            return True
-    return False
+def is_in_template(line_num, index):
+    """Check if a line starts inside template text."""
+    return index.line_in_template(line_num)
 
 
 def fix_file(filepath):
@@ -115,7 +40,7 @@ def fix_file(filepath):
     fixes = 0
     
     # Find all template regions
-    regions = find_all_templates(lines)
+    regions = find_all_templates(lines, ScopeIndex(''.join(lines)))
     
     # PART 1: Fix template literals - reduce by 4 more spaces for any still >= 24
     for start_line, end_line, backtick_indent in regions:
@@ -176,8 +101,8 @@ def fix_file(filepath):
             fixes += 1
     
     # PART 2: Fix non-template deeply nested code
-    # Re-find regions after template fixes
-    regions = find_all_templates(lines)
+    # Re-index after template fixes
+    index = ScopeIndex(''.join(lines))
     
     for i in range(len(lines)):
         raw = lines[i].rstrip('\n').rstrip('\r')
@@ -186,7 +111,7 @@ def fix_file(filepath):
             continue
         
         indent = len(raw) - len(raw.lstrip())
-        if indent >= 24 and not is_in_template(i, regions):
+        if indent >= 24 and not is_in_template(i, index):
             # This is non-template deeply nested code
             # Reduce by 4 spaces (one level)
             new_indent = indent - 4
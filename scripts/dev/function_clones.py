@@ -0,0 +1,321 @@
+#!/usr/bin/env python3
+"""
+Duplicate-function detector for js/.
+
+Every braced function found by the scope index is reduced to its token
+stream from the parameter list to the closing brace: whitespace and
+comments are gone and the function's own name is left out. Two hashes are
+taken of that stream:
+
+  exact    tokens as written - copies that differ only in formatting
+  renamed  the function's own parameters and declared locals alpha-renamed
+           in order of first use ($0, $1...), so copies that only rename
+           variables or parameters still match; free names (globals, called
+           functions, property names) are kept, so calling something else is
+           a real difference
+
+Near clones (edited copies) are found with MinHash over token 4-grams and
+locality-sensitive hashing: each function lands in a few buckets, only
+functions sharing a bucket are compared, and candidates are confirmed by
+the real Jaccard similarity of their 4-gram sets. Thousands of functions
+are indexed in linear time instead of being compared pairwise.
+
+A clone found inside functions that are themselves clones is not reported
+again.
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import re
+import sys
+import zlib
+from collections import defaultdict
+
+from scope_index import ScopeIndex
+
+JS_DIR = 'js'
+EXCLUDE_DIRS = {'node_modules', '.git', 'dist', 'coverage', 'archive'}
+MIN_TOKENS = 30
+THRESHOLD = 0.8
+SHINGLE = 4
+BANDS = 8
+ROWS = 4
+
+KEYWORDS = {
+    'async', 'await', 'break', 'case', 'catch', 'class', 'const', 'continue', 'debugger', 'default',
+    'delete', 'do', 'else', 'export', 'extends', 'false', 'finally', 'for', 'function', 'if', 'import',
+    'in', 'instanceof', 'let', 'new', 'null', 'of', 'return', 'static', 'super', 'switch', 'this',
+    'throw', 'true', 'try', 'typeof', 'undefined', 'var', 'void', 'while', 'with', 'yield', 'arguments',
+}
+_IDENT = re.compile(r'[A-Za-z_$][\w$]*')
+_BINS = BANDS * ROWS
+
+
+class FunctionInfo:
+    """One function and its fingerprints"""
+
+    def __init__(self, path, name, line, start, end, parent, tokens, local=()):
+        self.path = path
+        self.name = name or '(anonymous)'
+        self.line = line                  # 1-based, for reports
+        self.bytes = end - start
+        self.parent = parent              # (path, index) of the enclosing function
+        self.tokens = len(tokens)
+        renamed = normalize(tokens, local)
+        self.exact = _digest(tokens)
+        self.renamed = _digest(renamed)
+        self.shingles = shingles(renamed)
+
+    @property
+    def location(self):
+        return f'{self.path}:{self.line}'
+
+
+def _digest(tokens):
+    return hashlib.sha1('\x1f'.join(tokens).encode('utf-8')).hexdigest()
+
+
+def normalize(tokens, local):
+    """Alpha-rename the names in local; property names and free names are kept"""
+    names = {}
+    out = []
+    prev = None
+    for token in tokens:
+        original = token
+        if token in local and prev not in ('.', '?.'):
+            token = names.setdefault(token, f'${len(names)}')
+        out.append(token)
+        prev = original
+    return out
+
+
+def local_names(index, fn):
+    """
+    Names bound inside fn: its parameters, catch parameters, declarations in
+    its body and the parameters of functions and arrows nested in it.
+    """
+    begin = fn.params[0] if fn.params else fn.start
+    open_at, close_at = fn.body
+    names = {name for _, name, offset, _ in index.declarations if open_at < offset < close_at}
+    tokens = list(index.tokens(begin, close_at, offsets=True))
+    param_lists = {f.params[0]: f.params[1] for f in index.functions
+                   if f.params and begin <= f.params[0] < close_at}
+    for k, (offset, token) in enumerate(tokens[:-1]):
+        if token == ')' and tokens[k + 1][1] == '=>' and index.match(offset) is not None:
+            param_lists[index.match(offset)] = offset     # (a, b) => expression
+    params_end = -1
+    for k, (offset, token) in enumerate(tokens):
+        params_end = max(params_end, param_lists.get(offset, -1))
+        if not _IDENT.fullmatch(token) or token in KEYWORDS or not index.in_code(offset):
+            continue
+        prev = tokens[k - 1][1] if k else None
+        if offset < params_end and prev in ('(', ',', '...', '{', '['):
+            names.add(token)
+        elif k + 1 < len(tokens) and tokens[k + 1][1] == '=>':
+            names.add(token)                              # x => ...
+        elif prev == '(' and k > 1 and tokens[k - 2][1] == 'catch':
+            names.add(token)
+    return names
+
+
+def shingles(tokens, size=SHINGLE):
+    """crc32 of every token n-gram"""
+    if len(tokens) < size:
+        return {zlib.crc32('\x1f'.join(tokens).encode('utf-8'))}
+    return {zlib.crc32('\x1f'.join(tokens[i:i + size]).encode('utf-8'))
+            for i in range(len(tokens) - size + 1)}
+
+
+def signature(values):
+    """
+    One-permutation MinHash: each hashed n-gram falls into one of BANDS*ROWS
+    bins and every bin keeps its minimum, in one pass over the n-grams.
+    Empty bins borrow from the next filled bin to the right (densification).
+    """
+    bins = [None] * _BINS
+    for value in values:
+        value = (value * 0x9E3779B1) & 0xFFFFFFFF
+        slot, rest = value % _BINS, value // _BINS
+        if bins[slot] is None or rest < bins[slot]:
+            bins[slot] = rest
+    filled = [i for i, v in enumerate(bins) if v is not None]
+    for i, v in enumerate(bins):
+        if v is None:
+            j = next((j for j in filled if j > i), filled[0])
+            bins[i] = (j - i) % _BINS * (1 << 32) + bins[j]
+    return bins
+
+
+def jaccard(a, b):
+    return len(a & b) / len(a | b) if a or b else 1.0
+
+
+def get_js_files(root, js_dir=JS_DIR):
+    files = []
+    for directory, dirs, names in os.walk(os.path.join(root, js_dir)):
+        dirs[:] = sorted(d for d in dirs if d not in EXCLUDE_DIRS)
+        for name in sorted(names):
+            if name.endswith('.js'):
+                files.append(os.path.relpath(os.path.join(directory, name), root).replace(os.sep, '/'))
+    return files
+
+
+def extract_functions(root, path, min_tokens=MIN_TOKENS):
+    """FunctionInfo for every braced function in path with at least min_tokens tokens"""
+    with open(os.path.join(root, path), 'r', encoding='utf-8', errors='replace') as f:
+        text = f.read()
+    index = ScopeIndex(text)
+    functions = {}
+    for i, fn in enumerate(index.functions):
+        if fn.body[1] is None:
+            continue
+        begin = fn.params[0] if fn.params else fn.start
+        tokens = list(index.tokens(begin, fn.body[1] + 1))
+        if len(tokens) < min_tokens:
+            continue
+        parent = (path, fn.parent) if fn.parent is not None else None
+        functions[(path, i)] = FunctionInfo(path, fn.name, index.line_of(fn.start) + 1, fn.start,
+                                            fn.body[1] + 1, parent, tokens, local_names(index, fn))
+    return functions
+
+
+class _UnionFind:
+    def __init__(self):
+        self.parent = {}
+
+    def find(self, x):
+        self.parent.setdefault(x, x)
+        while self.parent[x] != x:
+            self.parent[x] = self.parent[self.parent[x]]
+            x = self.parent[x]
+        return x
+
+    def union(self, a, b):
+        self.parent[self.find(a)] = self.find(b)
+
+
+def _group_by(functions, attr):
+    groups = defaultdict(list)
+    for key, info in functions.items():
+        groups[getattr(info, attr)].append(key)
+    return [keys for keys in groups.values() if len(keys) > 1]
+
+
+def find_clones(functions, threshold=THRESHOLD):
+    """
+    Group functions into clone sets.
+
+    Returns a list of dicts with kind ('exact', 'renamed' or 'near'), the
+    similarity of the weakest confirmed pair, and the member keys.
+    """
+    groups = []
+    for keys in _group_by(functions, 'renamed'):
+        kind = 'exact' if len({functions[key].exact for key in keys}) == 1 else 'renamed'
+        groups.append({'kind': kind, 'similarity': 1.0, 'members': sorted(keys)})
+
+    # One representative per renamed group, then LSH buckets over those
+    copies = defaultdict(list)
+    for key, info in functions.items():
+        copies[info.renamed].append(key)
+    buckets = defaultdict(list)
+    for keys in copies.values():
+        sig = signature(functions[keys[0]].shingles)
+        for band in range(BANDS):
+            buckets[(band, tuple(sig[band * ROWS:(band + 1) * ROWS]))].append(keys[0])
+
+    near = _UnionFind()
+    edges = {}
+    for keys in buckets.values():
+        for i, a in enumerate(keys):
+            for b in keys[i + 1:]:
+                pair = (a, b) if a < b else (b, a)
+                if pair in edges:
+                    continue
+                edges[pair] = jaccard(functions[a].shingles, functions[b].shingles)
+                if edges[pair] >= threshold:
+                    near.union(a, b)
+
+    members = defaultdict(set)
+    weakest = {}
+    for (a, b), similarity in edges.items():
+        if similarity >= threshold:
+            root = near.find(a)
+            members[root].update(copies[functions[a].renamed] + copies[functions[b].renamed])
+            weakest[root] = min(weakest.get(root, 1.0), similarity)
+    for root, keys in members.items():
+        groups.append({'kind': 'near', 'similarity': round(weakest[root], 3), 'members': sorted(keys)})
+
+    # Exact and renamed copies inside a near group are reported as part of it
+    near_members = {key for group in groups if group['kind'] == 'near' for key in group['members']}
+    groups = [g for g in groups if g['kind'] == 'near' or not set(g['members']) <= near_members]
+
+    # Drop groups that only repeat clones of their enclosing functions
+    in_groups = {key for group in groups for key in group['members']}
+    groups = [g for g in groups
+              if not all(functions[key].parent in in_groups for key in g['members'])]
+    for group in groups:
+        sizes = sorted(functions[key].bytes for key in group['members'])
+        group['duplicate_bytes'] = sum(sizes[:-1])
+    groups.sort(key=lambda g: (-g['duplicate_bytes'], g['members']))
+    return groups
+
+
+def analyze(root='.', min_tokens=MIN_TOKENS, threshold=THRESHOLD):
+    """Index js/ and return (functions, groups)"""
+    functions = {}
+    for path in get_js_files(root):
+        functions.update(extract_functions(root, path, min_tokens))
+    return functions, find_clones(functions, threshold)
+
+
+def to_json(functions, groups):
+    return {
+        'functions': len(functions),
+        'groups': [dict(group, members=[{'file': functions[k].path, 'line': functions[k].line,
+                                         'name': functions[k].name, 'bytes': functions[k].bytes,
+                                         'tokens': functions[k].tokens} for k in group['members']])
+                   for group in groups],
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Find duplicated and near-duplicate functions in js/')
+    parser.add_argument('--root', default='.', help='Repository root')
+    parser.add_argument('--min-tokens', type=int, default=MIN_TOKENS, help='Ignore smaller functions')
+    parser.add_argument('--threshold', type=float, default=THRESHOLD, help='Near-clone Jaccard similarity')
+    parser.add_argument('--top', type=int, default=20, help='Groups to list (0 for all)')
+    parser.add_argument('--json', action='store_true', help='Print results as JSON')
+    args = parser.parse_args()
+
+    functions, groups = analyze(args.root, args.min_tokens, args.threshold)
+    if args.json:
+        print(json.dumps(to_json(functions, groups), indent=2))
+        return 0
+
+    print("=" * 60)
+    print("DUPLICATE FUNCTIONS")
+    print("=" * 60)
+    counts = defaultdict(int)
+    for group in groups:
+        counts[group['kind']] += 1
+    print(f"  - Functions indexed: {len(functions)} (>= {args.min_tokens} tokens)")
+    for kind in ('exact', 'renamed', 'near'):
+        print(f"  - {kind.capitalize()} clone groups: {counts[kind]}")
+    print(f"  - Duplicated code: {sum(g['duplicate_bytes'] for g in groups) / 1024:.1f} KB")
+
+    for group in groups[:args.top or None]:
+        label = group['kind'] if group['kind'] != 'near' else f"near ({group['similarity']:.0%})"
+        print(f"\n🔍 {label} clone, {len(group['members'])} copies, "
+              f"{group['duplicate_bytes'] / 1024:.1f} KB duplicated:")
+        for key in group['members']:
+            info = functions[key]
+            print(f"    - {info.location} {info.name} ({info.tokens} tokens)")
+    if not groups:
+        print("\n✅ No duplicate functions found!")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
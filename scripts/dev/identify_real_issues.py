@@ -1,116 +1,47 @@
 #!/usr/bin/env python3
 """
 Script to identify REAL issues that need fixing (not documentation).
+A view over the static_analysis.py comment-marker findings.
 """
-import os
-import re
+from collections import Counter
 from pathlib import Path
 
-# Patterns that indicate REAL issues
-real_issue_patterns = [
-    (r'TODO:', 'TODO comment'),
-    (r'FIXME:', 'FIXME comment'),
-    (r'XXX:', 'XXX comment'),
-    (r'HACK:', 'HACK comment'),
-    (r'@todo', 'JSDoc TODO'),
-    (r'@fixme', 'JSDoc FIXME'),
-    (r'@bug', 'JSDoc BUG'),
-    (r'@issue', 'JSDoc ISSUE'),
-    (r'not implemented', 'Not implemented'),
-    (r'not working', 'Not working'),
-    (r'broken', 'Broken feature'),
-    (r'bug:', 'Bug report'),
-    (r'known issue', 'Known issue'),
-    (r'workaround', 'Workaround needed'),
-    (r'temporary', 'Temporary solution'),
-    (r'placeholder', 'Placeholder code'),
-    (r'incomplete', 'Incomplete implementation'),
-    (r'missing implementation', 'Missing implementation'),
-    (r'needs fixing', 'Needs fixing'),
-    (r'needs to be', 'Needs to be'),
-]
+from static_analysis import analyze, select
 
-# Files to scan
-code_dirs = [
-    '/workspace/js',
-    '/workspace/css',
-    '/workspace/tests',
-]
+# Marker and note rules (TODO, FIXME, broken, workaround, ...) in comments
+real_issue_rules = ['todo-comment', 'unfinished-note']
 
-def scan_file_for_real_issues(filepath):
-    """Scan a single file for real issues."""
+# Files and directories to scan
+scan_paths = ['js', 'css', 'tests', 'index.html', 'story-engine.js', 'backstory-engine.js', 'styles.css']
+
+
+def collect_real_issues(report):
+    """One issue per line from the comment marker findings"""
     issues = []
-    
-    try:
-        with open(filepath, 'r', encoding='utf-8') as f:
-            content = f.read()
-            lines = content.split('\n')
-            
-        for i, line in enumerate(lines, 1):
-            line_stripped = line.strip()
-            
-            # Skip empty lines and comments-only lines
-            if not line_stripped or line_stripped.startswith('//') or line_stripped.startswith('/*'):
-                continue
-                
-            # Check for real issue patterns
-            for pattern, issue_type in real_issue_patterns:
-                if re.search(pattern, line, re.IGNORECASE):
-                    # Extract context
-                    context = line.strip()
-                    if len(context) > 150:
-                        context = context[:150] + '...'
-                    
-                    issues.append({
-                        'file': str(filepath.relative_to('/workspace')),
-                        'line': i,
-                        'type': issue_type,
-                        'context': context
-                    })
-                    break  # Only record once per line
-                    
-    except Exception as e:
-        print(f"Error reading {filepath}: {e}")
-        
+    seen = set()
+    for finding in select(report, real_issue_rules, under=scan_paths):
+        if (finding['file'], finding['line']) in seen:
+            continue
+        seen.add((finding['file'], finding['line']))
+        issues.append({
+            'file': finding['file'],
+            'line': finding['line'],
+            'type': finding['message'],
+            'context': finding['text']
+        })
     return issues
 
+
 def main():
     """Main function to scan all code files."""
     print("Scanning for REAL issues in code files...\n")
     
-    all_issues = []
-    
-    for code_dir in code_dirs:
-        dir_path = Path(code_dir)
-        if not dir_path.exists():
-            continue
-            
-        # Get all JS and CSS files
-        js_files = list(dir_path.glob('**/*.js'))
-        css_files = list(dir_path.glob('**/*.css'))
-        
-        for file_path in js_files + css_files:
-            issues = scan_file_for_real_issues(file_path)
-            if issues:
-                all_issues.extend(issues)
-                print(f"Found {len(issues)} issues in {file_path.relative_to('/workspace')}")
-    
-    # Also check main files
-    main_files = [
-        '/workspace/index.html',
-        '/workspace/story-engine.js',
-        '/workspace/backstory-engine.js',
-        '/workspace/styles.css',
-    ]
-    
-    for filepath in main_files:
-        path = Path(filepath)
-        if path.exists():
-            issues = scan_file_for_real_issues(path)
-            if issues:
-                all_issues.extend(issues)
-                print(f"Found {len(issues)} issues in {path.name}")
-    
+    report = analyze()
+    all_issues = collect_real_issues(report)
+    for path, count in sorted(Counter(issue['file'] for issue in all_issues).items()):
+        print(f"Found {count} issues in {path}")
+    print(f"({report['stats']['scanned']} files analyzed, {report['stats']['reused']} from cache)")
+
     # Group issues by type
     issues_by_type = {}
     for issue in all_issues:
@@ -150,7 +81,7 @@ def main():
         report_lines.append("")
     
     # Write report
-    report_path = Path('/workspace/REAL_ISSUES_REPORT.md')
+    report_path = Path('REAL_ISSUES_REPORT.md')
     with open(report_path, 'w', encoding='utf-8') as f:
         f.write('\n'.join(report_lines))
     
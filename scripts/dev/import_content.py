@@ -0,0 +1,312 @@
+#!/usr/bin/env python3
+"""
+Bulk content import for the story engine paragraph pools.
+
+Streams authored paragraphs from JSONL or CSV files and inserts them into the
+pools catalogued by content_pools.py, replacing the hand-edited expand_*.py
+scripts. Each record names a target pool and its text:
+
+    {"pool": "generateSocialParagraphs.middles", "text": "..."}
+    pool,text
+    lorePool,"..."
+
+Records are validated as they stream in:
+  - duplicates of anything already in any engine pool (or earlier in the
+    batch) are skipped via a set of normalized-text hashes
+  - ${...} placeholders are only accepted in template-literal pools inside a
+    generator function, and must start with a name in that function's scope
+  - [TOKEN] placeholders must already be used by the target pool
+  - word counts must fall inside the pool's bounds (by default half the
+    shortest to one and a half times the longest existing entry)
+
+Accepted paragraphs are written with one batched pass per engine file.
+"""
+
+import argparse
+import csv
+import hashlib
+import json
+import math
+import os
+import re
+import shutil
+import sys
+import tempfile
+import time
+from collections import Counter, defaultdict
+
+from content_pools import ENGINE_FILES, find_functions, load_pools, scope_names
+from js_literals import skip_string
+
+_EXPRESSION = re.compile(r'\$\{([^}]*)\}')
+_MEMBER_PATH = re.compile(r'^\s*([A-Za-z_$][\w$]*)(?:\s*\.\s*[A-Za-z_$][\w$]*)*\s*$')
+_TOKEN = re.compile(r'\[([A-Z][A-Z_]*)\]')
+_JSON_TYPES = {list: 'an array', int: 'a number', float: 'a number', bool: 'a boolean', type(None): 'null'}
+
+
+def normalize_hash(text):
+    """Hash used for duplicate detection: whitespace- and case-insensitive"""
+    normalized = ' '.join(text.split()).casefold()
+    return hashlib.blake2b(normalized.encode('utf-8'), digest_size=16).digest()
+
+
+def count_words(text):
+    """Words as rendered: each ${...} placeholder counts as one word"""
+    return len(_EXPRESSION.sub('X', text).split())
+
+
+def iter_records(path, default_pool=None):
+    """Yield (location, pool, text) from a JSONL or CSV file without loading it whole"""
+    if path.endswith('.csv'):
+        with open(path, 'r', encoding='utf-8', newline='') as f:
+            for row_number, row in enumerate(csv.DictReader(f), start=2):
+                yield f'{path}:{row_number}', (row.get('pool') or default_pool), row.get('text') or ''
+        return
+
+    with open(path, 'r', encoding='utf-8') as f:
+        for line_number, line in enumerate(f, start=1):
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                record = json.loads(line)
+            except ValueError as e:
+                yield f'{path}:{line_number}', None, ValueError(f"invalid JSON: {e}")
+                continue
+            if isinstance(record, str):
+                record = {'text': record}
+            if not isinstance(record, dict):
+                yield f'{path}:{line_number}', None, ValueError(
+                    f"expected an object or a string, got {_JSON_TYPES.get(type(record), 'a value')}")
+                continue
+            pool, text = record.get('pool') or default_pool, record.get('text') or ''
+            if pool is not None and not isinstance(pool, str):
+                pool, text = None, ValueError("'pool' must be a string")
+            elif not isinstance(text, str):
+                text = ValueError("'text' must be a string")
+            yield f'{path}:{line_number}', pool, text
+
+
+class PoolRules:
+    """Validation rules derived from one target pool"""
+
+    def __init__(self, pool, content, functions, min_words=None, max_words=None):
+        self.pool = pool
+        lengths = [count_words(entry) for entry in pool.value]
+        self.min_words = min_words if min_words is not None else math.floor(min(lengths) * 0.5)
+        self.max_words = max_words if max_words is not None else math.ceil(max(lengths) * 1.5)
+        self.tokens = {token for entry in pool.value for token in _TOKEN.findall(entry)}
+        self.quote = self._detect_quote(content)
+        self.allows_expressions = self.quote == '`' and pool.function is not None
+        self.scope = scope_names(content, functions, pool.function) if self.allows_expressions else set()
+        self.indent = self._detect_indent(content)
+
+    def _detect_quote(self, content):
+        quotes = Counter()
+        i = self.pool.start + 1
+        while i < self.pool.end:
+            if content[i] in '"\'`':
+                quotes[content[i]] += 1
+                i = skip_string(content, i)
+                continue
+            i += 1
+        return quotes.most_common(1)[0][0] if quotes else '"'
+
+    def _detect_indent(self, content):
+        first = self.pool.start + 1
+        while first < self.pool.end and content[first].isspace():
+            first += 1
+        line_start = content.rfind('\n', 0, first) + 1
+        return content[line_start:first] if content[line_start:first].isspace() else '  '
+
+    def problems(self, text):
+        """List the reasons text cannot go into this pool"""
+        problems = []
+        words = count_words(text)
+        if not self.min_words <= words <= self.max_words:
+            problems.append(f"{words} words (pool allows {self.min_words}-{self.max_words})")
+
+        for expression in _EXPRESSION.findall(text):
+            if not self.allows_expressions:
+                problems.append(f"${{{expression}}} not allowed in {self.pool.name}")
+                continue
+            match = _MEMBER_PATH.match(expression)
+            if not match:
+                problems.append(f"${{{expression}}} is not a simple property path")
+            elif match.group(1) not in self.scope:
+                problems.append(f"${{{expression}}}: '{match.group(1)}' is not in scope in {self.pool.function}")
+        if '${' in _EXPRESSION.sub('', text):
+            problems.append("unterminated ${ placeholder")
+
+        for token in _TOKEN.findall(text):
+            if token not in self.tokens:
+                problems.append(f"[{token}] is not a placeholder used by {self.pool.name}")
+        return problems
+
+    def literal(self, text):
+        """Serialize text as a JS string literal in the pool's quoting style"""
+        if self.quote == '`':
+            return '`' + text.replace('\\', '\\\\').replace('`', '\\`') + '`'
+        if self.quote == "'":
+            return "'" + text.replace('\\', '\\\\').replace("'", "\\'").replace('\n', '\\n') + "'"
+        return json.dumps(text, ensure_ascii=False)
+
+
+def plan_insertion(content, pool, literals, indent):
+    """Return (offset, text) that appends literals to the end of a pool array"""
+    last = pool.end - 1
+    while last > pool.start and content[last].isspace():
+        last -= 1
+    if last == pool.start:
+        closing_indent = indent[:-2] if len(indent) >= 2 else ''
+        body = ''.join(f'\n{indent}{lit},' for lit in literals).rstrip(',')
+        return pool.start + 1, body + '\n' + closing_indent
+    if content[last] == ',':
+        return last + 1, ''.join(f'\n{indent}{lit},' for lit in literals)
+    return last + 1, ''.join(f',\n{indent}{lit}' for lit in literals)
+
+
+def apply_insertions(content, insertions):
+    """Splice all (offset, text) insertions into content in a single pass"""
+    parts = []
+    cursor = 0
+    for offset, text in sorted(insertions):
+        parts.append(content[cursor:offset])
+        parts.append(text)
+        cursor = offset
+    parts.append(content[cursor:])
+    return ''.join(parts)
+
+
+def write_atomic(path, content):
+    """Replace path with content without ever leaving a partial file"""
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, tmp = tempfile.mkstemp(prefix='.import-', dir=directory)
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            f.write(content)
+        if os.path.exists(path):
+            shutil.copymode(path, tmp)
+        os.replace(tmp, path)
+    except BaseException:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+        raise
+
+
+def import_content(sources, engine_files=None, default_pool=None, min_words=None, max_words=None,
+                   dry_run=False):
+    """Validate, dedupe and insert every record from sources; returns a report dict"""
+    engine_files = engine_files or ENGINE_FILES
+    contents = {}
+    functions = {}
+    for path in engine_files:
+        with open(path, 'r', encoding='utf-8') as f:
+            contents[path] = f.read()
+        functions[path] = find_functions(contents[path])
+
+    pools = load_pools(engine_files)
+    seen = {normalize_hash(entry) for pool in pools.values() if pool.is_strings for entry in pool.value}
+    rules = {}
+    accepted = defaultdict(list)
+    rejected = []
+    duplicates = 0
+    total = 0
+
+    for source in sources:
+        for location, pool_name, text in iter_records(source, default_pool):
+            total += 1
+            if isinstance(text, Exception):
+                rejected.append({'location': location, 'pool': pool_name, 'problems': [str(text)]})
+                continue
+            text = text.strip()
+            pool = pools.get(pool_name)
+            if pool is None or not pool.is_strings:
+                rejected.append({'location': location, 'pool': pool_name,
+                                 'problems': [f"unknown paragraph pool: {pool_name!r}"]})
+                continue
+            if pool_name not in rules:
+                rules[pool_name] = PoolRules(pool, contents[pool.path], functions[pool.path],
+                                             min_words, max_words)
+            digest = normalize_hash(text)
+            if digest in seen:
+                duplicates += 1
+                continue
+            problems = rules[pool_name].problems(text)
+            if problems:
+                rejected.append({'location': location, 'pool': pool_name, 'problems': problems})
+                continue
+            seen.add(digest)
+            accepted[pool_name].append(text)
+
+    insertions = defaultdict(list)
+    for pool_name, texts in accepted.items():
+        pool = pools[pool_name]
+        rule = rules[pool_name]
+        insertions[pool.path].append(
+            plan_insertion(contents[pool.path], pool, [rule.literal(t) for t in texts], rule.indent)
+        )
+
+    if not dry_run:
+        for path, planned in insertions.items():
+            write_atomic(path, apply_insertions(contents[path], planned))
+
+    return {
+        'records': total,
+        'accepted': {name: len(texts) for name, texts in accepted.items()},
+        'duplicates': duplicates,
+        'rejected': rejected,
+        'files_written': [] if dry_run else sorted(insertions),
+    }
+
+
+def main():
+    """Main function"""
+    parser = argparse.ArgumentParser(description='Import authored paragraphs into the engine pools')
+    parser.add_argument('sources', nargs='+', help='JSONL or CSV files with pool/text records')
+    parser.add_argument('--pool', help='Target pool for records that do not name one')
+    parser.add_argument('--engine', action='append', help='Engine file to import into (repeatable)')
+    parser.add_argument('--min-words', type=int, help='Override the minimum word count')
+    parser.add_argument('--max-words', type=int, help='Override the maximum word count')
+    parser.add_argument('--dry-run', action='store_true', help='Validate only, do not write')
+    parser.add_argument('--rejects', help='Write rejected records to this JSONL file')
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    report = import_content(args.sources, args.engine, args.pool, args.min_words, args.max_words,
+                            args.dry_run)
+    elapsed = time.perf_counter() - started
+
+    print("=" * 60)
+    print("Content Import")
+    print("=" * 60)
+    print(f"  - Records read: {report['records']:,}")
+    print(f"  - Accepted: {sum(report['accepted'].values()):,}")
+    for name, count in sorted(report['accepted'].items()):
+        print(f"      {name}: +{count}")
+    print(f"  - Duplicates skipped: {report['duplicates']:,}")
+    print(f"  - Rejected: {len(report['rejected']):,}")
+    for item in report['rejected'][:10]:
+        print(f"      ❌ {item['location']}: {'; '.join(item['problems'])}")
+    if len(report['rejected']) > 10:
+        print(f"      ... and {len(report['rejected']) - 10} more")
+    if args.dry_run:
+        print("  - Dry run: no files written")
+    else:
+        for path in report['files_written']:
+            print(f"  ✅ Updated {path}")
+        if 'story-engine.js' in report['files_written']:
+            print("  - Rebuild the content pack: python3 scripts/dev/build_content_pack.py")
+    print(f"  - Finished in {elapsed:.2f}s")
+
+    if args.rejects and report['rejected']:
+        with open(args.rejects, 'w', encoding='utf-8') as f:
+            for item in report['rejected']:
+                f.write(json.dumps(item, ensure_ascii=False) + '\n')
+        print(f"  - Rejected records written to {args.rejects}")
+
+    return 1 if report['rejected'] else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
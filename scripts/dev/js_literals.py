@@ -0,0 +1,214 @@
+#!/usr/bin/env python3
+"""
+Helpers for reading JavaScript literals out of the engine sources.
+Strings, template literals and comments are skipped while matching brackets,
+so prose inside content pools never confuses the block boundaries.
+"""
+
+import json
+import re
+
+OPENERS = {'{': '}', '[': ']', '(': ')'}
+CLOSERS = {'}', ']', ')'}
+
+_IDENT = re.compile(r'[A-Za-z_$][\w$]*')
+_NUMBER = re.compile(r'-?(?:0[xX][0-9a-fA-F]+|\d+(?:\.\d+)?(?:[eE][+-]?\d+)?|\.\d+)')
+_SIMPLE_ESCAPES = {
+    'n': '\n', 't': '\t', 'r': '\r', 'b': '\b', 'f': '\f', 'v': '\v', '0': '\0',
+}
+
+
+def skip_string(text, pos):
+    """Return the index just past the string or template literal opening at pos"""
+    quote = text[pos]
+    i = pos + 1
+    length = len(text)
+    while i < length:
+        ch = text[i]
+        if ch == '\\':
+            i += 2
+            continue
+        if ch == quote:
+            return i + 1
+        if quote == '`' and ch == '$' and text.startswith('${', i):
+            i = find_matching(text, i + 1) + 1
+            continue
+        if ch == '\n' and quote != '`':
+            raise ValueError(f"Unterminated string literal at offset {pos}")
+        i += 1
+    raise ValueError(f"Unterminated string literal at offset {pos}")
+
+
+def skip_comment(text, pos):
+    """Return the index past a comment starting at pos, or pos if there is none"""
+    if text.startswith('//', pos):
+        end = text.find('\n', pos)
+        return len(text) if end == -1 else end
+    if text.startswith('/*', pos):
+        end = text.find('*/', pos + 2)
+        if end == -1:
+            raise ValueError(f"Unterminated comment at offset {pos}")
+        return end + 2
+    return pos
+
+
+def find_matching(text, pos):
+    """Return the index of the bracket that closes the opener at pos"""
+    stack = [OPENERS[text[pos]]]
+    i = pos + 1
+    length = len(text)
+    while i < length:
+        ch = text[i]
+        if ch in '"\'`':
+            i = skip_string(text, i)
+            continue
+        if ch == '/':
+            after = skip_comment(text, i)
+            if after != i:
+                i = after
+                continue
+        if ch in OPENERS:
+            stack.append(OPENERS[ch])
+        elif ch in CLOSERS:
+            if ch != stack.pop():
+                raise ValueError(f"Mismatched '{ch}' at offset {i}")
+            if not stack:
+                return i
+        i += 1
+    raise ValueError(f"Unbalanced '{text[pos]}' at offset {pos}")
+
+
+def find_block(text, marker, start=0):
+    """Find the first {...} or [...] block after marker; returns (open, close) or None"""
+    at = text.find(marker, start)
+    if at == -1:
+        return None
+    i = at + len(marker)
+    while i < len(text) and text[i] not in '{[':
+        i += 1
+    if i >= len(text):
+        return None
+    return i, find_matching(text, i)
+
+
+def decode_string(body):
+    """Decode the escape sequences of a JS string body"""
+    if '\\' not in body:
+        return body
+    out = []
+    i = 0
+    while i < len(body):
+        ch = body[i]
+        if ch != '\\' or i + 1 >= len(body):
+            out.append(ch)
+            i += 1
+            continue
+        nxt = body[i + 1]
+        if nxt in _SIMPLE_ESCAPES:
+            out.append(_SIMPLE_ESCAPES[nxt])
+            i += 2
+        elif nxt == 'u' and body.startswith('{', i + 2):
+            end = body.index('}', i + 3)
+            out.append(chr(int(body[i + 3:end], 16)))
+            i = end + 1
+        elif nxt == 'u':
+            out.append(json.loads('"' + body[i:i + 6] + '"'))
+            i += 6
+        elif nxt == 'x':
+            out.append(chr(int(body[i + 2:i + 4], 16)))
+            i += 4
+        elif nxt == '\n':
+            i += 2
+        else:
+            out.append(nxt)
+            i += 2
+    return ''.join(out)
+
+
+def skip_space(text, pos):
+    """Skip whitespace and comments"""
+    while pos < len(text):
+        if text[pos].isspace():
+            pos += 1
+            continue
+        after = skip_comment(text, pos)
+        if after == pos:
+            break
+        pos = after
+    return pos
+
+
+def parse_literal(text, pos=0):
+    """
+    Parse the JS object/array/string/number literal at pos.
+
+    Template literals are returned with their ${...} expressions left in place,
+    which is how the content pools use them. Returns (value, end_offset) and
+    raises ValueError on anything that is not plain data.
+    """
+    pos = skip_space(text, pos)
+    if pos >= len(text):
+        raise ValueError("Unexpected end of input")
+    ch = text[pos]
+
+    if ch in '"\'`':
+        end = skip_string(text, pos)
+        return decode_string(text[pos + 1:end - 1]), end
+
+    if ch == '[':
+        items = []
+        pos = skip_space(text, pos + 1)
+        while text[pos] != ']':
+            value, pos = parse_literal(text, pos)
+            items.append(value)
+            pos = skip_space(text, pos)
+            if text[pos] == ',':
+                pos = skip_space(text, pos + 1)
+            elif text[pos] != ']':
+                raise ValueError(f"Expected ',' or ']' at offset {pos}")
+        return items, pos + 1
+
+    if ch == '{':
+        obj = {}
+        pos = skip_space(text, pos + 1)
+        while text[pos] != '}':
+            if text[pos] in '"\'':
+                key, pos = parse_literal(text, pos)
+            else:
+                match = _IDENT.match(text, pos) or _NUMBER.match(text, pos)
+                if not match:
+                    raise ValueError(f"Expected property name at offset {pos}")
+                key, pos = match.group(0), match.end()
+            pos = skip_space(text, pos)
+            if text[pos] != ':':
+                raise ValueError(f"Expected ':' after '{key}' at offset {pos}")
+            obj[key], pos = parse_literal(text, pos + 1)
+            pos = skip_space(text, pos)
+            if text[pos] == ',':
+                pos = skip_space(text, pos + 1)
+            elif text[pos] != '}':
+                raise ValueError(f"Expected ',' or '}}' at offset {pos}")
+        return obj, pos + 1
+
+    match = _NUMBER.match(text, pos)
+    if match:
+        literal = match.group(0)
+        if literal.lower().startswith(('0x', '-0x')):
+            return int(literal, 16), match.end()
+        number = float(literal)
+        return (int(number) if number.is_integer() and '.' not in literal else number), match.end()
+
+    match = _IDENT.match(text, pos)
+    if match and match.group(0) in ('true', 'false', 'null', 'undefined'):
+        return {'true': True, 'false': False}.get(match.group(0)), match.end()
+
+    raise ValueError(f"Unsupported literal at offset {pos}: {text[pos:pos + 30]!r}")
+
+
+def read_literal(text, marker, start=0):
+    """Parse the block that follows marker, or return None when marker is absent"""
+    block = find_block(text, marker, start)
+    if block is None:
+        return None
+    value, _ = parse_literal(text, block[0])
+    return value
@@ -0,0 +1,383 @@
+#!/usr/bin/env python3
+"""
+Load generator for the static site and its service-worker path.
+
+Replays reader sessions against a server with asyncio, many sessions at
+once. A session does what a browser does for index.html:
+  - initial: the page, then its same-origin scripts and stylesheets on up to
+    --connections keep-alive connections, then /sw.js
+  - sw-install: the service worker's urlsToCache list (cache.addAll)
+  - lazy: --lazy modules from the LazyLoader manifest
+    (js/utils/lazy-loader.js), each fetched the way loadModule does: the
+    stylesheets, then the scripts, one after another
+  - repeat: --repeat later visits to the page and the same lazy modules
+
+sw.js is network-first, so a repeat visit still asks the server for every
+asset; what the cache changes is that the client now holds validators and
+the server answers 304 Not Modified. Repeat visits send If-None-Match
+(or If-Modified-Since) for everything fetched before.
+
+The paths come from the tree at --root. Without --url the tree is served
+by the tests' StaticServer in a child process, so the server does not
+share the generator's interpreter. The report has requests/sec, latency
+percentiles overall and per phase, and bytes transferred per session
+(headers included, as received on the wire).
+"""
+
+import argparse
+import asyncio
+import json
+import multiprocessing
+import os
+import random
+import statistics
+import sys
+import threading
+import time
+import urllib.parse
+
+from js_literals import read_literal
+from module_manifest import scan_html
+
+ROOT = os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
+HTML_PATH = 'index.html'
+SERVICE_WORKER_PATH = 'sw.js'
+LAZY_LOADER_PATH = 'js/utils/lazy-loader.js'
+PHASES = ('initial', 'sw-install', 'lazy', 'repeat')
+PERCENTILES = (50, 90, 95, 99)
+ACCEPT_ENCODING = 'gzip, deflate, br'
+DEFAULT_SESSIONS = 50
+DEFAULT_CONCURRENCY = 10
+DEFAULT_CONNECTIONS = 6
+DEFAULT_LAZY = 2
+DEFAULT_REPEAT = 1
+DEFAULT_TIMEOUT = 10
+
+
+def _read(root, path):
+    try:
+        with open(os.path.join(root, path), encoding='utf-8') as f:
+            return f.read()
+    except OSError:
+        return None
+
+
+def _local(src):
+    """Root-relative path of a same-origin URL, or None for other origins"""
+    parts = urllib.parse.urlsplit(src)
+    if parts.scheme or src.startswith('//'):
+        return None
+    return parts.path.lstrip('/')
+
+
+def load_plan(root=ROOT):
+    """The paths a reader session requests, read from the tree at root"""
+    html = _read(root, HTML_PATH)
+    if html is None:
+        raise FileNotFoundError(os.path.join(root, HTML_PATH))
+    page = scan_html(html)
+    assets = []
+    for src in page['scripts'] + page['stylesheets']:
+        path = _local(src)
+        if path and path not in assets:
+            assets.append(path)
+
+    worker = _read(root, SERVICE_WORKER_PATH)
+    precache = []
+    if worker is not None:
+        for url in read_literal(worker, 'const urlsToCache') or []:
+            path = _local(url)
+            if path is not None and path not in precache:
+                precache.append(path)
+
+    lazy = {}
+    loader = _read(root, LAZY_LOADER_PATH)
+    if loader is not None:
+        for name, spec in (read_literal(loader, 'const modules') or {}).items():
+            lazy[name] = list(spec.get('css', [])) + list(spec.get('files', []))
+    return {'page': '', 'assets': assets, 'service_worker': SERVICE_WORKER_PATH if worker is not None else None,
+            'precache': precache, 'lazy': lazy}
+
+
+class Connection:
+    """One keep-alive HTTP/1.1 connection driven by asyncio streams"""
+
+    def __init__(self, host, port, timeout=DEFAULT_TIMEOUT):
+        self.host = host
+        self.port = port
+        self.timeout = timeout
+        self.reader = None
+        self.writer = None
+        self.opened = 0
+
+    async def request(self, target, headers):
+        """(status, response headers, bytes received) for a GET of target"""
+        for attempt in (0, 1):
+            reused = self.writer is not None
+            if not reused:
+                self.reader, self.writer = await asyncio.wait_for(
+                    asyncio.open_connection(self.host, self.port), self.timeout)
+                self.opened += 1
+            lines = [f'GET {target} HTTP/1.1', f'Host: {self.host}:{self.port}']
+            lines += [f'{name}: {value}' for name, value in headers.items()]
+            try:
+                self.writer.write(('\r\n'.join(lines) + '\r\n\r\n').encode('latin-1'))
+                await self.writer.drain()
+                status, response_headers, size = await asyncio.wait_for(self._response(), self.timeout)
+            except (ConnectionError, asyncio.IncompleteReadError):
+                self.close()
+                if attempt or not reused:
+                    raise
+                continue
+            if response_headers.get('connection', '').lower() == 'close':
+                self.close()
+            return status, response_headers, size
+
+    async def _response(self):
+        head = await self.reader.readuntil(b'\r\n\r\n')
+        lines = head.decode('latin-1').split('\r\n')
+        status = int(lines[0].split()[1])
+        headers = {}
+        for line in lines[1:]:
+            if ':' in line:
+                name, value = line.split(':', 1)
+                headers[name.strip().lower()] = value.strip()
+        size = len(head)
+        if status in (204, 304) or status < 200:
+            return status, headers, size
+        if headers.get('transfer-encoding', '').lower() == 'chunked':
+            while True:
+                line = await self.reader.readuntil(b'\r\n')
+                length = int(line.split(b';')[0], 16)
+                size += len(line) + len(await self.reader.readexactly(length + 2))
+                if length == 0:
+                    break
+        elif 'content-length' in headers:
+            size += len(await self.reader.readexactly(int(headers['content-length'])))
+        else:
+            size += len(await self.reader.read())
+            headers['connection'] = 'close'
+        return status, headers, size
+
+    def close(self):
+        if self.writer is not None:
+            self.writer.close()
+        self.reader = self.writer = None
+
+
+class ReaderSession:
+    """One simulated reader: its connections, cached validators and request records"""
+
+    def __init__(self, base_url, plan, rng, connections=DEFAULT_CONNECTIONS, timeout=DEFAULT_TIMEOUT):
+        parts = urllib.parse.urlsplit(base_url)
+        self.prefix = parts.path.rstrip('/')
+        self.plan = plan
+        self.rng = rng
+        self.connections = [Connection(parts.hostname, parts.port or 80, timeout) for _ in range(connections)]
+        self.validators = {}
+        self.records = []
+        self._pool = None
+
+    async def run(self, lazy=DEFAULT_LAZY, repeat=DEFAULT_REPEAT):
+        self._pool = asyncio.Queue()
+        for connection in self.connections:
+            self._pool.put_nowait(connection)
+        try:
+            await self.visit('initial')
+            if self.plan['service_worker']:
+                await self.fetch_all(self.plan['precache'], 'sw-install')
+            groups = self.rng.sample(sorted(self.plan['lazy']), min(lazy, len(self.plan['lazy'])))
+            await self.open_modules(groups, 'lazy')
+            for _ in range(repeat):
+                await self.visit('repeat')
+                await self.open_modules(groups, 'repeat')
+        finally:
+            for connection in self.connections:
+                connection.close()
+        return self.records
+
+    async def visit(self, phase):
+        """The page, its assets in parallel, then the service worker script"""
+        await self.fetch(self.plan['page'], phase)
+        await self.fetch_all(self.plan['assets'], phase)
+        if self.plan['service_worker']:
+            await self.fetch(self.plan['service_worker'], phase)
+
+    async def open_modules(self, groups, phase):
+        """LazyLoader.loadModule for each group: its files one after another"""
+        for group in groups:
+            for path in self.plan['lazy'][group]:
+                await self.fetch(path, phase)
+
+    async def fetch_all(self, paths, phase):
+        await asyncio.gather(*(self.fetch(path, phase) for path in paths))
+
+    async def fetch(self, path, phase):
+        connection = await self._pool.get()
+        headers = {'Accept-Encoding': ACCEPT_ENCODING}
+        etag, modified = self.validators.get(path, (None, None))
+        if etag:
+            headers['If-None-Match'] = etag
+        elif modified:
+            headers['If-Modified-Since'] = modified
+        record = {'phase': phase, 'path': path, 'status': 0, 'bytes': 0, 'error': None}
+        start = time.perf_counter()
+        try:
+            status, response_headers, size = await connection.request(f'{self.prefix}/{path}', headers)
+            record.update(status=status, bytes=size)
+            if status == 200:
+                self.validators[path] = (response_headers.get('etag'), response_headers.get('last-modified'))
+        except (OSError, asyncio.TimeoutError, asyncio.IncompleteReadError, ValueError, IndexError) as e:
+            connection.close()
+            record['error'] = f'{type(e).__name__}: {e}' if str(e) else type(e).__name__
+        finally:
+            record['latency'] = time.perf_counter() - start
+            self._pool.put_nowait(connection)
+        self.records.append(record)
+        return record
+
+
+def percentile(ordered, p):
+    """Nearest-rank percentile of a sorted list"""
+    if not ordered:
+        return 0.0
+    return ordered[max(0, min(len(ordered) - 1, -(-len(ordered) * p // 100) - 1))]
+
+
+def _latencies(records):
+    ordered = sorted(record['latency'] * 1000 for record in records)
+    stats = {f'p{p}': round(percentile(ordered, p), 2) for p in PERCENTILES}
+    stats['max'] = round(ordered[-1], 2) if ordered else 0.0
+    stats['mean'] = round(statistics.mean(ordered), 2) if ordered else 0.0
+    return stats
+
+
+def summarize(sessions, wall):
+    """Throughput, latency percentiles and bytes per session for a list of session records"""
+    records = [record for session in sessions for record in session]
+    failed = [record for record in records if record['error'] or record['status'] >= 400]
+    per_session = [sum(record['bytes'] for record in session) for session in sessions]
+    phases = {}
+    for phase in PHASES:
+        selected = [record for record in records if record['phase'] == phase]
+        if selected:
+            phases[phase] = {
+                'requests': len(selected),
+                'bytes': sum(record['bytes'] for record in selected),
+                'not_modified': sum(1 for record in selected if record['status'] == 304),
+                'latency_ms': _latencies(selected),
+            }
+    return {
+        'sessions': len(sessions),
+        'requests': len(records),
+        'wall': round(wall, 3),
+        'rps': round(len(records) / wall, 1) if wall else 0.0,
+        'errors': len(failed),
+        'failed_paths': sorted({record['path'] or '/' for record in failed}),
+        'bytes': sum(per_session),
+        'bytes_per_session': {
+            'mean': round(statistics.mean(per_session)) if per_session else 0,
+            'min': min(per_session, default=0),
+            'max': max(per_session, default=0),
+        },
+        'latency_ms': _latencies(records),
+        'phases': phases,
+    }
+
+
+async def _run(base_url, plan, sessions, concurrency, connections, lazy, repeat, seed, timeout):
+    results = [None] * sessions
+    pending = iter(range(sessions))
+
+    async def worker():
+        for index in pending:
+            session = ReaderSession(base_url, plan, random.Random(seed + index), connections, timeout)
+            results[index] = await session.run(lazy, repeat)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(max(1, min(concurrency, sessions)))))
+    return summarize(results, time.perf_counter() - start)
+
+
+def run_load(base_url, plan, sessions=DEFAULT_SESSIONS, concurrency=DEFAULT_CONCURRENCY,
+             connections=DEFAULT_CONNECTIONS, lazy=DEFAULT_LAZY, repeat=DEFAULT_REPEAT, seed=0,
+             timeout=DEFAULT_TIMEOUT):
+    """Run sessions reader sessions, at most concurrency at a time, and return the report"""
+    return asyncio.run(_run(base_url, plan, sessions, concurrency, connections, lazy, repeat, seed, timeout))
+
+
+def _serve(root, urls):
+    sys.path.insert(0, os.path.join(ROOT, 'tests', 'python'))
+    from static_server import StaticServer
+    server = StaticServer(root).start()
+    urls.put(server.url)
+    threading.Event().wait()
+
+
+def main():
+    """Main function"""
+    parser = argparse.ArgumentParser(description='Replay reader sessions against the static site')
+    parser.add_argument('--url', help='Server to load (default: serve --root in a child process)')
+    parser.add_argument('--root', default=ROOT, help='Tree the session paths are read from')
+    parser.add_argument('-n', '--sessions', type=int, default=DEFAULT_SESSIONS, help='Reader sessions in total')
+    parser.add_argument('-c', '--concurrency', type=int, default=DEFAULT_CONCURRENCY,
+                        help='Sessions running at once')
+    parser.add_argument('--connections', type=int, default=DEFAULT_CONNECTIONS,
+                        help='Keep-alive connections per session')
+    parser.add_argument('--lazy', type=int, default=DEFAULT_LAZY, help='LazyLoader modules each reader opens')
+    parser.add_argument('--repeat', type=int, default=DEFAULT_REPEAT, help='Repeat visits per session')
+    parser.add_argument('--seed', type=int, default=0, help='Seed for the lazy module choice')
+    parser.add_argument('--timeout', type=float, default=DEFAULT_TIMEOUT, help='Per-request timeout in seconds')
+    parser.add_argument('--json', action='store_true', help='Print the report as JSON')
+    args = parser.parse_args()
+
+    plan = load_plan(args.root)
+    server = None
+    url = args.url
+    if url is None:
+        context = multiprocessing.get_context('spawn')
+        urls = context.Queue()
+        server = context.Process(target=_serve, args=(args.root, urls), daemon=True)
+        server.start()
+        url = urls.get(timeout=10)
+    try:
+        report = run_load(url, plan, args.sessions, args.concurrency, args.connections, args.lazy,
+                          args.repeat, args.seed, args.timeout)
+    finally:
+        if server is not None:
+            server.terminate()
+            server.join()
+    report['url'] = url
+
+    if args.json:
+        print(json.dumps(report, indent=2))
+        return 1 if report['errors'] else 0
+
+    print("=" * 60)
+    print("Load Generator")
+    print("=" * 60)
+    print(f"  - Target: {url}")
+    print(f"  - Sessions: {report['sessions']} ({args.concurrency} at once, {args.connections} connections each)")
+    print(f"  - Session: {len(plan['assets']) + 1} page requests, {len(plan['precache'])} precached, "
+          f"{args.lazy} lazy module(s), {args.repeat} repeat visit(s)")
+    print(f"\n📊 {report['requests']} requests in {report['wall']:.2f}s: {report['rps']:.1f} req/s")
+    latency = report['latency_ms']
+    print("  - Latency: " + ', '.join(f"p{p} {latency[f'p{p}']:.1f} ms" for p in PERCENTILES)
+          + f", max {latency['max']:.1f} ms")
+    per_session = report['bytes_per_session']
+    print(f"  - Bytes per session: {per_session['mean'] / 1024:.1f} KB "
+          f"(min {per_session['min'] / 1024:.1f}, max {per_session['max'] / 1024:.1f})")
+    print("\n📦 Phases:")
+    for phase, stats in report['phases'].items():
+        print(f"  - {phase:10s} {stats['requests']:6d} requests, {stats['bytes'] / 1024:9.1f} KB, "
+              f"{stats['not_modified']:5d} not modified, p50 {stats['latency_ms']['p50']:.1f} ms, "
+              f"p95 {stats['latency_ms']['p95']:.1f} ms")
+    if report['errors']:
+        print(f"\n❌ {report['errors']} failed request(s): {', '.join(report['failed_paths'][:10])}")
+        return 1
+    print("\n✅ No failed requests")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
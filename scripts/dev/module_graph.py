@@ -0,0 +1,469 @@
+#!/usr/bin/env python3
+"""
+Module dependency graph for the front-end scripts.
+
+The nodes are every script under js/, the story engines (and their packed
+build), each <script> tag in index.html (including inline blocks and CDN
+scripts) and the inline event handlers of index.html. The modules are classic
+scripts sharing one global scope, so the edges are global names: a module
+that references a name another module defines (top-level declaration or
+window.X assignment) depends on it.
+
+Each reference is classified:
+  - load: executed while the script is evaluated (top level or inside an
+    IIFE), so the provider must be loaded first
+  - runtime: inside a function body, needed only once that code runs
+  - optional: the file checks `typeof Name` before using it, so a missing
+    provider is tolerated and the edge does not pull the provider in
+
+From the graph the tool computes the transitive closure of the critical
+path (the scripts index.html loads eagerly), its raw/gzip/brotli transfer
+size, a topological load order, scripts whose load-time dependencies are
+tagged later in index.html, and the modules in the LazyLoader manifest
+(js/utils/lazy-loader.js) that the critical path pulls in anyway.
+"""
+
+import argparse
+import bisect
+import gzip
+import heapq
+import json
+import os
+import re
+import sys
+from collections import defaultdict
+
+from js_literals import find_block, find_matching, parse_literal
+from static_analysis import EXCLUDE_DIRS, tokenize
+
+HTML_PATH = 'index.html'
+LAZY_LOADER_PATH = 'js/utils/lazy-loader.js'
+SCRIPT_ROOTS = ['js', 'story-engine.js', 'backstory-engine.js', 'story-content-pack.js',
+                'story-engine.packed.js']
+HANDLERS = f'{HTML_PATH}#handlers'
+
+_SCRIPT_TAG = re.compile(r'<script\b([^>]*)>(.*?)</script\s*>', re.S | re.I)
+_SRC = re.compile(r'\bsrc\s*=\s*["\']([^"\']+)["\']', re.I)
+_HANDLER = re.compile(r'\bon[a-z]+\s*=\s*"([^"]*)"|\bon[a-z]+\s*=\s*\'([^\']*)\'', re.I)
+_TOP_LEVEL = re.compile(r'\b(?:const|let|var|function\*?|class)\s+([A-Za-z_$][\w$]*)')
+_ANY_DECLARATION = re.compile(r'\b(?:const|let|var|function\*?|class)\s+([A-Za-z_$][\w$]*)')
+_WINDOW_EXPORT = re.compile(r'\bwindow\.([A-Za-z_$][\w$]*)\s*=(?!=)')
+_REFERENCE = re.compile(r'(?<![\w$])(window\s*\.\s*)?([A-Za-z_$][\w$]*)')
+_TYPEOF = re.compile(r'\btypeof\s+(?:window\s*\.\s*)?([A-Za-z_$][\w$]*)')
+# A function or method head up to its parameter list, or an arrow up to its body
+_CALLABLE_HEAD = re.compile(r'\bfunction\b[\s*]*(?:[A-Za-z_$][\w$]*\s*)?\(|(?<![\w$])[A-Za-z_$][\w$]*\s*\(|=>\s*\{')
+_RANK = {'optional': 0, 'runtime': 1, 'load': 2}
+_NOT_FUNCTIONS = {'if', 'for', 'while', 'switch', 'catch', 'with', 'return', 'typeof'}
+
+
+class Module:
+    """One node of the graph: a script file, an inline block or a CDN script"""
+
+    def __init__(self, name, kind, path=None, code=None, html_index=None, raw=b''):
+        self.name = name
+        self.kind = kind                # 'script', 'inline', 'handlers', 'external', 'unlisted'
+        self.path = path
+        self.code = code
+        self.html_index = html_index    # position in index.html, None when not tagged
+        self.raw = raw
+        self.sizes = transfer_sizes(raw) if raw else {'raw': 0, 'gzip': 0}
+        self.defines = set()
+        self.declared = set()
+        self.references = {}            # name -> 'load' | 'runtime' | 'optional'
+        self.definition_sites = []      # (name, offset, 'declaration' | 'window')
+        self.reference_sites = []       # (name, offset, 'load' | 'runtime' | 'optional')
+
+    def __repr__(self):
+        return f"Module({self.name!r}, {self.kind!r})"
+
+
+def transfer_sizes(data, with_brotli=True):
+    """Raw, gzip and (when the brotli module is installed) brotli byte counts"""
+    sizes = {'raw': len(data), 'gzip': len(gzip.compress(data, 9))}
+    if not with_brotli:
+        return sizes
+    try:
+        import brotli
+        sizes['brotli'] = len(brotli.compress(data))
+    except ImportError:
+        pass
+    return sizes
+
+
+def parse_script_tags(html):
+    """(src or None, inline code, offset) for every <script> outside HTML comments"""
+    code, _ = tokenize(html, 'html')
+    tags = []
+    for match in _SCRIPT_TAG.finditer(code):
+        src = _SRC.search(match.group(1))
+        if src:
+            tags.append((src.group(1).split('?')[0].split('#')[0], None, match.start()))
+        else:
+            tags.append((None, html[match.start(2):match.end(2)], match.start()))
+    return tags
+
+
+def parse_lazy_manifest(content):
+    """Map file -> LazyLoader group from the modules object in lazy-loader.js"""
+    block = find_block(content, 'const modules')
+    if block is None:
+        return {}
+    modules, _ = parse_literal(content, block[0])
+    return {path: group for group, spec in modules.items() for path in spec.get('files', [])}
+
+
+def _deferred_spans(code):
+    """Bodies of functions that do not run at load time (IIFE bodies do)"""
+    spans = []
+    for match in _CALLABLE_HEAD.finditer(code):
+        head = match.group(0)
+        name = re.match(r'[A-Za-z_$][\w$]*', head)
+        if name and name.group(0) in _NOT_FUNCTIONS:
+            continue
+        open_at = match.end() - 1
+        try:
+            if head.endswith('('):
+                # Balanced match: default parameters such as `options = {}` hold braces
+                open_at = find_matching(code, open_at) + 1
+                while open_at < len(code) and code[open_at].isspace():
+                    open_at += 1
+                if not code.startswith('{', open_at):
+                    continue
+            close = find_matching(code, open_at)
+        except ValueError:
+            continue
+        after = code[close + 1:close + 12].lstrip()
+        if after.startswith('(') or (after.startswith(')') and after[1:].lstrip().startswith('(')):
+            continue
+        spans.append((open_at, close))
+    return spans
+
+
+def _top_level_offsets(code):
+    """Offsets at brace depth 0, as a predicate"""
+    depth_changes = [(m.start(), 1 if m.group(0) == '{' else -1) for m in re.finditer(r'[{}]', code)]
+    positions = [p for p, _ in depth_changes]
+    depths = []
+    depth = 0
+    for _, delta in depth_changes:
+        depth += delta
+        depths.append(depth)
+
+    def at_top(offset):
+        i = bisect.bisect_right(positions, offset) - 1
+        return i < 0 or depths[i] == 0
+    return at_top
+
+
+def scan_module(module):
+    """Fill defines, declared and references from the module's code view"""
+    code = module.code
+    at_top = _top_level_offsets(code)
+    if module.kind != 'handlers':
+        for match in _TOP_LEVEL.finditer(code):
+            if at_top(match.start()):
+                module.defines.add(match.group(1))
+                module.definition_sites.append((match.group(1), match.start(1), 'declaration'))
+        for match in _WINDOW_EXPORT.finditer(code):
+            module.defines.add(match.group(1))
+            module.definition_sites.append((match.group(1), match.start(1), 'window'))
+        module.definition_sites.sort(key=lambda site: site[1])
+        module.declared = set(_ANY_DECLARATION.findall(code)) | module.defines
+
+    guarded = set(_TYPEOF.findall(code))
+    spans = sorted(_deferred_spans(code))
+    events = sorted([(start, 1) for start, _ in spans] + [(end, -1) for _, end in spans])
+    event_at = 0
+    open_spans = 0
+    for match in _REFERENCE.finditer(code):
+        while event_at < len(events) and events[event_at][0] <= match.start():
+            open_spans += events[event_at][1]
+            event_at += 1
+        name = match.group(2)
+        if match.start() > 0 and code[match.start() - 1] == '.' and not match.group(1):
+            continue
+        if name in module.declared and not match.group(1):
+            continue
+        kind = 'optional' if name in guarded else ('runtime' if open_spans or module.kind == 'handlers'
+                                                   else 'load')
+        module.reference_sites.append((name, match.start(2), kind))
+        if _RANK[kind] > _RANK.get(module.references.get(name), -1):
+            module.references[name] = kind
+
+
+class ModuleGraph:
+    """Modules, the global names they provide and the edges between them"""
+
+    def __init__(self, modules, lazy):
+        self.modules = modules
+        self.lazy = lazy
+        self.providers = defaultdict(list)
+        for module in self.ordered():
+            for name in sorted(module.defines):
+                self.providers[name].append(module.name)
+        self.edges = defaultdict(dict)    # source -> target -> {'names': [...], 'kind': ...}
+        for module in modules.values():
+            for name, kind in sorted(module.references.items()):
+                for target in self.providers.get(name, [])[:1]:
+                    if target == module.name:
+                        continue
+                    edge = self.edges[module.name].setdefault(target, {'names': [], 'kind': kind})
+                    edge['names'].append(name)
+                    if _RANK[kind] > _RANK[edge['kind']]:
+                        edge['kind'] = kind
+
+    def ordered(self):
+        """Modules in index.html order, then the untagged ones by path"""
+        return sorted(self.modules.values(),
+                      key=lambda m: (m.html_index is None, m.html_index or 0, m.name))
+
+    def eager(self):
+        """Everything index.html loads up front"""
+        return [m.name for m in self.ordered() if m.html_index is not None]
+
+    def closure(self, roots, include_optional=False):
+        """Roots plus every module they reach through load or runtime edges"""
+        seen = set()
+        stack = list(roots)
+        while stack:
+            name = stack.pop()
+            if name in seen or name not in self.modules:
+                continue
+            seen.add(name)
+            for target, edge in self.edges.get(name, {}).items():
+                if include_optional or edge['kind'] != 'optional':
+                    stack.append(target)
+        return seen
+
+    def load_order(self, names):
+        """Topological order of names over load edges; returns (order, cyclic)"""
+        names = set(names)
+        position = {m.name: i for i, m in enumerate(self.ordered())}
+        needs = {name: set() for name in names}
+        for source in names:
+            for target, edge in self.edges.get(source, {}).items():
+                if target in names and edge['kind'] == 'load':
+                    needs[source].add(target)
+        dependents = defaultdict(set)
+        for source, targets in needs.items():
+            for target in targets:
+                dependents[target].add(source)
+        ready = [(position[n], n) for n, targets in needs.items() if not targets]
+        heapq.heapify(ready)
+        order = []
+        while ready:
+            _, name = heapq.heappop(ready)
+            order.append(name)
+            for dependent in dependents[name]:
+                needs[dependent].discard(name)
+                if not needs[dependent]:
+                    heapq.heappush(ready, (position[dependent], dependent))
+        cyclic = sorted((n for n in names if n not in order), key=position.get)
+        return order + cyclic, cyclic
+
+    def order_violations(self):
+        """(module, provider, names) where a load-time dependency is tagged later or not at all"""
+        problems = []
+        for module in self.ordered():
+            if module.html_index is None:
+                continue
+            for target, edge in sorted(self.edges.get(module.name, {}).items()):
+                provider = self.modules[target]
+                if edge['kind'] == 'load' and (provider.html_index is None
+                                               or provider.html_index > module.html_index):
+                    problems.append((module.name, target, edge['names']))
+        return problems
+
+    def lazy_pulled_in(self, critical):
+        """(module, group, reason) for lazy-manifest modules inside the critical closure"""
+        pulled = []
+        for path, group in sorted(self.lazy.items()):
+            if path not in critical:
+                continue
+            module = self.modules[path]
+            if module.html_index is not None:
+                pulled.append((path, group, 'script tag in index.html'))
+                continue
+            users = [f"{source} ({', '.join(edges[path]['names'][:3])})"
+                     for source, edges in sorted(self.edges.items())
+                     if source in critical and path in edges and edges[path]['kind'] != 'optional']
+            pulled.append((path, group, 'referenced by ' + '; '.join(users[:3])))
+        return pulled
+
+    def total_sizes(self, names):
+        """Summed transfer sizes of local modules (each file compressed on its own)"""
+        totals = defaultdict(int)
+        for name in names:
+            for key, value in self.modules[name].sizes.items():
+                totals[key] += value
+        return dict(totals)
+
+
+def discover_scripts(root):
+    """Every script under SCRIPT_ROOTS as sorted root-relative paths"""
+    found = []
+    for entry in SCRIPT_ROOTS:
+        full = os.path.join(root, entry)
+        if os.path.isfile(full):
+            found.append(entry)
+            continue
+        for directory, dirs, files in os.walk(full):
+            dirs[:] = sorted(d for d in dirs if d not in EXCLUDE_DIRS)
+            for name in files:
+                if name.endswith('.js'):
+                    found.append(os.path.relpath(os.path.join(directory, name), root).replace(os.sep, '/'))
+    return sorted(found)
+
+
+def build_graph(root='.', html_path=HTML_PATH, lazy_loader_path=LAZY_LOADER_PATH):
+    """Build the ModuleGraph for the repository at root"""
+    modules = {}
+
+    def add_file(path, html_index=None):
+        with open(os.path.join(root, path), 'rb') as f:
+            raw = f.read()
+        code, _ = tokenize(raw.decode('utf-8', errors='replace'))
+        module = Module(path, 'script' if html_index is not None else 'unlisted', path, code,
+                        html_index, raw)
+        modules[path] = module
+        return module
+
+    html = ''
+    if os.path.exists(os.path.join(root, html_path)):
+        with open(os.path.join(root, html_path), 'r', encoding='utf-8') as f:
+            html = f.read()
+
+    inline_count = 0
+    for index, (src, inline, _) in enumerate(parse_script_tags(html)):
+        if src is None:
+            inline_count += 1
+            name = f'{html_path}#script-{inline_count}'
+            code, _ = tokenize(inline)
+            modules[name] = Module(name, 'inline', html_path, code, index, inline.encode('utf-8'))
+        elif re.match(r'^(?:[a-z]+:)?//', src):
+            modules[src] = Module(src, 'external', html_index=index)
+        else:
+            path = src.lstrip('/')
+            if os.path.exists(os.path.join(root, path)) and path not in modules:
+                add_file(path, index)
+
+    for path in discover_scripts(root):
+        if path not in modules:
+            add_file(path)
+
+    if html:
+        html_code, _ = tokenize(html, 'html')
+        handlers = '\n'.join(a or b for a, b in _HANDLER.findall(html_code))
+        modules[HANDLERS] = Module(HANDLERS, 'handlers', html_path, tokenize(handlers)[0])
+
+    for module in modules.values():
+        if module.code is not None:
+            scan_module(module)
+
+    lazy = {}
+    if os.path.exists(os.path.join(root, lazy_loader_path)):
+        with open(os.path.join(root, lazy_loader_path), 'r', encoding='utf-8') as f:
+            lazy = parse_lazy_manifest(f.read())
+    return ModuleGraph(modules, lazy)
+
+
+def analyze(graph, roots=None):
+    """Critical closure, load order and problems as a JSON-ready dict"""
+    roots = roots or graph.eager() + ([HANDLERS] if HANDLERS in graph.modules else [])
+    critical = graph.closure(roots)
+    order, cyclic = graph.load_order(critical)
+    local = [n for n in order if graph.modules[n].kind not in ('external', 'handlers')]
+    return {
+        'roots': roots,
+        'critical': [{'module': n, 'kind': graph.modules[n].kind, **graph.modules[n].sizes} for n in local],
+        'critical_sizes': graph.total_sizes(local),
+        'external': [n for n in order if graph.modules[n].kind == 'external'],
+        'cyclic': cyclic,
+        'not_loaded': sorted(n for n, m in graph.modules.items() if n not in critical and m.kind == 'unlisted'),
+        'not_loaded_sizes': graph.total_sizes(
+            [n for n, m in graph.modules.items() if n not in critical and m.kind == 'unlisted']),
+        'lazy_pulled_in': [{'module': m, 'group': g, 'reason': r} for m, g, r in graph.lazy_pulled_in(critical)],
+        'order_violations': [{'module': m, 'provider': p, 'names': names}
+                             for m, p, names in graph.order_violations()],
+        'conflicts': {name: providers for name, providers in sorted(graph.providers.items())
+                      if len(providers) > 1},
+        'edges': {source: targets for source, targets in sorted(graph.edges.items())},
+    }
+
+
+def _kb(value):
+    return f"{value / 1024:.1f} KB"
+
+
+def main():
+    """Main function"""
+    parser = argparse.ArgumentParser(description='Build the front-end module dependency graph')
+    parser.add_argument('--root', default='.', help='Repository root')
+    parser.add_argument('--html', default=HTML_PATH, help='Page whose script tags are the critical path')
+    parser.add_argument('--entry', action='append',
+                        help='Critical root module (repeatable; default: every script index.html loads)')
+    parser.add_argument('--json', action='store_true', help='Print the analysis as JSON')
+    args = parser.parse_args()
+
+    graph = build_graph(args.root, args.html)
+    unknown = [r for r in args.entry or () if r not in graph.modules]
+    if unknown:
+        print(f"❌ Unknown module(s): {', '.join(unknown)}")
+        return 2
+    report = analyze(graph, args.entry)
+
+    if args.json:
+        print(json.dumps(report, indent=2))
+        return 0
+
+    kinds = defaultdict(int)
+    for module in graph.modules.values():
+        kinds[module.kind] += 1
+    edge_kinds = defaultdict(int)
+    for targets in graph.edges.values():
+        for edge in targets.values():
+            edge_kinds[edge['kind']] += 1
+
+    print("=" * 60)
+    print("Module Dependency Graph")
+    print("=" * 60)
+    print(f"  - Modules: {len(graph.modules)} ({kinds['script']} tagged, {kinds['inline']} inline, "
+          f"{kinds['external']} CDN, {kinds['unlisted']} not in {args.html})")
+    print(f"  - Edges: {edge_kinds['load']} load-time, {edge_kinds['runtime']} runtime, "
+          f"{edge_kinds['optional']} typeof-guarded")
+    sizes = report['critical_sizes']
+    line = f"  - Critical path: {len(report['critical'])} scripts, {_kb(sizes.get('raw', 0))} raw, " \
+           f"{_kb(sizes.get('gzip', 0))} gzip"
+    if 'brotli' in sizes:
+        line += f", {_kb(sizes['brotli'])} brotli"
+    print(line)
+    print(f"  - Not loaded: {len(report['not_loaded'])} scripts, "
+          f"{_kb(report['not_loaded_sizes'].get('raw', 0))} raw")
+
+    print("\nLoad order (topological, critical path):")
+    for i, entry in enumerate(report['critical'], 1):
+        print(f"  {i:3d}. {entry['module']:45s} {entry['raw']:9,} {entry['gzip']:8,} gzip")
+    if report['external']:
+        print(f"  + CDN: {', '.join(report['external'])}")
+
+    if report['cyclic']:
+        print(f"\n⚠️  Load-time cycle between: {', '.join(report['cyclic'])}")
+    if report['order_violations']:
+        print("\n⚠️  Load-time dependencies tagged later in the page:")
+        for item in report['order_violations']:
+            print(f"  - {item['module']} needs {item['provider']} ({', '.join(item['names'][:3])})")
+    if report['lazy_pulled_in']:
+        print("\n⚠️  Lazy modules pulled into the critical path:")
+        for item in report['lazy_pulled_in']:
+            print(f"  - {item['module']} [{item['group']}]: {item['reason']}")
+    if report['conflicts']:
+        print("\n⚠️  Globals defined by more than one module:")
+        for name, providers in report['conflicts'].items():
+            print(f"  - {name}: {', '.join(providers)}")
+    if not (report['cyclic'] or report['order_violations'] or report['lazy_pulled_in']):
+        print("\n✅ Critical path is consistent with the lazy manifest")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,360 @@
+#!/usr/bin/env python3
+"""
+Cached manifest of what every front-end file declares.
+
+The feature test scripts (tests/test_analytics.py, test_cms.py, ...) used to
+open the same JS/CSS files in every test and look for `'name' in content`.
+This builds the answers once: for each script, stylesheet and index.html it
+records the exported namespaces, declared functions and object keys, the
+identifiers and dotted members the code uses, the words inside its strings,
+and for CSS the classes, ids and @media queries of its selectors.
+
+The manifest is written to module-manifest.json keyed by each file's sha256.
+A file whose size and mtime are unchanged is not even read again; one whose
+content changed is rescanned. load_manifest() keeps the result for the rest
+of the process, so a whole test session scans the tree once.
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import re
+import sys
+from collections import Counter
+
+from module_graph import HTML_PATH, discover_scripts
+from static_analysis import tokenize
+
+ROOT = os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
+MANIFEST_PATH = 'module-manifest.json'
+MANIFEST_FORMAT = 1
+STYLE_ROOTS = ['css', 'styles.css']
+
+_NAME = r'[A-Za-z_$][\w$]*'
+_IDENTIFIER = re.compile(r'(?<![\w$])' + _NAME)
+_MEMBER = re.compile(r'(?<![\w$])(?=(' + _NAME + r')\s*\.\s*(' + _NAME + r'))')
+_WINDOW_EXPORT = re.compile(r'\bwindow\s*\.\s*(' + _NAME + r')\s*=(?!=)')
+_FUNCTION_DECLARATION = re.compile(r'\bfunction\s*\*?\s*(' + _NAME + r')\s*\(')
+_FUNCTION_VALUE = re.compile(r'(?<![\w$.])(' + _NAME + r')\s*[:=]\s*(?:async\s+)?(?:function\b|(?:\([^()]*\)|'
+                             + _NAME + r')\s*=>)')
+_METHOD = re.compile(r'^[ \t]*(?:async\s+)?(?:static\s+)?(' + _NAME + r')\s*\([^()]*\)\s*\{', re.M)
+_KEY = re.compile(r'(?<![\w$.?])(' + _NAME + r')\s*:(?!:)')
+_IIFE = re.compile(r'\(\s*function\s*\(([^()]*)\)')
+_TRY = re.compile(r'\btry\s*\{')
+_WORD = re.compile(r'[\w$-]+')
+_NOT_METHODS = {'if', 'for', 'while', 'switch', 'catch', 'function', 'return', 'with'}
+
+_CSS_COMMENT = re.compile(r'/\*.*?\*/', re.S)
+_CSS_CLASS = re.compile(r'\.(-?[_a-zA-Z][\w-]*)')
+_CSS_ID = re.compile(r'#(-?[_a-zA-Z][\w-]*)')
+_LINK = re.compile(r'<link\b([^>]*)>', re.I)
+_HREF = re.compile(r'\bhref\s*=\s*["\']([^"\']+)["\']', re.I)
+_REL_STYLESHEET = re.compile(r'\brel\s*=\s*["\'][^"\']*\bstylesheet\b', re.I)
+_ID_ATTRIBUTE = re.compile(r'\bid\s*=\s*["\']([^"\']+)["\']', re.I)
+_SRC = re.compile(r'<script\b[^>]*\bsrc\s*=\s*["\']([^"\']+)["\']', re.I)
+
+
+def scanner_version():
+    """Changes whenever this scanner changes"""
+    with open(os.path.abspath(__file__), 'rb') as f:
+        return hashlib.sha256(f.read()).hexdigest()[:16]
+
+
+def _strip_query(src):
+    return src.split('#')[0].split('?')[0].lstrip('/')
+
+
+def _string_words(text, code, comments):
+    """Words inside string and template literals (comments excluded)"""
+    chars = [c if k == ' ' and c not in ' \t\r\n' else ' ' for c, k in zip(text, code)]
+    for offset, comment in comments:
+        chars[offset:offset + len(comment)] = ' ' * len(comment)
+    return set(_WORD.findall(''.join(chars)))
+
+
+def scan_js(text):
+    """Namespaces, functions, keys, identifiers, members and string words of one script"""
+    code, comments = tokenize(text)
+    identifiers = Counter(_IDENTIFIER.findall(code))
+    functions = set(_FUNCTION_DECLARATION.findall(code)) | set(_FUNCTION_VALUE.findall(code))
+    functions |= {name for name in _METHOD.findall(code) if name not in _NOT_METHODS}
+    return {
+        'kind': 'js',
+        'namespaces': sorted(set(_WINDOW_EXPORT.findall(code))),
+        'functions': sorted(functions),
+        'keys': sorted(set(_KEY.findall(code))),
+        'identifiers': dict(sorted(identifiers.items())),
+        'members': sorted({f'{a}.{b}' for a, b in _MEMBER.findall(code)}),
+        'strings': sorted(_string_words(text, code, comments)),
+        'iife_params': sorted({re.sub(r'\s+', '', params) for params in _IIFE.findall(code)}),
+        'jsdoc': sum(1 for _, comment in comments if comment.startswith('/**')),
+        'try_blocks': len(_TRY.findall(code)),
+    }
+
+
+def scan_css(text):
+    """Classes, ids and @media queries of a stylesheet's selectors"""
+    code = _CSS_COMMENT.sub(lambda m: ' ' * len(m.group(0)), text)
+    classes, ids, media = set(), set(), []
+    depth = 0
+    balanced = True
+    prelude = []
+    rules = 0
+    for ch in code:
+        if ch == '{':
+            head = ' '.join(''.join(prelude).split())
+            if head.startswith('@media'):
+                media.append(head)
+            elif not head.startswith('@'):
+                classes.update(_CSS_CLASS.findall(head))
+                ids.update(_CSS_ID.findall(head))
+                rules += 1
+            depth += 1
+            prelude = []
+        elif ch == '}':
+            depth -= 1
+            balanced = balanced and depth >= 0
+            prelude = []
+        elif ch == ';':
+            prelude = []
+        else:
+            prelude.append(ch)
+    return {
+        'kind': 'css',
+        'classes': sorted(classes),
+        'ids': sorted(ids),
+        'media': sorted(set(media)),
+        'rules': rules,
+        'balanced': balanced and depth == 0,
+    }
+
+
+def scan_html(text):
+    """Scripts, stylesheets, element ids, words and inline member accesses of a page"""
+    code, _ = tokenize(text, 'html')
+    stylesheets = []
+    for match in _LINK.finditer(code):
+        href = _HREF.search(match.group(1))
+        if href and _REL_STYLESHEET.search(match.group(1)):
+            stylesheets.append(_strip_query(href.group(1)))
+    return {
+        'kind': 'html',
+        'scripts': [_strip_query(src) for src in _SRC.findall(code)],
+        'stylesheets': stylesheets,
+        'ids': sorted(set(_ID_ATTRIBUTE.findall(code))),
+        'words': sorted(set(_WORD.findall(code))),
+        'members': sorted({f'{a}.{b}' for a, b in _MEMBER.findall(code)}),
+    }
+
+
+def scan_file(path, text):
+    if path.endswith('.css'):
+        return scan_css(text)
+    if path.endswith('.html'):
+        return scan_html(text)
+    return scan_js(text)
+
+
+def discover_files(root):
+    """Scripts, stylesheets and index.html as sorted root-relative paths"""
+    found = set(discover_scripts(root))
+    for entry in STYLE_ROOTS:
+        full = os.path.join(root, entry)
+        if os.path.isfile(full):
+            found.add(entry)
+            continue
+        for directory, dirs, files in os.walk(full):
+            dirs.sort()
+            for name in files:
+                if name.endswith('.css'):
+                    found.add(os.path.relpath(os.path.join(directory, name), root).replace(os.sep, '/'))
+    if os.path.isfile(os.path.join(root, HTML_PATH)):
+        found.add(HTML_PATH)
+    return sorted(found)
+
+
+class ManifestEntry:
+    """What one file declares; the questions the feature tests ask of it"""
+
+    def __init__(self, path, data):
+        self.path = path
+        self.data = data
+        self.kind = data['kind']
+        self.bytes = data['bytes']
+        self._sets = {}
+
+    def _set(self, key):
+        if key not in self._sets:
+            self._sets[key] = set(self.data.get(key, ()))
+        return self._sets[key]
+
+    def __getitem__(self, key):
+        return self.data[key]
+
+    def defines(self, name):
+        """A function, method or object key called name (`function name(` / `name:`)"""
+        return name in self._set('functions') or name in self._set('keys')
+
+    def exports(self, namespace):
+        """window.namespace is assigned"""
+        return namespace in self._set('namespaces')
+
+    def uses(self, name):
+        """The code refers to name; dotted names (Storage.getItem) must appear as a member access"""
+        if '.' in name:
+            return name in self._set('members')
+        return name in self.data.get('identifiers', {})
+
+    def count(self, name):
+        """How often the identifier name appears in code"""
+        return self.data.get('identifiers', {}).get(name, 0)
+
+    def mentions(self, word):
+        """word appears in code, in a string, or as a class, id or page word"""
+        return (self.uses(word) or word in self._set('strings') or word in self._set('words')
+                or word.lstrip('.') in self._set('classes') or word in self._set('ids'))
+
+    def has_class(self, selector):
+        """A selector uses the class (leading dot optional)"""
+        return selector.lstrip('.') in self._set('classes')
+
+    def has_media(self, query=None):
+        """Any @media rule, or one whose prelude contains query"""
+        media = self.data.get('media', [])
+        return bool(media) if query is None else any(query in rule for rule in media)
+
+    def loads_script(self, src):
+        return _strip_query(src) in self._set('scripts')
+
+    def loads_stylesheet(self, href):
+        return _strip_query(href) in self._set('stylesheets')
+
+
+class ModuleManifest:
+    """Manifest entries by root-relative path"""
+
+    def __init__(self, files):
+        self.files = files
+        self._entries = {}
+        self.stats = {}
+
+    def __contains__(self, path):
+        return path in self.files
+
+    def exists(self, path):
+        return path in self.files
+
+    def get(self, path):
+        """The entry for path, or None when no such script, stylesheet or page exists"""
+        if path not in self.files:
+            return None
+        if path not in self._entries:
+            self._entries[path] = ManifestEntry(path, self.files[path])
+        return self._entries[path]
+
+    __getitem__ = get
+
+
+def _load_cache(path, version):
+    try:
+        with open(path) as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    if data.get('format') != MANIFEST_FORMAT or data.get('scanner') != version:
+        return {}
+    return data.get('files', {})
+
+
+def build_manifest(root=ROOT, manifest_path=MANIFEST_PATH, refresh=False):
+    """
+    Load the manifest for root, rescanning only files whose content changed.
+
+    Unchanged size and mtime reuse an entry without reading the file; otherwise
+    the sha256 decides. stats counts {'scanned', 'hashed', 'reused'}. The
+    manifest file (relative to root, None to skip) is rewritten on any change.
+    """
+    version = scanner_version()
+    cache = {} if refresh else _load_cache(manifest_path and os.path.join(root, manifest_path), version)
+    files = {}
+    scanned = hashed = 0
+    for path in discover_files(root):
+        stat = os.stat(os.path.join(root, path))
+        cached = cache.get(path)
+        if cached and cached['mtime_ns'] == stat.st_mtime_ns and cached['bytes'] == stat.st_size:
+            files[path] = cached
+            continue
+        with open(os.path.join(root, path), 'rb') as f:
+            raw = f.read()
+        digest = hashlib.sha256(raw).hexdigest()
+        hashed += 1
+        if cached and cached['sha256'] == digest:
+            entry = dict(cached)
+        else:
+            entry = scan_file(path, raw.decode('utf-8', errors='replace'))
+            entry['sha256'] = digest
+            scanned += 1
+        entry['bytes'] = stat.st_size
+        entry['mtime_ns'] = stat.st_mtime_ns
+        files[path] = entry
+
+    if manifest_path and (hashed or set(files) != set(cache)):
+        with open(os.path.join(root, manifest_path), 'w') as f:
+            json.dump({'format': MANIFEST_FORMAT, 'scanner': version, 'files': files}, f, separators=(',', ':'))
+    manifest = ModuleManifest(files)
+    manifest.stats = {'scanned': scanned, 'hashed': hashed, 'reused': len(files) - hashed}
+    return manifest
+
+
+_loaded = {}
+
+
+def load_manifest(root=ROOT):
+    """The manifest for root, built once per process"""
+    root = os.path.abspath(root)
+    if root not in _loaded:
+        _loaded[root] = build_manifest(root)
+    return _loaded[root]
+
+
+def main():
+    """Main function"""
+    parser = argparse.ArgumentParser(description='Build the cached manifest of front-end modules')
+    parser.add_argument('paths', nargs='*', help='Print the entries of these files')
+    parser.add_argument('--root', default='.', help='Repository root')
+    parser.add_argument('--output', default=MANIFEST_PATH, help='Manifest file (relative to root)')
+    parser.add_argument('--refresh', action='store_true', help='Ignore the cached manifest')
+    parser.add_argument('--json', action='store_true', help='Print entries as JSON')
+    args = parser.parse_args()
+
+    manifest = build_manifest(args.root, args.output, args.refresh)
+    if args.paths:
+        missing = [path for path in args.paths if path not in manifest]
+        entries = {path: manifest.files[path] for path in args.paths if path in manifest}
+        if args.json:
+            print(json.dumps(entries, indent=2))
+        else:
+            for path, entry in entries.items():
+                print(f"\n🔍 {path} ({entry['kind']}, {entry['bytes']:,} bytes)")
+                for key in ('namespaces', 'functions', 'classes', 'media', 'scripts', 'stylesheets'):
+                    if entry.get(key):
+                        print(f"  - {key.capitalize()}: {', '.join(entry[key])}")
+        for path in missing:
+            print(f"❌ Not in the manifest: {path}")
+        return 1 if missing else 0
+
+    kinds = Counter(entry['kind'] for entry in manifest.files.values())
+    print("=" * 60)
+    print("Module Manifest")
+    print("=" * 60)
+    print(f"  - Files: {len(manifest.files)} ({', '.join(f'{n} {k}' for k, n in sorted(kinds.items()))})")
+    print(f"  - Scanned: {manifest.stats['scanned']}, hashed: {manifest.stats['hashed']}, "
+          f"reused: {manifest.stats['reused']}")
+    print(f"  - Namespaces: {sum(len(e.get('namespaces', [])) for e in manifest.files.values())}")
+    print(f"✅ Written to {os.path.join(args.root, args.output)}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
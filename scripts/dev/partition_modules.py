@@ -0,0 +1,320 @@
+#!/usr/bin/env python3
+"""
+Critical/lazy partitioner for the LazyLoader manifest.
+
+Combines the module dependency graph (module_graph.py) with measured first
+use from dom_harness.js, which runs the index.html scripts in a Node vm
+context with DOM stubs and reports which modules ran during script load,
+startup and the first interaction (a click on #nextBtn).
+
+A module must stay eager when it:
+  - ran in any of those phases, or installed event listeners or timers while
+    it loaded (nothing would ever load it later)
+  - is an inline <script> block or a CDN script
+  - is called from an inline handler in index.html outside a
+    `LazyLoader.loadModule('group')` call site (menu, login and the other
+    controls count as first interaction even though the harness only clicks
+    #nextBtn)
+  - is a load-time or runtime dependency of another eager module; only
+    typeof-guarded references may point at lazy code
+  - is tagged in index.html and no call site, or more than one, would load
+    it instead
+Lazy modules are what the loadModule() call sites reach: each call site's
+group lists the modules providing the names used in its handler plus their
+lazy dependencies, in load order, so loadModule() brings in everything a
+group needs. Groups are only emitted for call sites; untagged modules that
+no call site reaches are left out and listed.
+
+The regenerated manifest replaces the `const modules` object in
+js/utils/lazy-loader.js.
+"""
+
+import argparse
+import json
+import os
+import re
+import shutil
+import subprocess
+import sys
+from collections import defaultdict
+
+from import_content import write_atomic
+from js_literals import find_block, parse_literal
+from module_graph import HANDLERS, HTML_PATH, LAZY_LOADER_PATH, build_graph
+from static_analysis import tokenize
+
+HARNESS = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'dom_harness.js')
+CSS_DIR = 'css'
+
+_LOAD_MODULE = re.compile(r'\bLazyLoader\s*\.\s*loadModule\s*\(\s*[\'"]([\w-]+)[\'"]\s*\)')
+_HANDLER = re.compile(r'\bon[a-z]+\s*=\s*"([^"]*)"|\bon[a-z]+\s*=\s*\'([^\']*)\'', re.I)
+_IDENTIFIER = re.compile(r'(?<![\w$.])[A-Za-z_$][\w$]*')
+_PLAIN_KEY = re.compile(r'^[A-Za-z_$][\w$]*$')
+
+
+def run_harness(root, html_path=HTML_PATH, clicks=1, target='nextBtn'):
+    """Run dom_harness.js against root and return its report"""
+    if shutil.which('node') is None:
+        raise RuntimeError('node is required to measure module usage (or pass --usage)')
+    result = subprocess.run(['node', HARNESS, root, '--html', html_path, '--clicks', str(clicks),
+                             '--target', target],
+                            capture_output=True, text=True, timeout=300)
+    if result.returncode != 0:
+        raise RuntimeError(f"dom_harness.js failed: {result.stderr.strip()[-500:]}")
+    return json.loads(result.stdout)
+
+
+def read_manifest(content):
+    """The modules object of lazy-loader.js as {group: {'files': [...], 'css': [...]}}"""
+    block = find_block(content, 'const modules')
+    if block is None:
+        return {}
+    modules, _ = parse_literal(content, block[0])
+    return modules
+
+
+def call_sites(html):
+    """{group: names} for every inline handler that calls LazyLoader.loadModule('group')"""
+    code, _ = tokenize(html, 'html')
+    sites = defaultdict(set)
+    for match in _HANDLER.finditer(code):
+        group = 1 if match.group(1) is not None else 2
+        handler = html[match.start(group):match.end(group)]
+        # Names from the tokenized view, so string contents do not count
+        names = {n for n in _IDENTIFIER.findall(tokenize(handler)[0]) if n != 'LazyLoader'}
+        for name in _LOAD_MODULE.findall(handler):
+            sites[name].update(names)
+    return dict(sites)
+
+
+class Partition:
+    """Result of partition(): eager modules, lazy groups and what needs attention"""
+
+    def __init__(self):
+        self.eager = []             # load order
+        self.reasons = {}           # eager module -> why it is eager
+        self.groups = {}            # group -> {'files': [...], 'css': [...]}
+        self.deferred_tags = []     # tagged in index.html but now lazy
+        self.unreferenced = []      # local modules neither eager nor in a call-site group
+        self.dropped_groups = []
+
+
+def partition(graph, usage, sites=None, previous=None, root='.'):
+    """Split the graph into eager modules and LazyLoader groups from measured usage"""
+    sites = sites or {}
+    previous = previous or {}
+    result = Partition()
+    local = {n for n, m in graph.modules.items() if m.kind in ('script', 'unlisted')}
+    covered = set().union(*sites.values()) if sites else set()
+
+    required = {}
+    for name, entry in usage.get('usage', {}).items():
+        if name in graph.modules:
+            required[name] = f"used at {entry['phase']}"
+    for name, counts in usage.get('installs', {}).items():
+        if name in graph.modules and name not in required and (counts['listeners'] or counts['timers']):
+            required[name] = 'installs listeners or timers at load'
+    for name, module in graph.modules.items():
+        if module.kind in ('inline', 'external') and name not in required:
+            required[name] = f"{module.kind} script"
+    if HANDLERS in graph.modules:
+        required.setdefault(HANDLERS, 'index.html handlers')
+    if sites and LAZY_LOADER_PATH in graph.modules:
+        required.setdefault(LAZY_LOADER_PATH, 'LazyLoader call sites')
+
+    def follows(source, edge):
+        if edge['kind'] == 'optional':
+            return False
+        # Names a handler only uses after loadModule() resolves are the group's
+        return source != HANDLERS or any(n not in covered for n in edge['names'])
+
+    while True:
+        eager = set()
+        stack = list(required)
+        while stack:
+            name = stack.pop()
+            if name in eager:
+                continue
+            eager.add(name)
+            for target, edge in graph.edges.get(name, {}).items():
+                if target not in eager and follows(name, edge):
+                    result.reasons.setdefault(
+                        target, 'called from index.html' if name == HANDLERS else f"needed by {name}")
+                    stack.append(target)
+
+        # Group membership: the providers of the names each call site uses
+        lazy = (graph.closure(eager) & local) - eager
+        members = defaultdict(set)
+        for group, names in sorted(sites.items()):
+            for name in sorted(names):
+                for provider in graph.providers.get(name, [])[:1]:
+                    if provider in lazy:
+                        members[group].add(provider)
+        files = {group: graph.closure(members.get(group, ())) & lazy for group in sites}
+        grouped = set().union(*files.values()) if files else set()
+        # Tags only come out for modules exactly one call site takes over
+        stranded = {}
+        for name in sorted(local - eager):
+            if graph.modules[name].html_index is None:
+                continue
+            owners = [group for group in sorted(files) if name in files[group]]
+            if not owners:
+                stranded[name] = 'tagged in index.html, no loadModule() call site loads it'
+            elif len(owners) > 1:
+                stranded[name] = f"tagged in index.html, shared by {', '.join(owners)}"
+        if not stranded:
+            break
+        required.update(stranded)
+
+    for name, reason in required.items():
+        result.reasons[name] = reason
+    order, _ = graph.load_order(eager)
+    result.eager = [n for n in order if graph.modules[n].kind != 'handlers']
+    result.unreferenced = sorted(local - eager - grouped)
+    result.deferred_tags = [m.name for m in graph.ordered() if m.name in grouped and m.html_index is not None]
+
+    names = [g for g in previous if g in sites] + sorted(g for g in sites if g not in previous)
+    for group in names:
+        order, _ = graph.load_order(files[group])
+        css = [c for c in previous.get(group, {}).get('css', [])
+               if os.path.exists(os.path.join(root, c))]
+        default_css = f"{CSS_DIR}/{group}.css"
+        if not css and group not in previous and os.path.exists(os.path.join(root, default_css)):
+            css = [default_css]
+        result.groups[group] = {'files': order, 'css': css}
+    result.dropped_groups = [g for g in previous if g not in result.groups]
+    return result
+
+
+def _js_list(items, indent):
+    inline = '[' + ', '.join(f"'{item}'" for item in items) + ']'
+    if len(indent) + len('files: ') + len(inline) <= 100:
+        return inline
+    inner = indent + '    '
+    return '[\n' + ',\n'.join(f"{inner}'{item}'" for item in items) + '\n' + indent + ']'
+
+
+def render_manifest(groups, indent='    '):
+    """The modules object literal in lazy-loader.js style"""
+    inner = indent + '    '
+    entries = []
+    for group, spec in groups.items():
+        key = group if _PLAIN_KEY.match(group) else f"'{group}'"
+        entries.append(f"{inner}{key}: {{\n"
+                       f"{inner}    files: {_js_list(spec['files'], inner + '    ')},\n"
+                       f"{inner}    css: {_js_list(spec['css'], inner + '    ')}\n"
+                       f"{inner}}}")
+    return '{\n' + ',\n'.join(entries) + '\n' + indent + '}'
+
+
+def write_manifest(path, groups):
+    """Replace the modules object in lazy-loader.js; returns True when the file changed"""
+    with open(path, 'r', encoding='utf-8') as f:
+        content = f.read()
+    block = find_block(content, 'const modules')
+    if block is None:
+        raise ValueError(f"{path} has no `const modules` object")
+    start, end = block
+    line_start = content.rfind('\n', 0, start) + 1
+    indent = re.match(r'\s*', content[line_start:start]).group(0)
+    updated = content[:start] + render_manifest(groups, indent) + content[end + 1:]
+    if updated == content:
+        return False
+    write_atomic(path, updated)
+    return True
+
+
+def initial_sizes(graph, names):
+    """Transfer sizes of the local scripts among names"""
+    return graph.total_sizes([n for n in names if graph.modules[n].kind in ('script', 'inline')])
+
+
+def _load_errors(usage):
+    return [s for s in usage.get('scripts', []) if not s.get('loaded', True) and not s.get('external')]
+
+
+def _kb(value):
+    return f"{value / 1024:.1f} KB"
+
+
+def main():
+    """Main function"""
+    parser = argparse.ArgumentParser(description='Regenerate the LazyLoader manifest from measured module usage')
+    parser.add_argument('--root', default='.', help='Repository root')
+    parser.add_argument('--html', default=HTML_PATH, help='Page to measure')
+    parser.add_argument('--usage', help='Saved dom_harness.js report (default: run the harness)')
+    parser.add_argument('--clicks', type=int, default=1, help='Clicks on #nextBtn counted as first interaction')
+    parser.add_argument('--dry-run', action='store_true', help='Report without writing lazy-loader.js')
+    parser.add_argument('--check', action='store_true', help='Exit 1 when lazy-loader.js is out of date')
+    parser.add_argument('--json', action='store_true', help='Print the partition as JSON')
+    args = parser.parse_args()
+
+    try:
+        if args.usage:
+            with open(args.usage, 'r', encoding='utf-8') as f:
+                usage = json.load(f)
+        else:
+            usage = run_harness(args.root, args.html, args.clicks)
+    except (OSError, RuntimeError, ValueError) as e:
+        print(f"❌ {e}")
+        return 2
+
+    graph = build_graph(args.root, args.html)
+    loader_path = os.path.join(args.root, LAZY_LOADER_PATH)
+    with open(loader_path, 'r', encoding='utf-8') as f:
+        previous = read_manifest(f.read())
+    with open(os.path.join(args.root, args.html), 'r', encoding='utf-8') as f:
+        sites = call_sites(f.read())
+    result = partition(graph, usage, sites, previous, args.root)
+
+    before = initial_sizes(graph, graph.eager())
+    after = initial_sizes(graph, result.eager)
+    if args.json:
+        print(json.dumps({
+            'eager': [{'module': n, 'reason': result.reasons.get(n, '')} for n in result.eager],
+            'groups': result.groups,
+            'initial_sizes': {'before': before, 'after': after},
+            'deferred_tags': result.deferred_tags,
+            'unreferenced': result.unreferenced,
+            'dropped_groups': result.dropped_groups,
+            'load_errors': _load_errors(usage),
+        }, indent=2))
+    else:
+        print("=" * 60)
+        print("Module Partition")
+        print("=" * 60)
+        print(f"  - Eager: {len(result.eager)} modules, {_kb(after.get('gzip', 0))} gzip "
+              f"(index.html loads {_kb(before.get('gzip', 0))} gzip today)")
+        print(f"  - Lazy: {sum(len(g['files']) for g in result.groups.values())} files "
+              f"in {len(result.groups)} groups")
+        for group, spec in result.groups.items():
+            sizes = graph.total_sizes(spec['files'])
+            print(f"      {group:26s} {len(spec['files']):3d} files {_kb(sizes.get('gzip', 0)):>10s} gzip")
+        if result.deferred_tags:
+            print(f"  - Script tags to drop from {args.html}: {len(result.deferred_tags)}")
+            for name in result.deferred_tags:
+                print(f"      {name}")
+        if result.unreferenced:
+            print(f"  - Modules no eager code or call site loads, left out: {len(result.unreferenced)}")
+        if result.dropped_groups:
+            print(f"  - Groups dropped: {', '.join(result.dropped_groups)}")
+        failed = _load_errors(usage)
+        if failed:
+            print(f"  ⚠️  {len(failed)} script(s) failed in the harness; their usage is incomplete")
+
+    if args.check:
+        with open(loader_path, 'r', encoding='utf-8') as f:
+            current = read_manifest(f.read())
+        if current != result.groups:
+            print(f"❌ {LAZY_LOADER_PATH} is out of date - run scripts/dev/partition_modules.py")
+            return 1
+        return 0
+    if not args.dry_run:
+        changed = write_manifest(loader_path, result.groups)
+        if not args.json:
+            print(f"\n✅ {LAZY_LOADER_PATH} {'updated' if changed else 'already up to date'}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
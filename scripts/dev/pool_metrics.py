@@ -0,0 +1,636 @@
+#!/usr/bin/env python3
+"""
+Per-entry metrics for the engine content pools and analytic chapter
+word-count prediction.
+
+The precompute stage annotates every paragraph in every pool catalogued by
+content_pools.py with its word, sentence and placeholder counts and stores
+them in a sidecar index (story-content-metrics.json). The index records the
+sha256 of each engine file and is rebuilt only when one of them changes.
+
+From the index and the shape of the generator functions (which pools each
+paras.push() draws from, and which draws exclude earlier picks), the word
+count distribution of a chapter type is computed exactly by convolution:
+
+  - draws from the same pool without replacement are enumerated as
+    combinations, so the second middle can never repeat the first
+  - the closing paragraph is added
+  - the padding loop in generateChapter() is replayed as a renewal process:
+    probability mass below 1000 words keeps receiving one more paragraph
+    from the type's generator until it crosses the threshold
+
+Placeholders (${char.name}, [REGION], ...) are counted at the mean word
+count of the pool they are filled from, or one word when that cannot be
+determined.
+
+History effects - paragraphs filtered because earlier chapters used them -
+are modelled as two end states:
+
+  fresh      nothing has been used yet, every pool draw is available
+  exhausted  the long-run state and the CLI default (--mode): every
+             generated paragraph is on its reuse cooldown, so VR padding
+             comes only from the fallback generator (in the VR world the
+             base paragraphs are filtered out too) and backstory chapters
+             get no padding at all
+
+States in between, part way through a story, are not modelled.
+"""
+
+import argparse
+import hashlib
+import itertools
+import json
+import os
+import re
+import sys
+from collections import defaultdict
+
+from content_pools import ENGINE_FILES, find_functions, find_pools
+from js_literals import OPENERS, find_matching, parse_literal, skip_string
+
+INDEX_PATH = 'story-content-metrics.json'
+INDEX_FORMAT = 1
+STORY_ENGINE = 'story-engine.js'
+BACKSTORY_ENGINE = 'backstory-engine.js'
+TARGET_WORDS = 1000
+MAX_PADDING_ATTEMPTS = 100
+SETTINGS = ('vr_world', 'real_world')
+MODES = ('fresh', 'exhausted')
+
+_PLACEHOLDER = re.compile(r'\$\{([^}]*)\}|\[([A-Z][A-Z_]*)\]')
+_SENTENCE = re.compile(r'[.!?]+["\'”’)]*(?=\s|$)')
+_RANDOM_DRAW = re.compile(r'^(?:randomFrom|selectUnique)\(\s*(?:\[\s*\.\.\.)?([A-Za-z_$][\w$]*)')
+_DISPATCH_CASE = re.compile(r'case\s+"([^"]+)"\s*:|default\s*:|=\s*(?:BackstoryEngine\.)?([A-Za-z_$][\w$]*)\s*\(')
+
+# Helpers whose output is interpolated into paragraphs: estimated words
+# from the pools they read (buildSensoryDetail joins 2-3 sensory details).
+HELPER_WORDS = {
+    'buildSensoryDetail': lambda index: 2.5 * _mean(
+        [w for name, pool in index['pools'].items() if name.startswith('sensoryDetails.') for w in pool['words']]
+    ),
+}
+
+
+def entry_metrics(text):
+    """(words, sentences, placeholders) for one pool entry; placeholders count as one word"""
+    placeholders = len(_PLACEHOLDER.findall(text))
+    words = len(_PLACEHOLDER.sub('X', text).split())
+    sentences = len(_SENTENCE.findall(text)) or (1 if words else 0)
+    return words, sentences, placeholders
+
+
+def _mean(values):
+    return sum(values) / len(values) if values else 0.0
+
+
+def build_index(paths=None):
+    """Compute metrics for every string pool (and string fields of record pools)"""
+    sources = {}
+    pools = {}
+    for path in paths or ENGINE_FILES:
+        with open(path, 'r', encoding='utf-8') as f:
+            content = f.read()
+        sources[path] = hashlib.sha256(content.encode('utf-8')).hexdigest()
+        for pool in find_pools(content, path):
+            if pool.name in pools:
+                continue
+            if pool.is_strings:
+                metrics = [entry_metrics(entry) for entry in pool.value]
+                pools[pool.name] = {
+                    'path': path,
+                    'words': [m[0] for m in metrics],
+                    'sentences': [m[1] for m in metrics],
+                    'placeholders': [m[2] for m in metrics],
+                    'expressions': sorted({a or b for entry in pool.value for a, b in _PLACEHOLDER.findall(entry)}),
+                }
+            elif isinstance(pool.value, list) and pool.value and all(isinstance(v, dict) for v in pool.value):
+                fields = defaultdict(list)
+                for record in pool.value:
+                    for key, value in record.items():
+                        if isinstance(value, str):
+                            fields[key].append(entry_metrics(value)[0])
+                pools[pool.name] = {'path': path, 'fields': {k: _mean(v) for k, v in fields.items()}}
+    return {'format': INDEX_FORMAT, 'sources': sources, 'pools': pools}
+
+
+def load_or_build(index_path=INDEX_PATH, paths=None):
+    """Reuse the sidecar index while every engine file hashes the same"""
+    paths = paths or ENGINE_FILES
+    if index_path and os.path.exists(index_path):
+        try:
+            with open(index_path, 'r') as f:
+                cached = json.load(f)
+            if cached.get('format') == INDEX_FORMAT and set(cached.get('sources', {})) == set(paths):
+                current = True
+                for path in paths:
+                    with open(path, 'rb') as f:
+                        if hashlib.sha256(f.read()).hexdigest() != cached['sources'][path]:
+                            current = False
+                            break
+                if current:
+                    return cached, True
+        except (OSError, ValueError):
+            pass
+
+    index = build_index(paths)
+    if index_path:
+        with open(index_path, 'w') as f:
+            json.dump(index, f, separators=(',', ':'))
+    return index, False
+
+
+# ----------------------------------------------------------------------
+# Generator shapes
+# ----------------------------------------------------------------------
+
+def _statement(content, pos):
+    """Text from pos up to the ; ending the statement (brackets and strings skipped)"""
+    i = pos
+    while i < len(content) and content[i] != ';':
+        if content[i] in '"\'`':
+            i = skip_string(content, i)
+        elif content[i] in OPENERS:
+            i = find_matching(content, i) + 1
+        else:
+            i += 1
+    return content[pos:i].strip()
+
+
+def _definition(content, name, start, end):
+    """Initializer of the last `const/let name = ...` before end inside [start, end)"""
+    pattern = re.compile(r'\b(?:const|let|var)\s+' + re.escape(name) + r'\s*=\s*')
+    found = None
+    for match in pattern.finditer(content, start, end):
+        found = match
+    return _statement(content, found.end()) if found else None
+
+
+class GeneratorModel:
+    """The paragraphs one generator function pushes, per setting"""
+
+    def __init__(self, content, function, index, values):
+        self.content = content
+        self.name, _, self.start, self.end = function
+        self.index = index
+        self.values = values
+        self.top_scope = (0, len(content))
+        self.slots = {setting: [] for setting in SETTINGS}
+        self._pool_words = {}
+        self._parse()
+
+    # -- placeholder estimates -------------------------------------------------
+
+    def _lookup_pool(self, name):
+        for key in (f'{self.name}.{name}', name):
+            if key in self.index['pools']:
+                return key
+        return None
+
+    def estimate(self, expression):
+        """Expected rendered words for one ${...} or replace() expression"""
+        parts = [p.strip() for p in expression.split('.')]
+        root, fields = parts[0], parts[1:]
+        if not re.match(r'^[A-Za-z_$][\w$]*$', root):
+            return 1.0
+        definition = (_definition(self.content, root, self.start, self.end)
+                      or _definition(self.content, root, *self.top_scope))
+        if definition is None:
+            return 1.0
+        call = re.match(r'^([A-Za-z_$][\w$]*)\(\s*\)$', definition)
+        if call and call.group(1) in HELPER_WORDS:
+            return HELPER_WORDS[call.group(1)](self.index)
+        draw = _RANDOM_DRAW.match(definition)
+        if draw:
+            pool = self.index['pools'].get(self._lookup_pool(draw.group(1)) or '')
+            if pool and 'words' in pool and not fields:
+                return _mean(pool['words'])
+            if pool and 'fields' in pool and len(fields) == 1:
+                return pool['fields'].get(fields[0], 1.0)
+        return 1.0
+
+    def _fill_estimates(self, pool_name):
+        """Average filled-in word counts for a pool's entries"""
+        pool = self.index['pools'][pool_name]
+        estimates = {}
+        for expression in pool['expressions']:
+            if re.match(r'^[A-Z][A-Z_]*$', expression):
+                replaced = re.search(r"\.replace\(\s*['\"]\[" + expression + r"\]['\"]\s*,\s*([^)]+)\)",
+                                     self.content[self.start:self.end])
+                estimates[expression] = self.estimate(replaced.group(1)) if replaced else 1.0
+            else:
+                estimates[expression] = self.estimate(expression)
+        return estimates
+
+    def pool_words(self, pool_name):
+        """Filled-in word count of every entry of a pool"""
+        if pool_name in self._pool_words:
+            return self._pool_words[pool_name]
+        pool = self.index['pools'][pool_name]
+        estimates = self._fill_estimates(pool_name)
+        entries = self.values.get(pool_name)
+        result = []
+        for i, words in enumerate(pool['words']):
+            extra = 0.0
+            if pool['placeholders'][i] and entries is not None:
+                for a, b in _PLACEHOLDER.findall(entries[i]):
+                    extra += estimates.get(a or b, 1.0) - 1
+            result.append(int(round(words + extra)))
+        self._pool_words[pool_name] = result
+        return result
+
+    def literal_words(self, literal):
+        """Filled-in word count of a string or template literal pushed directly"""
+        value, _ = parse_literal(literal, 0)
+        words, _, _ = entry_metrics(value)
+        extra = sum(self.estimate(a) - 1 if a else 0 for a, b in _PLACEHOLDER.findall(value))
+        return int(round(words + extra))
+
+    # -- paras.push() parsing --------------------------------------------------
+
+    def _setting_ranges(self):
+        """(vr_range, real_range) for an `if (setting === "vr_world") {...} else {...}`"""
+        match = re.compile(r'if\s*\(\s*setting\s*===\s*"vr_world"\s*\)\s*\{').search(self.content, self.start, self.end)
+        if not match:
+            return None, None
+        vr_close = find_matching(self.content, match.end() - 1)
+        otherwise = re.compile(r'\s*else\s*\{').match(self.content, vr_close + 1)
+        if not otherwise:
+            return (match.end(), vr_close), None
+        return (match.end(), vr_close), (otherwise.end(), find_matching(self.content, otherwise.end() - 1))
+
+    def _resolve(self, argument, at):
+        """Map a push() argument to ('pool', name, distinct) or ('fixed', {setting: words})"""
+        argument = argument.strip()
+        if argument[:1] in '`"\'':
+            words = self.literal_words(argument)
+            return ('fixed', {s: words for s in SETTINGS})
+
+        draw = _RANDOM_DRAW.match(argument)
+        if draw:
+            distinct = '.filter(' in argument
+            name = draw.group(1)
+            pool = self._lookup_pool(name)
+            if pool is None:
+                alias = _definition(self.content, name, self.start, at)
+                if alias:
+                    source = re.match(r'^(?:\[\s*\.\.\.)?([A-Za-z_$][\w$]*)', alias)
+                    pool = self._lookup_pool(source.group(1)) if source else None
+                    distinct = distinct or '.filter(' in alias
+            return ('pool', pool, distinct) if pool else None
+
+        if re.match(r'^[A-Za-z_$][\w$]*$', argument):
+            definition = _definition(self.content, argument, self.start, at)
+            if definition is None:
+                return None
+            ternary = re.match(r'^setting\s*===\s*"vr_world"\s*\?', definition)
+            if ternary:
+                rest = definition[ternary.end():].strip()
+                first_end = skip_string(rest, 0)
+                second = rest[first_end:].strip().lstrip(':').strip()
+                return ('fixed', {'vr_world': self.literal_words(rest[:first_end]),
+                                  'real_world': self.literal_words(second)})
+            base = re.match(r'^([A-Za-z_$][\w$]*)\s*(?:\.replace|$)', definition)
+            if base and base.group(1) != argument:
+                return self._resolve(base.group(1), at)
+            return self._resolve(definition, at)
+        return None
+
+    def _parse(self):
+        vr_range, real_range = self._setting_ranges()
+        push = re.compile(r'\bparas\.push\(')
+        for match in push.finditer(self.content, self.start, self.end):
+            close = find_matching(self.content, match.end() - 1)
+            slot = self._resolve(self.content[match.end():close], match.start())
+            if slot is None:
+                continue
+            settings = SETTINGS
+            if vr_range and vr_range[0] <= match.start() < vr_range[1]:
+                settings = ('vr_world',)
+            elif real_range and real_range[0] <= match.start() < real_range[1]:
+                settings = ('real_world',)
+            for setting in settings:
+                self.slots[setting].append(slot)
+
+    # -- distributions ---------------------------------------------------------
+
+    def groups(self, setting):
+        """Collapse slots into independent groups: ('pool', name, k) or ('fixed', words)"""
+        groups = []
+        for slot in self.slots[setting]:
+            if slot[0] == 'fixed':
+                groups.append(['fixed', slot[1][setting]])
+            elif slot[2] and groups and groups[-1][0] == 'pool' and groups[-1][1] == slot[1]:
+                groups[-1][2] += 1
+            else:
+                groups.append(['pool', slot[1], 1])
+        return groups
+
+    def base_distribution(self, setting):
+        """Word count distribution of one generator call"""
+        distribution = {0: 1.0}
+        for group in self.groups(setting):
+            if group[0] == 'fixed':
+                distribution = convolve(distribution, {group[1]: 1.0})
+            else:
+                distribution = convolve(distribution, draw_distribution(self.pool_words(group[1]), group[2]))
+        return distribution
+
+    def paragraph_distribution(self, setting):
+        """Word count of one paragraph picked uniformly from a generator call"""
+        slots = self.slots[setting]
+        mixture = defaultdict(float)
+        for slot in slots:
+            if slot[0] == 'fixed':
+                mixture[slot[1][setting]] += 1.0 / len(slots)
+            else:
+                words = self.pool_words(slot[1])
+                for w in words:
+                    mixture[w] += 1.0 / len(slots) / len(words)
+        return dict(mixture)
+
+
+def convolve(a, b):
+    """Distribution of the sum of two independent word counts"""
+    result = defaultdict(float)
+    for x, p in a.items():
+        for y, q in b.items():
+            result[x + y] += p * q
+    return dict(result)
+
+
+def draw_distribution(words, k):
+    """Sum of k distinct entries drawn uniformly without replacement"""
+    k = min(k, len(words))
+    combos = list(itertools.combinations(words, k))
+    result = defaultdict(float)
+    for combo in combos:
+        result[sum(combo)] += 1.0 / len(combos)
+    return dict(result)
+
+
+def uniform(words):
+    """Distribution of one entry drawn uniformly"""
+    result = defaultdict(float)
+    for w in words:
+        result[w] += 1.0 / len(words)
+    return dict(result)
+
+
+def pad(base, paragraph, target=TARGET_WORDS, max_attempts=MAX_PADDING_ATTEMPTS):
+    """
+    Replay the padding loop: mass under target gets another paragraph.
+
+    Returns (final distribution, expected padding paragraphs).
+    """
+    final = defaultdict(float)
+    alive = {}
+    for w, p in base.items():
+        if w >= target:
+            final[w] += p
+        else:
+            alive[w] = p
+    expected = 0.0
+    for _ in range(max_attempts):
+        if not alive:
+            break
+        expected += sum(alive.values())
+        step = convolve(alive, paragraph)
+        alive = {}
+        for w, p in step.items():
+            if w >= target:
+                final[w] += p
+            else:
+                alive[w] = p
+    for w, p in alive.items():
+        final[w] += p
+    return dict(final), expected
+
+
+def summarize(distribution, paragraphs):
+    """Mean, percentiles and tail probabilities of a word-count distribution"""
+    ordered = sorted(distribution.items())
+    total = sum(p for _, p in ordered)
+
+    def percentile(q):
+        running = 0.0
+        for w, p in ordered:
+            running += p / total
+            if running >= q - 1e-12:
+                return w
+        return ordered[-1][0]
+
+    return {
+        'mean': round(sum(w * p for w, p in ordered) / total, 1),
+        'min': ordered[0][0],
+        'p10': percentile(0.10),
+        'p50': percentile(0.50),
+        'p90': percentile(0.90),
+        'max': ordered[-1][0],
+        'p_under_200': round(sum(p for w, p in ordered if w < 200) / total, 6),
+        'p_under_target': round(sum(p for w, p in ordered if w < TARGET_WORDS) / total, 6),
+        'expected_paragraphs': round(paragraphs, 2),
+    }
+
+
+def parse_dispatch(content, marker, start=0):
+    """Map chapter type -> generator function from the first `switch (...) {` after start"""
+    at = content.find(marker, start)
+    if at == -1:
+        return {}
+    open_brace = content.index('{', at)
+    body = content[open_brace:find_matching(content, open_brace)]
+    dispatch = {}
+    pending = []
+    for match in _DISPATCH_CASE.finditer(body):
+        if match.group(2):
+            for case in pending:
+                dispatch.setdefault(case, match.group(2))
+            pending = []
+        else:
+            pending.append(match.group(1) or 'default')
+    return dispatch
+
+
+class ChapterPredictor:
+    """Analytic word-count distributions for every chapter type"""
+
+    def __init__(self, index, story_path=STORY_ENGINE, backstory_path=BACKSTORY_ENGINE):
+        self.index = index
+        with open(story_path, 'r', encoding='utf-8') as f:
+            self.story = f.read()
+        with open(backstory_path, 'r', encoding='utf-8') as f:
+            self.backstory = f.read()
+        self.story_functions = {f[0]: f for f in find_functions(self.story)}
+        self.backstory_functions = {f[0]: f for f in find_functions(self.backstory)}
+        self.story_values = {p.name: p.value for p in find_pools(self.story, story_path)}
+        self.backstory_values = {p.name: p.value for p in find_pools(self.backstory, backstory_path)}
+
+        _, _, chapter_start, chapter_end = self.story_functions['generateChapter']
+        self.vr_dispatch = parse_dispatch(self.story, 'switch (type) {', chapter_start)
+        self.backstory_dispatch = parse_dispatch(self.story, 'switch (currentArc.theme) {', chapter_start)
+        self.backstory_dispatch.pop('default', None)
+
+        # Once every pool is on cooldown the padding loop falls through to
+        # the first of allGenerators for every remaining paragraph
+        fallback = re.compile(r'allGenerators\s*=\s*\[\s*\(\)\s*=>\s*([A-Za-z_$][\w$]*)')
+        match = fallback.search(self.story, chapter_start, chapter_end)
+        self.fallback = match.group(1) if match else None
+
+        forced = re.compile(r'setting\s*===\s*"real_world"\s*&&\s*\[([^\]]*)\]\.includes\(type\)')
+        match = forced.search(self.story, chapter_start, chapter_end)
+        self.vr_only = set(re.findall(r'"([^"]+)"', match.group(1))) if match else set()
+
+        self.types = []
+        for chapter_type in list(self.story_values.get('chapterTypes', [])) + list(self.vr_dispatch):
+            if chapter_type != 'default' and chapter_type not in self.types:
+                self.types.append(chapter_type)
+        self._models = {}
+        self._cache = {}
+
+    def model(self, function_name):
+        """GeneratorModel for a story or backstory generator function"""
+        if function_name not in self._models:
+            if function_name in self.story_functions:
+                self._models[function_name] = GeneratorModel(
+                    self.story, self.story_functions[function_name], self.index, self.story_values)
+            else:
+                self._models[function_name] = GeneratorModel(
+                    self.backstory, self.backstory_functions[function_name], self.index, self.backstory_values)
+        return self._models[function_name]
+
+    def chapter_types(self):
+        """(type, setting) pairs the engine can produce"""
+        pairs = [(t, 'real_world') for t in self.backstory_dispatch]
+        for chapter_type in self.types:
+            for setting in SETTINGS:
+                if setting == 'real_world' and chapter_type in self.vr_only:
+                    continue
+                pairs.append((chapter_type, setting))
+        return pairs
+
+    def predict(self, chapter_type, setting='vr_world', mode='fresh'):
+        """
+        Summary of the word-count distribution for one chapter type.
+
+        mode 'fresh' assumes no paragraph has been used yet; 'exhausted' is the
+        long-run state where every paragraph is on its reuse cooldown.
+        """
+        backstory = chapter_type in self.backstory_dispatch
+        if backstory:
+            generator, setting = self.backstory_dispatch[chapter_type], 'real_world'
+        else:
+            generator = self.vr_dispatch.get(chapter_type, self.vr_dispatch.get('default'))
+        key = (generator, setting, mode, backstory)
+        if key not in self._cache:
+            self._cache[key] = self._predict(generator, setting, mode, backstory)
+        return dict(self._cache[key])
+
+    def _predict(self, generator, setting, mode, backstory):
+        model = self.model(generator)
+        base = model.base_distribution(setting)
+        base_paragraphs = len(model.slots[setting])
+        max_attempts = MAX_PADDING_ATTEMPTS
+
+        if backstory:
+            closing = uniform(self.index['pools']['backstoryClosings']['words'])
+            paragraph = None
+            if mode == 'fresh':
+                # Padding draws from the union of every backstory generator's output
+                mixture = defaultdict(float)
+                generators = sorted(set(self.backstory_dispatch.values()))
+                for name in generators:
+                    for w, p in self.model(name).paragraph_distribution(setting).items():
+                        mixture[w] += p / len(generators)
+                paragraph = dict(mixture)
+                max_attempts = 10 ** 6
+        else:
+            closing = uniform(self.index['pools']['generateChapter.closings']['words'])
+            paragraph = model.paragraph_distribution(setting)
+            if mode == 'exhausted':
+                if setting == 'vr_world':
+                    # usedVRParagraphs filters every generated paragraph out
+                    base, base_paragraphs = {0: 1.0}, 0
+                paragraph = self.model(self.fallback).paragraph_distribution(setting)
+
+        start = convolve(base, closing)
+        if paragraph:
+            final, padding = pad(start, paragraph, max_attempts=max_attempts)
+        else:
+            final, padding = start, 0.0
+        summary = summarize(final, base_paragraphs + 1 + padding)
+        summary['generator'] = generator
+        summary['base_words'] = round(sum(w * p for w, p in start.items()), 1)
+        return summary
+
+
+def pool_readability(index):
+    """Per-pool entry count, mean words and mean words per sentence"""
+    report = {}
+    for name, pool in index['pools'].items():
+        if 'words' not in pool or not pool['words']:
+            continue
+        sentences = sum(pool['sentences']) or 1
+        report[name] = {
+            'entries': len(pool['words']),
+            'mean_words': round(_mean(pool['words']), 1),
+            'min_words': min(pool['words']),
+            'max_words': max(pool['words']),
+            'words_per_sentence': round(sum(pool['words']) / sentences, 1),
+            'placeholders': sum(pool['placeholders']),
+        }
+    return report
+
+
+def main():
+    """Main function"""
+    parser = argparse.ArgumentParser(description='Pool metrics index and analytic chapter word counts')
+    parser.add_argument('--index', default=INDEX_PATH, help='Sidecar metrics index (rebuilt when sources change)')
+    parser.add_argument('--type', help='Only predict this chapter type')
+    parser.add_argument('--setting', choices=SETTINGS, help='Only predict this setting')
+    parser.add_argument('--mode', choices=MODES, default='exhausted',
+                        help='fresh story state, or the long-run state with every paragraph on cooldown')
+    parser.add_argument('--pools', action='store_true', help='Also list per-pool readability metrics')
+    parser.add_argument('--json', help='Write the predictions to this JSON file')
+    args = parser.parse_args()
+
+    index, cached = load_or_build(args.index)
+    predictor = ChapterPredictor(index)
+
+    pairs = predictor.chapter_types()
+    if args.type:
+        pairs = [p for p in pairs if p[0] == args.type] or [(args.type, args.setting or 'vr_world')]
+    if args.setting:
+        pairs = [p for p in pairs if p[1] == args.setting]
+
+    predictions = {f'{t}/{s}': predictor.predict(t, s, args.mode) for t, s in pairs}
+
+    print("=" * 60)
+    print("Chapter Word Count Prediction")
+    print("=" * 60)
+    print(f"  - Metrics index: {args.index} ({'reused' if cached else 'rebuilt'}, {len(index['pools'])} pools)")
+    print(f"  - Story state: {args.mode}")
+    print(f"\n  {'type/setting':34s} {'mean':>7s} {'p10':>6s} {'p50':>6s} {'p90':>6s} {'<200':>8s} {'paras':>6s}")
+    for key, stats in predictions.items():
+        print(f"  {key:34s} {stats['mean']:7.1f} {stats['p10']:6d} {stats['p50']:6d} {stats['p90']:6d} "
+              f"{stats['p_under_200']:8.4f} {stats['expected_paragraphs']:6.2f}")
+    short = [k for k, s in predictions.items() if s['p_under_200'] > 0]
+    if short:
+        print(f"\n⚠️  Chapter types that can end under 200 words: {', '.join(short)}")
+    under = [k for k, s in predictions.items() if s['p50'] < TARGET_WORDS]
+    if under:
+        print(f"\n⚠️  Chapter types whose median stays under {TARGET_WORDS} words: {', '.join(under)}")
+
+    if args.pools:
+        print(f"\n  {'pool':55s} {'entries':>7s} {'words':>6s} {'w/sent':>6s}")
+        for name, stats in pool_readability(index).items():
+            print(f"  {name:55s} {stats['entries']:7d} {stats['mean_words']:6.1f} {stats['words_per_sentence']:6.1f}")
+
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump({'mode': args.mode, 'predictions': predictions, 'pools': pool_readability(index)}, f, indent=2)
+        print(f"\nReport written to {args.json}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
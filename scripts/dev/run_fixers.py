@@ -0,0 +1,634 @@
+#!/usr/bin/env python3
+"""
+Dry-run and parallel harness for the fix_*.py scripts.
+
+Every fixer is a standalone script that opens files, rewrites them in place
+and prints. This runner executes each one unchanged inside a worker process
+whose file access is redirected to an in-memory snapshot of the tree: reads
+come from the snapshot, writes stay in memory, directory listings (os.walk,
+os.listdir, Path.rglob) include files created and drop files deleted in
+memory, and `node -c <file>` style self-checks are pointed at a temporary
+copy of the in-memory content.
+
+Fixers run in parallel, all against the same base snapshot. Their results
+are then committed in the requested order. A fixer that read a file an
+earlier fixer changed is re-run against the updated snapshot, so the outcome
+is the same as running them one after another. Nothing touches the tree
+until --apply, which writes every change in one pass: temp files first, then
+renames, rolled back if anything fails.
+
+Scripts written for a /workspace checkout have that prefix mapped to the
+repository root. Checks that import the changed file in a Python subprocess
+still see the file on disk.
+"""
+
+import argparse
+import builtins
+import contextlib
+import difflib
+import fnmatch
+import glob
+import hashlib
+import io
+import json
+import locale
+import os
+import pathlib
+import re
+import runpy
+import shlex
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+import traceback
+from concurrent.futures import ProcessPoolExecutor
+
+ROOT = os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
+SCRIPTS_DIR = os.path.dirname(os.path.abspath(__file__))
+WORKSPACE_ALIAS = '/workspace'
+
+
+# ----------------------------------------------------------------------
+# In-memory file system (worker side)
+# ----------------------------------------------------------------------
+
+class _WriteBuffer(io.BytesIO):
+    """Binary buffer that hands its content to the snapshot on close"""
+
+    def __init__(self, on_close, initial=b''):
+        super().__init__(initial)
+        self.seek(0, io.SEEK_END)
+        self._on_close = on_close
+
+    def close(self):
+        if not self.closed:
+            self._on_close(self.getvalue())
+        super().close()
+
+
+class _Entry:
+    """os.DirEntry stand-in for a file or directory that exists only in memory"""
+
+    def __init__(self, directory, name, is_dir):
+        self.name = name
+        self.path = os.path.join(directory, name)
+        self._is_dir = is_dir
+
+    def __fspath__(self):
+        return self.path
+
+    def is_dir(self, follow_symlinks=True):
+        return self._is_dir
+
+    def is_file(self, follow_symlinks=True):
+        return not self._is_dir
+
+    def is_symlink(self):
+        return False
+
+
+class _Listing:
+    """Iterator with the context-manager protocol of os.scandir's result"""
+
+    def __init__(self, entries):
+        self._entries = iter(entries)
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        return next(self._entries)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        self._entries = iter(())
+
+
+class VirtualFS:
+    """
+    Copy-on-write view of the tree for one fixer.
+
+    base holds changes committed by earlier fixers (path -> bytes, None for a
+    deleted file); writes holds this fixer's own changes. reads and listed
+    record what the fixer looked at, which is what conflicts are judged on.
+    """
+
+    def __init__(self, root, base=None):
+        self.root = root
+        self.base = base or {}
+        self.writes = {}
+        self.reads = set()
+        self.listed = set()
+        self.digests = {}         # sha256 of each file as first read from disk
+        self._real = {'open': builtins.open, 'exists': os.path.exists, 'isfile': os.path.isfile,
+                      'isdir': os.path.isdir, 'scandir': os.scandir, 'listdir': os.listdir,
+                      'makedirs': os.makedirs, 'mkdir': os.mkdir, 'remove': os.remove,
+                      'run': subprocess.run, 'popen': os.popen}
+        self._tmp = None
+
+    def key(self, path):
+        """Root-relative path for files inside the tree, None for anything else"""
+        if isinstance(path, int):
+            return None
+        path = os.fspath(path)
+        if isinstance(path, bytes):
+            path = os.fsdecode(path)
+        if path == WORKSPACE_ALIAS or path.startswith(WORKSPACE_ALIAS + '/'):
+            path = self.root + path[len(WORKSPACE_ALIAS):]
+        full = os.path.normpath(os.path.join(self.root, path))
+        if full != self.root and not full.startswith(self.root + os.sep):
+            return None
+        return os.path.relpath(full, self.root).replace(os.sep, '/')
+
+    def content(self, key):
+        """Current bytes of key, or None when the file does not exist"""
+        self.reads.add(key)
+        if key in self.writes:
+            return self.writes[key]
+        if key in self.base:
+            return self.base[key]
+        path = os.path.join(self.root, key)
+        if not self._real['isfile'](path):
+            self.digests.setdefault(key, None)
+            return None
+        with self._real['open'](path, 'rb') as f:
+            data = f.read()
+        self.digests.setdefault(key, hashlib.sha256(data).hexdigest())
+        return data
+
+    # -- patched functions ---------------------------------------------
+
+    def open(self, file, mode='r', buffering=-1, encoding=None, errors=None, newline=None,
+             closefd=True, opener=None):
+        key = self.key(file)
+        if key is None:
+            return self._real['open'](file, mode, buffering, encoding, errors, newline, closefd, opener)
+
+        binary = 'b' in mode
+        if 'r' in mode and '+' not in mode:
+            data = self.content(key)
+            if data is None:
+                raise FileNotFoundError(2, 'No such file or directory', os.fspath(file))
+            raw = io.BytesIO(data)
+        else:
+            initial = b''
+            if 'a' in mode or '+' in mode:
+                initial = self.content(key)
+                if initial is None:
+                    if 'r' in mode:
+                        raise FileNotFoundError(2, 'No such file or directory', os.fspath(file))
+                    initial = b''
+            if 'x' in mode and self.content(key) is not None:
+                raise FileExistsError(17, 'File exists', os.fspath(file))
+
+            def store(data, key=key):
+                self.writes[key] = data
+            raw = _WriteBuffer(store, initial)
+            if 'r' in mode:
+                raw.seek(0)
+
+        if binary:
+            return raw
+        return io.TextIOWrapper(raw, encoding=encoding or locale.getpreferredencoding(False),
+                                errors=errors, newline=newline, write_through=True)
+
+    def exists(self, path):
+        key = self.key(path)
+        if key is None:
+            return self._real['exists'](path)
+        if self.content(key) is not None:
+            return True
+        return self.isdir(os.path.join(self.root, key))
+
+    def isfile(self, path):
+        key = self.key(path)
+        if key is None:
+            return self._real['isfile'](path)
+        return self.content(key) is not None
+
+    def isdir(self, path):
+        key = self.key(path)
+        if key is None or self._real['isdir'](os.path.join(self.root, key)):
+            return self._real['isdir'](path)
+        prefix = key + '/'
+        return any(data is not None and name.startswith(prefix)
+                   for name, data in {**self.base, **self.writes}.items())
+
+    def makedirs(self, name, mode=0o777, exist_ok=False):
+        """Directories in the tree are implied by the files written into them"""
+        if self.key(name) is None:
+            return self._real['makedirs'](name, mode, exist_ok)
+        if not exist_ok and self.isdir(name):
+            raise FileExistsError(17, 'File exists', os.fspath(name))
+
+    def mkdir(self, path, mode=0o777, *args, **kwargs):
+        if self.key(path) is None:
+            return self._real['mkdir'](path, mode, *args, **kwargs)
+        if self.exists(path):
+            raise FileExistsError(17, 'File exists', os.fspath(path))
+
+    def _listing(self, directory):
+        """
+        (entries kept from disk, [(name, is_dir)] created in memory) of a
+        directory in the tree, recorded in listed.
+        """
+        key = self.key(directory)
+        self.listed.add(key)
+        prefix = '' if key == '.' else key + '/'
+        changed = {**self.base, **self.writes}
+        full = os.path.join(self.root, key)
+        real = list(self._real['scandir'](full)) if self._real['isdir'](full) else []
+        on_disk = {entry.name for entry in real}
+        kept = [entry for entry in real if changed.get(prefix + entry.name, b'') is not None]
+        added = {}
+        for path, data in changed.items():
+            if data is not None and path.startswith(prefix):
+                name, _, rest = path[len(prefix):].partition('/')
+                if name not in on_disk:
+                    added[name] = added.get(name, False) or bool(rest)
+        if not real and not added and not self._real['isdir'](full):
+            raise FileNotFoundError(2, 'No such file or directory', os.fspath(directory))
+        return kept, sorted(added.items())
+
+    def scandir(self, path='.'):
+        if self.key(path) is None:
+            return self._real['scandir'](path)
+        kept, added = self._listing(path)
+        directory = os.fsdecode(os.fspath(path))
+        return _Listing(kept + [_Entry(directory, name, is_dir) for name, is_dir in added])
+
+    def listdir(self, path='.'):
+        if self.key(path) is None:
+            return self._real['listdir'](path)
+        kept, added = self._listing(path)
+        return [entry.name for entry in kept] + [name for name, _ in added]
+
+    def remove(self, path, *args, **kwargs):
+        key = self.key(path)
+        if key is None:
+            return self._real['remove'](path, *args, **kwargs)
+        if self.content(key) is None:
+            raise FileNotFoundError(2, 'No such file or directory', os.fspath(path))
+        self.writes[key] = None
+
+    def _materialize(self, token):
+        """Path of a temp copy holding the in-memory content, or token itself"""
+        key = self.key(token) if isinstance(token, (str, os.PathLike)) else None
+        if key is None:
+            return token
+        # Recorded as a read even when disk is current: the command depends on it
+        data = self.content(key)
+        if data is None or key not in self.writes and key not in self.base:
+            return token
+        path = os.path.join(self._tmp, hashlib.sha256(key.encode()).hexdigest()[:12], os.path.basename(key))
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with self._real['open'](path, 'wb') as f:
+            f.write(data)
+        return path
+
+    def run(self, args, *rest, **kwargs):
+        if isinstance(args, (list, tuple)):
+            args = [self._materialize(arg) for arg in args]
+        elif isinstance(args, str) and not kwargs.get('shell'):
+            args = self._materialize(args)
+        return self._real['run'](args, *rest, **kwargs)
+
+    def popen(self, cmd, *rest, **kwargs):
+        parts = re.split(r'(\s+)', cmd)
+        for i, part in enumerate(parts):
+            if part.strip():
+                path = self._materialize(part)
+                parts[i] = part if path == part else shlex.quote(path)
+        return self._real['popen'](''.join(parts), *rest, **kwargs)
+
+    @contextlib.contextmanager
+    def installed(self):
+        """
+        Route builtins/os/subprocess/pathlib file access through this snapshot.
+
+        os.walk and Path.glob/rglob list directories with os.scandir, so
+        patching it covers them too.
+        """
+        patches = [(builtins, 'open', self.open), (io, 'open', self.open),
+                   (os.path, 'exists', self.exists), (os.path, 'isfile', self.isfile),
+                   (os.path, 'isdir', self.isdir), (os, 'makedirs', self.makedirs), (os, 'mkdir', self.mkdir),
+                   (os, 'scandir', self.scandir), (os, 'listdir', self.listdir),
+                   (os, 'remove', self.remove), (os, 'unlink', self.remove),
+                   (subprocess, 'run', self.run), (os, 'popen', self.popen),
+                   (pathlib.Path, 'exists', lambda path, *args, **kwargs: self.exists(path)),
+                   (pathlib.Path, 'is_file', lambda path, *args, **kwargs: self.isfile(path))]
+        originals = [(module, name, getattr(module, name)) for module, name, _ in patches]
+        with tempfile.TemporaryDirectory(prefix='fixers-') as tmp:
+            self._tmp = tmp
+            for module, name, value in patches:
+                setattr(module, name, value)
+            try:
+                yield self
+            finally:
+                for module, name, value in originals:
+                    setattr(module, name, value)
+                self._tmp = None
+
+
+def run_fixer(root, script, base=None):
+    """Run one fix_*.py script against a snapshot; returns a plain result dict"""
+    fs = VirtualFS(root, base)
+    output = io.StringIO()
+    error = None
+    started = time.perf_counter()
+    cwd = os.getcwd()
+    argv = sys.argv
+    sys.argv = [script]
+    if SCRIPTS_DIR not in sys.path:
+        sys.path.insert(0, SCRIPTS_DIR)
+    try:
+        os.chdir(root)
+        with fs.installed(), contextlib.redirect_stdout(output), contextlib.redirect_stderr(output):
+            runpy.run_path(script, run_name='__main__')
+    except SystemExit as e:
+        if e.code not in (None, 0):
+            error = f'exit status {e.code}'
+    except BaseException as e:
+        error = f'{type(e).__name__}: {e}'
+        output.write(traceback.format_exc())
+    finally:
+        os.chdir(cwd)
+        sys.argv = argv
+
+    return {
+        'fixer': os.path.basename(script),
+        'ok': error is None,
+        'error': error,
+        'output': output.getvalue(),
+        'reads': sorted(fs.reads),
+        'listed': sorted(fs.listed),
+        'writes': fs.writes if error is None else {},
+        'digests': fs.digests,
+        'seconds': time.perf_counter() - started,
+        'rerun': False,
+    }
+
+
+# ----------------------------------------------------------------------
+# Scheduling
+# ----------------------------------------------------------------------
+
+def discover_fixers(patterns=None, scripts_dir=SCRIPTS_DIR):
+    """fix_*.py scripts matching patterns, in the order the patterns are given"""
+    available = sorted(os.path.basename(p) for p in glob.glob(os.path.join(scripts_dir, 'fix_*.py')))
+    if not patterns:
+        return [os.path.join(scripts_dir, name) for name in available]
+    selected = []
+    for pattern in patterns:
+        name = os.path.basename(pattern)
+        name = name if name.endswith('.py') or any(c in name for c in '*?[') else name + '.py'
+        matches = fnmatch.filter(available, name)
+        if not matches:
+            raise ValueError(f"No fixer matches '{pattern}'")
+        selected.extend(m for m in matches if os.path.join(scripts_dir, m) not in selected)
+    return [os.path.join(scripts_dir, name) if os.sep not in name else name for name in selected]
+
+
+def _conflicts(result, changed, existence_changed):
+    """True when result was computed from files an earlier fixer changed"""
+    if any(path in changed for path in result['reads']):
+        return True
+    for directory in result['listed']:
+        prefix = '' if directory == '.' else directory + '/'
+        if any(path.startswith(prefix) for path in existence_changed):
+            return True
+    return False
+
+
+def run_fixers(root, scripts, jobs=None, on_result=None):
+    """
+    Run scripts in parallel over one snapshot and commit their changes in order.
+
+    Returns (results, changes) where changes maps root-relative paths to new
+    bytes (None for deletions), relative to the tree on disk.
+    """
+    changes = {}
+    existence_changed = set()
+    results = []
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        futures = [pool.submit(run_fixer, root, script) for script in scripts]
+        for script, future in zip(scripts, futures):
+            result = future.result()
+            if _conflicts(result, changes, existence_changed):
+                result = pool.submit(run_fixer, root, script, dict(changes)).result()
+                result['rerun'] = True
+            for path, data in result['writes'].items():
+                on_disk = os.path.isfile(os.path.join(root, path))
+                if (data is None) == on_disk:
+                    existence_changed.add(path)
+                changes[path] = data
+            results.append(result)
+            if on_result:
+                on_result(result)
+
+    # Drop writes that reproduce what is already on disk
+    for path in list(changes):
+        full = os.path.join(root, path)
+        if changes[path] is None:
+            if not os.path.exists(full):
+                del changes[path]
+        elif os.path.isfile(full):
+            with open(full, 'rb') as f:
+                if f.read() == changes[path]:
+                    del changes[path]
+    return results, changes
+
+
+# ----------------------------------------------------------------------
+# Preview and commit
+# ----------------------------------------------------------------------
+
+def _read(root, path):
+    full = os.path.join(root, path)
+    if not os.path.isfile(full):
+        return None
+    with open(full, 'rb') as f:
+        return f.read()
+
+
+def unified_diff(root, changes, context=3):
+    """Unified diff of every change against the tree on disk"""
+    chunks = []
+    for path in sorted(changes):
+        before, after = _read(root, path), changes[path]
+        try:
+            old = (before or b'').decode('utf-8').splitlines(True)
+            new = (after or b'').decode('utf-8').splitlines(True)
+        except UnicodeDecodeError:
+            chunks.append(f'Binary files a/{path} and b/{path} differ\n')
+            continue
+        chunks.extend(difflib.unified_diff(old, new, '/dev/null' if before is None else f'a/{path}',
+                                           '/dev/null' if after is None else f'b/{path}', n=context))
+        if chunks and not chunks[-1].endswith('\n'):
+            chunks.append('\n\\ No newline at end of file\n')
+    return ''.join(chunks)
+
+
+def diff_stat(root, changes):
+    """(path, added, removed) per changed file"""
+    stats = []
+    for path in sorted(changes):
+        before = (_read(root, path) or b'').decode('utf-8', 'replace').splitlines()
+        after = (changes[path] or b'').decode('utf-8', 'replace').splitlines()
+        lines = list(difflib.unified_diff(before, after, n=0, lineterm=''))[2:]
+        added = sum(1 for line in lines if line.startswith('+'))
+        removed = sum(1 for line in lines if line.startswith('-'))
+        stats.append((path, added, removed))
+    return stats
+
+
+def commit(root, changes, expected=None):
+    """
+    Write every change in one pass: all temp files first, then the renames.
+
+    expected maps paths to the sha256 of the content the fixers started from;
+    if a file changed on disk since, nothing is written. Any failure restores
+    the files already replaced, so the tree is never left half-modified.
+    """
+    for path, digest in (expected or {}).items():
+        data = _read(root, path)
+        if (hashlib.sha256(data).hexdigest() if data is not None else None) != digest:
+            raise RuntimeError(f"{path} changed on disk during the run; nothing written")
+
+    staged = []
+    originals = {}
+    try:
+        for path, data in sorted(changes.items()):
+            full = os.path.join(root, path)
+            originals[full] = _read(root, path)
+            if data is None:
+                continue
+            directory = os.path.dirname(full)
+            os.makedirs(directory, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(prefix='.fixers-', dir=directory)
+            with os.fdopen(fd, 'wb') as f:
+                f.write(data)
+            if os.path.exists(full):
+                shutil.copymode(full, tmp)
+            staged.append((tmp, full))
+    except BaseException:
+        for tmp, _ in staged:
+            os.remove(tmp)
+        raise
+
+    done = []
+    try:
+        for tmp, full in staged:
+            os.replace(tmp, full)
+            done.append(full)
+        for path, data in changes.items():
+            if data is None:
+                os.remove(os.path.join(root, path))
+                done.append(os.path.join(root, path))
+    except BaseException:
+        for tmp, _ in staged:
+            if os.path.exists(tmp):
+                os.remove(tmp)
+        for full in done:
+            if originals[full] is None:
+                os.remove(full)
+            else:
+                with open(full, 'wb') as f:
+                    f.write(originals[full])
+        raise
+
+
+def snapshot_digests(results):
+    """sha256 of every file the fixers read, as they first saw it on disk"""
+    digests = {}
+    for result in results:
+        for path, digest in result['digests'].items():
+            digests.setdefault(path, digest)
+    return digests
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Run fix_*.py scripts over an in-memory snapshot')
+    parser.add_argument('fixers', nargs='*', help='Fixer names or globs, in order (default: all fix_*.py)')
+    parser.add_argument('--root', default=ROOT, help='Repository root')
+    parser.add_argument('--jobs', '-j', type=int, default=None, help='Worker processes (default: CPU count)')
+    parser.add_argument('--apply', action='store_true', help='Write the changes (default: preview only)')
+    parser.add_argument('--stat', action='store_true', help='Show a per-file summary instead of the full diff')
+    parser.add_argument('--verbose', '-v', action='store_true', help="Show each fixer's own output")
+    parser.add_argument('--json', action='store_true', help='Print results as JSON')
+    args = parser.parse_args()
+
+    root = os.path.abspath(args.root)
+    try:
+        scripts = discover_fixers(args.fixers)
+    except ValueError as e:
+        print(f"❌ {e}")
+        return 1
+
+    if not args.json:
+        print("=" * 60)
+        print(f"FIXER RUN ({'apply' if args.apply else 'dry run'}, {len(scripts)} fixers)")
+        print("=" * 60)
+
+    def report(result):
+        if args.json:
+            return
+        touched = len(result['writes'])
+        rerun = ' (re-run on updated snapshot)' if result['rerun'] else ''
+        if not result['ok']:
+            print(f"  ❌ {result['fixer']}: {result['error']}{rerun}")
+        elif touched:
+            print(f"  ✅ {result['fixer']}: {touched} file(s) in {result['seconds']:.2f}s{rerun}")
+        else:
+            print(f"  ⏭️  {result['fixer']}: no changes ({result['seconds']:.2f}s){rerun}")
+        if args.verbose and result['output'].strip():
+            for line in result['output'].rstrip().splitlines():
+                print(f"      {line}")
+
+    started = time.perf_counter()
+    results, changes = run_fixers(root, scripts, args.jobs, report)
+    elapsed = time.perf_counter() - started
+
+    if args.json:
+        print(json.dumps({
+            'results': [{k: v for k, v in r.items() if k not in ('writes', 'digests')}
+                        | {'writes': sorted(r['writes'])} for r in results],
+            'changes': {path: None if data is None else len(data) for path, data in sorted(changes.items())},
+            'seconds': round(elapsed, 3),
+        }, indent=2))
+    elif args.stat:
+        print()
+        for path, added, removed in diff_stat(root, changes):
+            print(f"  - {path}: +{added} -{removed}")
+    elif changes:
+        print()
+        print(unified_diff(root, changes), end='')
+
+    failed = [r for r in results if not r['ok']]
+    if not args.json:
+        print()
+        print(f"📈 {len(changes)} file(s) changed by {sum(1 for r in results if r['writes'])} fixer(s), "
+              f"{len(failed)} failed, {sum(r['rerun'] for r in results)} re-run, {elapsed:.2f}s")
+
+    if args.apply and changes:
+        try:
+            commit(root, changes, snapshot_digests(results))
+        except (OSError, RuntimeError) as e:
+            print(f"❌ Nothing written: {e}")
+            return 1
+        if not args.json:
+            print(f"✅ Wrote {len(changes)} file(s)")
+    elif changes and not args.json:
+        print("⚠️  Dry run - re-run with --apply to write these changes")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
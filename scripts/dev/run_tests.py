@@ -0,0 +1,598 @@
+#!/usr/bin/env python3
+"""
+One runner for the Python test scripts.
+
+The suites are standalone scripts in three styles: module-level test_*
+functions (many return False instead of asserting), run_all_tests()/main()
+entry points, and tester classes (FeatureTester, ...) whose run_all_tests()
+records every check through log_test. This finds all of them without
+importing anything, in tests/test_*.py, tests/python/test_*.py and
+scripts/dev/test_*.py, and runs them over a process pool, one file per task
+in a fresh worker.
+
+A test passes unless it raises, returns False or a non-zero exit code, or
+calls sys.exit with one. A tester class counts as one test and keeps each
+log_test entry as a subtest. Parameters named after FIXTURES are supplied:
+static_server (the repository served in-process, one per worker) and
+base_url (its URL); functions with any other required parameter are helpers.
+
+Every run is saved to .test-results.json. --last-failed reruns only what
+failed there and --failed-first runs those tests first. Durations also go
+into the rolling history of duration_history (.test-history.json): a test
+more than --regression-factor times slower than its median is reported,
+--slowest-first runs the files with the longest expected time first, and
+--shard K/N runs the K-th of N shards of even expected time. --json and
+--junit write the full report for CI.
+"""
+
+import argparse
+import ast
+import contextlib
+import importlib.util
+import io
+import json
+import multiprocessing
+import os
+import re
+import signal
+import sys
+import time
+import traceback
+import xml.etree.ElementTree as ET
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from datetime import datetime
+
+from duration_history import DurationHistory, REGRESSION_FACTOR, schedule
+from import_content import write_atomic
+
+ROOT = os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
+TEST_DIRS = ['tests', os.path.join('tests', 'python'), os.path.join('scripts', 'dev')]
+RESULTS_PATH = '.test-results.json'
+RESULTS_FORMAT = 1
+ENTRY_POINTS = ('run_all_tests', 'main')
+FIXTURES = ('static_server', 'base_url')
+SKIP_EXCEPTIONS = {'Skipped', 'SkipTest'}
+FAILED = ('failed', 'error')
+DEFAULT_TIMEOUT = 300
+MAX_OUTPUT = 20000
+
+_ANSI = re.compile(r'\x1b\[[0-9;]*[A-Za-z]')
+_XML_INVALID = re.compile('[^\t\n\r\x20-\ud7ff\ue000-\ufffd\U00010000-\U0010ffff]')
+
+
+class TestTimeout(Exception):
+    """A test ran past the per-test timeout"""
+
+
+def _required_params(function, skip=0):
+    """Positional parameters without defaults (after the first skip)"""
+    args = function.args.posonlyargs + function.args.args
+    required = args[skip:len(args) - len(function.args.defaults)]
+    required += [arg for arg, default in zip(function.args.kwonlyargs, function.args.kw_defaults) if default is None]
+    return [arg.arg for arg in required]
+
+
+def _fixture_params(function, skip=0):
+    """Fixture parameters of a function, or None when it needs anything else"""
+    required = _required_params(function, skip)
+    if any(name not in FIXTURES for name in required):
+        return None
+    args = function.args.posonlyargs + function.args.args + function.args.kwonlyargs
+    return [arg.arg for arg in args[skip:] if arg.arg in FIXTURES]
+
+
+def discover_file(path, root=ROOT):
+    """The runnable tests of one script, found from its syntax tree"""
+    with open(os.path.join(root, path), encoding='utf-8') as f:
+        tree = ast.parse(f.read(), path)
+    functions = {}
+    units = []
+    for node in tree.body:
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+            functions[node.name] = node
+        elif isinstance(node, ast.ClassDef):
+            methods = {n.name: n for n in node.body if isinstance(n, ast.FunctionDef)}
+            if 'run_all_tests' not in methods:
+                continue
+            params = _fixture_params(methods['__init__'], skip=1) if '__init__' in methods else []
+            if params is not None:
+                units.append({'name': node.name, 'kind': 'class', 'params': params})
+
+    tests = []
+    for name, node in functions.items():
+        if name.startswith('test_') and isinstance(node, ast.FunctionDef):
+            params = _fixture_params(node)
+            if params is not None:
+                tests.append({'name': name, 'kind': 'function', 'params': params})
+    if not tests and not units:
+        for name in ENTRY_POINTS:
+            if name in functions and _fixture_params(functions[name]) is not None:
+                tests.append({'name': name, 'kind': 'entry', 'params': _fixture_params(functions[name])})
+                break
+    return tests + units
+
+
+def discover(paths=None, root=ROOT, keyword=None):
+    """
+    {path: [unit, ...]} for the test scripts under paths (default TEST_DIRS).
+
+    paths may name directories or files relative to root; keyword keeps
+    only tests whose id contains it.
+    """
+    files = []
+    for entry in paths or TEST_DIRS:
+        full = os.path.join(root, entry)
+        if os.path.isfile(full):
+            files.append(os.path.relpath(full, root))
+        elif os.path.isdir(full):
+            files.extend(os.path.relpath(os.path.join(full, name), root) for name in sorted(os.listdir(full))
+                         if name.startswith('test_') and name.endswith('.py'))
+    found = {}
+    for path in files:
+        path = path.replace(os.sep, '/')
+        try:
+            units = discover_file(path, root)
+        except SyntaxError as e:
+            units = [{'name': '<module>', 'kind': 'syntax', 'params': [], 'error': f'SyntaxError: {e}'}]
+        if keyword:
+            units = [unit for unit in units if keyword in f"{path}::{unit['name']}"]
+        if units:
+            found[path] = units
+    return found
+
+
+# ---------------------------------------------------------------------------
+# Worker side
+# ---------------------------------------------------------------------------
+
+_fixtures = {}
+
+
+def _fixture(name, root):
+    """A fixture value for root, created once per process"""
+    if (name, root) not in _fixtures:
+        if name == 'base_url':
+            _fixtures[name, root] = _fixture('static_server', root).url
+        else:
+            sys.path.insert(0, os.path.join(ROOT, 'tests', 'python'))
+            from static_server import StaticServer
+            _fixtures[name, root] = StaticServer(root).start()
+    return _fixtures[name, root]
+
+
+@contextlib.contextmanager
+def _captured():
+    buffer = io.StringIO()
+    with contextlib.redirect_stdout(buffer), contextlib.redirect_stderr(buffer):
+        yield buffer
+
+
+@contextlib.contextmanager
+def _deadline(seconds):
+    """Raise TestTimeout in the main thread after seconds (where SIGALRM exists)"""
+    if not seconds or not hasattr(signal, 'SIGALRM'):
+        yield
+        return
+
+    def expire(signum, frame):
+        raise TestTimeout(f'timed out after {seconds}s')
+
+    previous = signal.signal(signal.SIGALRM, expire)
+    signal.setitimer(signal.ITIMER_REAL, seconds)
+    try:
+        yield
+    finally:
+        signal.setitimer(signal.ITIMER_REAL, 0)
+        signal.signal(signal.SIGALRM, previous)
+
+
+def _clean(text):
+    text = _ANSI.sub('', text)
+    return text if len(text) <= MAX_OUTPUT else '...\n' + text[-MAX_OUTPUT:]
+
+
+def _outcome_of(exc):
+    """(outcome, message) for an exception a test raised"""
+    if isinstance(exc, SystemExit):
+        code = exc.code
+        if code is None or code == 0:
+            return 'passed', ''
+        return 'failed', f'exit status {code}'
+    if type(exc).__name__ in SKIP_EXCEPTIONS:
+        return 'skipped', str(exc)
+    if isinstance(exc, AssertionError):
+        return 'failed', str(exc) or 'assertion failed'
+    return 'error', f'{type(exc).__name__}: {exc}'
+
+
+def _outcome_of_value(value):
+    """(outcome, message) for what a test returned"""
+    if value is False:
+        return 'failed', 'returned False'
+    if isinstance(value, int) and not isinstance(value, bool) and value != 0:
+        return 'failed', f'returned {value}'
+    return 'passed', ''
+
+
+def _subtests(instance):
+    """log_test entries of a tester instance as subtest results"""
+    subtests = []
+    for entry in getattr(instance, 'test_results', None) or []:
+        if isinstance(entry, dict) and 'test' in entry:
+            subtests.append({
+                'name': str(entry['test']),
+                'outcome': 'passed' if entry.get('passed') else 'failed',
+                'message': str(entry.get('message', '')),
+                'duration': entry.get('duration', 0.0),
+            })
+    return subtests
+
+
+def _run_unit(module, path, unit, timeout, root):
+    result = {'id': f"{path}::{unit['name']}", 'file': path, 'name': unit['name']}
+    instance = None
+    start = time.perf_counter()
+    with _captured() as output:
+        try:
+            with _deadline(timeout):
+                kwargs = {name: _fixture(name, root) for name in unit['params']}
+                if unit['kind'] == 'class':
+                    instance = getattr(module, unit['name'])(**kwargs)
+                    value = instance.run_all_tests()
+                else:
+                    value = getattr(module, unit['name'])(**kwargs)
+            outcome, message = _outcome_of_value(value)
+        except KeyboardInterrupt:
+            raise
+        except BaseException as e:
+            outcome, message = _outcome_of(e)
+            if outcome in FAILED:
+                result['details'] = traceback.format_exc()
+    result['duration'] = round(time.perf_counter() - start, 4)
+
+    if instance is not None:
+        subtests = _subtests(instance)
+        if subtests:
+            result['subtests'] = subtests
+            failed = [sub['name'] for sub in subtests if sub['outcome'] != 'passed']
+            if failed and 'details' not in result:
+                outcome = 'failed'
+                message = f"{len(failed)} of {len(subtests)} checks failed: {', '.join(failed[:5])}"
+                if len(failed) > 5:
+                    message += ', ...'
+    result['outcome'] = outcome
+    result['message'] = message
+    if outcome != 'passed' and output.getvalue():
+        result['output'] = _clean(output.getvalue())
+    return result
+
+
+def run_file(path, units, timeout=DEFAULT_TIMEOUT, root=ROOT):
+    """Import one test script and run the given units of it; a list of results"""
+    root = os.path.abspath(root)
+    os.chdir(root)
+    directory = os.path.dirname(os.path.join(root, path))
+    if directory not in sys.path:
+        sys.path.insert(0, directory)
+
+    if units and units[0]['kind'] == 'syntax':
+        return [{'id': f'{path}::<module>', 'file': path, 'name': '<module>', 'outcome': 'error',
+                 'message': units[0]['error'], 'duration': 0.0}]
+
+    start = time.perf_counter()
+    name = '_run_tests_' + re.sub(r'\W', '_', path)
+    with _captured() as output:
+        try:
+            spec = importlib.util.spec_from_file_location(name, os.path.join(root, path))
+            module = importlib.util.module_from_spec(spec)
+            sys.modules[name] = module
+            spec.loader.exec_module(module)
+        except KeyboardInterrupt:
+            raise
+        except BaseException as e:
+            outcome, message = _outcome_of(e)
+            return [{'id': f'{path}::<module>', 'file': path, 'name': '<module>', 'outcome': 'error',
+                     'message': message or f'{type(e).__name__} while importing', 'details': traceback.format_exc(),
+                     'output': _clean(output.getvalue()), 'duration': round(time.perf_counter() - start, 4)}]
+    return [_run_unit(module, path, unit, timeout, root) for unit in units]
+
+
+# ---------------------------------------------------------------------------
+# Scheduling and reports
+# ---------------------------------------------------------------------------
+
+def load_results(path=os.path.join(ROOT, RESULTS_PATH)):
+    """The saved results of earlier runs, or None"""
+    try:
+        with open(path) as f:
+            results = json.load(f)
+    except (OSError, ValueError):
+        return None
+    return results if results.get('format') == RESULTS_FORMAT else None
+
+
+def merge_results(previous, report):
+    """
+    Saved results updated with a report.
+
+    Only id, file, name, outcome and duration are kept per test. Tests the
+    report did not run keep their earlier entry, so a -k or --last-failed
+    run does not forget the rest of the suite.
+    """
+    tests = {test['id']: test for test in (previous or {}).get('tests', [])}
+    ran_files = {test['file'] for test in report['tests']}
+    for test_id, test in list(tests.items()):
+        if test['name'] == '<module>' and test['file'] in ran_files:
+            del tests[test_id]
+    for test in report['tests']:
+        tests[test['id']] = {key: test[key] for key in ('id', 'file', 'name', 'outcome', 'duration')}
+    return {'format': RESULTS_FORMAT, 'updated': report['created'], 'tests': sorted(tests.values(), key=lambda t: t['id'])}
+
+
+def expected_duration(history, path, units):
+    """Expected seconds for units of path; tests without history count as the median test"""
+    default = history.default([key for key in history.tests if key.count('::') == 1])
+    return sum(history.expected(f"{path}::{unit['name']}", default) for unit in units)
+
+
+def select(found, previous=None, last_failed=False, failed_first=False, history=None):
+    """
+    Ordered [(path, units)] tasks for a run.
+
+    last_failed keeps only the tests that failed or errored in previous, the
+    saved results (all of them when nothing did). failed_first puts files
+    and tests that failed first; with a DurationHistory, files with the
+    longest expected duration go first, which keeps a pool of workers evenly
+    busy to the end.
+    """
+    previous_tests = {test['id']: test for test in (previous or {}).get('tests', [])}
+    failed_ids = {test_id for test_id, test in previous_tests.items() if test['outcome'] in FAILED}
+    broken_files = {test['file'] for test in previous_tests.values()
+                    if test['outcome'] in FAILED and test['name'] == '<module>'}
+
+    def failed(path, unit):
+        return path in broken_files or f"{path}::{unit['name']}" in failed_ids
+
+    tasks = list(found.items())
+    if last_failed and any(failed(path, unit) for path, units in tasks for unit in units):
+        tasks = [(path, [unit for unit in units if failed(path, unit)]) for path, units in tasks]
+        tasks = [(path, units) for path, units in tasks if units]
+
+    def key(task):
+        path, units = task
+        parts = []
+        if failed_first:
+            parts.append(0 if any(failed(path, unit) for unit in units) else 1)
+        if history is not None:
+            parts.append(-expected_duration(history, path, units))
+        return parts
+
+    tasks.sort(key=key)
+    if failed_first:
+        tasks = [(path, sorted(units, key=lambda unit: not failed(path, unit))) for path, units in tasks]
+    return tasks
+
+
+def shard(tasks, index, count, history):
+    """
+    The index-th (from 1) of count shards of tasks with even expected time.
+
+    Files are split by schedule(), longest first, so every shard gets the
+    same file whichever machine computes it from the same history.
+    """
+    shards, _ = schedule(tasks, lambda task: expected_duration(history, *task), count)
+    return shards[index - 1]
+
+
+def record_durations(history, report):
+    """
+    Add the durations of a report to history; the regressions it shows.
+
+    Errored and skipped tests are left out: a timeout or an import failure
+    says nothing about how long the test takes.
+    """
+    regressions = []
+    for result in report['tests']:
+        if result['outcome'] in ('passed', 'failed'):
+            regression = history.record(result['id'], result['duration'])
+            if regression:
+                regressions.append(regression)
+    return regressions
+
+
+def summarize(results):
+    summary = {'tests': len(results), 'passed': 0, 'failed': 0, 'error': 0, 'skipped': 0}
+    for result in results:
+        summary[result['outcome']] += 1
+    summary['duration'] = round(sum(result['duration'] for result in results), 3)
+    return summary
+
+
+def run_tasks(tasks, jobs=None, timeout=DEFAULT_TIMEOUT, root=ROOT, progress=None):
+    """
+    Run [(path, units)] tasks and return the report.
+
+    Each file runs in a fresh spawned worker, at most jobs at a time
+    (default: the CPU count, at most 8); jobs=0 runs them in this process.
+    progress(path, results) is called as each file finishes.
+    """
+    if jobs is None:
+        jobs = min(8, os.cpu_count() or 1)
+    start = time.perf_counter()
+    by_file = {}
+    if jobs == 0:
+        cwd = os.getcwd()
+        try:
+            for path, units in tasks:
+                by_file[path] = run_file(path, units, timeout, root)
+                if progress:
+                    progress(path, by_file[path])
+        finally:
+            os.chdir(cwd)
+    else:
+        context = multiprocessing.get_context('spawn')
+        with ProcessPoolExecutor(max_workers=jobs, mp_context=context, max_tasks_per_child=1) as pool:
+            futures = {pool.submit(run_file, path, units, timeout, root): (path, units) for path, units in tasks}
+            for future in as_completed(futures):
+                path, units = futures[future]
+                try:
+                    by_file[path] = future.result()
+                except Exception as e:
+                    by_file[path] = [{'id': f"{path}::{unit['name']}", 'file': path, 'name': unit['name'],
+                                      'outcome': 'error', 'message': f'worker died: {type(e).__name__}: {e}',
+                                      'duration': 0.0} for unit in units]
+                if progress:
+                    progress(path, by_file[path])
+
+    results = [result for path, _ in tasks for result in by_file[path]]
+    return {
+        'format': RESULTS_FORMAT,
+        'created': datetime.now().isoformat(timespec='seconds'),
+        'wall': round(time.perf_counter() - start, 3),
+        'jobs': jobs,
+        'summary': summarize(results),
+        'tests': results,
+    }
+
+
+def to_junit(report):
+    """The report as a JUnit XML string; tester subtests become test cases"""
+    def text(value):
+        return _XML_INVALID.sub('', value)
+
+    suites = ET.Element('testsuites', name='Story-Unending', time=str(report['wall']))
+    files = {}
+    for result in report['tests']:
+        files.setdefault(result['file'], []).append(result)
+    totals = {'tests': 0, 'failures': 0, 'errors': 0, 'skipped': 0}
+    for path, results in files.items():
+        suite = ET.SubElement(suites, 'testsuite', name=path)
+        counts = {'tests': 0, 'failures': 0, 'errors': 0, 'skipped': 0}
+        cases = []
+        for result in results:
+            classname = path[:-3].replace('/', '.')
+            if result.get('subtests') and result['outcome'] != 'error':
+                for sub in result['subtests']:
+                    cases.append((f"{classname}.{result['name']}", sub['name'], sub, None))
+            else:
+                cases.append((classname, result['name'], result, result))
+        for classname, name, case, full in cases:
+            element = ET.SubElement(suite, 'testcase', classname=classname, name=name,
+                                    time=str(case.get('duration', 0.0)))
+            counts['tests'] += 1
+            tag = {'failed': 'failure', 'error': 'error', 'skipped': 'skipped'}.get(case['outcome'])
+            if tag:
+                counts[{'failure': 'failures', 'error': 'errors', 'skipped': 'skipped'}[tag]] += 1
+                child = ET.SubElement(element, tag, message=text(case.get('message', '')))
+                child.text = text((full or {}).get('details', '') or case.get('message', ''))
+            if full and full.get('output'):
+                ET.SubElement(element, 'system-out').text = text(full['output'])
+        suite.set('time', str(round(sum(result['duration'] for result in results), 3)))
+        for name, value in counts.items():
+            suite.set(name, str(value))
+            totals[name] += value
+    for name, value in totals.items():
+        suites.set(name, str(value))
+    ET.indent(suites)
+    return '<?xml version="1.0" encoding="utf-8"?>\n' + ET.tostring(suites, encoding='unicode') + '\n'
+
+
+def save_report(report, path):
+    write_atomic(path, json.dumps(report, indent=1) + '\n')
+
+
+def main():
+    """Main function"""
+    parser = argparse.ArgumentParser(description='Run the Python test scripts in parallel')
+    parser.add_argument('paths', nargs='*', help='Test files or directories (default: the standard test dirs)')
+    parser.add_argument('-k', dest='keyword', help='Only tests whose id contains this')
+    parser.add_argument('-j', '--jobs', type=int, help='Worker processes (default: CPUs, at most 8; 0 runs in-process)')
+    parser.add_argument('--timeout', type=float, default=DEFAULT_TIMEOUT, help='Per-test timeout in seconds')
+    parser.add_argument('--last-failed', action='store_true', help='Rerun only what failed in the previous run')
+    parser.add_argument('--failed-first', action='store_true', help='Run previous failures first')
+    parser.add_argument('--slowest-first', action='store_true', help='Run the files with the longest expected time first')
+    parser.add_argument('--shard', metavar='K/N', help='Run only the K-th of N shards of even expected time')
+    parser.add_argument('--regression-factor', type=float, default=REGRESSION_FACTOR,
+                        help='Report tests this many times slower than their median')
+    parser.add_argument('--json', metavar='PATH', help='Write the report as JSON')
+    parser.add_argument('--junit', metavar='PATH', help='Write the report as JUnit XML')
+    parser.add_argument('--durations', type=int, default=5, help='Show the N slowest tests')
+    parser.add_argument('--collect-only', action='store_true', help='List the tests without running them')
+    parser.add_argument('-v', '--verbose', action='store_true', help='Print every test')
+    args = parser.parse_args()
+    shard_index = shard_count = None
+    if args.shard:
+        match = re.fullmatch(r'(\d+)/(\d+)', args.shard)
+        if not match or not 1 <= int(match.group(1)) <= int(match.group(2)):
+            parser.error('--shard must be K/N with 1 <= K <= N')
+        shard_index, shard_count = int(match.group(1)), int(match.group(2))
+
+    found = discover(args.paths or None, keyword=args.keyword)
+    if not found:
+        print("❌ No tests found")
+        return 2
+    results_path = os.path.join(ROOT, RESULTS_PATH)
+    previous = load_results(results_path)
+    if (args.last_failed or args.failed_first) and previous is None:
+        print(f"⚠️  No previous run in {RESULTS_PATH}; running in discovery order")
+    history = DurationHistory(factor=args.regression_factor)
+    ordered = args.slowest_first or args.shard
+    tasks = select(found, previous, args.last_failed, args.failed_first, history if ordered else None)
+    if args.shard:
+        tasks = shard(tasks, shard_index, shard_count, history)
+    if args.collect_only:
+        for path, units in tasks:
+            for unit in units:
+                print(f"{path}::{unit['name']}")
+        return 0
+
+    print("=" * 60)
+    print("Test Runner")
+    print("=" * 60)
+    print(f"  - Files: {len(tasks)}, tests: {sum(len(units) for _, units in tasks)}")
+    if args.shard:
+        expected = sum(expected_duration(history, path, units) for path, units in tasks)
+        print(f"  - Shard {args.shard}: {expected:.1f}s expected")
+
+    def progress(path, results):
+        counts = summarize(results)
+        icon = '❌' if counts['failed'] or counts['error'] else '✅'
+        parts = [f"{counts[name]} {name}" for name in ('passed', 'failed', 'error', 'skipped') if counts[name]]
+        print(f"  {icon} {path}: {', '.join(parts)} ({counts['duration']:.2f}s)")
+        if args.verbose:
+            for result in results:
+                print(f"      {result['outcome'].upper():7s} {result['name']} ({result['duration']:.3f}s)")
+
+    report = run_tasks(tasks, args.jobs, args.timeout, progress=progress)
+    report['regressions'] = record_durations(history, report)
+    history.save()
+    save_report(merge_results(previous, report), results_path)
+    if args.json:
+        save_report(report, args.json)
+    if args.junit:
+        write_atomic(args.junit, to_junit(report))
+
+    problems = [result for result in report['tests'] if result['outcome'] in FAILED]
+    if problems:
+        print(f"\n❌ Failures ({len(problems)}):")
+        for result in problems:
+            print(f"  - {result['id']}: {result['message'].splitlines()[0] if result['message'] else result['outcome']}")
+    if args.durations:
+        print(f"\n🐢 Slowest {args.durations}:")
+        for result in sorted(report['tests'], key=lambda r: -r['duration'])[:args.durations]:
+            print(f"  - {result['duration']:8.3f}s  {result['id']}")
+
+    summary = report['summary']
+    workers = f"on {report['jobs']} worker(s)" if report['jobs'] else 'in-process'
+    print(f"\n📊 {summary['passed']} passed, {summary['failed']} failed, {summary['error']} errors, "
+          f"{summary['skipped']} skipped in {report['wall']:.2f}s "
+          f"({summary['duration']:.2f}s of tests {workers})")
+    if report['regressions']:
+        print(f"\n🐢 Slower than usual ({len(report['regressions'])}, over {args.regression_factor:g}x the median):")
+        for regression in report['regressions']:
+            print(f"  - {regression['duration']:8.3f}s  (usually {regression['expected']:.3f}s)  {regression['key']}")
+    return 1 if problems else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
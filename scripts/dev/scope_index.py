@@ -0,0 +1,409 @@
+#!/usr/bin/env python3
+"""
+One-pass scope index for a JavaScript file.
+
+The fixer scripts used to rescan the text for every question they asked:
+walking characters from an open brace to find its match, re-reading lines
+to find template literals, or running regexes that also match inside
+strings and comments. ScopeIndex reads the file once and records every
+bracket pair, string/template/regex/comment span, function boundary and
+declaration in sorted interval arrays, so "body of the function at offset
+X" or "is line N inside a template" is a bisect instead of a rescan.
+
+Line numbers are 0-based here so they index straight into a readlines()
+list, which is what the fixers work on.
+"""
+
+import bisect
+import re
+
+from static_analysis import REGEX_KEYWORDS, scan_regex
+
+_IDENT = re.compile(r'[A-Za-z_$][\w$]*')
+_NUMBER = re.compile(r'\d[\w.]*')
+_TOKEN = re.compile(r'[A-Za-z_$][\w$]*|\d[\w.]*|\.\.\.|=>|\?\.|[=!]==|\*\*=?|>>>=?|<<=|>>=|&&=|\|\|=|\?\?=|'
+                    r'&&|\|\||\?\?|\+\+|--|<<|>>|[-+*/%&|^!=<>]=|\S')
+# Keywords followed by (...) { that is a block, not a method body
+_CONTROL_KEYWORDS = {'if', 'for', 'while', 'switch', 'catch', 'with', 'function'}
+_DECLARING = {'const', 'let', 'var'}
+_OPENERS = {'(': ')', '[': ']', '{': '}'}
+_CLOSERS = {')': '(', ']': '[', '}': '{'}
+
+
+class Function:
+    """A function with a braced body: where it starts, its params and body"""
+
+    __slots__ = ('name', 'kind', 'start', 'params', 'body', 'is_async', 'is_generator', 'parent')
+
+    def __init__(self, name, kind, start, params, body_open, is_async=False, is_generator=False, parent=None):
+        self.name = name                    # own name, or the name it is assigned to
+        self.kind = kind                    # 'declaration', 'expression', 'arrow' or 'method'
+        self.start = start                  # offset of 'function', 'async', the name or the params
+        self.params = params                # (open, close) offsets of (...), None for `x => {`
+        self.body = (body_open, None)       # (open, close) offsets of {...}
+        self.is_async = is_async
+        self.is_generator = is_generator
+        self.parent = parent                # index of the enclosing function, or None
+
+    def __repr__(self):
+        return f'Function({self.name!r}, {self.kind!r}, body={self.body})'
+
+
+class ScopeIndex:
+    """Brackets, literal spans, functions and declarations of one JS source"""
+
+    def __init__(self, text):
+        self.text = text
+        self.spans = []           # (start, end, kind) literal bodies, sorted and disjoint
+        self.templates = []       # (start, end) whole template literals, backtick to backtick
+        self.pairs = {}           # bracket offset -> offset of its partner, both directions
+        self.braces = []          # (open, close) of every code {...}, sorted by open
+        self.functions = []       # Function, sorted by body open
+        self.declarations = []    # (kind, name, offset, top_level), in source order
+        self._line_starts = [0] + [m.end() for m in re.finditer('\n', text)]
+        self._scan()
+        self.braces.sort()
+        self._span_starts = [start for start, _, _ in self.spans]
+        self._function_opens = [fn.body[0] for fn in self.functions]
+        self.code = self._blank_literals()
+
+    # ------------------------------------------------------------------
+    # Scanning
+    # ------------------------------------------------------------------
+
+    def _scan(self):
+        text = self.text
+        length = len(text)
+        tokens = []               # (offset, value) of significant code tokens
+        stack = []                # open brackets: [char, offset, function index]; '${' for expressions
+        template_starts = []      # backtick offset of each template with an open ${
+        i = 0
+
+        def scan_template(i):
+            """Record template text from i; returns (index after ` or ${, opened)"""
+            start = i
+            while i < length:
+                ch = text[i]
+                if ch == '\\':
+                    i += 2
+                    continue
+                if ch == '`' or text.startswith('${', i):
+                    break
+                i += 1
+            end = min(i, length)
+            if end > start:
+                self.spans.append((start, end, 'template'))
+            if i < length and text[i] == '$':
+                return i + 2, True
+            return i + 1, False
+
+        def regex_allowed():
+            if not tokens:
+                return True
+            prev = tokens[-1][1]
+            if prev in REGEX_KEYWORDS:
+                return True
+            return not (prev[0].isalnum() or prev[0] in '_$"`/' or prev in (')', ']', '}'))
+
+        while i < length:
+            ch = text[i]
+
+            if ch == '/' and i + 1 < length and text[i + 1] in '/*':
+                if text[i + 1] == '/':
+                    end = text.find('\n', i)
+                    end = length if end == -1 else end
+                else:
+                    end = text.find('*/', i + 2)
+                    end = length if end == -1 else end + 2
+                self.spans.append((i, end, 'comment'))
+                i = end
+                continue
+
+            if ch in '"\'':
+                j = i + 1
+                while j < length and text[j] != ch and text[j] != '\n':
+                    j += 2 if text[j] == '\\' else 1
+                j = min(j, length)
+                if j > i + 1:
+                    self.spans.append((i + 1, j, 'string'))
+                tokens.append((i, '"'))
+                i = j + 1
+                continue
+
+            if ch == '`':
+                tokens.append((i, '`'))
+                start = i
+                i, opened = scan_template(i + 1)
+                if opened:
+                    stack.append(['${', i - 2, None])
+                    template_starts.append(start)
+                else:
+                    self.templates.append((start, i))
+                continue
+
+            if ch == '/' and regex_allowed():
+                regex = scan_regex(text, i)
+                if regex:
+                    if regex[0] > i + 1:
+                        self.spans.append((i + 1, regex[0], 'regex'))
+                    tokens.append((i, '/'))
+                    i = regex[1]
+                    continue
+
+            if ch.isalpha() or ch in '_$':
+                match = _IDENT.match(text, i)
+                self._declaration(tokens, match.group(0), i, stack)
+                tokens.append((i, match.group(0)))
+                i = match.end()
+                continue
+            if ch.isdigit():
+                tokens.append((i, '0'))
+                i = _NUMBER.match(text, i).end()
+                continue
+
+            if ch in _OPENERS:
+                fn = self._function_for(tokens, i, stack) if ch == '{' else None
+                stack.append([ch, i, fn])
+                tokens.append((i, ch))
+            elif ch == '}' and stack and stack[-1][0] == '${':
+                stack.pop()
+                start = template_starts.pop()
+                i, opened = scan_template(i + 1)
+                if opened:
+                    stack.append(['${', i - 2, None])
+                    template_starts.append(start)
+                else:
+                    self.templates.append((start, i))
+                continue
+            elif ch in _CLOSERS:
+                if stack and stack[-1][0] == _CLOSERS[ch]:
+                    _, open_at, fn = stack.pop()
+                    self.pairs[open_at] = i
+                    self.pairs[i] = open_at
+                    if ch == '}':
+                        self.braces.append((open_at, i))
+                    if fn is not None:
+                        self.functions[fn].body = (open_at, i)
+                tokens.append((i, ch))
+            elif ch == '=' and text.startswith('=>', i):
+                tokens.append((i, '=>'))
+                i += 2
+                continue
+            elif not ch.isspace():
+                tokens.append((i, ch))
+            i += 1
+
+    def _statement_start(self, tokens, k):
+        """True when the token at k begins a statement rather than an expression"""
+        if k == 0:
+            return True
+        offset, prev = tokens[k - 1]
+        if prev in ('{', '}', ';', 'export', 'default'):
+            return True
+        # Automatic semicolon insertion after a value ending the previous line
+        ends_value = prev[0].isalnum() or prev[0] in '_$"`/' or prev in (')', ']')
+        return ends_value and '\n' in self.text[offset:tokens[k][0]]
+
+    def _declaration(self, tokens, name, offset, stack):
+        if not tokens or name in REGEX_KEYWORDS or name == 'extends':
+            return
+        k = len(tokens) - 1
+        keyword = tokens[k][1]
+        if keyword == '*' and k > 0 and tokens[k - 1][1] == 'function':
+            k -= 1
+            keyword = 'function'
+        if keyword == 'function' and k > 0 and tokens[k - 1][1] == 'async':
+            k -= 1
+        if keyword in _DECLARING or (keyword in ('function', 'class') and self._statement_start(tokens, k)):
+            self.declarations.append((keyword, name, offset, not stack))
+
+    def _assigned_name(self, tokens, k):
+        """Name of `name = <k>` or `name: <k>`, where k is the first token of the value"""
+        if k >= 2 and tokens[k - 1][1] in ('=', ':'):
+            before = tokens[k - 2][1]
+            if _IDENT.fullmatch(before) and (k < 3 or tokens[k - 3][1] != '.'):
+                return before
+        return None
+
+    def _function_for(self, tokens, offset, stack):
+        """Record the function whose body opens at offset; returns its index or None"""
+        if not tokens:
+            return None
+        k = len(tokens) - 1
+        prev = tokens[k][1]
+        if prev == '=>':
+            if k < 1:
+                return None
+            param_at, param = tokens[k - 1]
+            if param == ')':
+                params = (self.pairs.get(param_at), param_at)
+                if params[0] is None:
+                    return None
+                first = self._token_index(tokens, params[0])
+            elif _IDENT.fullmatch(param):
+                params = None
+                first = k - 1
+            else:
+                return None
+            is_async = first > 0 and tokens[first - 1][1] == 'async'
+            if is_async:
+                first -= 1
+            fn = Function(self._assigned_name(tokens, first), 'arrow', tokens[first][0], params, offset, is_async)
+        elif prev == ')':
+            open_at = self.pairs.get(tokens[k][0])
+            if open_at is None:
+                return None
+            j = self._token_index(tokens, open_at)
+            params = (open_at, tokens[k][0])
+            before = tokens[j - 1][1] if j > 0 else None
+            if before is None:
+                return None
+            name = None
+            kw = None
+            if before == 'function':
+                kw = j - 1
+            elif before == '*' and j > 1 and tokens[j - 2][1] == 'function':
+                kw = j - 2
+            elif _IDENT.fullmatch(before):
+                name = before
+                if j > 1 and tokens[j - 2][1] == 'function':
+                    kw = j - 2
+                elif j > 2 and tokens[j - 2][1] == '*' and tokens[j - 3][1] == 'function':
+                    kw = j - 3
+                elif before in _CONTROL_KEYWORDS or (j > 1 and tokens[j - 2][1] == '.'):
+                    return None
+            else:
+                return None
+
+            if kw is None:
+                # Shorthand method: name(...) { in an object literal or class body
+                first = j - 1
+                is_generator = first > 0 and tokens[first - 1][1] == '*'
+                if is_generator:
+                    first -= 1
+                is_async = first > 0 and tokens[first - 1][1] == 'async'
+                if is_async:
+                    first -= 1
+                fn = Function(name, 'method', tokens[first][0], params, offset, is_async, is_generator)
+            else:
+                is_generator = tokens[kw + 1][1] == '*'
+                is_async = kw > 0 and tokens[kw - 1][1] == 'async'
+                first = kw - 1 if is_async else kw
+                kind = 'declaration' if name and self._statement_start(tokens, first) else 'expression'
+                if name is None:
+                    name = self._assigned_name(tokens, first)
+                fn = Function(name, kind, tokens[first][0], params, offset, is_async, is_generator)
+        else:
+            return None
+
+        for entry in reversed(stack):
+            if entry[2] is not None:
+                fn.parent = entry[2]
+                break
+        self.functions.append(fn)
+        return len(self.functions) - 1
+
+    @staticmethod
+    def _token_index(tokens, offset):
+        return bisect.bisect_left(tokens, (offset, ''))
+
+    def _blank_literals(self):
+        chars = list(self.text)
+        for start, end, _ in self.spans:
+            for i in range(start, end):
+                if chars[i] != '\n':
+                    chars[i] = ' '
+        return ''.join(chars)
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+
+    def match(self, offset):
+        """Offset of the bracket paired with the one at offset, or None"""
+        return self.pairs.get(offset)
+
+    def kind_at(self, offset):
+        """'string', 'template', 'regex' or 'comment' for literal bodies, None for code"""
+        i = bisect.bisect_right(self._span_starts, offset) - 1
+        if i >= 0 and offset < self.spans[i][1]:
+            return self.spans[i][2]
+        return None
+
+    def in_code(self, offset):
+        return self.kind_at(offset) is None
+
+    def line_of(self, offset):
+        """0-based line containing offset"""
+        return bisect.bisect_right(self._line_starts, offset) - 1
+
+    def line_start(self, line):
+        return self._line_starts[line]
+
+    def line_in_template(self, line):
+        """True when line starts inside template text (a continuation line of a template)"""
+        if not 0 <= line < len(self._line_starts):
+            return False
+        return self.kind_at(self._line_starts[line]) == 'template'
+
+    def multiline_templates(self):
+        """(start_line, end_line) of outermost template literals spanning several lines"""
+        regions = []
+        last_end = -1
+        for start, end in sorted(self.templates):
+            if start < last_end:
+                continue
+            first, last = self.line_of(start), self.line_of(end - 1)
+            if first != last:
+                regions.append((first, last))
+                last_end = end
+        return regions
+
+    def function_at(self, offset):
+        """Innermost function whose body braces contain offset, or None"""
+        i = bisect.bisect_right(self._function_opens, offset) - 1
+        while i is not None and i >= 0:
+            fn = self.functions[i]
+            if fn.body[1] is not None and fn.body[0] <= offset <= fn.body[1]:
+                return fn
+            i = fn.parent
+        return None
+
+    def body_of(self, offset):
+        """(open, close) of the body of the function containing offset, or None"""
+        fn = self.function_at(offset)
+        return fn.body if fn else None
+
+    def tokens(self, start=0, end=None, offsets=False):
+        """
+        Code tokens between start and end, comments dropped.
+
+        Each string, template text or regex body is one token prefixed with
+        its kind letter ('s', 't', 'r'), so literals compare by content.
+        With offsets=True (offset, token) pairs are yielded instead.
+        """
+        end = len(self.text) if end is None else end
+        k = bisect.bisect_left(self._span_starts, start)
+        pos = start
+        while pos < end:
+            span = self.spans[k] if k < len(self.spans) and self.spans[k][0] < end else None
+            for match in _TOKEN.finditer(self.text, pos, span[0] if span else end):
+                yield (match.start(), match.group(0)) if offsets else match.group(0)
+            if span is None:
+                break
+            span_start, span_end, kind = span
+            if kind != 'comment':
+                token = kind[0] + self.text[span_start:span_end]
+                yield (span_start, token) if offsets else token
+            pos = span_end
+            k += 1
+
+    def top_level(self, kinds=('function', 'const', 'let', 'var', 'class')):
+        """Names declared outside any bracket, in source order, without duplicates"""
+        seen = set()
+        names = []
+        for kind, name, _, top_level in self.declarations:
+            if top_level and kind in kinds and name not in seen:
+                seen.add(name)
+                names.append(name)
+        return names
@@ -0,0 +1,474 @@
+#!/usr/bin/env python3
+"""
+Size budgets for the shipped JS/CSS assets.
+
+Every run measures each asset (everything under js/ and css/, plus the
+top-level scripts and stylesheets such as story-engine.js) as raw, minified,
+gzip and brotli bytes, compares the result with the previous run and checks
+it against size-budgets.json:
+
+    {
+      "default": {"js": {"raw": 102400}},
+      "files": {"story-engine.js": {"gzip": 40960}, "js/modules/*.js": {"min": 30720}},
+      "total": {"js": {"gzip": 307200}, "css": {"gzip": 40960}}
+    }
+
+A file takes its budget from the first exact or glob entry under "files"
+that matches it, otherwise from "default" for its kind. Metrics are raw,
+min, gzip and brotli.
+
+Minified sizes come from terser (the minifier the Vite build uses) when
+node_modules/terser is installed, otherwise from a built-in pass that drops
+comments and collapsible whitespace. Compressed sizes are taken from the
+minified text. brotli needs the brotli Python module or node.
+
+Runs are appended to size-history.json only when something changed. Each run
+stores just the files that changed since the previous one, with a sha256
+prefix that lets the next run skip files whose content is the same.
+"""
+
+import argparse
+import fnmatch
+import hashlib
+import json
+import os
+import re
+import shutil
+import subprocess
+import sys
+from datetime import datetime
+
+from import_content import write_atomic
+from module_graph import transfer_sizes
+from static_analysis import EXCLUDE_DIRS, tokenize
+
+BUDGETS_PATH = 'size-budgets.json'
+HISTORY_PATH = 'size-history.json'
+HISTORY_FORMAT = 1
+MAX_RUNS = 500
+METRICS = ('raw', 'min', 'gzip', 'brotli')
+ASSET_DIRS = ['js', 'css']
+ASSET_EXTENSIONS = {'.js': 'js', '.css': 'css'}
+EXCLUDE_FILES = {'vite.config.js'}
+HEADROOM = 0.10
+
+_WORD = re.compile(r'[\w$]')
+_CSS_COMMENT = re.compile(r'/\*.*?\*/', re.S)
+_CSS_SPACE = re.compile(r'\s*([{};:,>~+])\s*')
+
+# Minifies JS with terser when it is installed and brotli-compresses the result
+# (or the built-in minifier's text given on stdin); prints {path: {text, brotli}}
+# with text set only for terser output.
+NODE_SCRIPT = '''
+const fs = require('fs');
+const path = require('path');
+const zlib = require('zlib');
+const { root, files } = JSON.parse(fs.readFileSync(0, 'utf8'));
+let terser = null;
+try { terser = require(path.join(root, 'node_modules', 'terser')); } catch (e) { terser = null; }
+(async () => {
+  const out = {};
+  for (const file of files) {
+    let text = file.text;
+    let minified = false;
+    if (terser && file.kind === 'js') {
+      try {
+        const result = await terser.minify(fs.readFileSync(path.join(root, file.path), 'utf8'),
+          { compress: { drop_console: true, drop_debugger: true } });
+        text = result.code;
+        minified = true;
+      } catch (e) {}
+    }
+    const data = Buffer.from(text, 'utf8');
+    out[file.path] = {
+      text: minified ? text : null,
+      brotli: zlib.brotliCompressSync(data, { params: { [zlib.constants.BROTLI_PARAM_QUALITY]: 11 } }).length,
+    };
+  }
+  process.stdout.write(JSON.stringify(out));
+})();
+'''
+
+
+def discover_assets(root='.'):
+    """Shipped JS/CSS files as root-relative paths"""
+    found = []
+    for name in sorted(os.listdir(root)):
+        if os.path.splitext(name)[1] in ASSET_EXTENSIONS and name not in EXCLUDE_FILES \
+                and os.path.isfile(os.path.join(root, name)):
+            found.append(name)
+    for top in ASSET_DIRS:
+        for directory, dirs, files in os.walk(os.path.join(root, top)):
+            dirs[:] = sorted(d for d in dirs if d not in EXCLUDE_DIRS)
+            for name in files:
+                if os.path.splitext(name)[1] in ASSET_EXTENSIONS:
+                    found.append(os.path.relpath(os.path.join(directory, name), root).replace(os.sep, '/'))
+    return sorted(found)
+
+
+def kind_of(path):
+    return ASSET_EXTENSIONS[os.path.splitext(path)[1]]
+
+
+def minify_js(text):
+    """Drop comments and collapsible whitespace, keeping a newline where ASI may need it"""
+    code, comments = tokenize(text)
+    keep = [True] * len(text)
+    for offset, comment in comments:
+        for i in range(offset, offset + len(comment)):
+            keep[i] = False
+    out = []
+    i = 0
+    length = len(text)
+    while i < length:
+        if not keep[i]:
+            i += 1
+            continue
+        if not text[i].isspace() or code[i] != text[i]:
+            out.append(text[i])
+            i += 1
+            continue
+        # A run of whitespace (and removed comments) in code
+        j = i
+        newline = False
+        literal = False
+        while j < length and (not keep[j] or code[j].isspace()):
+            if keep[j] and not text[j].isspace():
+                literal = True
+            newline = newline or text[j] == '\n'
+            j += 1
+        if literal:
+            out.append(text[i:j])
+        else:
+            before = out[-1][-1] if out and out[-1] else ''
+            after = text[j] if j < length else ''
+            if newline and before not in '{;,(' and after not in ')}];,.':
+                out.append('\n')
+            elif (_WORD.match(before or ' ') and _WORD.match(after or ' ')) or \
+                    (before in '+-' and after in '+-' and before and after):
+                out.append(' ')
+        i = j
+    return ''.join(out)
+
+
+def minify_css(text):
+    """Drop comments and whitespace around CSS punctuation"""
+    text = _CSS_COMMENT.sub('', text)
+    text = re.sub(r'\s+', ' ', text)
+    return _CSS_SPACE.sub(r'\1', text).replace(';}', '}').strip()
+
+
+def measure(root, paths, previous=None, use_node=True):
+    """{path: {'sha256', 'raw', 'min', 'gzip', 'brotli'}} reusing unchanged entries of previous"""
+    previous = previous or {}
+    sizes = {}
+    texts = {}
+    for path in paths:
+        with open(os.path.join(root, path), 'rb') as f:
+            data = f.read()
+        digest = hashlib.sha256(data).hexdigest()[:16]
+        cached = previous.get(path)
+        if cached and cached['sha256'] == digest:
+            sizes[path] = dict(cached)
+            continue
+        text = data.decode('utf-8', errors='replace')
+        texts[path] = minify_js(text) if kind_of(path) == 'js' else minify_css(text)
+        sizes[path] = {'sha256': digest, 'raw': len(data), 'brotli': None}
+
+    node = {}
+    if texts and use_node and shutil.which('node'):
+        request = {'root': os.path.abspath(root),
+                   'files': [{'path': p, 'kind': kind_of(p), 'text': t} for p, t in texts.items()]}
+        result = subprocess.run(['node', '-e', NODE_SCRIPT], input=json.dumps(request),
+                                capture_output=True, text=True, timeout=600)
+        if result.returncode == 0:
+            node = json.loads(result.stdout)
+    for path, text in texts.items():
+        entry = node.get(path)
+        minified = entry['text'] if entry and entry['text'] is not None else text
+        # node already measured brotli for the files it minified
+        measured = transfer_sizes(minified.encode('utf-8'), with_brotli=not entry)
+        sizes[path]['min'] = measured['raw']
+        sizes[path]['gzip'] = measured['gzip']
+        sizes[path]['brotli'] = entry['brotli'] if entry else measured.get('brotli')
+    return sizes
+
+
+def minifier_name(root):
+    return 'terser' if os.path.isdir(os.path.join(root, 'node_modules', 'terser')) \
+        and shutil.which('node') else 'builtin'
+
+
+# ----------------------------------------------------------------------
+# History
+# ----------------------------------------------------------------------
+
+def load_history(path):
+    """The history file, or an empty one when missing or from another format"""
+    if path and os.path.exists(path):
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                history = json.load(f)
+            if history.get('format') == HISTORY_FORMAT:
+                return history
+        except (OSError, ValueError):
+            pass
+    return {'format': HISTORY_FORMAT, 'runs': []}
+
+
+def _pack(entry):
+    return [entry['sha256']] + [entry.get(m) for m in METRICS]
+
+
+def _unpack(values):
+    return dict(zip(('sha256',) + METRICS, values))
+
+
+def snapshots(history):
+    """Full {path: sizes} state after each run, oldest first"""
+    state = {}
+    for run in history['runs']:
+        for path in run.get('removed', []):
+            state.pop(path, None)
+        for path, values in run.get('changed', {}).items():
+            state[path] = _unpack(values)
+        yield run, dict(state)
+
+
+def latest(history):
+    """(run, state) of the newest run, or (None, {})"""
+    result = (None, {})
+    for result in snapshots(history):
+        pass
+    return result
+
+
+def append_run(history, sizes, minifier, commit=None, now=None):
+    """Record sizes as a new run; returns False when nothing changed"""
+    run, previous = latest(history)
+    # Sizes from another minifier are not comparable, so record a full snapshot
+    base = previous if run is not None and run.get('minifier') == minifier else {}
+    changed = {p: _pack(s) for p, s in sorted(sizes.items()) if base.get(p) != s}
+    removed = sorted(p for p in previous if p not in sizes)
+    if run is not None and not changed and not removed:
+        return False
+    entry = {'time': (now or datetime.now()).isoformat(timespec='seconds'), 'commit': commit,
+             'minifier': minifier, 'changed': changed}
+    if removed:
+        entry['removed'] = removed
+    history['runs'].append(entry)
+    if len(history['runs']) > MAX_RUNS:
+        _rebase(history, len(history['runs']) - MAX_RUNS)
+    return True
+
+
+def _rebase(history, drop):
+    """Drop the oldest runs, folding their state into the first run kept"""
+    states = list(snapshots(history))
+    first, state = states[drop]
+    first = dict(first)
+    first['changed'] = {p: _pack(s) for p, s in sorted(state.items())}
+    first.pop('removed', None)
+    history['runs'] = [first] + history['runs'][drop + 1:]
+
+
+def save_history(path, history):
+    write_atomic(path, json.dumps(history, separators=(',', ':')) + '\n')
+
+
+def git_commit(root):
+    try:
+        result = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=root,
+                                capture_output=True, text=True, timeout=10)
+    except OSError:
+        return None
+    return result.stdout.strip() or None
+
+
+# ----------------------------------------------------------------------
+# Budgets and diffs
+# ----------------------------------------------------------------------
+
+def load_budgets(path):
+    if not path or not os.path.exists(path):
+        return {}
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def budget_for(budgets, path):
+    """The budget entry that applies to path"""
+    files = budgets.get('files', {})
+    if path in files:
+        return files[path]
+    for pattern, budget in files.items():
+        if fnmatch.fnmatchcase(path, pattern):
+            return budget
+    return budgets.get('default', {}).get(kind_of(path), {})
+
+
+def totals(sizes):
+    """{kind: {metric: bytes}} summed over sizes"""
+    result = {}
+    for path, entry in sizes.items():
+        bucket = result.setdefault(kind_of(path), {m: 0 for m in METRICS})
+        for metric in METRICS:
+            if entry.get(metric) is None:
+                bucket[metric] = None
+            elif bucket[metric] is not None:
+                bucket[metric] += entry[metric]
+    return result
+
+
+def check_budgets(budgets, sizes):
+    """(target, metric, size, budget) for every budget exceeded"""
+    violations = []
+    for path, entry in sorted(sizes.items()):
+        for metric, limit in budget_for(budgets, path).items():
+            if entry.get(metric) is not None and entry[metric] > limit:
+                violations.append((path, metric, entry[metric], limit))
+    summed = totals(sizes)
+    for kind, limits in budgets.get('total', {}).items():
+        for metric, limit in limits.items():
+            value = summed.get(kind, {}).get(metric)
+            if value is not None and value > limit:
+                violations.append((f'total {kind}', metric, value, limit))
+    return violations
+
+
+def diff(before, after, metric='gzip'):
+    """(path, before, after) for files added, removed or resized, largest change first"""
+    changes = []
+    for path in set(before) | set(after):
+        old = before.get(path, {}).get(metric)
+        new = after.get(path, {}).get(metric)
+        if old != new:
+            changes.append((path, old, new))
+    return sorted(changes, key=lambda c: (-abs((c[2] or 0) - (c[1] or 0)), c[0]))
+
+
+def initial_budgets(sizes, default_raw=102400, headroom=HEADROOM):
+    """Budgets that pass today: a raw default per kind, gzip caps for the big files and totals"""
+    def cap(value):
+        return int(-(-value * (1 + headroom) // 1024) * 1024)
+
+    budgets = {'default': {'js': {'raw': default_raw}, 'css': {'raw': default_raw // 2}}, 'files': {}, 'total': {}}
+    for path, entry in sorted(sizes.items()):
+        limit = budgets['default'][kind_of(path)]['raw']
+        if entry['raw'] > limit:
+            budgets['files'][path] = {'raw': cap(entry['raw']), 'gzip': cap(entry['gzip'])}
+    for kind, summed in totals(sizes).items():
+        budgets['total'][kind] = {'gzip': cap(summed['gzip'])}
+    return budgets
+
+
+def run_check(root='.', budgets_path=BUDGETS_PATH, history_path=HISTORY_PATH, record=True, against=None):
+    """Measure, diff and check; returns a JSON-ready report"""
+    history = load_history(os.path.join(root, history_path) if history_path else None)
+    minifier = minifier_name(root)
+    run, state = latest(history)
+    reuse = state if run is not None and run.get('minifier') == minifier else {}
+    sizes = measure(root, discover_assets(root), reuse)
+
+    baseline_run, baseline = run, state
+    if against:
+        for candidate, snapshot in snapshots(history):
+            if (candidate.get('commit') or '').startswith(against):
+                baseline_run, baseline = candidate, snapshot
+
+    recorded = False
+    if record and history_path:
+        recorded = append_run(history, sizes, minifier, git_commit(root))
+        if recorded:
+            save_history(os.path.join(root, history_path), history)
+
+    budgets = load_budgets(os.path.join(root, budgets_path))
+    return {
+        'minifier': minifier,
+        'files': sizes,
+        'totals': totals(sizes),
+        'baseline': {'time': baseline_run['time'], 'commit': baseline_run.get('commit'),
+                     'totals': totals(baseline)} if baseline_run else None,
+        'changes': [{'file': p, 'before': b, 'after': a} for p, b, a in diff(baseline, sizes)],
+        'violations': [{'target': t, 'metric': m, 'size': s, 'budget': b}
+                       for t, m, s, b in check_budgets(budgets, sizes)],
+        'recorded': recorded,
+    }
+
+
+def _kb(value):
+    return '-' if value is None else f"{value / 1024:.1f} KB"
+
+
+def _delta(before, after):
+    if before is None or after is None:
+        return ''
+    change = after - before
+    if not change:
+        return '='
+    sign = '+' if change > 0 else '-'
+    return f"{sign}{abs(change)} B" if abs(change) < 1024 else f"{sign}{abs(change) / 1024:.1f} KB"
+
+
+def main():
+    """Main function"""
+    parser = argparse.ArgumentParser(description='Track JS/CSS asset sizes against budgets')
+    parser.add_argument('--root', default='.', help='Repository root')
+    parser.add_argument('--budgets', default=BUDGETS_PATH, help='Budget file')
+    parser.add_argument('--history', default=HISTORY_PATH, help='History file')
+    parser.add_argument('--against', help='Diff against the last run recorded at this commit')
+    parser.add_argument('--no-record', action='store_true', help='Do not append this run to the history')
+    parser.add_argument('--check', action='store_true', help='Exit 1 when a budget is exceeded')
+    parser.add_argument('--init-budgets', action='store_true',
+                        help=f'Write budgets with {HEADROOM:.0%} headroom over the current sizes')
+    parser.add_argument('--top', type=int, default=10, help='Changed files to list')
+    parser.add_argument('--json', action='store_true', help='Print the report as JSON')
+    args = parser.parse_args()
+
+    report = run_check(args.root, args.budgets, args.history, not args.no_record, args.against)
+    if args.init_budgets:
+        write_atomic(os.path.join(args.root, args.budgets),
+                     json.dumps(initial_budgets(report['files']), indent=2) + '\n')
+        report['violations'] = []
+        print(f"✅ Wrote {args.budgets}")
+
+    if args.json:
+        print(json.dumps(report, indent=2))
+        return 1 if args.check and report['violations'] else 0
+
+    print("=" * 60)
+    print("Asset Size Budgets")
+    print("=" * 60)
+    print(f"  - Assets: {len(report['files'])} (minified with {report['minifier']})")
+    baseline = report['baseline']
+    for kind, summed in sorted(report['totals'].items()):
+        before = baseline['totals'].get(kind, {}) if baseline else {}
+        print(f"  - {kind.upper()}: " + ', '.join(
+            f"{metric} {_kb(summed[metric])}" + (f" ({_delta(before.get(metric), summed[metric])})"
+                                                  if baseline and summed[metric] is not None else '')
+            for metric in METRICS))
+    if baseline:
+        print(f"  - Compared with run of {baseline['time']}"
+              + (f" ({baseline['commit']})" if baseline['commit'] else ''))
+        if report['changes']:
+            print(f"\n📈 Changed files (gzip): {len(report['changes'])}")
+            for change in report['changes'][:args.top]:
+                label = 'new' if change['before'] is None else 'removed' if change['after'] is None \
+                    else _delta(change['before'], change['after'])
+                print(f"    {change['file']:55s} {_kb(change['after']):>10s}  {label}")
+        else:
+            print("  - No size changes")
+
+    if report['violations']:
+        print(f"\n❌ Budgets exceeded: {len(report['violations'])}")
+        for v in report['violations']:
+            print(f"    {v['target']:55s} {v['metric']:6s} {_kb(v['size']):>10s} > {_kb(v['budget'])}")
+    else:
+        print("\n✅ All size budgets met")
+    if report['recorded']:
+        print(f"  - Recorded in {args.history}")
+    return 1 if args.check and report['violations'] else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
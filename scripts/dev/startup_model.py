@@ -0,0 +1,317 @@
+#!/usr/bin/env python3
+"""
+Startup cost model for the index.html script loading.
+
+Replays the <script> order of index.html and estimates time-to-first-chapter
+for several loading strategies under a network/CPU profile:
+
+  - network: the HTML is fetched over a fresh connection, then every script
+    is requested once the HTML has arrived (the preload scanner finds them
+    all). Same-origin scripts share one HTTP/2 connection, each CDN host pays
+    for its own connection setup, and all transfers share the bandwidth
+    equally. Sizes are gzip transfer sizes.
+  - main thread: blocking scripts run in document order, each once it has
+    arrived and the previous one has finished. A script costs its compile
+    time (bytes x a per-byte rate, calibrated by timing vm.Script compilation
+    of every file in Node) plus its execution time (measured by
+    dom_harness.js), both scaled by the profile's CPU slowdown.
+  - first chapter: DOMContentLoaded after the last blocking script, then the
+    startup work dom_harness.js measures (the listeners that generate and
+    render the first chapter).
+
+Strategies:
+  current      index.html as it is
+  partitioned  only the eager modules from partition_modules.py
+  bundled      the partitioned local scripts concatenated into one file
+  async-cdn    index.html with the CDN scripts marked async
+
+CDN script sizes are unknown offline; they are assumed to be --external-kb
+gzip each (3x that uncompressed for the compile estimate).
+"""
+
+import argparse
+import gzip
+import json
+import os
+import shutil
+import statistics
+import subprocess
+import sys
+
+from module_graph import HTML_PATH, LAZY_LOADER_PATH, build_graph
+from partition_modules import call_sites, partition, read_manifest, run_harness
+
+PROFILES = {
+    'desktop': {'bandwidth_kbps': 10240, 'rtt_ms': 40, 'cpu': 1},
+    'slow-4g': {'bandwidth_kbps': 1638, 'rtt_ms': 150, 'cpu': 4},
+    'slow-3g': {'bandwidth_kbps': 400, 'rtt_ms': 400, 'cpu': 4},
+}
+STRATEGIES = ['current', 'partitioned', 'bundled', 'async-cdn']
+HANDSHAKE_RTTS = 3          # DNS + TCP + TLS before the first request on a new host
+EXTERNAL_KB = 100
+RAW_PER_GZIP = 3
+
+# Times `new vm.Script()` for each file; a unique trailing comment defeats the
+# compilation cache so every run is a cold compile.
+CALIBRATE_SCRIPT = '''
+const fs = require('fs');
+const vm = require('vm');
+const [runs, ...files] = process.argv.slice(1);
+const timings = {};
+for (const file of files) {
+  const source = fs.readFileSync(file, 'utf8');
+  const samples = [];
+  for (let i = 0; i < Number(runs); i++) {
+    const started = process.hrtime.bigint();
+    try { new vm.Script(source + `\\n// calibration ${i}`, { filename: file }); } catch (e) { break; }
+    samples.push(Number(process.hrtime.bigint() - started) / 1e6);
+  }
+  timings[file] = samples;
+}
+console.log(JSON.stringify(timings));
+'''
+
+
+class Resource:
+    """One script as the model sees it"""
+
+    def __init__(self, name, host, transfer, raw, compile_ms=0.0, exec_ms=0.0, blocking=True):
+        self.name = name
+        self.host = host                # None for inline scripts
+        self.transfer = transfer        # bytes on the wire
+        self.raw = raw
+        self.compile_ms = compile_ms
+        self.exec_ms = exec_ms
+        self.blocking = blocking
+
+    def __repr__(self):
+        return f"Resource({self.name!r}, {self.transfer} B)"
+
+
+def calibrate(root, paths, runs=5):
+    """Median cold vm.Script compile time in ms for each path"""
+    if shutil.which('node') is None:
+        raise RuntimeError('node is required to calibrate compile cost')
+    files = [os.path.join(root, p) for p in paths]
+    result = subprocess.run(['node', '-e', CALIBRATE_SCRIPT, '--', str(runs), *files],
+                            capture_output=True, text=True, timeout=300)
+    if result.returncode != 0:
+        raise RuntimeError(f"calibration failed: {result.stderr.strip()[-500:]}")
+    samples = json.loads(result.stdout)
+    return {p: statistics.median(samples[f]) for p, f in zip(paths, files) if samples.get(f)}
+
+
+def fit_rate(sizes, timings):
+    """Least-squares compile cost in ms per byte through the origin"""
+    pairs = [(sizes[p], ms) for p, ms in timings.items() if p in sizes]
+    denominator = sum(size * size for size, _ in pairs)
+    if not denominator:
+        return 0.0
+    return sum(size * ms for size, ms in pairs) / denominator
+
+
+def build_resources(graph, report, rate, strategy, eager=None, external_kb=EXTERNAL_KB):
+    """The scripts index.html would load under strategy, in document order"""
+    executed = {s['module']: s.get('ms', 0.0) for s in report.get('scripts', [])}
+    resources = []
+    for module in graph.ordered():
+        if module.html_index is None:
+            continue
+        if strategy in ('partitioned', 'bundled') and module.kind == 'script' and module.name not in eager:
+            continue
+        if module.kind == 'external':
+            transfer = external_kb * 1024
+            raw = transfer * RAW_PER_GZIP
+            resources.append(Resource(module.name, module.name.split('/')[2], transfer, raw,
+                                      rate * raw, blocking=strategy != 'async-cdn'))
+            continue
+        compile_ms = rate * module.sizes['raw']
+        exec_ms = max(0.0, executed.get(module.name, 0.0) - compile_ms)
+        host = None if module.kind == 'inline' else 'origin'
+        resources.append(Resource(module.name, host, module.sizes['gzip'], module.sizes['raw'],
+                                  compile_ms, exec_ms))
+
+    if strategy == 'bundled':
+        local = [r for r in resources if r.host == 'origin']
+        if local:
+            data = b'\n;\n'.join(graph.modules[r.name].raw for r in local)
+            bundle = Resource('bundle.js', 'origin', len(gzip.compress(data, 9)), len(data),
+                              rate * len(data), sum(r.exec_ms for r in local))
+            first = resources.index(local[0])
+            resources = [r for r in resources if r.host != 'origin']
+            resources.insert(first, bundle)
+    return resources
+
+
+def simulate_network(resources, profile, start_ms):
+    """Arrival time of every fetched resource; transfers share bandwidth equally"""
+    rtt = profile['rtt_ms']
+    bytes_per_ms = profile['bandwidth_kbps'] * 1024 / 8 / 1000
+    pending = []
+    for index, resource in enumerate(resources):
+        if resource.host is None:
+            continue
+        setup = 0 if resource.host == 'origin' else HANDSHAKE_RTTS * rtt
+        pending.append([start_ms + setup + rtt, float(resource.transfer), index])
+    arrivals = {}
+    now = start_ms
+    active = []
+    pending.sort()
+    while pending or active:
+        if not active:
+            now = max(now, pending[0][0])
+        while pending and pending[0][0] <= now:
+            active.append(pending.pop(0))
+        share = bytes_per_ms / len(active)
+        finish = min(entry[1] for entry in active) / share
+        step = finish if not pending else min(finish, pending[0][0] - now)
+        for entry in active:
+            entry[1] -= share * step
+        now += step
+        for entry in [e for e in active if e[1] <= 1e-6]:
+            arrivals[entry[2]] = now
+            active.remove(entry)
+    return arrivals
+
+
+def simulate(resources, profile, html_bytes, startup_ms):
+    """Timeline of one page load; returns a JSON-ready dict"""
+    rtt = profile['rtt_ms']
+    bytes_per_ms = profile['bandwidth_kbps'] * 1024 / 8 / 1000
+    html_done = HANDSHAKE_RTTS * rtt + rtt + html_bytes / bytes_per_ms
+    arrivals = simulate_network(resources, profile, html_done)
+
+    cpu = profile['cpu']
+    main_thread = html_done
+    timeline = []
+    for index, resource in enumerate(resources):
+        arrived = arrivals.get(index, html_done)
+        if not resource.blocking:
+            timeline.append({'script': resource.name, 'arrived': arrived, 'blocking': False})
+            continue
+        waited = arrived > main_thread
+        started = max(main_thread, arrived)
+        main_thread = started + (resource.compile_ms + resource.exec_ms) * cpu
+        timeline.append({'script': resource.name, 'arrived': arrived, 'started': started,
+                         'finished': main_thread, 'blocked_on_network': waited})
+    first_chapter = main_thread + startup_ms * cpu
+    return {
+        'html_done': html_done,
+        'dom_content_loaded': main_thread,
+        'first_chapter': first_chapter,
+        'network_done': max(arrivals.values(), default=html_done),
+        'transfer_bytes': sum(r.transfer for r in resources if r.host is not None),
+        'cpu_ms': sum(r.compile_ms + r.exec_ms for r in resources if r.blocking) * cpu,
+        'requests': sum(1 for r in resources if r.host is not None),
+        'timeline': timeline,
+    }
+
+
+def model(root='.', profiles=None, strategies=None, runs=5, external_kb=EXTERNAL_KB, report=None):
+    """Calibrate, then simulate every strategy under every profile"""
+    profiles = profiles or PROFILES
+    strategies = strategies or STRATEGIES
+    graph = build_graph(root)
+    report = report or run_harness(root)
+    local = [n for n, m in graph.modules.items() if m.kind in ('script', 'unlisted')]
+    timings = calibrate(root, local, runs)
+    rate = fit_rate({n: graph.modules[n].sizes['raw'] for n in local}, timings)
+
+    eager = None
+    if any(s in ('partitioned', 'bundled') for s in strategies):
+        with open(os.path.join(root, LAZY_LOADER_PATH), 'r', encoding='utf-8') as f:
+            previous = read_manifest(f.read())
+        with open(os.path.join(root, HTML_PATH), 'r', encoding='utf-8') as f:
+            sites = call_sites(f.read())
+        eager = set(partition(graph, report, sites, previous, root).eager)
+
+    with open(os.path.join(root, HTML_PATH), 'rb') as f:
+        html_bytes = len(gzip.compress(f.read(), 9))
+    startup_ms = report.get('timings', {}).get('startup', 0.0)
+
+    results = {}
+    for strategy in strategies:
+        resources = build_resources(graph, report, rate, strategy, eager, external_kb)
+        results[strategy] = {name: simulate(resources, profile, html_bytes, startup_ms)
+                             for name, profile in profiles.items()}
+    return {
+        'calibration': {'ms_per_kb': rate * 1024, 'files': len(timings),
+                        'compile_ms': sum(timings.values()), 'startup_ms': startup_ms},
+        'profiles': profiles,
+        'results': results,
+    }
+
+
+def _ms(value):
+    return f"{value / 1000:.2f} s" if value >= 1000 else f"{value:.0f} ms"
+
+
+def main():
+    """Main function"""
+    parser = argparse.ArgumentParser(description='Estimate time-to-first-chapter per loading strategy')
+    parser.add_argument('--root', default='.', help='Repository root')
+    parser.add_argument('--profile', action='append', choices=sorted(PROFILES),
+                        help='Network/CPU profile (repeatable; default: all)')
+    parser.add_argument('--strategy', action='append', choices=STRATEGIES,
+                        help='Loading strategy (repeatable; default: all)')
+    parser.add_argument('--bandwidth', type=float, help='Override bandwidth in kbit/s')
+    parser.add_argument('--rtt', type=float, help='Override round-trip time in ms')
+    parser.add_argument('--cpu', type=float, help='Override CPU slowdown factor')
+    parser.add_argument('--external-kb', type=float, default=EXTERNAL_KB,
+                        help='Assumed gzip size of each CDN script')
+    parser.add_argument('--runs', type=int, default=5, help='Compile timing runs per file')
+    parser.add_argument('--waterfall', action='store_true', help='Print the per-script timeline')
+    parser.add_argument('--json', action='store_true', help='Print the results as JSON')
+    args = parser.parse_args()
+
+    profiles = {}
+    for name in args.profile or PROFILES:
+        profile = dict(PROFILES[name])
+        for key, value in (('bandwidth_kbps', args.bandwidth), ('rtt_ms', args.rtt), ('cpu', args.cpu)):
+            if value is not None:
+                profile[key] = value
+        profiles[name] = profile
+
+    try:
+        result = model(args.root, profiles, args.strategy, args.runs, args.external_kb)
+    except RuntimeError as e:
+        print(f"❌ {e}")
+        return 2
+
+    if args.json:
+        print(json.dumps(result, indent=2))
+        return 0
+
+    calibration = result['calibration']
+    print("=" * 60)
+    print("Startup Cost Model")
+    print("=" * 60)
+    print(f"  - Compile cost: {calibration['ms_per_kb']:.3f} ms/KB "
+          f"(vm.Script, {calibration['files']} files)")
+    print(f"  - Startup work after DOMContentLoaded: {_ms(calibration['startup_ms'])}")
+    print(f"  - CDN scripts assumed {args.external_kb:.0f} KB gzip each")
+    for name, profile in profiles.items():
+        print(f"\n📶 {name}: {profile['bandwidth_kbps']:.0f} kbit/s, {profile['rtt_ms']:.0f} ms RTT, "
+              f"{profile['cpu']:g}x CPU")
+        print(f"  {'strategy':12s} {'requests':>8s} {'transfer':>10s} {'cpu':>9s} "
+              f"{'DCL':>9s} {'first chapter':>14s}")
+        for strategy, runs in result['results'].items():
+            run = runs[name]
+            print(f"  {strategy:12s} {run['requests']:8d} {run['transfer_bytes'] / 1024:8.0f} KB "
+                  f"{_ms(run['cpu_ms']):>9s} {_ms(run['dom_content_loaded']):>9s} "
+                  f"{_ms(run['first_chapter']):>14s}")
+        if args.waterfall:
+            for strategy, runs in result['results'].items():
+                print(f"\n  {strategy} waterfall:")
+                for entry in runs[name]['timeline']:
+                    if not entry.get('blocking', True):
+                        print(f"    {entry['script']:52s} arrives {_ms(entry['arrived']):>9s} (async)")
+                        continue
+                    wait = ' ⏳' if entry['blocked_on_network'] else ''
+                    print(f"    {entry['script']:52s} {_ms(entry['started']):>9s} -> "
+                          f"{_ms(entry['finished']):>9s}{wait}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,744 @@
+#!/usr/bin/env python3
+"""
+Single-pass static analysis engine for the front-end sources.
+
+Every .js/.css/.html file is read and tokenized once. The tokenizer blanks
+the bodies of strings, template literals, regex literals and comments (line
+and column offsets are preserved) so rules match against real code instead
+of guessing from quote counts. Rules register themselves with @rule and run
+as plugins over the tokenized SourceFile; checks that need an external tool
+(the node syntax check) register with @batch_rule and run once for all
+changed files.
+
+Findings are written to one machine-readable file (static-analysis.json),
+keyed by each file's sha256. Unchanged files reuse their cached findings, so
+the report scripts (deep_analysis.py, medium_priority_analysis.py,
+comprehensive_issue_analysis.py, identify_real_issues.py,
+find_actual_code_issues.py, create_fixable_issues_report.py and
+analyze_issues.py) are views that select and format findings from here.
+"""
+
+import argparse
+import bisect
+import hashlib
+import json
+import os
+import re
+import shutil
+import subprocess
+import sys
+import time
+from collections import Counter
+
+from js_literals import find_matching
+
+FINDINGS_PATH = 'static-analysis.json'
+FINDINGS_FORMAT = 1
+EXTENSIONS = {'.js': 'js', '.css': 'css', '.html': 'html'}
+EXCLUDE_DIRS = {'node_modules', '.git', 'dist', 'coverage', 'archive', '__pycache__'}
+LARGE_FILE_BYTES = 100000
+DEEP_INDENT = 24
+TEXT_WIDTH = 150
+
+RULES = {}
+BATCH_RULES = {}
+
+_IDENT = re.compile(r'[A-Za-z_$][\w$]*')
+_NUMBER = re.compile(r'\d[\w.]*')
+# Keywords after which a '/' starts a regex literal rather than a division
+REGEX_KEYWORDS = {'return', 'typeof', 'instanceof', 'in', 'of', 'new', 'delete', 'void',
+                  'throw', 'case', 'do', 'else', 'yield', 'await'}
+
+
+# ----------------------------------------------------------------------
+# Tokenizing
+# ----------------------------------------------------------------------
+
+def _blank(chars, start, end):
+    for i in range(start, end):
+        if chars[i] != '\n':
+            chars[i] = ' '
+
+
+def scan_regex(text, i):
+    """
+    (body_end, end) of the regex literal whose opening '/' is at i: the offset
+    of the closing '/' and the index past the flags. None when the line has
+    no closing '/', so the slash was a division after all.
+    """
+    length = len(text)
+    j = i + 1
+    in_class = False
+    while j < length and text[j] != '\n':
+        if text[j] == '\\':
+            j += 2
+            continue
+        if text[j] == '[':
+            in_class = True
+        elif text[j] == ']':
+            in_class = False
+        elif text[j] == '/' and not in_class:
+            break
+        j += 1
+    if j >= length or text[j] != '/':
+        return None
+    end = j + 1
+    while end < length and (text[end].isalnum() or text[end] in '_$'):
+        end += 1
+    return j, end
+
+
+def tokenize(text, kind='js'):
+    """
+    Return (code, comments) for a source file.
+
+    code has the same length and line breaks as text, with every string,
+    template, regex and comment body replaced by spaces (delimiters are kept,
+    ${...} expressions inside templates stay code). comments is a list of
+    (offset, text) pairs.
+    """
+    chars = list(text)
+    comments = []
+    length = len(text)
+
+    if kind == 'html':
+        for match in re.finditer(r'<!--.*?-->', text, re.S):
+            comments.append((match.start(), match.group(0)))
+            _blank(chars, match.start(), match.end())
+        return ''.join(chars), comments
+
+    templates = []          # brace depth of each open ${...} expression
+    prev = '('              # last significant token: '(' allows a regex next
+    i = 0
+
+    def scan_template(i):
+        """Blank template text from i; returns index after the closing ` or ${"""
+        start = i
+        while i < length:
+            ch = text[i]
+            if ch == '\\':
+                i += 2
+                continue
+            if ch == '`':
+                _blank(chars, start, i)
+                return i + 1, False
+            if ch == '$' and text.startswith('${', i):
+                _blank(chars, start, i)
+                return i + 2, True
+            i += 1
+        _blank(chars, start, length)
+        return length, False
+
+    while i < length:
+        ch = text[i]
+
+        if ch == '/' and i + 1 < length and text[i + 1] in '/*':
+            if text[i + 1] == '/':
+                end = text.find('\n', i)
+                end = length if end == -1 else end
+            else:
+                end = text.find('*/', i + 2)
+                end = length if end == -1 else end + 2
+            comments.append((i, text[i:end]))
+            _blank(chars, i, end)
+            i = end
+            continue
+
+        if ch in '"\'':
+            j = i + 1
+            while j < length and text[j] != ch and text[j] != '\n':
+                j += 2 if text[j] == '\\' else 1
+            _blank(chars, i + 1, min(j, length))
+            i = j + 1
+            prev = 'a'
+            continue
+
+        if ch == '`' and kind == 'js':
+            i, opened = scan_template(i + 1)
+            if opened:
+                templates.append(0)
+                prev = '('
+            else:
+                prev = 'a'
+            continue
+
+        if ch == '/' and kind == 'js' and prev not in ('a', ')'):
+            regex = scan_regex(text, i)
+            if regex:
+                _blank(chars, i + 1, regex[0])
+                i = regex[1]
+                prev = 'a'
+                continue
+
+        if templates and ch == '{':
+            templates[-1] += 1
+        elif templates and ch == '}':
+            if templates[-1] == 0:
+                templates.pop()
+                i, opened = scan_template(i + 1)
+                if opened:
+                    templates.append(0)
+                    prev = '('
+                else:
+                    prev = 'a'
+                continue
+            templates[-1] -= 1
+
+        if ch.isalpha() or ch in '_$':
+            match = _IDENT.match(text, i)
+            prev = '(' if match.group(0) in REGEX_KEYWORDS else 'a'
+            i = match.end()
+            continue
+        if ch.isdigit():
+            i = _NUMBER.match(text, i).end()
+            prev = 'a'
+            continue
+        if not ch.isspace():
+            prev = ')' if ch in ')]}' else '('
+        i += 1
+
+    return ''.join(chars), comments
+
+
+class SourceFile:
+    """One file, read and tokenized once, shared by every rule"""
+
+    def __init__(self, path, text, size=None):
+        self.path = path
+        self.text = text
+        self.size = size if size is not None else len(text.encode('utf-8'))
+        self.kind = EXTENSIONS.get(os.path.splitext(path)[1], 'js')
+        self.code, self.comments = tokenize(text, self.kind)
+        self.lines = text.split('\n')
+        self.code_lines = self.code.split('\n')
+        self._line_starts = [0]
+        for line in self.lines[:-1]:
+            self._line_starts.append(self._line_starts[-1] + len(line) + 1)
+
+    def line_of(self, offset):
+        """1-based line number of a character offset"""
+        return bisect.bisect_right(self._line_starts, offset)
+
+    def is_code(self, offset):
+        """True when offset is outside strings, regexes and comments"""
+        return self.code[offset] == self.text[offset] or self.text[offset].isspace()
+
+    def excerpt(self, line):
+        """The stripped source line, shortened for reports"""
+        if not 1 <= line <= len(self.lines):
+            return ''
+        text = self.lines[line - 1].strip()
+        return text if len(text) <= TEXT_WIDTH else text[:TEXT_WIDTH] + '...'
+
+
+# ----------------------------------------------------------------------
+# Rule registry
+# ----------------------------------------------------------------------
+
+class Rule:
+    """A registered check: yields (line, message) pairs for one SourceFile"""
+
+    def __init__(self, name, severity, kinds, check, description):
+        self.name = name
+        self.severity = severity
+        self.kinds = kinds
+        self.check = check
+        self.description = description
+
+
+def rule(name, severity, kinds=('js',), description=''):
+    """Register a per-file rule"""
+    def register(check):
+        RULES[name] = Rule(name, severity, kinds, check, description or (check.__doc__ or '').strip())
+        return check
+    return register
+
+
+def batch_rule(name, severity, kinds=('js',), description=''):
+    """
+    Register a rule that checks a list of SourceFiles (paths relative to root)
+    at once, called as check(sources, root); returns {path: [(line, message)]}
+    """
+    def register(check):
+        BATCH_RULES[name] = Rule(name, severity, kinds, check, description or (check.__doc__ or '').strip())
+        return check
+    return register
+
+
+def _matches(source, pattern, flags=0):
+    """(line, match) for every match of pattern in the code view"""
+    for match in re.finditer(pattern, source.code, flags):
+        yield source.line_of(match.start()), match
+
+
+# ----------------------------------------------------------------------
+# Code quality rules
+# ----------------------------------------------------------------------
+
+@rule('var-declaration', 'LOW')
+def check_var(source):
+    """var declarations"""
+    for line, _ in _matches(source, r'\bvar\s+[A-Za-z_$]'):
+        yield line, 'var declaration'
+
+
+@rule('loose-equality', 'LOW')
+def check_loose_equality(source):
+    """== comparisons"""
+    for line, _ in _matches(source, r'(?<![!=<>])==(?!=)'):
+        yield line, 'loose equality (==)'
+
+
+@rule('loose-inequality', 'LOW')
+def check_loose_inequality(source):
+    """!= comparisons"""
+    for line, _ in _matches(source, r'!=(?!=)'):
+        yield line, 'loose inequality (!=)'
+
+
+def _console_rule(method):
+    @rule(f'console-{method}', 'LOW', description=f'console.{method}() calls')
+    def check(source):
+        for line, _ in _matches(source, rf'\bconsole\.{method}\s*\('):
+            yield line, f'console.{method}'
+    return check
+
+
+for _method in ('error', 'warn', 'log', 'debug', 'info'):
+    _console_rule(_method)
+
+
+@rule('function-declaration', 'LOW')
+def check_function_declaration(source):
+    """function declarations and function expressions assigned with ="""
+    for line, match in _matches(source, r'\bfunction\s+([A-Za-z_$][\w$]*)\s*\('):
+        yield line, f'function declaration: {match.group(1)}'
+    for line, _ in _matches(source, r'=\s*function\s*\('):
+        yield line, 'function expression'
+
+
+@rule('deep-nesting', 'LOW')
+def check_deep_nesting(source):
+    """code indented 24 columns or more"""
+    for number, line in enumerate(source.code_lines, 1):
+        stripped = line.strip()
+        if len(stripped) <= 5 or stripped.startswith('*'):
+            continue
+        indent = len(line) - len(line.lstrip())
+        if indent >= DEEP_INDENT:
+            level = indent // 4 if '    ' in line[:indent] else indent // 2
+            yield number, f'indent level {level}'
+
+
+@rule('large-file', 'LOW')
+def check_large_file(source):
+    """files over 100KB"""
+    if source.size > LARGE_FILE_BYTES:
+        yield 0, f'File size: {round(source.size / 1024, 1)}KB'
+
+
+@rule('empty-catch', 'LOW')
+def check_empty_catch(source):
+    """catch blocks with no statements"""
+    for line, _ in _matches(source, r'\bcatch\s*(?:\([^)]*\))?\s*\{\s*\}'):
+        yield line, 'empty catch block'
+
+
+@rule('double-iife', 'HIGH')
+def check_double_iife(source):
+    """more than one (function() { wrapper in a file"""
+    wrappers = [m.start() for m in re.finditer(r'\(function\s*\(\)\s*\{', source.code)]
+    if len(wrappers) > 1:
+        yield source.line_of(wrappers[1]), 'File has nested IIFE patterns - potential code duplication'
+
+
+@rule('duplicate-exports', 'HIGH')
+def check_duplicate_exports(source):
+    """window.Name assigned more than once"""
+    seen = Counter()
+    for line, match in _matches(source, r'\bwindow\.([A-Z][A-Za-z]+)\s*=(?!=)'):
+        seen[match.group(1)] += 1
+        if seen[match.group(1)] == 2:
+            yield line, f'Duplicate window export: {match.group(1)}'
+
+
+@rule('async-without-try', 'MEDIUM')
+def check_async_without_try(source):
+    """async functions whose body has no try/catch"""
+    for match in re.finditer(r'\basync\s+function\s+([A-Za-z_$][\w$]*)\s*\([^)]*\)\s*\{', source.code):
+        try:
+            end = find_matching(source.code, match.end() - 1)
+        except ValueError:
+            continue
+        if not re.search(r'\btry\b', source.code[match.end():end]):
+            yield source.line_of(match.start()), f'Async function {match.group(1)} lacks error handling'
+
+
+@rule('undefined-reference', 'LOW')
+def check_undefined_reference(source):
+    """undefined/null outside if conditions"""
+    for line, match in _matches(source, r'\b(undefined|null)\b'):
+        if 'if' in source.code_lines[line - 1]:
+            continue
+        yield line, f'Potential undefined/null reference: {match.group(1)}'
+
+
+# ----------------------------------------------------------------------
+# Security rules
+# ----------------------------------------------------------------------
+
+@rule('eval', 'CRITICAL', kinds=('js', 'html'))
+def check_eval(source):
+    """eval() calls"""
+    for line, _ in _matches(source, r'(?<![\w$.])eval\s*\('):
+        yield line, 'eval()'
+
+
+@rule('document-write', 'CRITICAL', kinds=('js', 'html'))
+def check_document_write(source):
+    """document.write() calls"""
+    for line, _ in _matches(source, r'\bdocument\.write(?:ln)?\s*\('):
+        yield line, 'document.write()'
+
+
+@rule('innerhtml-concat', 'CRITICAL', kinds=('js', 'html'))
+def check_innerhtml_concat(source):
+    """innerHTML built by concatenation"""
+    for line, match in _matches(source, r'\.innerHTML\s*(\+?=)(?!=)'):
+        rest = source.code_lines[line - 1][source.code_lines[line - 1].find('innerHTML') + 9:]
+        if match.group(1) == '+=' or '+' in rest:
+            yield line, 'innerHTML concatenation'
+
+
+@rule('innerhtml-assign', 'MEDIUM', kinds=('js', 'html'))
+def check_innerhtml_assign(source):
+    """plain innerHTML assignments"""
+    for line, match in _matches(source, r'\.innerHTML\s*(\+?=)(?!=)'):
+        rest = source.code_lines[line - 1][source.code_lines[line - 1].find('innerHTML') + 9:]
+        if match.group(1) == '=' and '+' not in rest:
+            yield line, 'innerHTML assignment'
+
+
+@rule('hardcoded-password', 'HIGH', kinds=('js', 'html'))
+def check_hardcoded_password(source):
+    """password literals in code"""
+    for match in re.finditer(r'password\s*[:=]\s*["\'][^"\'\n]+["\']', source.text, re.I):
+        if source.is_code(match.start()):
+            yield source.line_of(match.start()), 'hardcoded password'
+
+
+@rule('localstorage-sensitive', 'MEDIUM', kinds=('js', 'html'))
+def check_localstorage_sensitive(source):
+    """localStorage access with credential-like keys"""
+    pattern = r'localStorage\.(?:setItem|getItem)\s*\([^\n]*(?:password|token|secret|key)'
+    for match in re.finditer(pattern, source.text, re.I):
+        if source.is_code(match.start()):
+            yield source.line_of(match.start()), 'sensitive data in localStorage'
+
+
+def _dialog_rule(name, severity):
+    @rule(name, severity, kinds=('js', 'html'), description=f'{name}() dialogs')
+    def check(source):
+        for line, _ in _matches(source, rf'(?:(?<![\w$.])|(?<=window\.)){name}\s*\('):
+            yield line, f'{name}()'
+    return check
+
+
+_dialog_rule('alert', 'HIGH')
+_dialog_rule('prompt', 'HIGH')
+_dialog_rule('confirm', 'LOW')
+
+
+# ----------------------------------------------------------------------
+# Comment markers
+# ----------------------------------------------------------------------
+
+_MARKERS = [
+    (r'\bTODO\b', 'TODO'), (r'\bFIXME\b', 'FIXME'), (r'\bXXX\b', 'XXX'), (r'\bHACK\b', 'HACK'),
+    (r'@todo\b', 'JSDoc TODO'), (r'@fixme\b', 'JSDoc FIXME'), (r'@bug\b', 'JSDoc BUG'),
+    (r'@issue\b', 'JSDoc ISSUE'),
+]
+_NOTES = [
+    (r'not implemented', 'Not implemented'), (r'not working', 'Not working'),
+    (r'\bbroken\b', 'Broken feature'), (r'\bbug:', 'Bug report'), (r'known issue', 'Known issue'),
+    (r'workaround', 'Workaround needed'), (r'\btemporary\b', 'Temporary solution'),
+    (r'\bplaceholder\b', 'Placeholder code'), (r'\bincomplete\b', 'Incomplete implementation'),
+    (r'missing implementation', 'Missing implementation'), (r'needs fixing', 'Needs fixing'),
+    (r'needs to be', 'Needs to be'),
+]
+
+
+def _comment_lines(source):
+    for offset, text in source.comments:
+        first = source.line_of(offset)
+        for delta, line in enumerate(text.split('\n')):
+            yield first + delta, line
+
+
+@rule('todo-comment', 'LOW', kinds=('js', 'css', 'html'))
+def check_todo_comment(source):
+    """TODO/FIXME/XXX/HACK markers in comments"""
+    for line, text in _comment_lines(source):
+        for pattern, marker in _MARKERS:
+            if re.search(pattern, text):
+                yield line, marker
+                break
+
+
+@rule('unfinished-note', 'LOW', kinds=('js', 'css', 'html'))
+def check_unfinished_note(source):
+    """comments describing broken, temporary or missing code"""
+    for line, text in _comment_lines(source):
+        for pattern, note in _NOTES:
+            if re.search(pattern, text, re.I):
+                yield line, note
+                break
+
+
+# ----------------------------------------------------------------------
+# Accessibility rules (HTML)
+# ----------------------------------------------------------------------
+
+@rule('img-no-alt', 'MEDIUM', kinds=('html',))
+def check_img_alt(source):
+    """<img> without alt"""
+    for number, line in enumerate(source.code_lines, 1):
+        if re.search(r'<img\b', line) and not re.search(r'\balt\s*=', line):
+            yield number, 'image without alt text'
+
+
+@rule('button-no-label', 'MEDIUM', kinds=('html',))
+def check_button_label(source):
+    """icon-only <button> without aria-label"""
+    for number, line in enumerate(source.code_lines, 1):
+        if re.search(r'<button\b', line) and not re.search(r'\baria-label\s*=', line):
+            if len(re.sub(r'<[^>]+>', '', line).strip()) < 2:
+                yield number, 'button without accessible name'
+
+
+@rule('input-no-label', 'MEDIUM', kinds=('html',))
+def check_input_label(source):
+    """<input> with neither aria-label nor id"""
+    for number, line in enumerate(source.code_lines, 1):
+        if re.search(r'<input\b', line) and not re.search(r'\b(?:aria-label|id)\s*=', line):
+            yield number, 'input without label'
+
+
+@rule('click-no-tabindex', 'MEDIUM', kinds=('html',))
+def check_click_tabindex(source):
+    """clickable <div> that cannot be focused"""
+    for number, line in enumerate(source.code_lines, 1):
+        if re.search(r'<div\b.*onclick', line) and not re.search(r'\btabindex\s*=', line):
+            yield number, 'clickable div without tabindex'
+
+
+# ----------------------------------------------------------------------
+# Syntax check (one node process for every changed file)
+# ----------------------------------------------------------------------
+
+SYNTAX_SCRIPT = r'''
+const fs = require('fs');
+const vm = require('vm');
+const results = {};
+for (const file of JSON.parse(fs.readFileSync(0, 'utf8'))) {
+  const source = fs.readFileSync(file, 'utf8');
+  try {
+    new vm.Script(source, { filename: file });
+  } catch (error) {
+    if (!/import|export|module/.test(error.message)) {
+      results[file] = [errorLine(error), error.message];
+      continue;
+    }
+    try {
+      new vm.SourceTextModule(source, { identifier: file });
+    } catch (moduleError) {
+      results[file] = [errorLine(moduleError), moduleError.message];
+    }
+  }
+}
+function errorLine(error) {
+  const match = /:(\d+)\n/.exec(error.stack || '');
+  return match ? Number(match[1]) : 0;
+}
+process.stdout.write(JSON.stringify(results));
+'''
+
+
+@batch_rule('syntax-error', 'HIGH')
+def check_syntax(sources, root='.'):
+    """files node cannot parse (skipped when node is not installed)"""
+    node = shutil.which('node')
+    if node is None or not sources:
+        return {}
+    result = subprocess.run([node, '--experimental-vm-modules', '--no-warnings', '-e', SYNTAX_SCRIPT],
+                            input=json.dumps([s.path for s in sources]),
+                            capture_output=True, text=True, timeout=300, cwd=root)
+    if result.returncode != 0:
+        return {}
+    return {path: [(line, f'SyntaxError: {message}')]
+            for path, (line, message) in json.loads(result.stdout or '{}').items()}
+
+
+# ----------------------------------------------------------------------
+# Engine
+# ----------------------------------------------------------------------
+
+def ruleset_version():
+    """Changes whenever a rule (this file) changes or node availability flips"""
+    with open(os.path.abspath(__file__), 'rb') as f:
+        digest = hashlib.sha256(f.read())
+    digest.update(b'node' if shutil.which('node') else b'-')
+    return digest.hexdigest()[:16]
+
+
+def discover(root='.'):
+    """Every .js/.css/.html source under root, sorted, as root-relative paths"""
+    found = []
+    for directory, dirs, files in os.walk(root):
+        dirs[:] = sorted(d for d in dirs if d not in EXCLUDE_DIRS)
+        for name in files:
+            if os.path.splitext(name)[1] in EXTENSIONS:
+                found.append(os.path.relpath(os.path.join(directory, name), root).replace(os.sep, '/'))
+    return sorted(found)
+
+
+def _load_cache(findings_path, version):
+    if not findings_path or not os.path.exists(findings_path):
+        return {}
+    try:
+        with open(findings_path, 'r') as f:
+            cached = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    if cached.get('format') != FINDINGS_FORMAT or cached.get('ruleset') != version:
+        return {}
+    return cached.get('files', {})
+
+
+def analyze(root='.', findings_path=FINDINGS_PATH, paths=None, refresh=False):
+    """
+    Run every rule over the sources under root and return the findings report.
+
+    Files whose sha256 matches the cached findings file are not re-read by
+    the rules. The report is
+    {'format', 'ruleset', 'rules', 'files': {path: {'sha256', 'size', 'findings'}}}.
+    With paths, only those files are analyzed and reported, and their entries
+    are merged into findings_path; a full run rewrites it.
+    """
+    version = ruleset_version()
+    cache = {} if refresh else _load_cache(findings_path and os.path.join(root, findings_path), version)
+    files = {}
+    changed = []
+    reused = 0
+
+    for path in paths or discover(root):
+        with open(os.path.join(root, path), 'rb') as f:
+            raw = f.read()
+        digest = hashlib.sha256(raw).hexdigest()
+        if path in cache and cache[path]['sha256'] == digest:
+            files[path] = cache[path]
+            reused += 1
+            continue
+        source = SourceFile(path, raw.decode('utf-8', errors='replace'), len(raw))
+        findings = []
+        for registered in RULES.values():
+            if source.kind in registered.kinds:
+                for line, message in registered.check(source):
+                    findings.append([registered.name, line, message, source.excerpt(line)])
+        files[path] = {'sha256': digest, 'size': len(raw), 'findings': findings}
+        changed.append(source)
+
+    if changed:
+        for registered in BATCH_RULES.values():
+            batch = [s for s in changed if s.kind in registered.kinds]
+            for path, results in registered.check(batch, root).items():
+                excerpt = next(s.excerpt for s in batch if s.path == path)
+                for line, message in results:
+                    files[path]['findings'].append([registered.name, line, message, excerpt(line)])
+        for source in changed:
+            files[source.path]['findings'].sort(key=lambda f: (f[1], f[0]))
+
+    all_rules = {**RULES, **BATCH_RULES}
+    report = {
+        'format': FINDINGS_FORMAT,
+        'ruleset': version,
+        'rules': {name: {'severity': r.severity, 'description': r.description}
+                  for name, r in sorted(all_rules.items())},
+        'files': files,
+    }
+    stored = {**cache, **files} if paths else files
+    if findings_path and (changed or stored.keys() != cache.keys()):
+        with open(os.path.join(root, findings_path), 'w') as f:
+            json.dump(dict(report, files=dict(sorted(stored.items()))), f, separators=(',', ':'))
+    report['stats'] = {'scanned': len(changed), 'reused': reused}
+    return report
+
+
+def select(report, rules=None, under=(), exclude=()):
+    """
+    Flat finding dicts (rule, severity, file, line, message, text) from report.
+
+    under limits results to paths starting with one of the given prefixes (or
+    equal to them); exclude drops paths containing any of the given strings.
+    """
+    wanted = set(rules) if rules else None
+    severities = {name: meta['severity'] for name, meta in report['rules'].items()}
+    selected = []
+    for path, entry in sorted(report['files'].items()):
+        if under and not any(path == p or path.startswith(p.rstrip('/') + '/') for p in under):
+            continue
+        if any(part in path for part in exclude):
+            continue
+        for name, line, message, text in entry['findings']:
+            if wanted is None or name in wanted:
+                selected.append({'rule': name, 'severity': severities.get(name, 'LOW'), 'file': path,
+                                 'line': line, 'message': message, 'text': text})
+    return selected
+
+
+def main():
+    """Main function"""
+    parser = argparse.ArgumentParser(description='Run the static analysis rules over the front-end sources')
+    parser.add_argument('paths', nargs='*', help='Limit the run to these files')
+    parser.add_argument('--root', default='.', help='Repository root')
+    parser.add_argument('--output', default=FINDINGS_PATH, help='Findings file (relative to root)')
+    parser.add_argument('--rule', action='append', help='Only show findings of this rule (repeatable)')
+    parser.add_argument('--refresh', action='store_true', help='Ignore cached findings')
+    parser.add_argument('--list-rules', action='store_true', help='List the registered rules')
+    parser.add_argument('--json', action='store_true', help='Print the selected findings as JSON')
+    args = parser.parse_args()
+
+    if args.list_rules:
+        for name, registered in sorted({**RULES, **BATCH_RULES}.items()):
+            print(f"  {name:24s} {registered.severity:8s} {registered.description}")
+        return 0
+
+    unknown = set(args.rule or ()) - set(RULES) - set(BATCH_RULES)
+    if unknown:
+        print(f"❌ Unknown rule(s): {', '.join(sorted(unknown))}")
+        return 2
+
+    started = time.perf_counter()
+    report = analyze(args.root, args.output, args.paths or None, args.refresh)
+    elapsed = time.perf_counter() - started
+    findings = select(report, args.rule)
+
+    if args.json:
+        print(json.dumps(findings, indent=2))
+        return 0
+
+    print("=" * 60)
+    print("Static Analysis")
+    print("=" * 60)
+    print(f"  - Files: {len(report['files'])} ({report['stats']['scanned']} analyzed, "
+          f"{report['stats']['reused']} from cache)")
+    print(f"  - Findings: {len(findings):,}")
+    for name, count in Counter(f['rule'] for f in findings).most_common():
+        print(f"      {name}: {count}")
+    print(f"  - Findings written to {os.path.join(args.root, args.output)}")
+    print(f"  - Finished in {elapsed:.2f}s")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,334 @@
+#!/usr/bin/env python3
+"""
+Persistent index of the app's global names.
+
+The front-end scripts are classic scripts sharing one global scope, so a
+name is global when a script declares it at the top level or assigns
+window.X. For every global the index records where it is defined, every
+site that references it (with the phase of the reference, as classified by
+module_graph: load, runtime or typeof-guarded) and the position in
+index.html of each defining script.
+
+The index is written to symbol-index.json keyed by each file's sha256; on
+the next run only files whose content changed are scanned again (index.html
+counts as one file for its inline scripts and event handlers). Queries:
+
+  - definitions and references of a name
+  - conflicts: globals defined by more than one script
+  - use-before-load: references made while a script is evaluated to a
+    global that no earlier script in index.html defines
+  - duplicate exports: window.X assigned more than once in one file
+"""
+
+import argparse
+import bisect
+import hashlib
+import json
+import os
+import re
+import sys
+from collections import defaultdict
+
+from module_graph import (HANDLERS, HTML_PATH, Module, _HANDLER, discover_scripts, parse_script_tags,
+                          scan_module)
+from static_analysis import tokenize
+
+INDEX_PATH = 'symbol-index.json'
+INDEX_FORMAT = 1
+# Never globals of the app: references to these are not stored
+RESERVED = {
+    'async', 'await', 'break', 'case', 'catch', 'class', 'const', 'continue', 'debugger', 'default',
+    'delete', 'do', 'else', 'export', 'extends', 'false', 'finally', 'for', 'function', 'if', 'import',
+    'in', 'instanceof', 'let', 'new', 'null', 'of', 'return', 'static', 'super', 'switch', 'this',
+    'throw', 'true', 'try', 'typeof', 'undefined', 'var', 'void', 'while', 'with', 'yield', 'arguments',
+    'get', 'set',
+}
+
+
+def scanner_version():
+    """Changes whenever the scanner (this file or module_graph.py) changes"""
+    digest = hashlib.sha256()
+    here = os.path.dirname(os.path.abspath(__file__))
+    for name in ('symbol_index.py', 'module_graph.py'):
+        with open(os.path.join(here, name), 'rb') as f:
+            digest.update(f.read())
+    return digest.hexdigest()[:16]
+
+
+def _line_finder(text, base=0):
+    """Map an offset in text to a 1-based line of the file text was cut from"""
+    breaks = [i for i, c in enumerate(text) if c == '\n']
+    first = base
+
+    def line_of(offset):
+        return first + bisect.bisect_right(breaks, offset - 1) + 1
+    return line_of
+
+
+def scan_code(name, kind, text, first_line=0):
+    """{'defines', 'references'}: name -> [[line, kind], ...] for one script"""
+    module = Module(name, kind, code=tokenize(text)[0])
+    scan_module(module)
+    line_of = _line_finder(text, first_line)
+    defines = defaultdict(list)
+    for symbol, offset, how in module.definition_sites:
+        defines[symbol].append([line_of(offset), how])
+    defined_at = {offset for _, offset, _ in module.definition_sites}
+    references = defaultdict(list)
+    for symbol, offset, how in module.reference_sites:
+        if symbol not in RESERVED and offset not in defined_at:
+            references[symbol].append([line_of(offset), how])
+    return {'defines': dict(defines), 'references': dict(references)}
+
+
+def scan_html(html, html_path=HTML_PATH):
+    """Modules and script order of a page: its inline blocks, handlers and <script> tags"""
+    html_code, _ = tokenize(html, 'html')
+    line_of = _line_finder(html)
+    modules = {}
+    scripts = []
+    inline_count = 0
+    for src, inline, offset in parse_script_tags(html):
+        if src is None:
+            inline_count += 1
+            name = f'{html_path}#script-{inline_count}'
+            start = html.index('>', offset) + 1
+            modules[name] = scan_code(name, 'inline', inline, line_of(start) - 1)
+            scripts.append(name)
+        elif re.match(r'^(?:[a-z]+:)?//', src):
+            scripts.append(src)
+        else:
+            scripts.append(src.lstrip('/'))
+
+    handlers = {'defines': {}, 'references': defaultdict(list)}
+    for match in _HANDLER.finditer(html_code):
+        group = 1 if match.group(1) is not None else 2
+        scanned = scan_code(HANDLERS, 'handlers', html[match.start(group):match.end(group)],
+                            line_of(match.start(group)) - 1)
+        for symbol, sites in scanned['references'].items():
+            handlers['references'][symbol].extend(sites)
+    handlers['references'] = dict(handlers['references'])
+    modules[HANDLERS] = handlers
+    return modules, scripts
+
+
+class SymbolIndex:
+    """Definition and reference sites of every global, with index.html load positions"""
+
+    def __init__(self, files, html_path=HTML_PATH):
+        self.files = files
+        self.html_path = html_path
+        self.modules = {}               # module -> {'file', 'defines', 'references'}
+        for path, entry in sorted(files.items()):
+            for name, scanned in entry['modules'].items():
+                self.modules[name] = dict(scanned, file=path)
+        self.positions = {name: i for i, name in enumerate(files.get(html_path, {}).get('scripts', []))}
+        self.defined = defaultdict(list)
+        self.referenced = defaultdict(list)
+        for name, module in self.modules.items():
+            for symbol, sites in module['defines'].items():
+                self.defined[symbol].extend(self._sites(name, sites))
+            for symbol, sites in module['references'].items():
+                self.referenced[symbol].extend(self._sites(name, sites))
+        self.stats = {}
+
+    def _sites(self, module, sites):
+        return [{'module': module, 'file': self.modules[module]['file'], 'line': line, 'kind': kind,
+                 'position': self.positions.get(module)} for line, kind in sites]
+
+    def position(self, module):
+        """Index of module among the <script> tags of index.html, None when not tagged"""
+        return self.positions.get(module)
+
+    def definitions(self, name):
+        return self.defined.get(name, [])
+
+    def references(self, name):
+        """Reference sites of a global name; nothing for names no script defines"""
+        if name not in self.defined:
+            return []
+        return self.referenced.get(name, [])
+
+    def providers(self, name):
+        """Modules defining name, in load order (untagged modules last)"""
+        names = {site['module'] for site in self.definitions(name)}
+        return sorted(names, key=lambda m: (self.position(m) is None, self.position(m) or 0, m))
+
+    def conflicts(self, loaded_only=False):
+        """name -> providers for globals defined by more than one module"""
+        found = {}
+        for name in sorted(self.defined):
+            providers = self.providers(name)
+            if loaded_only:
+                providers = [m for m in providers if self.position(m) is not None]
+            if len(providers) > 1:
+                found[name] = providers
+        return found
+
+    def use_before_load(self):
+        """
+        Load-time references from scripts index.html loads to globals that no
+        script tagged earlier (or the script itself) defines. Each item names
+        the providers and whether they load later or are not tagged at all.
+        """
+        problems = []
+        for name in sorted(self.referenced):
+            if name not in self.defined:
+                continue
+            providers = self.providers(name)
+            for site in self.referenced[name]:
+                here = site['position']
+                if site['kind'] != 'load' or here is None or site['module'] in providers:
+                    continue
+                if any(self.position(m) is not None and self.position(m) < here for m in providers):
+                    continue
+                later = [m for m in providers if self.position(m) is not None]
+                problems.append(dict(site, name=name, providers=providers,
+                                     reason='loaded later' if later else 'not loaded by ' + self.html_path))
+        problems.sort(key=lambda p: (p['position'], p['line'], p['name']))
+        return problems
+
+    def duplicate_exports(self):
+        """file -> names assigned to window more than once in that file"""
+        found = defaultdict(set)
+        for name, sites in self.defined.items():
+            per_file = defaultdict(int)
+            for site in sites:
+                if site['kind'] == 'window':
+                    per_file[site['file']] += 1
+            for path, count in per_file.items():
+                if count > 1:
+                    found[path].add(name)
+        return {path: sorted(names) for path, names in sorted(found.items())}
+
+
+def _load_index(index_path, version):
+    if not index_path or not os.path.exists(index_path):
+        return {}
+    try:
+        with open(index_path, 'r') as f:
+            cached = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    if cached.get('format') != INDEX_FORMAT or cached.get('scanner') != version:
+        return {}
+    return cached.get('files', {})
+
+
+def build_index(root='.', index_path=INDEX_PATH, html_path=HTML_PATH, refresh=False):
+    """
+    Load the symbol index for root, scanning only files whose sha256 changed.
+
+    The returned SymbolIndex has stats {'scanned', 'reused'}; the index file
+    (relative to root, None to skip) is rewritten when anything changed.
+    """
+    version = scanner_version()
+    cache = {} if refresh else _load_index(index_path and os.path.join(root, index_path), version)
+    files = {}
+    scanned = 0
+
+    paths = discover_scripts(root)
+    if os.path.exists(os.path.join(root, html_path)):
+        paths.append(html_path)
+    position = 0
+    while position < len(paths):
+        path = paths[position]
+        position += 1
+        with open(os.path.join(root, path), 'rb') as f:
+            raw = f.read()
+        digest = hashlib.sha256(raw).hexdigest()
+        if path in cache and cache[path]['sha256'] == digest:
+            files[path] = cache[path]
+        else:
+            text = raw.decode('utf-8', errors='replace')
+            if path == html_path:
+                modules, scripts = scan_html(text, html_path)
+                files[path] = {'sha256': digest, 'modules': modules, 'scripts': scripts}
+            else:
+                files[path] = {'sha256': digest, 'modules': {path: scan_code(path, 'script', text)}}
+            scanned += 1
+        # Scripts the page tags outside the usual roots are indexed too
+        for src in files[path].get('scripts', []):
+            if src not in files and src not in paths and os.path.isfile(os.path.join(root, src)):
+                paths.append(src)
+
+    if index_path and (scanned or set(files) != set(cache)):
+        with open(os.path.join(root, index_path), 'w') as f:
+            json.dump({'format': INDEX_FORMAT, 'scanner': version, 'files': files}, f,
+                      separators=(',', ':'))
+    index = SymbolIndex(files, html_path)
+    index.stats = {'scanned': scanned, 'reused': len(files) - scanned}
+    return index
+
+
+def _where(site):
+    position = f" [#{site['position']}]" if site['position'] is not None else ''
+    return f"{site['file']}:{site['line']}{position}"
+
+
+def main():
+    """Main function"""
+    parser = argparse.ArgumentParser(description='Index the global names defined and used by the front-end')
+    parser.add_argument('names', nargs='*', help='Show definitions and references of these globals')
+    parser.add_argument('--root', default='.', help='Repository root')
+    parser.add_argument('--output', default=INDEX_PATH, help='Index file (relative to root)')
+    parser.add_argument('--refresh', action='store_true', help='Ignore the cached index')
+    parser.add_argument('--conflicts', action='store_true', help='Only list conflicting definitions')
+    parser.add_argument('--use-before-load', action='store_true', help='Only list use-before-load references')
+    parser.add_argument('--loaded', action='store_true', help='Conflicts between tagged scripts only')
+    parser.add_argument('--json', action='store_true', help='Print results as JSON')
+    args = parser.parse_args()
+
+    index = build_index(args.root, args.output, refresh=args.refresh)
+    everything = not (args.names or args.conflicts or args.use_before_load)
+    report = {}
+    if args.names:
+        report['symbols'] = {name: {'providers': index.providers(name), 'definitions': index.definitions(name),
+                                    'references': index.references(name)} for name in args.names}
+    if everything or args.conflicts:
+        report['conflicts'] = index.conflicts(args.loaded)
+    if everything or args.use_before_load:
+        report['use_before_load'] = index.use_before_load()
+    if everything:
+        report['duplicate_exports'] = index.duplicate_exports()
+
+    if args.json:
+        print(json.dumps(dict(report, stats=index.stats), indent=2))
+        return 0
+
+    print("=" * 60)
+    print("Global Symbol Index")
+    print("=" * 60)
+    print(f"  - Files: {len(index.files)} ({index.stats['scanned']} scanned, {index.stats['reused']} cached)")
+    print(f"  - Globals: {len(index.defined)} defined by {len(index.modules)} scripts")
+
+    for name, entry in report.get('symbols', {}).items():
+        if not entry['definitions']:
+            print(f"\n❌ {name}: not defined by any script")
+            continue
+        print(f"\n🔍 {name}")
+        for site in entry['definitions']:
+            print(f"    defined    {_where(site)} ({site['kind']})")
+        for site in entry['references']:
+            print(f"    referenced {_where(site)} ({site['kind']})")
+
+    if report.get('conflicts'):
+        print("\n⚠️  Globals defined by more than one script:")
+        for name, providers in report['conflicts'].items():
+            sites = [_where(s) for s in index.definitions(name)]
+            print(f"  - {name}: {', '.join(sites)}")
+    if report.get('use_before_load'):
+        print("\n⚠️  Globals used while a script loads but defined later:")
+        for item in report['use_before_load']:
+            print(f"  - {_where(item)} uses {item['name']} ({item['reason']}: {', '.join(item['providers'])})")
+    if report.get('duplicate_exports'):
+        print("\n⚠️  window exports assigned more than once:")
+        for path, names in report['duplicate_exports'].items():
+            print(f"  - {path}: {', '.join(names)}")
+    if not args.names and not any(report.get(k) for k in ('conflicts', 'use_before_load', 'duplicate_exports')):
+        print("\n✅ No global conflicts or use-before-load references")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
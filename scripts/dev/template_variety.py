@@ -0,0 +1,281 @@
+#!/usr/bin/env python3
+"""
+Template variety enumerator for the dynamic-content procedural generator.
+
+Extracts proceduralGenerator.paragraphTemplates and its placeholder vocabularies
+from js/modules/dynamic-content.js, counts the exact number of distinct
+paragraphs each template type can render, and samples them uniformly.
+
+Renderings are never materialized: the templates are compiled into a character
+automaton whose path counts are memoized, so counting, ranking and sampling all
+walk the automaton lazily. Identical templates and renderings that two
+different templates happen to share are only counted once.
+"""
+
+import argparse
+import json
+import random
+import sys
+from typing import Dict, List
+
+from js_literals import read_literal
+
+DYNAMIC_CONTENT_PATH = 'js/modules/dynamic-content.js'
+
+ACCEPT = ('accept',)
+
+
+def load_procedural_templates(path=DYNAMIC_CONTENT_PATH):
+    """Read (templates, placeholders) out of proceduralGenerator"""
+    with open(path, 'r', encoding='utf-8') as f:
+        content = f.read()
+
+    templates = read_literal(content, 'paragraphTemplates:')
+    placeholders = read_literal(content, 'placeholders:')
+    if templates is None or placeholders is None:
+        raise ValueError(f"proceduralGenerator templates not found in {path}")
+    return templates, placeholders
+
+
+def compile_template(template, placeholders):
+    """
+    Split a template into segments, each a tuple of alternative strings.
+
+    Mirrors generateParagraph(): placeholders are visited in declaration order
+    and String.replace() only substitutes the first occurrence of each token,
+    so repeated or unknown tokens stay in the text literally.
+    """
+    slots = []
+    for name, values in placeholders.items():
+        token = f'[{name}]'
+        at = template.find(token)
+        if at == -1:
+            continue
+        distinct = tuple(dict.fromkeys(values))
+        if any('[' in value for value in distinct):
+            raise ValueError(f"Placeholder {name} has values containing '['")
+        slots.append((at, len(token), distinct))
+
+    segments = []
+    cursor = 0
+    for at, width, values in sorted(slots):
+        if at > cursor:
+            segments.append((template[cursor:at],))
+        segments.append(values)
+        cursor = at + width
+    if cursor < len(template):
+        segments.append((template[cursor:],))
+    return tuple(segment for segment in segments if segment != ('',))
+
+
+def leaked_tokens(template, placeholders):
+    """Tokens that survive rendering: unknown names and repeated known ones"""
+    seen = set()
+    leaks = []
+    start = 0
+    while True:
+        at = template.find('[', start)
+        end = template.find(']', at + 1)
+        if at == -1 or end == -1:
+            return leaks
+        name = template[at + 1:end]
+        if name not in placeholders or name in seen:
+            leaks.append(f'[{name}]')
+        seen.add(name)
+        start = end + 1
+
+
+class RenderingSpace:
+    """The set of distinct strings a group of compiled templates can produce"""
+
+    def __init__(self, compiled: List[tuple]):
+        self.compiled = list(dict.fromkeys(compiled))
+        self._steps = {}
+        self._counts = {}
+        self.start = self._closure(
+            (index, 0, alt, 0) for index in range(len(self.compiled)) for alt in self._alts(index, 0)
+        )
+
+    def _alts(self, index, seg):
+        segments = self.compiled[index]
+        if seg >= len(segments):
+            return [None]
+        return range(len(segments[seg]))
+
+    def _closure(self, states):
+        """Normalize states so each one is about to read a character"""
+        result = set()
+        pending = list(states)
+        while pending:
+            state = pending.pop()
+            index, seg, alt, offset = state
+            segments = self.compiled[index]
+            if seg >= len(segments):
+                result.add(ACCEPT)
+            elif offset < len(segments[seg][alt]):
+                result.add(state)
+            else:
+                pending.extend((index, seg + 1, nxt, 0) for nxt in self._alts(index, seg + 1))
+        return frozenset(result)
+
+    def transitions(self, node):
+        """Sorted (char, next_node) pairs leaving an automaton node"""
+        cached = self._steps.get(node)
+        if cached is not None:
+            return cached
+        by_char = {}
+        for state in node:
+            if state is ACCEPT:
+                continue
+            index, seg, alt, offset = state
+            ch = self.compiled[index][seg][alt][offset]
+            by_char.setdefault(ch, []).append((index, seg, alt, offset + 1))
+        cached = [(ch, self._closure(by_char[ch])) for ch in sorted(by_char)]
+        self._steps[node] = cached
+        return cached
+
+    def count(self, node=None):
+        """Number of distinct strings readable from node (default: all of them)"""
+        node = self.start if node is None else node
+        if node in self._counts:
+            return self._counts[node]
+        # Post-order walk instead of recursion so long paragraphs stay cheap
+        stack = [node]
+        while stack:
+            current = stack[-1]
+            if current in self._counts:
+                stack.pop()
+                continue
+            pending = [nxt for _, nxt in self.transitions(current) if nxt not in self._counts]
+            if pending:
+                stack.extend(pending)
+                continue
+            total = 1 if ACCEPT in current else 0
+            total += sum(self._counts[nxt] for _, nxt in self.transitions(current))
+            self._counts[current] = total
+            stack.pop()
+        return self._counts[node]
+
+    def __len__(self):
+        return self.count()
+
+    def render_at(self, index):
+        """Return the index-th rendering in lexicographic order"""
+        if not 0 <= index < self.count():
+            raise IndexError(f"Rendering index {index} out of range")
+        node = self.start
+        chars = []
+        while True:
+            if ACCEPT in node:
+                if index == 0:
+                    return ''.join(chars)
+                index -= 1
+            for ch, nxt in self.transitions(node):
+                size = self.count(nxt)
+                if index < size:
+                    chars.append(ch)
+                    node = nxt
+                    break
+                index -= size
+
+    def __iter__(self):
+        """Lazily yield every rendering in lexicographic order"""
+        stack = [(self.start, '')]
+        while stack:
+            node, prefix = stack.pop()
+            if ACCEPT in node:
+                yield prefix
+            for ch, nxt in reversed(self.transitions(node)):
+                stack.append((nxt, prefix + ch))
+
+    def sample(self, k, rng=None):
+        """Draw k distinct renderings uniformly at random"""
+        rng = rng or random.Random()
+        total = self.count()
+        k = min(k, total)
+        picked = set()
+        samples = []
+        while len(samples) < k:
+            index = rng.randrange(total)
+            if index not in picked:
+                picked.add(index)
+                samples.append(self.render_at(index))
+        return samples
+
+
+def naive_product(segments):
+    """Renderings a template would produce if nothing ever collided"""
+    total = 1
+    for segment in segments:
+        total *= len(segment)
+    return total
+
+
+def analyze_variety(templates: Dict[str, List[str]], placeholders: Dict[str, List[str]]):
+    """Build per-type variety statistics and rendering spaces"""
+    report = {}
+    spaces = {}
+    for kind, entries in templates.items():
+        compiled = [compile_template(t, placeholders) for t in entries]
+        space = RenderingSpace(compiled)
+        spaces[kind] = space
+        leaks = {t: leaked_tokens(t, placeholders) for t in dict.fromkeys(entries)}
+        report[kind] = {
+            'templates': len(entries),
+            'unique_templates': len(space.compiled),
+            'naive_renderings': sum(naive_product(c) for c in compiled),
+            'distinct_renderings': space.count(),
+            'per_template': [
+                {'template': t, 'renderings': RenderingSpace([c]).count()}
+                for t, c in zip(dict.fromkeys(entries), space.compiled)
+            ],
+            'leaked_tokens': {t: tokens for t, tokens in leaks.items() if tokens},
+        }
+    return report, spaces
+
+
+def main():
+    """Main function"""
+    parser = argparse.ArgumentParser(description='Measure dynamic-content template variety')
+    parser.add_argument('--file', default=DYNAMIC_CONTENT_PATH, help='Path to dynamic-content.js')
+    parser.add_argument('--type', dest='kind', help='Only report this template type')
+    parser.add_argument('--samples', type=int, default=3, help='Uniform samples to print per type')
+    parser.add_argument('--seed', type=int, help='Seed for reproducible samples')
+    parser.add_argument('--json', help='Write the full report to this JSON file')
+    args = parser.parse_args()
+
+    templates, placeholders = load_procedural_templates(args.file)
+    if args.kind:
+        if args.kind not in templates:
+            print(f"❌ Unknown template type: {args.kind}")
+            return 1
+        templates = {args.kind: templates[args.kind]}
+
+    report, spaces = analyze_variety(templates, placeholders)
+    rng = random.Random(args.seed)
+
+    print("=" * 60)
+    print("Dynamic Content Template Variety")
+    print("=" * 60)
+    for kind, stats in report.items():
+        print(f"\n{kind}:")
+        print(f"  - Templates: {stats['templates']} ({stats['unique_templates']} unique)")
+        print(f"  - Naive product: {stats['naive_renderings']:,}")
+        print(f"  - Distinct renderings: {stats['distinct_renderings']:,}")
+        for template, tokens in stats['leaked_tokens'].items():
+            print(f"  ⚠️  Leaks {', '.join(tokens)}: {template}")
+        for sample in spaces[kind].sample(args.samples, rng):
+            print(f"    • {sample}")
+
+    total = sum(stats['distinct_renderings'] for stats in report.values())
+    print(f"\nTotal distinct paragraphs: {total:,}")
+
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump(report, f, indent=2)
+        print(f"Report written to {args.json}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -4,9 +4,14 @@ Test lazy loading implementation without requiring Vite build.
 Verify that lazy loading works correctly in development mode.
 """
 
-import subprocess
-import time
+import gzip
+import sys
 import os
+import urllib.request
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', 'tests', 'python'))
+
+from static_server import StaticServer
 
 def test_html_structure():
     """Test that HTML structure is correct."""
@@ -155,7 +160,8 @@ def test_module_files_exist():
         'js/ui/modals.js',
         'js/ui/notifications.js',
         'backstory-engine.js',
-        'story-engine.js',
+        'story-content-pack.js',
+        'story-engine.packed.js',
     ]
     
     print("  Critical Modules:")
@@ -212,70 +218,28 @@ def test_module_files_exist():
     return critical_found == len(critical_modules) and lazy_found == len(lazy_modules)
 
 def calculate_performance_improvement():
-    """Calculate expected performance improvement."""
+    """Estimate time-to-first-chapter for each loading strategy."""
     print("\n" + "=" * 80)
     print("TEST 4: Performance Improvement Analysis")
     print("=" * 80)
     
-    # Calculate sizes
-    critical_modules = [
-        'js/utils/security.js',
-        'js/utils/storage.js',
-        'js/utils/helpers.js',
-        'js/utils/formatters.js',
-        'js/utils/ui-helpers.js',
-        'js/utils/lazy-loader.js',
-        'js/modules/app-state.js',
-        'js/modules/auth.js',
-        'js/modules/navigation.js',
-        'js/modules/initialization.js',
-        'js/ui/dropdown.js',
-        'js/ui/text-size.js',
-        'js/ui/modals.js',
-        'js/ui/notifications.js',
-        'backstory-engine.js',
-        'story-engine.js',
-    ]
+    sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+    from startup_model import PROFILES, model
     
-    lazy_modules = [
-        'js/modules/analytics.js',
-        'js/ui/analytics-ui.js',
-        'js/modules/bookmarks.js',
-        'js/ui/bookmarks-ui.js',
-        'js/modules/search.js',
-        'js/ui/search-ui.js',
-        'js/modules/save-load.js',
-        'js/ui/save-load-ui.js',
-        'js/modules/reading-history.js',
-        'js/ui/reading-history-ui.js',
-        'js/modules/performance.js',
-        'js/ui/performance-ui.js',
-        'js/modules/content-management.js',
-        'js/ui/content-management-ui.js',
-        'js/modules/user-profiles.js',
-        'js/modules/user-preferences.js',
-        'js/modules/achievements.js',
-        'js/modules/social-features.js',
-        'js/modules/messaging.js',
-        'js/ui/user-features-ui.js',
-        'js/modules/notifications.js',
-        'js/ui/notifications-ui.js',
-        'js/modules/api.js',
-        'js/modules/branching-narrative.js',
-        'js/modules/dynamic-content.js',
-    ]
-    
-    critical_size = sum(os.path.getsize(m) for m in critical_modules if os.path.exists(m))
-    lazy_size = sum(os.path.getsize(m) for m in lazy_modules if os.path.exists(m))
-    total_size = critical_size + lazy_size
-    
-    improvement = (lazy_size / total_size) * 100
+    try:
+        result = model('.', {'slow-4g': PROFILES['slow-4g']})
+    except RuntimeError as e:
+        print(f"  ⚠️  Startup model unavailable: {e}")
+        return True
     
-    print(f"  Total JavaScript Size: {total_size:,} bytes ({total_size/1024:.1f} KB)")
-    print(f"  Critical (Initial Load): {critical_size:,} bytes ({critical_size/1024:.1f} KB)")
-    print(f"  Lazy Load (On Demand): {lazy_size:,} bytes ({lazy_size/1024:.1f} KB)")
-    print(f"  Initial Load Reduction: {lazy_size/1024:.1f} KB")
-    print(f"  Expected Performance Improvement: ~{improvement:.1f}% faster initial load")
+    runs = {strategy: profiles['slow-4g'] for strategy, profiles in result['results'].items()}
+    baseline = runs['current']['first_chapter']
+    print(f"  Compile cost: {result['calibration']['ms_per_kb']:.3f} ms/KB (calibrated with vm.Script)")
+    print("  Time to first chapter on slow 4G (1.6 Mbit/s, 150 ms RTT, 4x CPU):")
+    for strategy, run in runs.items():
+        change = (baseline - run['first_chapter']) / baseline * 100
+        print(f"    {strategy:12s} {run['first_chapter'] / 1000:6.2f} s  "
+              f"({run['requests']} requests, {run['transfer_bytes'] / 1024:.0f} KB, {change:.1f}% faster than current)")
     
     return True
 
@@ -286,31 +250,20 @@ def test_server_startup():
     print("=" * 80)
     
     try:
-        # Start server in background
-        print("  Starting HTTP server on port 8080...")
-        process = subprocess.Popen(
-            ['python3', '-m', 'http.server', '8080'],
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE
-        )
-        
-        # Wait for server to start
-        time.sleep(2)
-        
-        # Check if process is running
-        if process.poll() is None:
+        # Start the in-process server on an ephemeral port; start() returns once it is ready
+        with StaticServer('.') as server:
             print("  ✓ Server started successfully")
-            print("  ✓ Server running on http://localhost:8080")
+            print(f"  ✓ Server running on {server.url}")
             
-            # Stop server
-            process.terminate()
-            process.wait(timeout=5)
-            print("  ✓ Server stopped successfully")
-            
-            return True
-        else:
-            print("  ✗ Server failed to start")
-            return False
+            request = urllib.request.Request(f'{server.url}/index.html', headers={'Accept-Encoding': 'gzip'})
+            with urllib.request.urlopen(request, timeout=5) as response:
+                if response.status != 200 or 'js/utils/lazy-loader.js' not in gzip.decompress(response.read()).decode():
+                    print("  ✗ index.html was not served")
+                    return False
+            print(f"  ✓ index.html served ({response.headers.get('Content-Encoding', 'identity')})")
+        
+        print("  ✓ Server stopped successfully")
+        return True
             
     except Exception as e:
         print(f"  ✗ Server error: {e}")
@@ -0,0 +1,181 @@
+#!/usr/bin/env node
+/**
+ * User-flow timing on top of dom_harness.js: loads the index.html scripts in
+ * the DOM-stub page, runs startup, then reads N chapters the way a user does.
+ *
+ * Each step lets virtual time run until the story timer has produced a new
+ * chapter (the generate phase: StoryEngine.generateChapter plus the sidebar,
+ * stats and notification updates it triggers), then clicks --target (default
+ * #nextBtn) and times the click until the UI has settled (the render phase:
+ * Navigation.nextChapter -> showChapter). Every StoryEngine.generateChapter
+ * call is timed on its own as well.
+ *
+ * AdminReadingTracker only lets the engine run 10 chapters past what the
+ * admin has read, and nothing in the page records guest reading, so a
+ * longer flow would stall at chapter 11. The harness raises that buffer to
+ * cover all clicks unless --keep-buffer is given.
+ *
+ * Usage: node user_flow.js <root> [--html index.html] [--clicks 20]
+ *                          [--target nextBtn] [--startup-ms 1000]
+ *                          [--settle-ms 16] [--max-wait-ms 600000] [--keep-buffer]
+ * Prints one JSON object with the raw per-step timings; user_flow.py turns
+ * them into percentiles.
+ */
+
+'use strict';
+
+const path = require('path');
+const { createPage } = require('./dom_harness');
+
+const DEFAULT_INTERVAL_MS = 30000;
+
+function flush() {
+  return new Promise((resolve) => setImmediate(resolve));
+}
+
+function elapsed(started) {
+  return Number(process.hrtime.bigint() - started) / 1e6;
+}
+
+// Wrap StoryEngine.generateChapter so every call records its duration
+function timeEngine(page, calls) {
+  const engine = page.context.StoryEngine;
+  if (!engine || typeof engine.generateChapter !== 'function') return false;
+  const original = engine.generateChapter;
+  engine.generateChapter = function (...args) {
+    const started = process.hrtime.bigint();
+    try {
+      return original.apply(this, args);
+    } finally {
+      calls.push(elapsed(started));
+    }
+  };
+  return true;
+}
+
+function appState(page) {
+  const state = page.context.AppState;
+  return state ? { current: state.currentChapter || 0, total: state.totalGenerated || 0 } : null;
+}
+
+async function run(root, options = {}) {
+  const page = createPage(root, options);
+  const onError = (error) => page.guard(() => { throw error; });
+  const rejections = [];
+  const onRejection = (reason) => rejections.push(String(reason && reason.message ? reason.message : reason));
+  process.on('unhandledRejection', onRejection);
+
+  let started = process.hrtime.bigint();
+  const failed = [];
+  for (const script of page.scripts) {
+    const result = page.runScript(script);
+    if (!result.loaded && !result.external) failed.push(result);
+  }
+  await flush();
+  const loadMs = elapsed(started);
+
+  const clicks = options.clicks ?? 20;
+  const tracker = page.context.AdminReadingTracker;
+  if (!options.keepBuffer && tracker && typeof tracker.setConfig === 'function') {
+    const buffer = tracker.getConfig().bufferChapters;
+    tracker.setConfig({ bufferChapters: Math.max(buffer, clicks + buffer) });
+  }
+
+  const engineCalls = [];
+  const engineTimed = timeEngine(page, engineCalls);
+  started = process.hrtime.bigint();
+  page.startup(options.startupMs ?? 1000);
+  await flush();
+  const startupMs = elapsed(started);
+  const startupCalls = engineCalls.splice(0).length;
+
+  const target = page.document.getElementById(options.target || 'nextBtn');
+  if (!target) throw new Error(`#${options.target || 'nextBtn'} not found in ${options.html || 'index.html'}`);
+  const interval = Number(page.context.CHAPTER_INTERVAL_MS) || DEFAULT_INTERVAL_MS;
+  const settle = options.settleMs ?? 16;
+  const maxWait = options.maxWaitMs ?? interval * 20;
+  const steps = [];
+
+  for (let i = 0; i < clicks; i++) {
+    const before = appState(page);
+    // Generate: advance virtual time one tick at a time until a chapter is waiting
+    started = process.hrtime.bigint();
+    let waited = 0;
+    while (before && appState(page).total <= before.current && waited < maxWait) {
+      page.clock.advance(Math.min(interval, maxWait - waited), onError);
+      waited += interval;
+    }
+    await flush();
+    const generateMs = elapsed(started);
+    const generated = engineCalls.splice(0);
+
+    // Render: the click and whatever it schedules within one frame
+    const errorsBefore = page.errors.length;
+    started = process.hrtime.bigint();
+    target.click();
+    page.clock.advance(settle, onError);
+    await flush();
+    const clickMs = elapsed(started);
+    const after = appState(page);
+    steps.push({
+      click: i + 1,
+      from: before ? before.current : null,
+      to: after ? after.current : null,
+      advanced: !!(before && after && after.current === before.current + 1),
+      virtualWaitMs: Math.min(waited, maxWait),
+      generateMs,
+      engineMs: generated,
+      clickMs,
+      errors: page.errors.length - errorsBefore,
+    });
+  }
+
+  process.removeListener('unhandledRejection', onRejection);
+  const container = page.document.getElementById('storyContainer');
+  return {
+    html: options.html || 'index.html',
+    target: options.target || 'nextBtn',
+    engineTimed,
+    chapterIntervalMs: interval,
+    loadMs,
+    startupMs,
+    startupChapters: startupCalls,
+    failedScripts: failed,
+    steps,
+    chapters: appState(page),
+    renderedBytes: container ? String(container.innerHTML).length : 0,
+    errors: page.errors.slice(0, 50),
+    rejections: rejections.slice(0, 20),
+    console: page.consoleCounts,
+    consoleErrors: page.consoleErrors,
+  };
+}
+
+function parseArgs(argv) {
+  const options = { root: argv[0] || '.' };
+  for (let i = 1; i < argv.length; i++) {
+    const value = argv[i + 1];
+    if (argv[i] === '--html') { options.html = value; i++; }
+    else if (argv[i] === '--clicks') { options.clicks = Number(value); i++; }
+    else if (argv[i] === '--target') { options.target = value; i++; }
+    else if (argv[i] === '--startup-ms') { options.startupMs = Number(value); i++; }
+    else if (argv[i] === '--settle-ms') { options.settleMs = Number(value); i++; }
+    else if (argv[i] === '--max-wait-ms') { options.maxWaitMs = Number(value); i++; }
+    else if (argv[i] === '--keep-buffer') { options.keepBuffer = true; }
+    else if (argv[i] === '--verbose') { options.verbose = true; }
+  }
+  return options;
+}
+
+if (require.main === module) {
+  const options = parseArgs(process.argv.slice(2));
+  run(path.resolve(options.root), options).then((report) => {
+    process.stdout.write(JSON.stringify(report) + '\n');
+    process.exit(0);
+  }, (error) => {
+    console.error(error.stack || String(error));
+    process.exit(1);
+  });
+}
+
+module.exports = { run };
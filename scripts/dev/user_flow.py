@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+"""
+User-flow latency for chapter reading, without a browser.
+
+Runs user_flow.js, which loads the index.html scripts into the dom_harness.js
+DOM stubs, starts the page and then clicks #nextBtn N times. Before each click
+virtual time runs until the story timer has produced the next chapter, so
+every step exercises StoryEngine.generateChapter and the UI updates around
+it; the click itself renders the chapter through Navigation.nextChapter and
+showChapter.
+
+Reported per phase, as percentiles over the clicks:
+  engine    StoryEngine.generateChapter calls
+  generate  the timer tick that calls it (sidebar, stats, notifications)
+  click     the #nextBtn click until the UI settles (one 16 ms frame)
+Times are wall-clock milliseconds in Node; timers run on a virtual clock, so
+the 30 s chapter interval costs nothing. AdminReadingTracker's 10-chapter
+buffer is raised to cover the run (--keep-buffer leaves it alone).
+"""
+
+import argparse
+import json
+import math
+import os
+import shutil
+import subprocess
+import sys
+
+from module_graph import HTML_PATH
+
+FLOW = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'user_flow.js')
+PERCENTILES = (50, 90, 95, 99)
+
+
+def percentiles(values, points=PERCENTILES):
+    """Nearest-rank percentiles plus mean and max of a list of milliseconds"""
+    if not values:
+        return {}
+    ordered = sorted(values)
+    result = {f'p{p}': round(ordered[max(0, math.ceil(p / 100 * len(ordered)) - 1)], 3) for p in points}
+    result['mean'] = round(sum(ordered) / len(ordered), 3)
+    result['max'] = round(ordered[-1], 3)
+    result['n'] = len(ordered)
+    return result
+
+
+def run_flow(root, clicks=20, html_path=HTML_PATH, target='nextBtn', startup_ms=1000, settle_ms=16,
+             keep_buffer=False):
+    """Run user_flow.js against root and return its raw report"""
+    if shutil.which('node') is None:
+        raise RuntimeError('node is required to run the user-flow harness')
+    command = ['node', FLOW, root, '--html', html_path, '--clicks', str(clicks), '--target', target,
+               '--startup-ms', str(startup_ms), '--settle-ms', str(settle_ms)]
+    if keep_buffer:
+        command.append('--keep-buffer')
+    result = subprocess.run(command, capture_output=True, text=True, timeout=600)
+    if result.returncode != 0:
+        raise RuntimeError(f"user_flow.js failed: {result.stderr.strip()[-500:]}")
+    return json.loads(result.stdout)
+
+
+def measure(root, clicks=20, **options):
+    """Run the flow and add latency percentiles per phase"""
+    report = run_flow(root, clicks, **options)
+    steps = report['steps']
+    report['latency'] = {
+        'engine': percentiles([ms for step in steps for ms in step['engineMs']]),
+        'generate': percentiles([step['generateMs'] for step in steps]),
+        'click': percentiles([step['clickMs'] for step in steps]),
+    }
+    report['advanced'] = sum(1 for step in steps if step['advanced'])
+    return report
+
+
+def main():
+    """Main function"""
+    parser = argparse.ArgumentParser(description='Time chapter generation and #nextBtn clicks in the DOM-stub page')
+    parser.add_argument('--root', default='.', help='Repository root')
+    parser.add_argument('--html', default=HTML_PATH, help='Page to load, relative to the root')
+    parser.add_argument('--clicks', type=int, default=20, help='Number of #nextBtn clicks')
+    parser.add_argument('--target', default='nextBtn', help='Id of the element to click')
+    parser.add_argument('--keep-buffer', action='store_true',
+                        help="Keep AdminReadingTracker's chapter buffer (generation stops 10 chapters in)")
+    parser.add_argument('--steps', action='store_true', help='Print every click')
+    parser.add_argument('--json', action='store_true', help='Print the report as JSON')
+    args = parser.parse_args()
+
+    try:
+        report = measure(args.root, args.clicks, html_path=args.html, target=args.target,
+                         keep_buffer=args.keep_buffer)
+    except RuntimeError as e:
+        print(f"❌ {e}")
+        return 2
+
+    if args.json:
+        print(json.dumps(report, indent=2))
+        return 0
+
+    print("=" * 60)
+    print("User Flow Latency")
+    print("=" * 60)
+    print(f"  - Script load: {report['loadMs']:.1f} ms, startup: {report['startupMs']:.1f} ms "
+          f"({report['startupChapters']} chapter(s) generated)")
+    print(f"  - Clicks on #{report['target']}: {len(report['steps'])}, "
+          f"advanced a chapter: {report['advanced']}")
+    if report['chapters']:
+        print(f"  - Chapter {report['chapters']['current']} of {report['chapters']['total']} shown, "
+              f"{report['renderedBytes'] / 1024:.1f} KB in #storyContainer")
+    if not report['engineTimed']:
+        print("  ⚠️  StoryEngine.generateChapter not found; engine times are missing")
+
+    print("\n📈 Latency (ms)")
+    print(f"  {'phase':10s} " + ' '.join(f"{name:>8s}" for name in ('p50', 'p90', 'p95', 'p99', 'max')))
+    for phase, stats in report['latency'].items():
+        if stats:
+            print(f"  {phase:10s} " + ' '.join(f"{stats[name]:8.2f}" for name in ('p50', 'p90', 'p95', 'p99', 'max')))
+
+    if args.steps:
+        print("\n🔍 Steps:")
+        for step in report['steps']:
+            engine = sum(step['engineMs'])
+            print(f"  {step['click']:4d}  ch {step['from']} -> {step['to']}  generate {step['generateMs']:7.2f}  "
+                  f"engine {engine:7.2f}  click {step['clickMs']:7.2f}")
+
+    problems = report['failedScripts'] + report['errors'] + report['rejections']
+    if report['failedScripts']:
+        print(f"\n⚠️  {len(report['failedScripts'])} script(s) failed to load:")
+        for script in report['failedScripts']:
+            print(f"  - {script['module']}: {script.get('error')}")
+    if report['errors'] or report['rejections']:
+        print(f"\n⚠️  {len(report['errors']) + len(report['rejections'])} page error(s):")
+        for error in (report['errors'] + report['rejections'])[:10]:
+            print(f"  - {error}")
+    if report['advanced'] < len(report['steps']):
+        print(f"\n❌ {len(report['steps']) - report['advanced']} click(s) did not advance a chapter")
+        return 1
+    if not problems:
+        print("\n✅ Every click rendered the next chapter")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,1485 @@
+/**
+ * Generated by scripts/dev/build_content_pack.py from story-engine.js - do not edit.
+ * Content pools live in story-content-pack.js, which must be loaded first.
+ */
+if (typeof StoryContentPack === 'undefined' && typeof require !== 'undefined') {
+  global.StoryContentPack = require('./story-content-pack');
+}
+/* ============================================
+   ENDLESS STORY ENGINE — CHAPTER GENERATOR
+   Complete Story Bible + Non-Repetitive Generation
+   ============================================ */
+
+const StoryEngine = (() => {
+  // ============================================
+  // STORY POOL INTEGRATION
+  // Integrates with UnifiedPoolManager for expanded content pools
+  // ============================================
+  let poolIntegration = null;
+  let useExpandedPools = false;
+  
+  // ============================================
+  // SEEDED PRNG — Ensures same story for ALL users
+  // Uses mulberry32 algorithm with fixed seed
+  // ============================================
+  const STORY_SEED = 314159265; // Fixed seed — same for everyone
+  let _rngState = STORY_SEED;
+
+  function seededRandom() {
+    _rngState |= 0;
+    _rngState = (_rngState + 0x6D2B79F5) | 0;
+    let t = Math.imul(_rngState ^ (_rngState >>> 15), 1 | _rngState);
+    t = (t + Math.imul(t ^ (t >>> 7), 61 | t)) ^ t;
+    return ((t ^ (t >>> 14)) >>> 0) / 4294967296;
+  }
+
+  // Override Math.random within this scope
+  const random = seededRandom;
+  // ============================================
+  // MC STATE — All 23 stats tracked
+  // ============================================
+  let mcState = {
+    name: "Kael",
+    class: "Vampire Progenitor",
+    level: 1,
+    xp: 0,
+    xpToNext: 100,
+    // Core Stats
+    hp: 500, maxHp: 500,
+    sp: 300, maxSp: 300,
+    mp: 400, maxMp: 400,
+    bloodEssence: 100, maxBloodEssence: 100,
+    // Primary Attributes
+    strength: 12,
+    agility: 15,
+    intelligence: 18,
+    vitality: 14,
+    endurance: 13,
+    luck: 10,
+    // Vampire Stats
+    bloodlust: 0,
+    darkAffinity: 15,
+    regeneration: 5,
+    domination: 8,
+    // Combat Stats
+    attackPower: 25,
+    defense: 18,
+    criticalRate: 8,
+    evasion: 12,
+    attackSpeed: 14,
+    // Hidden Stats
+    karma: 50,
+    instinct: 10,
+    willpower: 16,
+    presence: 12,
+    // Economy
+    gold: 0,
+    // Tracking
+    extractionCount: 0,
+    killCount: 0,
+    bossesDefeated: 0,
+    dungeonsCleared: 0,
+    titlesEarned: [],
+    currentTitle: "Newcomer",
+    currentLocation: "Real World",
+    vampireEvolution: "Base Progenitor",
+    skills: [],
+    abilities: [],
+    items: [],
+    extractedItems: []
+  };
+
+  // ============================================
+  // WORLD STATE
+  // ============================================
+  let worldState = {
+    regionsDiscovered: ["Ashenveil Ruins"],
+    currentRegion: "Ashenveil Ruins",
+    dayNightCycle: "day",
+    weather: "clear",
+    worldEvents: [],
+    loreFragments: [],
+    hiddenRealmsFound: [],
+    gameVersion: "1.0.0",
+    gameUpdates: []
+  };
+
+  // ============================================
+  // CHARACTER REGISTRY
+  // ============================================
+  let characters = {
+    allies: [],
+    rivals: [],
+    enemies: [],
+    mentors: [],
+    romanceInterests: [],
+    friends: [],
+    clanMembers: [],
+    guildMembers: []
+  };
+
+  // ============================================
+  // STORY TRACKING — Prevents Repetition
+  // ============================================
+  let storyTracker = {
+    chaptersGenerated: 0,
+    totalWords: 0,
+    usedOpenings: [],
+    usedThemes: [],
+    usedLocations: [],
+    usedCombatStyles: [],
+    usedPlotPoints: [],
+    usedBackstoryParagraphs: [],
+    usedVRParagraphs: [],
+    usedPaddingParagraphs: [],
+    usedTitles: [],
+    titleHashes: new Set(),
+    currentArc: 0,
+    currentArcName: "Before the Headset",
+    arcChapterCount: 0,
+    recentEvents: [],
+    pendingDirectives: [],
+    incorporatedDirectives: [],
+    sisterMentioned: false,
+    parentsRevealed: false,
+    lastChapterType: "",
+    lastSetting: "",
+    consecutiveVR: 0,
+    consecutiveReal: 0
+  };
+
+  // ============================================
+  // STORY BIBLE — MASSIVE CONTENT POOLS
+  // ============================================
+
+  // --- ARC DEFINITIONS (Backstory first, then VR game) ---
+
+  // --- CHAPTER TYPES (ensures variety) ---
+
+  // --- OPENING STYLES (never repeat consecutively) ---
+
+  // --- VR REGIONS ---
+
+  // --- REAL WORLD LOCATIONS ---
+
+  // --- NPC / CHARACTER TEMPLATES ---
+
+  // --- SKILLS & ABILITIES ---
+
+
+  // --- ITEMS ---
+
+  // --- LORE FRAGMENTS ---
+
+  // --- SENSORY DETAIL POOLS ---
+
+  // --- INTERNAL THOUGHT PATTERNS ---
+
+
+  // --- CHAPTER GENERATION ENGINE ---
+
+  // Select without recent repetition
+  function selectUnique(pool, usedList, count = 5) {
+    const available = pool.filter(item => !usedList.slice(-count).includes(item));
+    if (available.length === 0) return pool[Math.floor(random() * pool.length)];
+    const selected = available[Math.floor(random() * available.length)];
+    usedList.push(selected);
+    return selected;
+  }
+
+  // Generate dynamic title by combining elements
+  function generateDynamicTitle(type, setting) {
+    // Use expanded pools if available
+    const adjectives = getAdjectivesPool();
+    const nouns = getNounsPool();
+    const actions = getActionsPool();
+    
+    const adj = randomFrom(adjectives);
+    const noun = randomFrom(nouns);
+    const action = randomFrom(actions);
+    const noun2 = randomFrom(nouns);
+    
+    const patterns = StoryContentPack.fill("generateDynamicTitle.patterns", { adj, noun, action, noun2 });
+    
+    return randomFrom(patterns);
+  }
+
+  function randomFrom(arr) {
+    return arr[Math.floor(random() * arr.length)];
+  }
+
+  function randomInt(min, max) {
+    return Math.floor(random() * (max - min + 1)) + min;
+  }
+
+  function shuffleArray(arr) {
+    const shuffled = [...arr];
+    for (let i = shuffled.length - 1; i > 0; i--) {
+      const j = Math.floor(random() * (i + 1));
+      [shuffled[i], shuffled[j]] = [shuffled[j], shuffled[i]];
+    }
+    return shuffled;
+  }
+
+  // ============================================
+  // POOL INTEGRATION FUNCTIONS
+  // ============================================
+  
+  /**
+   * Initialize pool integration with UnifiedPoolManager
+   * @param {Object} integration - StoryPoolIntegration instance
+   */
+  function initializePoolIntegration(integration) {
+    if (integration) {
+      poolIntegration = integration;
+      useExpandedPools = true;
+    }
+  }
+  
+  /**
+   * Get expanded adjectives pool
+   * @returns {Array} - Adjectives array
+   */
+  function getAdjectivesPool() {
+    if (useExpandedPools && poolIntegration) {
+      return poolIntegration.getAdjectives();
+    }
+    return [
+      "Silent", "Dark", "Hidden", "Lost", "Forgotten", "Eternal", "Broken", "Shattered", "Whispering", "Burning",
+      "Frozen", "Ancient", "Sacred", "Cursed", "Blessed", "Empty", "Full", "Bright", "Dim", "Sharp",
+      "Golden", "Silver", "Crimson", "Azure", "Emerald", "Obsidian", "Ivory", "Amber", "Violet", "Scarlet",
+      "Mystic", "Divine", "Infernal", "Celestial", "Abyssal", "Radiant", "Shadowed", "Luminous", "Phantom", "Spectral",
+      "Trembling", "Rising", "Falling", "Soaring", "Diving", "Wandering", "Seeking", "Finding", "Losing", "Gaining",
+      "Weeping", "Laughing", "Singing", "Dancing", "Fighting", "Loving", "Hating", "Fearing", "Hoping", "Dreaming",
+      "Bitter", "Sweet", "Sour", "Spicy", "Salty", "Tangy", "Sharp", "Dull", "Bright", "Dark",
+      "Heavy", "Light", "Soft", "Hard", "Rough", "Smooth", "Cold", "Hot", "Warm", "Cool",
+      "Swift", "Slow", "Fast", "Steady", "Quick", "Rapid", "Gradual", "Sudden", "Instant", "Eternal"
+    ];
+  }
+  
+  /**
+   * Get expanded nouns pool
+   * @returns {Array} - Nouns array
+   */
+  function getNounsPool() {
+    if (useExpandedPools && poolIntegration) {
+      return poolIntegration.getNouns();
+    }
+    return [
+      "Path", "Road", "Way", "Journey", "Quest", "Mission", "Duty", "Burden", "Gift", "Curse",
+      "Memory", "Dream", "Nightmare", "Vision", "Truth", "Lie", "Secret", "Mystery", "Puzzle", "Answer",
+      "Destiny", "Fate", "Fortune", "Luck", "Chance", "Choice", "Decision", "Action", "Reaction", "Consequence",
+      "Heart", "Soul", "Spirit", "Mind", "Body", "Blood", "Bone", "Flesh", "Breath", "Voice",
+      "Sword", "Shield", "Armor", "Weapon", "Tool", "Instrument", "Device", "Machine", "Engine", "Gear",
+      "Kingdom", "Empire", "Realm", "Domain", "Territory", "Land", "World", "Universe", "Cosmos", "Void",
+      "Hero", "Villain", "Warrior", "Mage", "Thief", "Priest", "Paladin", "Ranger", "Monk", "Necromancer",
+      "Dragon", "Demon", "Angel", "Spirit", "Ghost", "Phantom", "Specter", "Wraith", "Shade", "Shadow",
+      "Fire", "Ice", "Lightning", "Earth", "Wind", "Water", "Nature", "Magic", "Power", "Energy",
+      "Dawn", "Dusk", "Day", "Night", "Morning", "Evening", "Noon", "Midnight", "Sunrise", "Sunset",
+      "Mountain", "Valley", "Forest", "Desert", "Ocean", "River", "Lake", "Sky", "Cloud", "Star",
+      "Castle", "Tower", "Fortress", "Dungeon", "Cave", "Temple", "Shrine", "Palace", "Throne", "Altar"
+    ];
+  }
+  
+  /**
+   * Get expanded actions pool
+   * @returns {Array} - Actions array
+   */
+  function getActionsPool() {
+    if (useExpandedPools && poolIntegration) {
+      return poolIntegration.getActions();
+    }
+    return [
+      "Falls", "Rises", "Breaks", "Heals", "Burns", "Freezes", "Whispers", "Screams", "Silences", "Awakens",
+      "Sleeps", "Dreams", "Remembers", "Forgets", "Loves", "Hates", "Fears", "Hopes", "Believes", "Doubts",
+      "Fights", "Flies", "Swims", "Runs", "Walks", "Crawls", "Climbs", "Dives", "Soars", "Descends",
+      "Creates", "Destroys", "Builds", "Demolishes", "Forms", "Shapes", "Molds", "Casts", "Forges", "Crafts",
+      "Speaks", "Listens", "Hears", "Sees", "Watches", "Observes", "Notices", "Discovers", "Finds", "Loses",
+      "Gives", "Takes", "Receives", "Offers", "Accepts", "Rejects", "Refuses", "Denies", "Admits", "Confesses",
+      "Begins", "Ends", "Starts", "Stops", "Pauses", "Continues", "Proceeds", "Advances", "Retreats", "Withdraws",
+      "Wins", "Loses", "Victory", "Defeat", "Conquers", "Surrenders", "Captures", "Escapes", "Frees", "Imprisons",
+      "Lives", "Dies", "Survives", "Thrives", "Withers", "Blooms", "Grows", "Shrinks", "Expands", "Contracts",
+      "Shines", "Glows", "Fades", "Darkens", "Brightens", "Dims", "Illuminates", "Obscures", "Reveals", "Conceals"
+    ];
+  }
+
+  // Determine chapter setting (balance VR and real world)
+  function getChapterSetting() {
+    if (storyTracker.consecutiveVR >= 4) {
+      storyTracker.consecutiveVR = 0;
+      storyTracker.consecutiveReal++;
+      return "real_world";
+    }
+    if (storyTracker.consecutiveReal >= 2) {
+      storyTracker.consecutiveReal = 0;
+      storyTracker.consecutiveVR++;
+      return "vr_world";
+    }
+    const roll = random();
+    if (roll < 0.65) {
+      storyTracker.consecutiveVR++;
+      storyTracker.consecutiveReal = 0;
+      return "vr_world";
+    } else {
+      storyTracker.consecutiveReal++;
+      storyTracker.consecutiveVR = 0;
+      return "real_world";
+    }
+  }
+
+  // Select chapter type (never repeat last type)
+  function getChapterType() {
+    let type;
+    const arcName = StoryContentPack.pool("storyArcs")[storyTracker.currentArc % StoryContentPack.pool("storyArcs").length].name;
+    // Weight certain types based on arc
+    const weights = {};
+    StoryContentPack.pool("chapterTypes").forEach(t => weights[t] = 1);
+
+    if (arcName.includes("Dungeon") || arcName.includes("Echoes")) {
+      weights["combat"] = 3; weights["boss_fight"] = 2; weights["exploration"] = 2;
+    } else if (arcName.includes("Sister") || arcName.includes("Bonds")) {
+      weights["relationship"] = 3; weights["sister_moment"] = 3; weights["introspection"] = 2;
+    } else if (arcName.includes("Market") || arcName.includes("Auction")) {
+      weights["economy"] = 3; weights["crafting"] = 2; weights["social"] = 2;
+    } else if (arcName.includes("Guild") || arcName.includes("Rivals")) {
+      weights["pvp"] = 2; weights["rival_encounter"] = 3; weights["clan_guild"] = 2;
+    } else if (arcName.includes("Evolution") || arcName.includes("Bloodline")) {
+      weights["vampire_power"] = 3; weights["skill_evolution"] = 3; weights["training"] = 2;
+    } else if (arcName.includes("Memory") || arcName.includes("Whispers")) {
+      weights["flashback"] = 3; weights["lore_discovery"] = 3; weights["investigation"] = 2;
+    }
+
+    const weighted = [];
+    for (const [t, w] of Object.entries(weights)) {
+      for (let i = 0; i < w; i++) weighted.push(t);
+    }
+
+    do {
+      type = randomFrom(weighted);
+    } while (type === storyTracker.lastChapterType);
+
+    storyTracker.lastChapterType = type;
+    return type;
+  }
+
+  // Generate chapter title
+  function generateTitle(chapterNum, type, setting) {
+    const vrTitles = StoryContentPack.pool("generateTitle.vrTitles");
+
+    const realTitles = StoryContentPack.pool("generateTitle.realTitles");
+
+    const allTitles = { ...vrTitles, ...realTitles };
+    const titlePool = allTitles[type] || allTitles["exploration"];
+    
+    // Hash function for title uniqueness
+    function hashTitle(title) {
+      const str = String(title).trim();
+      let hash = 0;
+      for (let i = 0; i < str.length; i++) {
+        const char = str.charCodeAt(i);
+        hash = ((hash << 5) - hash) + char;
+        hash = hash & hash;
+      }
+      return hash;
+    }
+    
+    // Generate unique title with retries
+    let title;
+    let attempts = 0;
+    const maxAttempts = 100;
+    
+    while (attempts < maxAttempts) {
+      // Try dynamic title generation 50% of the time
+      if (random() < 0.5) {
+        title = generateDynamicTitle(type, setting);
+      } else {
+        // Try to select from pool
+        const available = titlePool.filter(item => !storyTracker.usedTitles.includes(item));
+        if (available.length > 0) {
+          title = available[Math.floor(random() * available.length)];
+        } else {
+          title = generateDynamicTitle(type, setting);
+        }
+      }
+      
+      // Check if title is unique using hash
+      const hash = hashTitle(title);
+      if (!storyTracker.titleHashes.has(hash)) {
+        storyTracker.titleHashes.add(hash);
+        storyTracker.usedTitles.push(title);
+        return title;
+      }
+      
+      attempts++;
+    }
+    
+    // Fallback: Generate deterministic unique title
+    title = `Chapter ${chapterNum}: ${Date.now()}-${Math.random()}`;
+    const hash = hashTitle(title);
+    storyTracker.titleHashes.add(hash);
+    storyTracker.usedTitles.push(title);
+    return title;
+  }
+
+  // Build sensory paragraph
+  function buildSensoryDetail() {
+    const senses = Object.keys(StoryContentPack.pool("sensoryDetails"));
+    const chosen = shuffleArray(senses).slice(0, randomInt(2, 3));
+    return chosen.map(s => randomFrom(StoryContentPack.pool("sensoryDetails")[s])).join(". ") + ".";
+  }
+
+  // Generate stat changes for a chapter
+  function generateStatChanges(type) {
+    const changes = [];
+    switch (type) {
+      case "combat":
+      case "boss_fight":
+      case "pvp":
+        if (random() > 0.3) { mcState.xp += randomInt(20, 80); changes.push({ stat: "XP", val: "+" + randomInt(20, 80) }); }
+        if (random() > 0.5) { const g = randomInt(10, 50); mcState.gold += g; changes.push({ stat: "Gold", val: "+" + g }); }
+        if (random() > 0.6) { mcState.strength += 1; changes.push({ stat: "STR", val: "+1" }); }
+        if (random() > 0.7) { mcState.killCount += randomInt(1, 5); changes.push({ stat: "Kills", val: "+" + randomInt(1, 5) }); }
+        if (type === "boss_fight") { mcState.bossesDefeated++; changes.push({ stat: "Boss", val: "+1" }); }
+        mcState.bloodlust = Math.min(100, mcState.bloodlust + randomInt(5, 15));
+        break;
+      case "extraction":
+        mcState.extractionCount++; changes.push({ stat: "Extract", val: "+1" });
+        break;
+      case "training":
+      case "skill_evolution":
+        if (random() > 0.4) { mcState.agility += 1; changes.push({ stat: "AGI", val: "+1" }); }
+        if (random() > 0.4) { mcState.intelligence += 1; changes.push({ stat: "INT", val: "+1" }); }
+        mcState.xp += randomInt(10, 40);
+        break;
+      case "vampire_power":
+        mcState.darkAffinity += randomInt(1, 3); changes.push({ stat: "Dark Affinity", val: "+" + randomInt(1, 3) });
+        mcState.regeneration += 1; changes.push({ stat: "Regen", val: "+1" });
+        if (random() > 0.5) { mcState.domination += 1; changes.push({ stat: "Domination", val: "+1" }); }
+        break;
+      case "dungeon":
+        mcState.xp += randomInt(30, 60);
+        mcState.dungeonsCleared++; changes.push({ stat: "Dungeon", val: "+1" });
+        if (random() > 0.5) { const g = randomInt(20, 80); mcState.gold += g; changes.push({ stat: "Gold", val: "+" + g }); }
+        break;
+      case "crafting":
+      case "economy":
+        if (random() > 0.5) { const g = randomInt(5, 30); mcState.gold += g; changes.push({ stat: "Gold", val: "+" + g }); }
+        break;
+      case "lore_discovery":
+        if (random() > 0.5) { mcState.intelligence += 1; changes.push({ stat: "INT", val: "+1" }); }
+        mcState.willpower += 1; changes.push({ stat: "Willpower", val: "+1" });
+        break;
+      case "introspection":
+      case "sister_moment":
+        mcState.willpower += 1; changes.push({ stat: "Willpower", val: "+1" });
+        if (random() > 0.6) { mcState.karma += randomInt(1, 3); changes.push({ stat: "Karma", val: "+" + randomInt(1, 3) }); }
+        break;
+      case "exploration":
+      case "travel":
+        mcState.xp += randomInt(5, 20);
+        if (random() > 0.6) { mcState.luck += 1; changes.push({ stat: "Luck", val: "+1" }); }
+        if (random() > 0.7) { mcState.instinct += 1; changes.push({ stat: "Instinct", val: "+1" }); }
+        break;
+      default:
+        if (random() > 0.7) { mcState.xp += randomInt(5, 15); }
+        break;
+    }
+
+    // Level up check
+    while (mcState.xp >= mcState.xpToNext) {
+      mcState.xp -= mcState.xpToNext;
+      mcState.level++;
+      mcState.xpToNext = Math.floor(mcState.xpToNext * 1.15);
+      mcState.maxHp += randomInt(15, 30);
+      mcState.maxSp += randomInt(8, 15);
+      mcState.maxMp += randomInt(10, 20);
+      mcState.maxBloodEssence += randomInt(5, 10);
+      mcState.hp = mcState.maxHp;
+      mcState.sp = mcState.maxSp;
+      mcState.mp = mcState.maxMp;
+      mcState.bloodEssence = mcState.maxBloodEssence;
+      changes.push({ stat: "LEVEL UP", val: mcState.level, levelUp: true });
+    }
+
+    return changes;
+  }
+
+  // ============================================
+  // PARAGRAPH GENERATORS — Each type unique
+  // ============================================
+
+  function generateExplorationParagraphs(setting, region) {
+    const paras = [];
+    const sensory = buildSensoryDetail();
+
+    if (setting === "vr_world") {
+      // Create more unique openings by combining templates with different sensory details
+      const openingTemplates = StoryContentPack.pool("generateExplorationParagraphs.openingTemplates");
+      
+      // Generate unique opening by combining template with current values
+      const openingTemplate = randomFrom(openingTemplates);
+      const opening = openingTemplate
+        .replace('[SENSORY]', sensory)
+        .replace('[REGION]', region.name)
+        .replace('[REGION_DESC]', region.desc);
+      paras.push(opening);
+
+      // Create more unique middle paragraphs
+      const middleTemplates = StoryContentPack.pool("generateExplorationParagraphs.middleTemplates");
+      
+      // Generate unique middles by combining templates with current values
+      const middle1Template = randomFrom(middleTemplates);
+      const middle1 = middle1Template
+        .replace('[REGION]', region.name)
+        .replace('[REGION_DESC]', region.desc);
+      paras.push(middle1);
+      
+      const availableMiddles = middleTemplates.filter(t => t !== middle1Template);
+      const middle2Template = randomFrom(availableMiddles);
+      const middle2 = middle2Template
+        .replace('[REGION]', region.name)
+        .replace('[REGION_DESC]', region.desc);
+      paras.push(middle2);
+
+    } else {
+      const realLoc = randomFrom(StoryContentPack.pool("realWorldLocations"));
+      const openings = StoryContentPack.fill("generateExplorationParagraphs.openings", { realLoc });
+      paras.push(randomFrom(openings));
+
+      const middles = StoryContentPack.pool("generateExplorationParagraphs.middles");
+      paras.push(randomFrom(middles));
+      paras.push(randomFrom(middles.filter(m => !paras.includes(m))));
+    }
+
+    return paras;
+  }
+
+  function generateCombatParagraphs(setting) {
+    const paras = [];
+    const enemies = [
+      { name: "Shadow Wraith", level: mcState.level + randomInt(-2, 3), desc: "a creature of compressed darkness that moved like smoke and hit like a truck" },
+      { name: "Bone Sentinel", level: mcState.level + randomInt(-1, 4), desc: "seven feet of animated skeleton wrapped in rusted armor, its eye sockets burning with cold blue fire" },
+      { name: "Crimson Stalker", level: mcState.level + randomInt(0, 5), desc: "a lesser vampire that had gone feral, all instinct and hunger with none of the intelligence" },
+      { name: "Thornbeast", level: mcState.level + randomInt(-2, 2), desc: "a mass of living thorns and vines that had learned to hunt, patient and relentless" },
+      { name: "Void Crawler", level: mcState.level + randomInt(1, 6), desc: "something that existed between dimensions, its body flickering in and out of visibility" },
+      { name: "Iron Construct", level: mcState.level + randomInt(0, 3), desc: "a mechanical guardian left over from a forgotten era, its joints screaming with every movement" },
+      { name: "Frost Serpent", level: mcState.level + randomInt(-1, 3), desc: "a coiling mass of ice and scales that moved with impossible speed, its breath freezing everything it touched" },
+      { name: "Flame Warden", level: mcState.level + randomInt(0, 4), desc: "an elemental guardian wreathed in eternal fire, its attacks leaving trails of molten stone" }
+    ,
+      { name: "Abyssal Horror", level: mcState.level + randomInt(2, 7), desc: "a writhing mass of tentacles and eyes from the deepest void, its presence warping reality around it" },
+      { name: "Crystal Guardian", level: mcState.level + randomInt(1, 5), desc: "an ancient construct of living crystal that reflected attacks back at the source" },
+      { name: "Blood Knight", level: mcState.level + randomInt(0, 4), desc: "a fallen vampire warrior clad in crimson armor, wielding a blade that drank blood with every strike" },
+      { name: "Storm Caller", level: mcState.level + randomInt(1, 6), desc: "an elemental being that commanded lightning and thunder, its attacks crackling with raw power" },
+      { name: "Shadow Weaver", level: mcState.level + randomInt(0, 3), desc: "a creature that could manipulate shadows, creating duplicates and striking from unexpected angles" },
+      { name: "Venomous Hydra", level: mcState.level + randomInt(2, 5), desc: "a multi-headed serpent whose venom could melt through armor and flesh alike" },
+      { name: "Spectral Banshee", level: mcState.level + randomInt(1, 4), desc: "a ghostly entity whose scream could shatter concentration and drain health" },
+      { name: "Inferno Titan", level: mcState.level + randomInt(3, 8), desc: "a massive construct of molten rock and eternal flame, each step leaving burning footprints" },
+      { name: "Frost Wraith", level: mcState.level + randomInt(0, 4), desc: "a spirit of pure cold that could freeze enemies in place with its touch" },
+      { name: "Void Stalker", level: mcState.level + randomInt(2, 6), desc: "a hunter from between dimensions that could phase through walls and strike from nowhere" },
+      { name: "Ancient Golem", level: mcState.level + randomInt(1, 5), desc: "a massive stone guardian that had stood watch for centuries, its body covered in runes of power" },
+      { name: "Plague Carrier", level: mcState.level + randomInt(0, 3), desc: "a diseased creature whose very presence spread corruption and decay" },
+      { name: "Thunder Drake", level: mcState.level + randomInt(2, 5), desc: "a winged reptile that rode lightning bolts and struck with electrifying speed" },
+      { name: "Mind Flayer", level: mcState.level + randomInt(3, 7), desc: "a psychic predator that could attack the mind directly, bypassing physical defenses" },
+      { name: "Bone Dragon", level: mcState.level + randomInt(4, 9), desc: "an undead dragon whose skeletal form was harder than steel and whose breath was death" }
+    ];
+
+    const enemy = randomFrom(enemies);
+    const skill = mcState.skills.length > 0 ? randomFrom(mcState.skills) : StoryContentPack.pool("vampireSkills")[0];
+
+    // Create more unique combat openings
+    const openingTemplates = StoryContentPack.pool("generateCombatParagraphs.openingTemplates");
+    
+    const openingTemplate = randomFrom(openingTemplates);
+    const opening = openingTemplate
+      .replace('[ENEMY_DESC]', enemy.desc)
+      .replace('[ENEMY_LEVEL]', enemy.level)
+      .replace('[SKILL_NAME]', skill.name)
+      .replace('[ENEMY_NAME]', enemy.name);
+    paras.push(opening);
+
+    // Create more unique combat middle paragraphs
+    const combatMiddleTemplates = StoryContentPack.pool("generateCombatParagraphs.combatMiddleTemplates");
+    
+    const middle1Template = randomFrom(combatMiddleTemplates);
+    const middle1 = middle1Template
+      .replace('[SKILL_NAME]', skill.name)
+      .replace('[ENEMY_NAME]', enemy.name)
+      .replace('[ENEMY_DESC]', enemy.desc);
+    paras.push(middle1);
+    
+    const availableMiddles = combatMiddleTemplates.filter(t => t !== middle1Template);
+    const middle2Template = randomFrom(availableMiddles);
+    const middle2 = middle2Template
+      .replace('[SKILL_NAME]', skill.name)
+      .replace('[ENEMY_NAME]', enemy.name)
+      .replace('[ENEMY_DESC]', enemy.desc);
+    paras.push(middle2);
+
+
+    const vrScenarios = StoryContentPack.pool("generateCombatParagraphs.vrScenarios");
+
+
+    const dialogueOptions = StoryContentPack.pool("generateCombatParagraphs.dialogueOptions");
+
+    return paras;
+  }
+
+  function generateIntrospectionParagraphs() {
+    const paras = [];
+    const thought = randomFrom(StoryContentPack.pool("mcThoughts"));
+    const pattern = randomFrom(StoryContentPack.pool("thoughtPatterns")).replace("{thought}", thought);
+
+    const openings = StoryContentPack.fill("generateIntrospectionParagraphs.openings", { pattern });
+    paras.push(randomFrom(openings));
+
+    const middles = StoryContentPack.pool("generateIntrospectionParagraphs.middles");
+    paras.push(randomFrom(middles));
+    paras.push(randomFrom(middles.filter(m => !paras.includes(m))));
+
+    return paras;
+  }
+
+  function generateSisterMomentParagraphs() {
+    const paras = [];
+
+    const openings = StoryContentPack.pool("generateSisterMomentParagraphs.openings");
+    paras.push(randomFrom(openings));
+
+    const middles = StoryContentPack.pool("generateSisterMomentParagraphs.middles");
+    paras.push(randomFrom(middles));
+    paras.push(randomFrom(middles.filter(m => !paras.includes(m))));
+
+    return paras;
+  }
+
+  function generateExtractionParagraphs() {
+    const paras = [];
+    const item = randomFrom(StoryContentPack.pool("itemPool"));
+
+    const openings = [
+      `The extraction happened in the space between heartbeats. One moment, the ${item.name} existed only as data—polygons and textures and stat values rendered by a server farm somewhere in the real world. The next moment, it was in my hand. My real hand. Physical. Tangible. Impossible.`,
+      `I held the ${item.name} up to the light of my apartment window and watched reality try to make sense of it. ${item.desc}. It shouldn't exist here. It couldn't exist here. And yet my fingers felt its weight, its texture, its temperature. The extraction ability didn't care about what should or shouldn't be. It simply was.`,
+      `Extraction number ${mcState.extractionCount + 1}. I'd started keeping count because the scientist in me—the part that still believed in rules and laws and the orderly nature of the universe—needed data points. Each extraction taught me something new about the ability's limits. Or rather, its lack of limits.`,
+      `The process was getting easier. The first extraction had felt like pushing a camel through the eye of a needle—every atom of the item resisting the transition from digital to physical. Now it was more like opening a door. A door that shouldn't exist, connecting two rooms that occupied the same space in different realities. The ${item.name} passed through without resistance.`
+    ];
+    paras.push(randomFrom(openings));
+
+    const middles = StoryContentPack.fill("generateExtractionParagraphs.middles", { item });
+    paras.push(randomFrom(middles));
+    paras.push(randomFrom(middles.filter(m => !paras.includes(m))));
+
+    return paras;
+  }
+
+  function generateVampirePowerParagraphs() {
+    const paras = [];
+    const skill = mcState.skills.length > 0 ? randomFrom(mcState.skills) : randomFrom(StoryContentPack.pool("vampireSkills"));
+
+    const openings = StoryContentPack.fill("generateVampirePowerParagraphs.openings", { skill });
+    paras.push(randomFrom(openings));
+
+    const middles = StoryContentPack.fill("generateVampirePowerParagraphs.middles", { skill });
+    paras.push(randomFrom(middles));
+    paras.push(randomFrom(middles.filter(m => !paras.includes(m))));
+
+    return paras;
+  }
+
+  function generateLoreDiscoveryParagraphs() {
+    const paras = [];
+    const lore = selectUnique(StoryContentPack.pool("lorePool"), worldState.loreFragments, 4);
+
+    const openings = StoryContentPack.pool("generateLoreDiscoveryParagraphs.openings");
+    paras.push(randomFrom(openings));
+
+    paras.push(`The fragment read: "${lore}" I read it three times, each pass revealing new implications. This wasn't flavor text. This wasn't worldbuilding for atmosphere. This was a breadcrumb—deliberately placed, carefully hidden, meant for someone with the patience and the perception to find it. Someone like me. Or someone like whatever I was becoming.`);
+
+    const middles = StoryContentPack.pool("generateLoreDiscoveryParagraphs.middles");
+    paras.push(randomFrom(middles));
+
+    return paras;
+  }
+
+  function generateFlashbackParagraphs() {
+    const paras = [];
+
+    const openings = StoryContentPack.pool("generateFlashbackParagraphs.openings");
+    paras.push(randomFrom(openings));
+
+    const middles = StoryContentPack.pool("generateFlashbackParagraphs.middles");
+    paras.push(randomFrom(middles));
+    paras.push(randomFrom(middles.filter(m => !paras.includes(m))));
+
+    return paras;
+  }
+
+  function generateSocialParagraphs() {
+    const paras = [];
+    const charPool = [...StoryContentPack.pool("characterTemplates").allies, ...StoryContentPack.pool("characterTemplates").rivals];
+    const char = randomFrom(charPool);
+
+    const openings = [
+      `"You're weird, you know that?" ${char.name} said it without malice, the way you'd comment on the weather or the respawn timer. We were sitting on the edge of a cliff in ${randomFrom(StoryContentPack.pool("vrRegions")).name}, legs dangling over a drop that would have killed us both if fall damage wasn't disabled in safe zones. ${char.personality}.`,
+      `I found ${char.name} at the usual spot—the tavern in the central hub where players gathered between dungeons to trade, brag, and pretend they weren't addicted. ${char.name} was ${char.quirk}, which somehow made the conversation that followed feel more real than it had any right to.`,
+      `The party invite appeared in my interface with ${char.name}'s tag attached. I hesitated—I always hesitated, because parties meant trust and trust meant vulnerability and vulnerability meant someone else could see how I played. How I really played. But ${char.name} had earned a provisional version of my trust, and the dungeon ahead was designed for groups.`,
+      `${char.name} caught up to me outside the dungeon entrance, slightly out of breath despite the fact that avatars didn't technically breathe. "${char.name} the ${char.class}," they'd introduced themselves the first time we met. Now they just appeared, like a recurring character in a story I hadn't agreed to share.`
+    ];
+    paras.push(randomFrom(openings));
+
+    const middles = StoryContentPack.fill("generateSocialParagraphs.middles", { char });
+    paras.push(randomFrom(middles));
+    paras.push(randomFrom(middles.filter(m => !paras.includes(m))));
+
+    return paras;
+  }
+
+  function generateWorldEventParagraphs() {
+    const paras = [];
+    const events = StoryContentPack.pool("generateWorldEventParagraphs.events");
+
+    const event = randomFrom(events);
+
+    const openings = StoryContentPack.fill("generateWorldEventParagraphs.openings", { event });
+    paras.push(randomFrom(openings));
+
+    const middles = StoryContentPack.pool("generateWorldEventParagraphs.middles");
+    paras.push(randomFrom(middles));
+    paras.push(randomFrom(middles.filter(m => !paras.includes(m))));
+
+    return paras;
+  }
+
+  function generateGenericParagraphs(type, setting) {
+    const paras = [];
+    const sensory = buildSensoryDetail();
+    const region = randomFrom(StoryContentPack.pool("vrRegions"));
+    const realLoc = randomFrom(StoryContentPack.pool("realWorldLocations"));
+
+    const opening = setting === "vr_world"
+      ? `${region.name} held secrets in its architecture—${region.desc}. ${sensory} I moved through it with the careful attention of someone who'd learned that this game rewarded observation as much as combat.`
+      : `${realLoc.desc} The real world demanded a different kind of attention than the game—subtler, slower, but no less important. ${sensory}`;
+    paras.push(opening);
+
+    const middles = StoryContentPack.fill("generateGenericParagraphs.middles", { mcState });
+    paras.push(randomFrom(middles));
+    paras.push(randomFrom(middles.filter(m => !paras.includes(m))));
+
+    return paras;
+  }
+
+  // ============================================
+  // MAIN CHAPTER GENERATOR
+  // ============================================
+  // --- BACKSTORY CHAPTER TITLES ---
+
+  // --- BACKSTORY CLOSINGS ---
+
+  // AI Configuration
+  const aiConfig = {
+    enabled: typeof window !== 'undefined' && window.UnifiedAIGenerator !== undefined,
+    percentage: 40,  // 40% AI, 60% template
+    webllmModel: 'Llama-2-7b-chat-hf-q4f16_1-MLC',
+    transformersModel: 'Xenova/phi-2',
+    enableParallelGeneration: true,
+    enableEnsemble: true
+  };
+
+  // AI Status Tracking
+  if (!storyTracker.aiGenerated) {
+    storyTracker.aiGenerated = 0;
+    storyTracker.templateGenerated = 0;
+    storyTracker.aiErrors = 0;
+  }
+
+  // Initialize AI if available
+  async function initializeAI() {
+    if (aiConfig.enabled && window.UnifiedAIGenerator && !window.UnifiedAIGenerator.isEnabled()) {
+      try {
+        await window.UnifiedAIGenerator.initialize({
+          webllmModel: aiConfig.webllmModel,
+          transformersModel: aiConfig.transformersModel,
+          maxTokens: 200,
+          temperature: 0.8,
+          aiPercentage: aiConfig.percentage,
+          enableParallelGeneration: aiConfig.enableParallelGeneration,
+          enableEnsemble: aiConfig.enableEnsemble
+        });
+        } catch (error) {
+        console.error('Failed to initialize Unified AI Generator:', error);
+        aiConfig.enabled = false;
+      }
+    }
+  }
+
+  // Generate paragraph with AI
+  async function generateParagraphWithAI(context, options = {}) {
+    if (!aiConfig.enabled || !window.UnifiedAIGenerator) {
+      return null;  // AI not available, use template
+    }
+
+    try {
+      const prompt = `Generate a single paragraph for a ${context.type} scene in a ${context.setting} setting. 
+        ${context.theme ? `Theme: ${context.theme}.` : ''}
+        ${context.region ? `Region: ${context.region.name}.` : ''}
+        ${context.directive ? `Include this directive: ${context.directive}` : ''}
+        The paragraph should be 2-4 sentences long and fit the tone of a dark fantasy VR game story.`;
+
+      const result = await window.UnifiedAIGenerator.generateParagraph(prompt, options);
+      
+      if (result) {
+        storyTracker.aiGenerated++;
+        return result;
+      }
+      
+      return null;  // AI failed, use template
+    } catch (error) {
+      console.error('AI generation error:', error);
+      storyTracker.aiErrors++;
+      return null;  // AI failed, use template
+    }
+  }
+
+  // Generate chapter with AI (async version)
+  async function generateChapterWithAI(directive = null) {
+    // Initialize AI if needed
+    await initializeAI();
+
+    // Generate base chapter
+    const chapter = generateChapter(directive);
+
+    // If AI is enabled, replace some paragraphs with AI-generated ones
+    if (aiConfig.enabled && window.AIIntegration && window.AIIntegration.isInitialized) {
+      const numParagraphsToReplace = Math.floor(chapter.paragraphs.length * (aiConfig.percentage / 100));
+      const indicesToReplace = [];
+      
+      // Select random paragraphs to replace
+      while (indicesToReplace.length < numParagraphsToReplace) {
+        const idx = Math.floor(Math.random() * chapter.paragraphs.length);
+        if (!indicesToReplace.includes(idx)) {
+          indicesToReplace.push(idx);
+        }
+      }
+
+      // Replace selected paragraphs with AI-generated ones
+      for (const idx of indicesToReplace) {
+        const context = {
+          type: chapter.arc,
+          setting: chapter.arc.includes('backstory') ? 'real_world' : 'vr_world',
+          theme: chapter.arc,
+          region: chapter.arc.includes('backstory') ? null : { name: 'unknown', desc: 'unknown' },
+          directive: directive ? directive.text : null
+        };
+
+        const aiParagraph = await generateParagraphWithAI(context);
+        if (aiParagraph) {
+          chapter.paragraphs[idx] = aiParagraph;
+        }
+      }
+    }
+
+    return chapter;
+  }
+
+  function generateChapter(directive = null) {
+    // Check admin reading progress (if admin tracker is available)
+    if (typeof window !== 'undefined' && window.AdminReadingTracker) {
+      const progress = window.AdminReadingTracker.getReadingProgress();
+      const nextChapterNum = storyTracker.chaptersGenerated + 1;
+      
+      if (!window.AdminReadingTracker.canGenerateChapter(nextChapterNum)) {
+        throw new Error(
+          `Cannot generate chapter ${nextChapterNum}. ` +
+          `Admin has only read up to chapter ${progress.lastChapterRead}. ` +
+          `Maximum allowed chapter: ${progress.maxAllowedChapter}. ` +
+          `Please read more chapters to generate further content.`
+        );
+      }
+    }
+
+    storyTracker.chaptersGenerated++;
+    storyTracker.arcChapterCount++;
+
+    // Check arc progression
+    const currentArcDef = StoryContentPack.pool("storyArcs")[storyTracker.currentArc % StoryContentPack.pool("storyArcs").length];
+    if (storyTracker.arcChapterCount >= currentArcDef.chapters) {
+      storyTracker.currentArc++;
+      storyTracker.arcChapterCount = 0;
+      const newArc = StoryContentPack.pool("storyArcs")[storyTracker.currentArc % StoryContentPack.pool("storyArcs").length];
+      storyTracker.currentArcName = newArc.name;
+    }
+
+    const chapterNum = storyTracker.chaptersGenerated;
+    const currentArc = StoryContentPack.pool("storyArcs")[storyTracker.currentArc % StoryContentPack.pool("storyArcs").length];
+    const isPreVR = currentArc.preVR === true;
+
+    // ============================================
+    // BACKSTORY CHAPTERS (Pre-VR)
+    // ============================================
+    if (isPreVR) {
+      let paragraphs = [];
+      let type = currentArc.theme;
+      const setting = "real_world";
+
+      // Generate backstory paragraphs based on arc theme
+      switch (currentArc.theme) {
+        case "backstory_life":
+          paragraphs = BackstoryEngine.generateBackstoryLifeParagraphs(randomFrom, randomInt);
+          break;
+        case "backstory_sister":
+          paragraphs = BackstoryEngine.generateBackstorySisterParagraphs(randomFrom, randomInt);
+          break;
+        case "backstory_parents":
+          paragraphs = BackstoryEngine.generateBackstoryParentsParagraphs(randomFrom, randomInt);
+          break;
+        case "backstory_struggle":
+          paragraphs = BackstoryEngine.generateBackstoryStruggleParagraphs(randomFrom, randomInt);
+          break;
+        case "backstory_vr_hype":
+          paragraphs = BackstoryEngine.generateBackstoryVRHypeParagraphs(randomFrom, randomInt);
+          break;
+        case "backstory_headset":
+          paragraphs = BackstoryEngine.generateBackstoryHeadsetParagraphs(randomFrom, randomInt);
+          break;
+        default:
+          paragraphs = BackstoryEngine.generateBackstoryLifeParagraphs(randomFrom, randomInt);
+          break;
+      }
+      
+      // Filter out paragraphs already used in previous chapters
+      let filteredParagraphs = paragraphs.filter(p => !storyTracker.usedBackstoryParagraphs.includes(p));
+      
+      // If all paragraphs are used, allow reuse with a cooldown
+      if (filteredParagraphs.length === 0) {
+        // Reset tracking for this type to allow reuse
+        const recentUsed = storyTracker.usedBackstoryParagraphs.slice(-5000); // Keep only recent 5000
+        filteredParagraphs = paragraphs.filter(p => !recentUsed.includes(p));
+        
+        // If still no paragraphs, just use all paragraphs
+        if (filteredParagraphs.length === 0) {
+          filteredParagraphs = paragraphs;
+        }
+      }
+      
+      paragraphs = filteredParagraphs;
+      
+      // Track these paragraphs to avoid reuse in future chapters
+      paragraphs.forEach(p => {
+        if (!storyTracker.usedBackstoryParagraphs.includes(p)) {
+          storyTracker.usedBackstoryParagraphs.push(p);
+        }
+      });
+
+      // Handle directives even in backstory
+      let directiveText = null;
+      if (directive) {
+        directiveText = directive.text;
+      } else if (storyTracker.pendingDirectives.length > 0) {
+        const pd = storyTracker.pendingDirectives[0];
+        pd.chaptersRemaining--;
+        directiveText = pd.text;
+        if (pd.chaptersRemaining <= 0) {
+          storyTracker.pendingDirectives.shift();
+          storyTracker.incorporatedDirectives.push({ ...pd, status: "incorporated" });
+        }
+      }
+
+      if (directiveText) {
+        const directivePara = `Something changed in the texture of the day—${directiveText.toLowerCase()}. It was subtle, barely noticeable, but it left a mark on everything that followed.`;
+        paragraphs.splice(Math.min(1, paragraphs.length), 0, directivePara);
+        // Track directive paragraph to prevent reuse
+        if (!storyTracker.usedBackstoryParagraphs.includes(directivePara)) {
+          storyTracker.usedBackstoryParagraphs.push(directivePara);
+        }
+      }
+
+      // Add backstory closing
+      // Add closing paragraph
+      const availableClosings = StoryContentPack.pool("backstoryClosings").filter(p => !storyTracker.usedBackstoryParagraphs.includes(p));
+      let closingPara;
+      
+      if (availableClosings.length > 0) {
+        closingPara = availableClosings[Math.floor(random() * availableClosings.length)];
+        storyTracker.usedBackstoryParagraphs.push(closingPara);
+      } else {
+        // If all closings are used, reuse with cooldown
+        const recentUsed = storyTracker.usedBackstoryParagraphs.slice(-5000);
+        const reusableClosings = StoryContentPack.pool("backstoryClosings").filter(p => !recentUsed.includes(p));
+        closingPara = reusableClosings.length > 0 
+          ? reusableClosings[Math.floor(random() * reusableClosings.length)]
+          : StoryContentPack.pool("backstoryClosings")[Math.floor(random() * StoryContentPack.pool("backstoryClosings").length)];
+      }
+      
+      paragraphs.push(closingPara);
+
+      // Pad to ~1000 words
+      // Build a pool of ALL available backstory paragraphs for padding
+      // Call each generator once to get all available paragraphs
+      const allBackstoryParas = [
+        ...BackstoryEngine.generateBackstoryLifeParagraphs(randomFrom, randomInt),
+        ...BackstoryEngine.generateBackstorySisterParagraphs(randomFrom, randomInt),
+        ...BackstoryEngine.generateBackstoryParentsParagraphs(randomFrom, randomInt),
+        ...BackstoryEngine.generateBackstoryStruggleParagraphs(randomFrom, randomInt),
+        ...BackstoryEngine.generateBackstoryVRHypeParagraphs(randomFrom, randomInt),
+        ...BackstoryEngine.generateBackstoryHeadsetParagraphs(randomFrom, randomInt)
+      ];
+      
+      // Remove duplicates from the pool (in case generators return overlapping paragraphs)
+      const uniquePool = [...new Set(allBackstoryParas)];
+      
+      // Get recently used padding paragraphs for cooldown
+      const recentPadding = storyTracker.usedPaddingParagraphs.slice(-5000);
+      
+      while (paragraphs.join(" ").split(/\s+/).length < 1000) {
+        // Filter out paragraphs already in the chapter and recently used
+        const availableParas = uniquePool.filter(p => 
+          !paragraphs.includes(p) && !recentPadding.includes(p)
+        );
+        
+        if (availableParas.length > 0) {
+          const selectedPara = availableParas[randomInt(0, availableParas.length - 1)];
+          paragraphs.splice(paragraphs.length - 1, 0, selectedPara);
+          // Track padding paragraphs to prevent excessive reuse
+          storyTracker.usedPaddingParagraphs.push(selectedPara);
+        } else {
+          // If all paragraphs are already used, break to avoid infinite loop
+          break;
+        }
+      }
+
+      // No stat changes during backstory (no game yet)
+      const statChanges = [];
+      mcState.currentLocation = "Real World";
+
+      // Get backstory title
+      const titlePool = StoryContentPack.pool("backstoryTitles")[currentArc.theme] || StoryContentPack.pool("backstoryTitles")["backstory_life"];
+      const available = titlePool.filter(item => !storyTracker.usedTitles.includes(item));
+      let title;
+      
+      // Use dynamic title generation 50% of the time for more variety
+      if (random() < 0.5) {
+        const dynamicTitle = generateDynamicTitle(currentArc.theme, "real_world");
+        // Only use dynamic title if it's not already used
+        if (!storyTracker.usedTitles.includes(dynamicTitle)) {
+          title = dynamicTitle;
+          storyTracker.usedTitles.push(title);
+        }
+      }
+      
+      if (!title && available.length > 0) {
+        title = available[Math.floor(random() * available.length)];
+        storyTracker.usedTitles.push(title);
+      } else if (!title) {
+        // If all titles are used, generate a dynamic title
+        title = generateDynamicTitle(currentArc.theme, "real_world");
+        storyTracker.usedTitles.push(title);
+      }
+      const wordCount = paragraphs.join(" ").split(/\s+/).length;
+      storyTracker.totalWords += wordCount;
+
+      return {
+        id: chapterNum,
+        number: chapterNum,
+        title: title,
+        type: type,
+        setting: setting,
+        location: "Real World",
+        arc: storyTracker.currentArcName,
+        paragraphs: paragraphs,
+        wordCount: wordCount,
+        statChanges: statChanges,
+        mcSnapshot: { ...mcState, skills: mcState.skills.map(s => ({ ...s })) },
+        trackerSnapshot: { chaptersGenerated: storyTracker.chaptersGenerated, totalWords: storyTracker.totalWords },
+        timestamp: new Date().toISOString()
+      };
+    }
+
+    // ============================================
+    // VR GAME CHAPTERS (Post-Backstory)
+    // ============================================
+    const setting = getChapterSetting();
+    let type = getChapterType();
+
+    // Force certain types based on setting
+    if (setting === "real_world" && ["dungeon", "boss_fight", "crafting", "pvp", "quest"].includes(type)) {
+      type = randomFrom(["introspection", "real_world", "sister_moment", "extraction", "flashback", "relationship", "rest_recovery"]);
+    }
+
+    // Handle directives
+    let directiveText = null;
+    if (directive) {
+      directiveText = directive.text;
+    } else if (storyTracker.pendingDirectives.length > 0) {
+      const pd = storyTracker.pendingDirectives[0];
+      pd.chaptersRemaining--;
+      directiveText = pd.text;
+      if (pd.chaptersRemaining <= 0) {
+        storyTracker.pendingDirectives.shift();
+        storyTracker.incorporatedDirectives.push({ ...pd, status: "incorporated" });
+      }
+    }
+
+    // Generate paragraphs based on type
+    let paragraphs = [];
+    const region = StoryContentPack.pool("vrRegions")[Math.min(Math.floor((chapterNum - 58) / 15), StoryContentPack.pool("vrRegions").length - 1)];
+
+    switch (type) {
+      case "exploration":
+      case "travel":
+        paragraphs = generateExplorationParagraphs(setting, region);
+        break;
+      case "combat":
+      case "pvp":
+        paragraphs = generateCombatParagraphs(setting);
+        break;
+      case "boss_fight":
+        paragraphs = generateCombatParagraphs(setting);
+        break;
+      case "introspection":
+      case "rest_recovery":
+      case "nightmare_vision":
+        paragraphs = generateIntrospectionParagraphs();
+        break;
+      case "sister_moment":
+        paragraphs = generateSisterMomentParagraphs();
+        break;
+      case "extraction":
+        paragraphs = generateExtractionParagraphs();
+        break;
+      case "vampire_power":
+      case "skill_evolution":
+        paragraphs = generateVampirePowerParagraphs();
+        break;
+      case "lore_discovery":
+      case "investigation":
+        paragraphs = generateLoreDiscoveryParagraphs();
+        break;
+      case "flashback":
+        paragraphs = generateFlashbackParagraphs();
+        break;
+      case "dialogue":
+      case "social":
+      case "relationship":
+      case "romance_scene":
+      case "mentor_lesson":
+      case "rival_encounter":
+      case "clan_guild":
+        paragraphs = generateSocialParagraphs();
+        break;
+      case "world_event":
+        paragraphs = generateWorldEventParagraphs();
+        break;
+      default:
+        paragraphs = generateGenericParagraphs(type, setting);
+        break;
+    }
+
+    // Filter out paragraphs already used in previous VR chapters
+    if (setting === 'vr_world') {
+      paragraphs = paragraphs.filter(p => !storyTracker.usedVRParagraphs.includes(p));
+    }
+
+    // Track initial VR paragraphs to prevent cross-chapter duplication
+    if (setting === 'vr_world') {
+      paragraphs.forEach(p => {
+        if (!storyTracker.usedVRParagraphs.includes(p)) {
+          storyTracker.usedVRParagraphs.push(p);
+        }
+      });
+    }
+
+    // Weave in directive if present
+    if (directiveText) {
+      const directivePara = `Something shifted in the fabric of the world—${directiveText.toLowerCase()}. The change was subtle at first, like a new color appearing at the edge of vision, but its implications rippled outward through everything that followed.`;
+      paragraphs.splice(Math.min(1, paragraphs.length), 0, directivePara);
+      // Track directive paragraph to prevent reuse
+      if (setting === 'vr_world' && !storyTracker.usedVRParagraphs.includes(directivePara)) {
+        storyTracker.usedVRParagraphs.push(directivePara);
+      }
+    }
+
+    // Add closing paragraph with forward momentum
+    const closings = StoryContentPack.pool("generateChapter.closings");
+    const closingPara = selectUnique(closings, storyTracker.usedPlotPoints, 9999);
+    paragraphs.push(closingPara);
+    // Track closing paragraph to prevent reuse
+    if (setting === 'vr_world' && !storyTracker.usedVRParagraphs.includes(closingPara)) {
+      storyTracker.usedVRParagraphs.push(closingPara);
+    }
+
+    // Pad to ~1000 words with improved logic
+    let paddingAttempts = 0;
+    const maxPaddingAttempts = 100; // Increased from 50 to 100
+    
+    // Get recently used padding paragraphs for cooldown
+    const recentPadding = storyTracker.usedPaddingParagraphs.slice(-5000);
+    
+    while (paragraphs.join(" ").split(/\s+/).length < 1000 && paddingAttempts < maxPaddingAttempts) {
+      paddingAttempts++;
+      let extraParas;
+      switch (type) {
+        case "exploration": case "travel":
+          extraParas = generateExplorationParagraphs(setting, region); break;
+        case "combat": case "pvp": case "boss_fight":
+          extraParas = generateCombatParagraphs(setting); break;
+        case "introspection": case "rest_recovery": case "nightmare_vision":
+          extraParas = generateIntrospectionParagraphs(); break;
+        case "sister_moment":
+          extraParas = generateSisterMomentParagraphs(); break;
+        case "extraction":
+          extraParas = generateExtractionParagraphs(); break;
+        case "vampire_power": case "skill_evolution":
+          extraParas = generateVampirePowerParagraphs(); break;
+        case "lore_discovery": case "investigation":
+          extraParas = generateLoreDiscoveryParagraphs(); break;
+        case "flashback":
+          extraParas = generateFlashbackParagraphs(); break;
+        case "dialogue": case "social": case "relationship": case "romance_scene":
+        case "mentor_lesson": case "rival_encounter": case "clan_guild":
+          extraParas = generateSocialParagraphs(); break;
+        case "world_event":
+          extraParas = generateWorldEventParagraphs(); break;
+        default:
+          extraParas = generateGenericParagraphs(type, setting); break;
+      }
+      
+      // Filter out paragraphs already in the chapter and recently used
+      const uniqueParas = extraParas.filter(p => 
+        !paragraphs.includes(p) && !recentPadding.includes(p)
+      );
+      
+      if (uniqueParas.length > 0) {
+        const selectedPara = uniqueParas[randomInt(0, uniqueParas.length - 1)];
+        paragraphs.splice(paragraphs.length - 1, 0, selectedPara);
+        // Track padding paragraphs to prevent excessive reuse
+        storyTracker.usedPaddingParagraphs.push(selectedPara);
+      } else {
+        // If all paragraphs are already used, try a different generator type
+        // This provides more variety when the primary generator is exhausted
+        const fallbackGenerators = [
+          () => generateIntrospectionParagraphs(),
+          () => generateExplorationParagraphs(setting, region),
+          () => generateSocialParagraphs(),
+          () => generateLoreDiscoveryParagraphs()
+        ];
+        
+        for (const fallbackGen of fallbackGenerators) {
+          const fallbackParas = fallbackGen();
+          const uniqueFallback = fallbackParas.filter(p => !paragraphs.includes(p) && !storyTracker.usedVRParagraphs.includes(p));
+          
+          if (uniqueFallback.length > 0) {
+            const selectedFallback = uniqueFallback[randomInt(0, uniqueFallback.length - 1)];
+            paragraphs.splice(paragraphs.length - 1, 0, selectedFallback);
+            storyTracker.usedVRParagraphs.push(selectedFallback);
+            break;
+          }
+        }
+        
+        // If still no unique paragraphs found after trying fallbacks, 
+        // allow reuse of paragraphs not in this specific chapter
+        const allGenerators = [
+          () => generateIntrospectionParagraphs(),
+          () => generateExplorationParagraphs(setting, region),
+          () => generateSocialParagraphs(),
+          () => generateLoreDiscoveryParagraphs(),
+          () => generateGenericParagraphs(type, setting),
+          () => generateFlashbackParagraphs(),
+          () => generateVampirePowerParagraphs()
+        ];
+        let foundAny = false;
+        for (const gen of allGenerators) {
+          const genParas = gen();
+          const notInChapter = genParas.filter(p => !paragraphs.includes(p));
+          if (notInChapter.length > 0) {
+            paragraphs.splice(paragraphs.length - 1, 0, notInChapter[randomInt(0, notInChapter.length - 1)]);
+            foundAny = true;
+            break;
+          }
+        }
+        if (!foundAny) break;
+      }
+    }
+
+    // Generate stat changes
+    const statChanges = generateStatChanges(type);
+
+    // Update MC location
+    mcState.currentLocation = setting === "vr_world" ? region.name : "Real World";
+
+    // Initialize skills if empty
+    if (mcState.skills.length === 0 && chapterNum >= 60) {
+      mcState.skills = StoryContentPack.pool("vampireSkills").slice(0, 3).map(s => ({ ...s }));
+    }
+    if (mcState.skills.length < StoryContentPack.pool("vampireSkills").length && mcState.skills.length > 0 && chapterNum % 5 === 0) {
+      const nextSkill = StoryContentPack.pool("vampireSkills")[mcState.skills.length];
+      if (nextSkill) mcState.skills.push({ ...nextSkill });
+    }
+
+    const title = generateTitle(chapterNum, type, setting);
+    const wordCount = paragraphs.join(" ").split(/\s+/).length;
+    storyTracker.totalWords += wordCount;
+
+    const chapter = {
+      id: chapterNum,
+      number: chapterNum,
+      title: title,
+      type: type,
+      setting: setting,
+      location: mcState.currentLocation,
+      arc: storyTracker.currentArcName,
+      paragraphs: paragraphs,
+      wordCount: wordCount,
+      statChanges: statChanges,
+      mcSnapshot: { ...mcState, skills: mcState.skills.map(s => ({ ...s })) },
+      trackerSnapshot: { chaptersGenerated: storyTracker.chaptersGenerated, totalWords: storyTracker.totalWords },
+      timestamp: new Date().toISOString()
+    };
+
+    // Validate chapter for duplicates (if strict duplicate prevention is available)
+    if (typeof window !== 'undefined' && window.StrictDuplicatePrevention) {
+      const validation = window.StrictDuplicatePrevention.validateChapter(chapter);
+      if (!validation.valid) {
+        console.warn(`Chapter ${chapterNum} rejected: ${validation.reason}`);
+        console.warn('Duplicates:', validation.duplicates);
+        throw new Error(
+          `Chapter ${chapterNum} contains duplicate content. ` +
+          `Strict duplicate prevention is enabled. ` +
+          `Please try again to generate unique content.`
+        );
+      }
+    }
+
+    return chapter;
+  }
+
+  // ============================================
+  // PUBLIC API
+  // ============================================
+  return {
+    generateChapter,
+    generateChapterWithAI,
+    getMcState: () => ({ ...mcState }),
+    getWorldState: () => ({ ...worldState }),
+    getStoryTracker: () => ({ ...storyTracker }),
+    getCharacters: () => ({ ...characters }),
+    addDirective: (text, chapters) => {
+      const directive = {
+        id: Date.now(),
+        text: text,
+        chaptersTotal: chapters,
+        chaptersRemaining: chapters,
+        status: "pending",
+        addedAt: new Date().toISOString()
+      };
+      storyTracker.pendingDirectives.push(directive);
+      return directive;
+    },
+    getPendingDirectives: () => [...storyTracker.pendingDirectives],
+    getIncorporatedDirectives: () => [...storyTracker.incorporatedDirectives],
+    getAllDirectives: () => [
+      ...storyTracker.pendingDirectives.map(d => ({ ...d, status: "pending" })),
+      ...storyTracker.incorporatedDirectives.map(d => ({ ...d, status: "incorporated" }))
+    ],
+    reset: () => {
+      // Reset MC state
+      mcState = {
+        level: 1,
+        hp: 100,
+        sp: 100,
+        mp: 50,
+        bloodEssence: 100,
+        strength: 10,
+        agility: 10,
+        intelligence: 10,
+        vitality: 10,
+        endurance: 10,
+        luck: 5,
+        bloodlust: 0,
+        darkAffinity: 0,
+        regeneration: 0,
+        domination: 0,
+        attackPower: 15,
+        defense: 10,
+        criticalRate: 5,
+        evasion: 5,
+        attackSpeed: 10,
+        karma: 0,
+        instinct: 0,
+        willpower: 0,
+        presence: 0,
+        skills: [],
+        abilities: [],
+        inventory: [],
+        gold: 0,
+        extractionCount: 0
+      };
+      
+      // Reset story tracker - ALL fields must be reset
+      storyTracker = {
+        chaptersGenerated: 0,
+        totalWords: 0,
+        usedOpenings: [],
+        usedThemes: [],
+        usedLocations: [],
+        usedCombatStyles: [],
+        usedPlotPoints: [],
+        usedBackstoryParagraphs: [],
+        usedVRParagraphs: [],
+        usedPaddingParagraphs: [],
+        usedTitles: [],
+        currentArc: 0,
+        currentArcName: "Before the Headset",
+        arcChapterCount: 0,
+        recentEvents: [],
+        pendingDirectives: [],
+        // AI Tracking
+        aiGenerated: 0,
+        templateGenerated: 0,
+        aiErrors: 0,
+        incorporatedDirectives: [],
+        sisterMentioned: false,
+        parentsRevealed: false,
+        lastChapterType: "",
+        lastSetting: "",
+        consecutiveVR: 0,
+        consecutiveReal: 0,
+        chaptersInArc: 0,
+        relationships: {},
+        worldState: {},
+        questProgress: {}
+      };
+      
+      // Reset RNG
+      _rngState = STORY_SEED;
+      
+      // Clear localStorage directives (if available)
+      if (typeof localStorage !== 'undefined') {
+        localStorage.removeItem('ese_directives');
+      }
+    },
+    getSkillEvolutions: () => ({ ...StoryContentPack.pool("skillEvolutions") }),
+    getVampireSkills: () => [...StoryContentPack.pool("vampireSkills")],
+    getItemPool: () => [...StoryContentPack.pool("itemPool")],
+    initializePoolIntegration,
+    getAdjectivesPool,
+    getNounsPool,
+    getActionsPool,
+    // AI Configuration
+    setAIConfig: (config) => {
+      Object.assign(aiConfig, config);
+    },
+    getAIConfig: () => ({ ...aiConfig }),
+    getAIStats: () => ({
+      generated: storyTracker.aiGenerated || 0,
+      template: storyTracker.templateGenerated || 0,
+      errors: storyTracker.aiErrors || 0
+    }),
+    initializeAI
+  };
+})();
+
+// Export for both browser and Node.js
+if (typeof module !== 'undefined' && module.exports) {
+  module.exports = StoryEngine;
+} else {
+  window.StoryEngine = StoryEngine;
+}
\ No newline at end of file
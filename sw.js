@@ -1,12 +1,13 @@
 // Service Worker for Story-Unending
 // Provides offline support with network-first caching strategy
 
-const CACHE_NAME = 'story-unending-v3';
+const CACHE_NAME = 'story-unending-v4';
 const urlsToCache = [
   '/',
   '/index.html',
   '/styles.css',
-  '/story-engine.js',
+  '/story-content-pack.js',
+  '/story-engine.packed.js',
   '/backstory-engine.js',
   '/js/utils/security.js',
   '/js/utils/storage.js',
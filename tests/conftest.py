@@ -0,0 +1,22 @@
+"""
+Shared pytest fixtures for the test suites
+"""
+
+import os
+import sys
+
+import pytest
+
+TESTS_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(TESTS_DIR, 'python'))
+
+from static_server import StaticServer
+
+REPO_ROOT = os.path.dirname(TESTS_DIR)
+
+
+@pytest.fixture(scope='session')
+def static_server():
+    """The repository served in-process on an ephemeral port, one per session (and per xdist worker)"""
+    with StaticServer(REPO_ROOT) as server:
+        yield server
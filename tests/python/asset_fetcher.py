@@ -0,0 +1,182 @@
+#!/usr/bin/env python3
+"""
+Concurrent asset fetcher for the HTTP feature testers
+
+AssetFetcher downloads a set of paths with a bounded thread pool. Each
+worker keeps one HTTP/1.1 connection open and reuses it, so a sweep over
+every script and stylesheet index.html references costs roughly one round
+trip per worker instead of one per asset. Every Asset records its latency,
+transferred size and compression ratio.
+"""
+
+import gzip
+import http.client
+import threading
+import time
+import urllib.parse
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterable, Optional
+
+from page_fixture import _normalize_src
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+DEFAULT_CONCURRENCY = 8
+
+
+class Asset:
+    """One fetched asset and how it travelled"""
+
+    def __init__(self, path: str, status: int, body: bytes, size: int, encoding: str,
+                 latency: float, error: Optional[str] = None):
+        self.path = path
+        self.status = status
+        self.body = body
+        self.size = size                # bytes on the wire
+        self.raw_size = len(body)       # bytes after decoding
+        self.encoding = encoding
+        self.latency = latency          # seconds, request sent to body read
+        self.error = error
+
+    @property
+    def ok(self) -> bool:
+        return self.status == 200
+
+    @property
+    def ratio(self) -> float:
+        """Transferred / decoded size; 1.0 for uncompressed responses"""
+        return self.size / self.raw_size if self.raw_size else 1.0
+
+    @property
+    def text(self) -> str:
+        return self.body.decode('utf-8', errors='replace')
+
+    def __contains__(self, needle: str) -> bool:
+        return needle in self.text
+
+    def to_dict(self) -> dict:
+        return {'path': self.path, 'status': self.status, 'bytes': self.size, 'raw_bytes': self.raw_size,
+                'encoding': self.encoding, 'ratio': round(self.ratio, 3),
+                'latency_ms': round(self.latency * 1000, 2), 'error': self.error}
+
+
+def _decode(body: bytes, encoding: str) -> bytes:
+    if encoding == 'gzip':
+        return gzip.decompress(body)
+    if encoding == 'br':
+        return brotli.decompress(body)
+    return body
+
+
+def local_assets(page) -> list:
+    """Same-origin scripts and stylesheets of an IndexedPage, in page order, without duplicates"""
+    paths = []
+    for src in list(page.scripts) + list(page.stylesheets):
+        if urllib.parse.urlsplit(src).scheme or src.startswith('//'):
+            continue
+        path = _normalize_src(src)
+        if path not in paths:
+            paths.append(path)
+    return paths
+
+
+class AssetFetcher:
+    """Parallel keep-alive downloads under one base URL"""
+
+    def __init__(self, base_url: str, concurrency: int = DEFAULT_CONCURRENCY, timeout: float = 5):
+        parts = urllib.parse.urlsplit(base_url)
+        self.scheme = parts.scheme or 'http'
+        self.host = parts.hostname
+        self.port = parts.port
+        self.prefix = parts.path.rstrip('/')
+        self.concurrency = concurrency
+        self.timeout = timeout
+        self.accept_encoding = 'br, gzip' if brotli is not None else 'gzip'
+        self.connections = 0
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._open = []
+        self.last_sweep = {}
+
+    def fetch(self, path: str) -> Asset:
+        """Fetch one path on this thread's connection, reconnecting once if the server closed it"""
+        target = f'{self.prefix}/{path.lstrip("/")}'
+        for attempt in (0, 1):
+            conn = self._connection(fresh=attempt == 1)
+            start = time.perf_counter()
+            try:
+                conn.request('GET', target, headers={'Accept-Encoding': self.accept_encoding})
+                response = conn.getresponse()
+                body = response.read()
+            except (http.client.RemoteDisconnected, http.client.CannotSendRequest,
+                    ConnectionResetError, BrokenPipeError) as e:
+                if attempt:
+                    return Asset(path, 0, b'', 0, 'identity', time.perf_counter() - start, str(e))
+                continue
+            except OSError as e:
+                return Asset(path, 0, b'', 0, 'identity', time.perf_counter() - start, str(e))
+            latency = time.perf_counter() - start
+            if response.will_close:
+                self._local.conn = None
+            encoding = (response.getheader('Content-Encoding') or 'identity').lower()
+            return Asset(path, response.status, _decode(body, encoding), len(body), encoding, latency)
+
+    def fetch_all(self, paths: Iterable[str]) -> Dict[str, Asset]:
+        """Fetch every path with at most `concurrency` requests in flight"""
+        paths = list(dict.fromkeys(paths))
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=max(1, min(self.concurrency, len(paths)))) as pool:
+            results = dict(zip(paths, pool.map(self.fetch, paths)))
+        self.last_sweep = {'wall': time.perf_counter() - start, 'assets': len(paths)}
+        return results
+
+    def sweep(self, page) -> Dict[str, Asset]:
+        """Fetch every same-origin script and stylesheet the page references"""
+        return self.fetch_all(local_assets(page))
+
+    def close(self):
+        with self._lock:
+            for conn in self._open:
+                conn.close()
+            self._open.clear()
+
+    def _connection(self, fresh=False):
+        conn = getattr(self._local, 'conn', None)
+        if conn is None or fresh:
+            if conn is not None:
+                conn.close()
+            cls = http.client.HTTPSConnection if self.scheme == 'https' else http.client.HTTPConnection
+            conn = cls(self.host, self.port, timeout=self.timeout)
+            self._local.conn = conn
+            with self._lock:
+                self._open.append(conn)
+                self.connections += 1
+        return conn
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def summarize(assets: Dict[str, Asset], wall: Optional[float] = None) -> dict:
+    """Totals for a sweep: bytes, compression, summed vs wall-clock latency"""
+    sent = sum(a.size for a in assets.values())
+    raw = sum(a.raw_size for a in assets.values())
+    latencies = sorted(a.latency for a in assets.values())
+    slowest = max(assets.values(), key=lambda a: a.latency, default=None)
+    return {
+        'assets': len(assets),
+        'failed': sorted(path for path, a in assets.items() if not a.ok),
+        'bytes': sent,
+        'raw_bytes': raw,
+        'ratio': round(sent / raw, 3) if raw else 1.0,
+        'latency_sum_ms': round(sum(latencies) * 1000, 2),
+        'latency_max_ms': round(latencies[-1] * 1000, 2) if latencies else 0.0,
+        'wall_ms': round(wall * 1000, 2) if wall is not None else None,
+        'slowest': slowest.path if slowest else None,
+    }
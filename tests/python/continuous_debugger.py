@@ -2,22 +2,58 @@
 """
 Continuous Debugger System
 Runs tests in sections, finds bugs/glitches, and consolidates all issues.
+
+Progress is published in a small status JSON (--status-file): the current
+check, how many are done, issues so far by severity and an ETA from the
+mean duration of the checks finished in this run. run_debugger.py reads it
+instead of parsing the log.
+
+Checks that scan files are resumable. Every few seconds, and when the run
+is interrupted, the file cursor and the findings so far of the running
+check go to --checkpoint-file. A restarted run restores those findings and
+continues at the next unscanned file instead of starting the check over.
 """
 
+import bisect
 import json
 import os
 import re
+import signal
 import subprocess
 import time
 from datetime import datetime
 from typing import Dict, List, Any
 import sys
 
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', 'scripts', 'dev'))
+
+from import_content import write_atomic
+from size_budget import run_check as run_size_check
+from run_tests import discover, run_tasks
+
+FEATURE_TESTS = ['tests/python/test_comprehensive_features.py']
+FEATURE_TEST_TIMEOUT = 120
+STATUS_FILE = 'debugger_status.json'
+CHECKPOINT_FILE = 'debugger_checkpoint.json'
+CHECKPOINT_FORMAT = 1
+CHECKPOINT_INTERVAL = 2.0
+SEVERITIES = ('critical', 'high', 'medium', 'low')
+
 class ContinuousDebugger:
-    def __init__(self, issues_file="DEBUGGER_ISSUES_LOG.md", max_tests_per_section=5):
+    def __init__(self, issues_file="DEBUGGER_ISSUES_LOG.md", max_tests_per_section=5, status_file=STATUS_FILE,
+                 checkpoint_file=CHECKPOINT_FILE):
         self.issues_file = issues_file
         self.max_tests_per_section = max_tests_per_section
-        self.issues_found = []
+        self.status_file = status_file
+        self.status = {}
+        self.check_durations = []
+        self.sections_to_run = None
+        self.sections_done = 0
+        self.checkpoint_file = checkpoint_file
+        self.checkpoint_interval = CHECKPOINT_INTERVAL
+        self.checkpoint = self.load_checkpoint()
+        self.current_check = None
+        self.issues_found = list(self.checkpoint['issues_found'])
         self.test_registry = self.load_test_registry()
         self.web_search_enabled = True
         
@@ -143,11 +179,12 @@ class ContinuousDebugger:
             content = f.read()
         
         # Update statistics
-        total_issues = len(self.issues_found)
-        critical = len([i for i in self.issues_found if i.get('severity') == 'critical'])
-        high = len([i for i in self.issues_found if i.get('severity') == 'high'])
-        medium = len([i for i in self.issues_found if i.get('severity') == 'medium'])
-        low = len([i for i in self.issues_found if i.get('severity') == 'low'])
+        counts = self.issue_counts()
+        total_issues = counts['total']
+        critical = counts['critical']
+        high = counts['high']
+        medium = counts['medium']
+        low = counts['low']
         tests_completed = len(self.test_registry['completed_tests'])
         
         # Update summary section
@@ -214,6 +251,107 @@ class ContinuousDebugger:
         with open(self.issues_file, 'w') as f:
             f.write(content)
     
+    def issue_counts(self) -> Dict[str, int]:
+        """Issues found so far, in total and per severity"""
+        counts = {'total': len(self.issues_found)}
+        for severity in SEVERITIES:
+            counts[severity] = len([i for i in self.issues_found if i.get('severity') == severity])
+        return counts
+
+    def write_status(self, **fields):
+        """Merge fields into the status file and rewrite it atomically"""
+        self.status.update(fields, pid=os.getpid(), updated=datetime.now().isoformat(timespec='seconds'))
+        if self.status_file:
+            write_atomic(self.status_file, json.dumps(self.status, indent=2) + '\n')
+
+    def checks_left(self, done_in_section=0) -> int:
+        """Checks this run will still execute"""
+        left = len([t for t in self.test_registry['available_tests']
+                    if t['id'] not in self.test_registry['completed_tests']])
+        if self.sections_to_run:
+            budget = (self.sections_to_run - self.sections_done) * self.max_tests_per_section - done_in_section
+            left = min(left, max(budget, 0))
+        return left
+
+    def progress(self, done_in_section=0, section_total=0) -> Dict[str, Any]:
+        """Progress fields of the status: counts, issues and ETA"""
+        left = self.checks_left(done_in_section)
+        mean = sum(self.check_durations) / len(self.check_durations) if self.check_durations else None
+        return {
+            'progress': {
+                'completed': len(self.test_registry['completed_tests']),
+                'total': len(self.test_registry['available_tests']),
+                'section_done': done_in_section,
+                'section_total': section_total,
+                'left_this_run': left,
+            },
+            'issues': self.issue_counts(),
+            'eta_seconds': round(mean * left, 1) if mean is not None else None,
+        }
+
+    def load_checkpoint(self) -> Dict[str, Any]:
+        """Cursors and findings left by an interrupted run, or an empty checkpoint"""
+        try:
+            with open(self.checkpoint_file, 'r') as f:
+                checkpoint = json.load(f)
+        except (OSError, ValueError, TypeError):
+            checkpoint = None
+        if not checkpoint or checkpoint.get('format') != CHECKPOINT_FORMAT:
+            checkpoint = {'format': CHECKPOINT_FORMAT, 'checks': {}, 'issues_found': []}
+        return checkpoint
+
+    def save_checkpoint(self):
+        if self.checkpoint_file:
+            write_atomic(self.checkpoint_file, json.dumps(self.checkpoint) + '\n')
+
+    def clear_checkpoint(self, check_id: str):
+        """Drop the cursors of a finished check and keep the run's findings"""
+        checks = self.checkpoint['checks']
+        for name in [n for n in checks if n == check_id or n.startswith(check_id + ':')]:
+            del checks[name]
+        self.checkpoint['issues_found'] = self.issues_found
+        self.save_checkpoint()
+
+    def checkpointed(self, files: List[str], issues: List[Dict[str, Any]], part: str = None):
+        """
+        Iterate files in sorted order, checkpointing the scan of the running check.
+
+        The cursor (the last file fully scanned) and the issues appended while
+        scanning are saved at most every checkpoint_interval seconds and when
+        the loop ends or is abandoned. If a checkpoint exists, its issues are
+        appended to issues and the scan continues after its cursor. part
+        names a second file loop within the same check.
+        """
+        name = (self.current_check or 'adhoc') + (f':{part}' if part else '')
+        files = sorted(files)
+        base = len(issues)
+        saved = self.checkpoint['checks'].get(name)
+        done, position = None, 0
+        if saved:
+            done = saved['last']
+            position = bisect.bisect_right(files, done)
+            issues.extend(saved['issues'])
+            print(f"  ⏩ Resuming at file {position + 1}/{len(files)} ({len(saved['issues'])} findings restored)")
+        done_issues = len(issues)
+        last_save = time.monotonic()
+
+        def save():
+            self.checkpoint['checks'][name] = {'last': done, 'position': position, 'total': len(files),
+                                               'issues': issues[base:done_issues]}
+            self.save_checkpoint()
+            self.write_status(cursor={'check': name, 'file': done, 'position': position, 'total': len(files)})
+
+        try:
+            for path in files[position:]:
+                yield path
+                done, position, done_issues = path, position + 1, len(issues)
+                if time.monotonic() - last_save >= self.checkpoint_interval:
+                    save()
+                    last_save = time.monotonic()
+        finally:
+            if done is not None:
+                save()
+
     def add_web_search_test(self, test_info: Dict[str, Any]):
         """Add a test discovered via web search"""
         self.test_registry['web_search_tests'].append(test_info)
@@ -261,7 +399,7 @@ class ContinuousDebugger:
         
         print(f"  Checking {len(js_files)} JavaScript files for syntax errors...")
         
-        for js_file in js_files:
+        for js_file in self.checkpointed(js_files, issues):
             try:
                 result = subprocess.run(
                     ['node', '-c', js_file],
@@ -339,56 +477,34 @@ class ContinuousDebugger:
         
         print("  Running feature tests...")
         
-        # Run the comprehensive test script
-        if os.path.exists('test_comprehensive_features.py'):
-            try:
-                result = subprocess.run(
-                    ['python3', 'test_comprehensive_features.py'],
-                    capture_output=True,
-                    text=True,
-                    timeout=60
-                )
-                
-                # Parse the actual test results from output
-                output = result.stdout
-                
-                # Look for the summary line: "Failed: N"
-                failed_match = re.search(r'Failed:\s*(\d+)', output)
-                passed_match = re.search(r'Passed:\s*(\d+)', output)
-                
-                if failed_match:
-                    failed_count = int(failed_match.group(1))
-                    passed_count = int(passed_match.group(1)) if passed_match else 0
-                    
-                    if failed_count > 0:
-                        issues.append({
-                            'title': 'Feature Test Failures',
-                            'severity': 'high',
-                            'location': 'test_comprehensive_features.py',
-                            'description': f'{failed_count} tests failed out of {passed_count + failed_count}'
-                        })
-                elif result.returncode != 0:
-                    issues.append({
-                        'title': 'Feature Test Error',
-                        'severity': 'medium',
-                        'location': 'test_comprehensive_features.py',
-                        'description': 'Test script returned non-zero exit code'
-                    })
-                
-            except subprocess.TimeoutExpired:
-                issues.append({
-                    'title': 'Feature Tests Timeout',
-                    'severity': 'medium',
-                    'location': 'test_comprehensive_features.py',
-                    'description': 'Feature tests timed out'
-                })
-            except Exception as e:
+        # Structured results from the test runner: one issue per failed check
+        tasks = list(discover(FEATURE_TESTS).items())
+        report = run_tasks(tasks, jobs=1, timeout=FEATURE_TEST_TIMEOUT)
+        
+        for result in report['tests']:
+            if result['outcome'] == 'error':
                 issues.append({
                     'title': 'Feature Test Error',
                     'severity': 'medium',
-                    'location': 'test_comprehensive_features.py',
-                    'description': str(e)
+                    'location': result['id'],
+                    'description': result['message']
                 })
+            elif result['outcome'] == 'failed':
+                failed_checks = [sub for sub in result.get('subtests', []) if sub['outcome'] == 'failed']
+                for check in failed_checks:
+                    issues.append({
+                        'title': 'Feature Test Failure',
+                        'severity': 'high',
+                        'location': f"{result['id']}::{check['name']}",
+                        'description': check['message'] or 'Check failed'
+                    })
+                if not failed_checks:
+                    issues.append({
+                        'title': 'Feature Test Failure',
+                        'severity': 'high',
+                        'location': result['id'],
+                        'description': result['message']
+                    })
         
         return issues
     
@@ -412,7 +528,7 @@ class ContinuousDebugger:
             (r'catch\s*\([^)]*\)\s*\{\s*\}', 'Empty catch block'),
         ]
         
-        for js_file in js_files:
+        for js_file in self.checkpointed(js_files, issues):
             try:
                 with open(js_file, 'r') as f:
                     lines = f.readlines()
@@ -463,7 +579,7 @@ class ContinuousDebugger:
             (r'new\s+Function\s*\(', 'Dynamic function creation - potential code injection', 'medium'),
         ]
         
-        for js_file in js_files:
+        for js_file in self.checkpointed(js_files, issues):
             try:
                 with open(js_file, 'r') as f:
                     lines = f.readlines()
@@ -506,23 +622,26 @@ class ContinuousDebugger:
         
         print("  Running performance analysis...")
         
-        # Check file sizes
-        large_files = []
-        for root, dirs, files in os.walk('js'):
-            for file in files:
-                if file.endswith('.js'):
-                    file_path = os.path.join(root, file)
-                    size = os.path.getsize(file_path)
-                    if size > 100000:  # > 100KB
-                        large_files.append((file_path, size))
-        
-        for file_path, size in large_files:
+        # Check asset sizes against size-budgets.json (recorded in size-history.json)
+        report = run_size_check('.')
+        for violation in report['violations']:
+            over = violation['size'] / violation['budget'] - 1
             issues.append({
-                'title': 'Large JavaScript File',
-                'severity': 'low',
-                'location': file_path,
-                'description': f'File size is {size/1024:.1f}KB - consider code splitting'
+                'title': 'Size Budget Exceeded',
+                'severity': 'medium' if over > 0.1 else 'low',
+                'location': violation['target'],
+                'description': f"{violation['metric']} size is {violation['size']/1024:.1f}KB, "
+                               f"budget {violation['budget']/1024:.1f}KB ({over:.0%} over)"
             })
+        for change in report['changes']:
+            if change['before'] and change['after'] and change['after'] > change['before'] * 1.1:
+                issues.append({
+                    'title': 'Asset Size Growth',
+                    'severity': 'low',
+                    'location': change['file'],
+                    'description': f"gzip size grew from {change['before']/1024:.1f}KB to "
+                                   f"{change['after']/1024:.1f}KB since the last recorded run"
+                })
         
         # Check for nested loops (simplified)
         js_files = []
@@ -531,7 +650,7 @@ class ContinuousDebugger:
                 if file.endswith('.js'):
                     js_files.append(os.path.join(root, file))
         
-        for js_file in js_files:
+        for js_file in self.checkpointed(js_files, issues):
             try:
                 with open(js_file, 'r') as f:
                     content = f.read()
@@ -573,7 +692,7 @@ class ContinuousDebugger:
             (r'!=[^=]', 'Use of != - consider using !== for strict inequality'),
         ]
         
-        for js_file in js_files:
+        for js_file in self.checkpointed(js_files, issues):
             try:
                 with open(js_file, 'r') as f:
                     lines = f.readlines()
@@ -656,7 +775,7 @@ class ContinuousDebugger:
                 if file.endswith('.js') and not file.endswith('.backup'):
                     js_files.append(os.path.join(root, file))
         
-        for js_file in js_files:
+        for js_file in self.checkpointed(js_files, issues):
             try:
                 with open(js_file, 'r') as f:
                     file_content = f.read()
@@ -765,7 +884,7 @@ class ContinuousDebugger:
             (r'(?<!typeof )\bnew IntersectionObserver\b', 'IntersectionObserver - not supported in Safari < 12.1', 'low'),
         ]
         
-        for js_file in js_files:
+        for js_file in self.checkpointed(js_files, issues):
             try:
                 with open(js_file, 'r') as f:
                     lines = f.readlines()
@@ -814,7 +933,7 @@ class ContinuousDebugger:
                 if file.endswith('.css'):
                     css_files.append(os.path.join(root, file))
         
-        for css_file in css_files:
+        for css_file in self.checkpointed(css_files, issues, part='css'):
             try:
                 with open(css_file, 'r') as f:
                     lines = f.readlines()
@@ -1050,6 +1169,7 @@ class ContinuousDebugger:
         print(f"Description: {test_info.get('description', 'No description')}")
         
         # Get test function
+        self.current_check = test_info.get('id')
         function_name = test_info.get('function', '')
         if hasattr(self, function_name):
             test_function = getattr(self, function_name)
@@ -1087,7 +1207,13 @@ class ContinuousDebugger:
         # Run tests in this section
         tests_to_run = available_tests[:self.max_tests_per_section]
         
-        for test_info in tests_to_run:
+        for done, test_info in enumerate(tests_to_run):
+            started = time.monotonic()
+            self.write_status(
+                section=self.sections_done + 1,
+                current={'id': test_info['id'], 'name': test_info.get('name', test_info['id']),
+                         'started': datetime.now().isoformat(timespec='seconds')},
+                **self.progress(done, len(tests_to_run)))
             try:
                 issues = self.run_test(test_info)
                 
@@ -1102,6 +1228,9 @@ class ContinuousDebugger:
                 # Mark test as completed
                 self.test_registry['completed_tests'].append(test_info['id'])
                 self.save_test_registry()
+                self.clear_checkpoint(test_info['id'])
+                self.check_durations.append(time.monotonic() - started)
+                self.write_status(current=None, cursor=None, **self.progress(done + 1, len(tests_to_run)))
                 
                 # Small delay between tests
                 time.sleep(1)
@@ -1115,6 +1244,8 @@ class ContinuousDebugger:
                     'description': str(e)
                 }]
                 self.update_issues_file(issues, test_info)
+                self.check_durations.append(time.monotonic() - started)
+                self.write_status(current=None, **self.progress(done + 1, len(tests_to_run)))
         
         # Search web for new tests after completing a section
         if self.web_search_enabled:
@@ -1140,11 +1271,17 @@ class ContinuousDebugger:
         print("="*60)
         
         section_count = 0
+        self.sections_to_run = sections_to_run
+        self.write_status(state='running', started=datetime.now().isoformat(timespec='seconds'),
+                          sections=sections_to_run, max_tests=self.max_tests_per_section,
+                          issues_file=self.issues_file, current=None, **self.progress())
+        state = 'finished'
         
         try:
             while True:
                 has_more = self.run_section()
                 section_count += 1
+                self.sections_done = section_count
                 
                 if not has_more:
                     print("\n✅ All tests completed!")
@@ -1160,7 +1297,9 @@ class ContinuousDebugger:
         
         except KeyboardInterrupt:
             print("\n\n👋 Debugger interrupted by user")
+            state = 'stopped'
         
+        self.write_status(state=state, current=None, **self.progress())
         print(f"\n{'='*60}")
         print("🐛 CONTINUOUS DEBUGGER STOPPED")
         print(f"Total Sections Run: {section_count}")
@@ -1169,6 +1308,10 @@ class ContinuousDebugger:
         print("="*60)
 
 
+def _interrupt(signum, frame):
+    raise KeyboardInterrupt
+
+
 def main():
     """Main entry point"""
     import argparse
@@ -1177,14 +1320,25 @@ def main():
     parser.add_argument('--sections', type=int, help='Number of sections to run (default: continuous)')
     parser.add_argument('--max-tests', type=int, default=5, help='Max tests per section (default: 5)')
     parser.add_argument('--issues-file', default='DEBUGGER_ISSUES_LOG.md', help='Issues log file (default: DEBUGGER_ISSUES_LOG.md)')
+    parser.add_argument('--status-file', default=STATUS_FILE, help=f'Status JSON for run_debugger.py (default: {STATUS_FILE})')
+    parser.add_argument('--checkpoint-file', default=CHECKPOINT_FILE, help=f'Resume checkpoint (default: {CHECKPOINT_FILE})')
+    parser.add_argument('--fresh', action='store_true', help='Discard the checkpoint of an interrupted run')
     
     args = parser.parse_args()
     
+    if args.fresh and os.path.exists(args.checkpoint_file):
+        os.remove(args.checkpoint_file)
+    
     debugger = ContinuousDebugger(
         issues_file=args.issues_file,
-        max_tests_per_section=args.max_tests
+        max_tests_per_section=args.max_tests,
+        status_file=args.status_file,
+        checkpoint_file=args.checkpoint_file
     )
     
+    # run_debugger.py stops the run with SIGTERM; finish like Ctrl+C so the status is final
+    signal.signal(signal.SIGTERM, _interrupt)
+    
     debugger.run_continuous(sections_to_run=args.sections)
 
 
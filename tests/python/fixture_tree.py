@@ -0,0 +1,18 @@
+#!/usr/bin/env python3
+"""
+Fixture trees for the dev-tool test suites
+
+The suites describe a small repository as a {relative path: content} dict;
+write_tree() lays it out under a temporary root.
+"""
+
+import os
+
+
+def write_tree(root, files):
+    """Write each path in files under root, creating parent directories"""
+    for path, content in files.items():
+        target = os.path.join(root, path)
+        os.makedirs(os.path.dirname(target) or root, exist_ok=True)
+        with open(target, 'w') as f:
+            f.write(content)
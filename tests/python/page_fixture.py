@@ -0,0 +1,162 @@
+#!/usr/bin/env python3
+"""
+Fetch-once page fixture for the HTTP feature testers
+
+FeatureTester, UserInteractionTester and RealisticUserFlowTester all look
+at the same index.html. PageFixture downloads each URL once per run and
+parses it once into an IndexedPage; later lookups are served from memory.
+revalidate() asks the server again with If-None-Match / If-Modified-Since,
+so an unchanged page costs a 304 and keeps its parsed index.
+"""
+
+import urllib.error
+import urllib.request
+from collections import Counter
+from html.parser import HTMLParser
+from typing import Dict, Optional
+
+
+def _normalize_src(src: str) -> str:
+    """Drop the cache-busting query and fragment: js/app.js?v=3 -> js/app.js"""
+    return src.split('#')[0].split('?')[0].lstrip('/')
+
+
+class _PageParser(HTMLParser):
+    """Collects ids, classes, script srcs and link hrefs in one pass"""
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.ids = {}
+        self.classes = Counter()
+        self.tags = Counter()
+        self.scripts = []
+        self.stylesheets = []
+        self.links = []
+        self.inline_scripts = 0
+
+    def handle_starttag(self, tag, attrs):
+        attrs = dict(attrs)
+        self.tags[tag] += 1
+        if attrs.get('id'):
+            self.ids.setdefault(attrs['id'], tag)
+        for name in (attrs.get('class') or '').split():
+            self.classes[name] += 1
+        if tag == 'script':
+            if attrs.get('src'):
+                self.scripts.append(attrs['src'])
+            else:
+                self.inline_scripts += 1
+        elif tag == 'link' and attrs.get('href'):
+            self.links.append(attrs['href'])
+            if 'stylesheet' in (attrs.get('rel') or '').lower().split():
+                self.stylesheets.append(attrs['href'])
+
+
+class IndexedPage:
+    """A fetched page: its text plus id, class, script and stylesheet indexes"""
+
+    def __init__(self, url: str, status: int, text: str, etag: Optional[str] = None,
+                 last_modified: Optional[str] = None):
+        self.url = url
+        self.status = status
+        self.text = text
+        self.etag = etag
+        self.last_modified = last_modified
+        parser = _PageParser()
+        parser.feed(text)
+        parser.close()
+        self.ids = parser.ids
+        self.classes = parser.classes
+        self.tags = parser.tags
+        self.scripts = parser.scripts
+        self.stylesheets = parser.stylesheets
+        self.links = parser.links
+        self.inline_scripts = parser.inline_scripts
+        self._script_set = {_normalize_src(src) for src in parser.scripts}
+        self._stylesheet_set = {_normalize_src(href) for href in parser.stylesheets}
+        self._found = {}
+        self._lower = None
+
+    def __contains__(self, needle: str) -> bool:
+        """Substring test on the page text, remembered per needle"""
+        if needle not in self._found:
+            self._found[needle] = needle in self.text
+        return self._found[needle]
+
+    def __len__(self):
+        return len(self.text)
+
+    def __str__(self):
+        return self.text
+
+    def lower(self) -> str:
+        if self._lower is None:
+            self._lower = self.text.lower()
+        return self._lower
+
+    def has_id(self, element_id: str) -> bool:
+        return element_id in self.ids
+
+    def has_class(self, name: str) -> bool:
+        return name in self.classes
+
+    def has_script(self, src: str) -> bool:
+        """True when a <script src> loads src (query strings ignored)"""
+        return _normalize_src(src) in self._script_set
+
+    def has_stylesheet(self, href: str) -> bool:
+        return _normalize_src(href) in self._stylesheet_set
+
+
+class PageFixture:
+    """Per-run cache of IndexedPages keyed by URL"""
+
+    def __init__(self):
+        self.pages: Dict[str, IndexedPage] = {}
+        self.stats = Counter()          # downloads, not_modified, hits
+
+    def get(self, url: str, timeout: float = 5) -> IndexedPage:
+        """The page at url, downloaded and parsed on first use only"""
+        page = self.pages.get(url)
+        if page is not None:
+            self.stats['hits'] += 1
+            return page
+        return self._fetch(url, timeout)
+
+    def revalidate(self, url: str, timeout: float = 5) -> IndexedPage:
+        """Ask the server whether the page changed; re-parse only when it did"""
+        return self._fetch(url, timeout, self.pages.get(url))
+
+    def clear(self):
+        self.pages.clear()
+
+    def _fetch(self, url, timeout, cached=None):
+        headers = {'Accept-Encoding': 'identity'}
+        if cached is not None:
+            if cached.etag:
+                headers['If-None-Match'] = cached.etag
+            if cached.last_modified:
+                headers['If-Modified-Since'] = cached.last_modified
+        request = urllib.request.Request(url, headers=headers)
+        try:
+            with urllib.request.urlopen(request, timeout=timeout) as response:
+                status, body, info = response.status, response.read(), response.headers
+        except urllib.error.HTTPError as e:
+            if e.code == 304 and cached is not None:
+                self.stats['not_modified'] += 1
+                return cached
+            status, body, info = e.code, e.read(), e.headers
+        charset = info.get_content_charset() or 'utf-8'
+        page = IndexedPage(url, status, body.decode(charset, errors='replace'),
+                           info.get('ETag'), info.get('Last-Modified'))
+        self.stats['downloads'] += 1
+        self.pages[url] = page
+        return page
+
+
+_shared = PageFixture()
+
+
+def shared_fixture() -> PageFixture:
+    """The fixture every tester in this process shares"""
+    return _shared
@@ -2,8 +2,15 @@
 """
 Run Continuous Debugger in Background
 Provides status monitoring and control
+
+Monitoring spawns nothing: status reads the status JSON the debugger keeps
+up to date (current check, progress, issues so far, ETA), and tail / tail
+--follow read the log directly, seeking from the last offset instead of
+rereading the file.
 """
 
+import codecs
+import json
 import subprocess
 import time
 import os
@@ -11,14 +18,43 @@ import signal
 import sys
 from datetime import datetime
 
+TAIL_BLOCK = 8192
+FOLLOW_INTERVAL = 0.5
+STOP_TIMEOUT = 10
+SEVERITY_ICONS = {'critical': '🔴', 'high': '🟠', 'medium': '🟡', 'low': '🟢'}
+
+
+def _duration(seconds):
+    seconds = int(seconds)
+    if seconds >= 3600:
+        return f"{seconds // 3600}h {seconds % 3600 // 60}m"
+    if seconds >= 60:
+        return f"{seconds // 60}m {seconds % 60}s"
+    return f"{seconds}s"
+
+
+def _alive(pid):
+    """Whether a process with pid exists"""
+    if not pid:
+        return False
+    try:
+        os.kill(pid, 0)
+    except PermissionError:
+        return True
+    except (ProcessLookupError, OSError):
+        return False
+    return True
+
+
 class DebuggerRunner:
     def __init__(self):
         self.process = None
         self.pid_file = "debugger.pid"
         self.log_file = "debugger_output.log"
+        self.status_file = "debugger_status.json"
     
-    def start(self, sections=None, max_tests=5):
-        """Start the debugger in background"""
+    def start(self, sections=None, max_tests=5, fresh=False):
+        """Start the debugger in background; it resumes an interrupted check unless fresh"""
         if self.is_running():
             print("❌ Debugger is already running!")
             print(f"   PID: {self.get_pid()}")
@@ -29,9 +65,15 @@ class DebuggerRunner:
         print(f"   PID file: {self.pid_file}")
         
         # Build command
-        cmd = ['python3', 'continuous_debugger.py', '--max-tests', str(max_tests)]
+        cmd = ['python3', '-u', 'continuous_debugger.py', '--max-tests', str(max_tests), '--status-file', self.status_file]
         if sections:
             cmd.extend(['--sections', str(sections)])
+        if fresh:
+            cmd.append('--fresh')
+        
+        # A status left by an earlier run would be reported as this one
+        if os.path.exists(self.status_file):
+            os.remove(self.status_file)
         
         # Start process
         with open(self.log_file, 'a') as log:
@@ -54,12 +96,12 @@ class DebuggerRunner:
         print(f"✅ Debugger started with PID: {self.process.pid}")
         print(f"   Run 'python3 run_debugger.py status' to check status")
         print(f"   Run 'python3 run_debugger.py stop' to stop debugger")
-        print(f"   Run 'python3 run_debugger.py tail' to view live output")
+        print(f"   Run 'python3 run_debugger.py tail -f' to follow live output")
         
         return True
     
-    def stop(self):
-        """Stop the debugger"""
+    def stop(self, timeout=STOP_TIMEOUT):
+        """Stop the debugger: SIGTERM, then SIGKILL if it has not exited within timeout"""
         if not self.is_running():
             print("❌ Debugger is not running!")
             return False
@@ -69,14 +111,13 @@ class DebuggerRunner:
         
         try:
             # Kill the process group
-            os.killpg(os.getpgid(pid), signal.SIGTERM)
+            group = os.getpgid(pid)
+            os.killpg(group, signal.SIGTERM)
             
-            # Wait a bit
-            time.sleep(2)
-            
-            # Force kill if still running
-            if self.is_running():
-                os.killpg(os.getpgid(pid), signal.SIGKILL)
+            # Force kill if it does not exit in time
+            if not self.wait(pid, timeout):
+                os.killpg(group, signal.SIGKILL)
+                self.wait(pid, timeout)
             
             # Remove PID file
             if os.path.exists(self.pid_file):
@@ -95,35 +136,132 @@ class DebuggerRunner:
             print(f"❌ Error stopping debugger: {e}")
             return False
     
-    def status(self):
+    def wait(self, pid, timeout):
+        """Wait up to timeout seconds for pid to exit; True once it has"""
+        if self.process is not None and self.process.pid == pid:
+            try:
+                self.process.wait(timeout)
+                return True
+            except subprocess.TimeoutExpired:
+                return False
+        
+        deadline = time.monotonic() + timeout
+        delay = 0.01
+        while _alive(pid):
+            if time.monotonic() >= deadline:
+                return False
+            time.sleep(delay)
+            delay = min(delay * 2, 0.25)
+        return True
+    
+    def read_status(self):
+        """
+        The debugger's status, or None before it has written one.
+        
+        'state' is running, finished or stopped as the debugger reported it,
+        or 'died' when it says running but its process is gone.
+        """
+        try:
+            with open(self.status_file, 'r') as f:
+                status = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if status.get('state') == 'running' and not _alive(status.get('pid')):
+            status['state'] = 'died'
+        return status
+    
+    def status(self, as_json=False):
         """Check debugger status"""
-        if not self.is_running():
+        status = self.read_status()
+        if as_json:
+            print(json.dumps(status, indent=2))
+            return bool(status) and status.get('state') == 'running'
+        
+        if status is None:
+            if self.is_running():
+                print("📊 Debugger Status: STARTING")
+                print(f"   PID: {self.get_pid()}")
+                return True
             print("📊 Debugger Status: STOPPED")
             print("   Run 'python3 run_debugger.py start' to start")
             return False
         
-        pid = self.get_pid()
-        print("📊 Debugger Status: RUNNING")
-        print(f"   PID: {pid}")
+        state = status.get('state', 'unknown')
+        print(f"📊 Debugger Status: {state.upper()}")
+        print(f"   PID: {status.get('pid')}")
         print(f"   Log file: {self.log_file}")
-        print(f"   Issues file: DEBUGGER_ISSUES_LOG.md")
+        print(f"   Issues file: {status.get('issues_file', 'DEBUGGER_ISSUES_LOG.md')}")
         
-        # Check if issues file exists and show summary
-        if os.path.exists('DEBUGGER_ISSUES_LOG.md'):
-            with open('DEBUGGER_ISSUES_LOG.md', 'r') as f:
-                content = f.read()
-            
-            # Extract summary
-            if 'Total Issues Found:' in content:
-                summary_section = content.split('## Summary Statistics')[1].split('## Issues Found')[0]
-                print("\n   Current Summary:")
-                for line in summary_section.strip().split('\n'):
-                    print(f"   {line}")
+        current = status.get('current')
+        if current:
+            started = datetime.fromisoformat(current['started'])
+            running = (datetime.now() - started).total_seconds()
+            print(f"   Section {status.get('section')}: {current['name']} (running {_duration(running)})")
+        cursor = status.get('cursor')
+        if current and cursor:
+            print(f"   Scanned: {cursor['position']}/{cursor['total']} files (last: {cursor['file']})")
         
-        return True
+        progress = status.get('progress', {})
+        if progress:
+            print(f"   Progress: {progress['completed']}/{progress['total']} checks completed, "
+                  f"{progress['section_done']}/{progress['section_total']} in this section")
+        
+        issues = status.get('issues', {})
+        if issues:
+            parts = [f"{SEVERITY_ICONS[severity]} {issues[severity]}" for severity in SEVERITY_ICONS if issues.get(severity)]
+            print(f"   Issues so far: {issues['total']}" + (f" ({', '.join(parts)})" if parts else ''))
+        
+        if state == 'running':
+            eta = status.get('eta_seconds')
+            print(f"   ETA: {'~' + _duration(eta) if eta is not None else 'after the first check'}"
+                  f" ({progress.get('left_this_run', '?')} checks left)")
+        print(f"   Updated: {status.get('updated')}")
+        
+        return state == 'running'
+    
+    def read_tail(self, lines=50):
+        """
+        The last lines of the log and the offset just past them.
+        
+        Reads blocks backwards from the end, so the cost does not grow
+        with the size of the log.
+        """
+        with open(self.log_file, 'rb') as f:
+            end = f.seek(0, os.SEEK_END)
+            position = end
+            data = b''
+            while position > 0 and data.count(b'\n') <= lines:
+                step = min(TAIL_BLOCK, position)
+                position -= step
+                f.seek(position)
+                data = f.read(step) + data
+        if data.endswith(b'\n'):
+            data = data[:-1]
+        text = b'\n'.join(data.split(b'\n')[-lines:]) if lines else b''
+        return text.decode('utf-8', errors='replace'), end
     
-    def tail(self, lines=50):
-        """Show recent debugger output"""
+    def read_from(self, offset):
+        """
+        Log bytes written since offset and the offset to continue from.
+        
+        A log shorter than offset was truncated or replaced, so reading
+        starts over from its beginning.
+        """
+        try:
+            size = os.path.getsize(self.log_file)
+        except OSError:
+            return b'', 0
+        if size < offset:
+            offset = 0
+        if size == offset:
+            return b'', offset
+        with open(self.log_file, 'rb') as f:
+            f.seek(offset)
+            data = f.read(size - offset)
+        return data, offset + len(data)
+    
+    def tail(self, lines=50, follow=False, interval=FOLLOW_INTERVAL):
+        """Show recent debugger output; with follow, keep streaming it until the debugger exits"""
         if not os.path.exists(self.log_file):
             print("❌ Log file not found!")
             return
@@ -132,14 +270,29 @@ class DebuggerRunner:
         print("="*60)
         
         try:
-            result = subprocess.run(
-                ['tail', '-n', str(lines), self.log_file],
-                capture_output=True,
-                text=True
-            )
-            print(result.stdout)
-        except Exception as e:
+            text, offset = self.read_tail(lines)
+        except OSError as e:
             print(f"❌ Error reading log: {e}")
+            return
+        print(text)
+        if not follow:
+            return
+        
+        pid = self.get_pid()
+        decoder = codecs.getincrementaldecoder('utf-8')(errors='replace')
+        try:
+            while True:
+                data, offset = self.read_from(offset)
+                if data:
+                    sys.stdout.write(decoder.decode(data))
+                    sys.stdout.flush()
+                elif not _alive(pid):
+                    print("\n⏹️  Debugger is not running")
+                    break
+                else:
+                    time.sleep(interval)
+        except KeyboardInterrupt:
+            print()
     
     def is_running(self):
         """Check if debugger is running"""
@@ -176,29 +329,33 @@ def main():
     start_parser = subparsers.add_parser('start', help='Start debugger')
     start_parser.add_argument('--sections', type=int, help='Number of sections to run')
     start_parser.add_argument('--max-tests', type=int, default=5, help='Max tests per section')
+    start_parser.add_argument('--fresh', action='store_true', help='Do not resume an interrupted check')
     
     # Stop command
     subparsers.add_parser('stop', help='Stop debugger')
     
     # Status command
-    subparsers.add_parser('status', help='Check debugger status')
+    status_parser = subparsers.add_parser('status', help='Check debugger status')
+    status_parser.add_argument('--json', action='store_true', help='Print the raw status JSON')
     
     # Tail command
     tail_parser = subparsers.add_parser('tail', help='View debugger output')
     tail_parser.add_argument('--lines', type=int, default=50, help='Number of lines to show')
+    tail_parser.add_argument('-f', '--follow', action='store_true', help='Keep streaming new output')
+    tail_parser.add_argument('--interval', type=float, default=FOLLOW_INTERVAL, help='Seconds between checks when following')
     
     args = parser.parse_args()
     
     runner = DebuggerRunner()
     
     if args.command == 'start':
-        runner.start(sections=args.sections, max_tests=args.max_tests)
+        runner.start(sections=args.sections, max_tests=args.max_tests, fresh=args.fresh)
     elif args.command == 'stop':
         runner.stop()
     elif args.command == 'status':
-        runner.status()
+        runner.status(as_json=args.json)
     elif args.command == 'tail':
-        runner.tail(lines=args.lines)
+        runner.tail(lines=args.lines, follow=args.follow, interval=args.interval)
     else:
         parser.print_help()
 
@@ -0,0 +1,194 @@
+#!/usr/bin/env python3
+"""
+Embedded static server for the HTTP test suites
+
+StaticServer serves a directory from a background thread on an ephemeral
+port, so suites never collide on a hardcoded port and can run side by side.
+Readiness is an Event set by the serving thread, not a sleep. Connections
+are HTTP/1.1 keep-alive, and text assets are gzip (and brotli, when the
+module is installed) compressed once per file version and kept in memory.
+"""
+
+import email.utils
+import functools
+import gzip
+import hashlib
+import io
+import mimetypes
+import os
+import threading
+from collections import Counter
+from http import HTTPStatus
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+COMPRESSIBLE = ('text/', 'application/javascript', 'application/json', 'application/xml',
+                'image/svg+xml', 'application/manifest+json')
+MIN_COMPRESS_SIZE = 256
+
+
+class _Asset:
+    """One version of a file with its precompressed variants"""
+
+    def __init__(self, path, stat):
+        with open(path, 'rb') as f:
+            body = f.read()
+        self.version = (stat.st_mtime_ns, stat.st_size)
+        self.type = mimetypes.guess_type(path)[0] or 'application/octet-stream'
+        self.last_modified = email.utils.formatdate(stat.st_mtime, usegmt=True)
+        digest = hashlib.sha1(body).hexdigest()[:16]
+        self.variants = {'identity': (body, f'"{digest}"')}
+        if len(body) >= MIN_COMPRESS_SIZE and self.type.startswith(COMPRESSIBLE):
+            self.variants['gzip'] = (gzip.compress(body, 9, mtime=0), f'"{digest}-gzip"')
+            if brotli is not None:
+                self.variants['br'] = (brotli.compress(body), f'"{digest}-br"')
+
+    def negotiate(self, accept_encoding):
+        """Best variant the client accepts: br, then gzip, then identity"""
+        accepted = {part.split(';')[0].strip().lower() for part in (accept_encoding or '').split(',')}
+        for encoding in ('br', 'gzip'):
+            if encoding in self.variants and encoding in accepted:
+                return encoding
+        return 'identity'
+
+
+class _Handler(SimpleHTTPRequestHandler):
+    """Keep-alive handler that serves cached, precompressed assets"""
+
+    protocol_version = 'HTTP/1.1'
+    # Headers and body go out in separate writes; with Nagle on, the body of
+    # every keep-alive response after the first waits for a delayed ACK
+    disable_nagle_algorithm = True
+
+    def setup(self):
+        super().setup()
+        self.server.owner._count('connections')
+
+    def send_head(self):
+        path = self.translate_path(self.path)
+        if os.path.isdir(path):
+            if not self.path.split('?')[0].endswith('/'):
+                self.send_response(HTTPStatus.MOVED_PERMANENTLY)
+                self.send_header('Location', self.path.split('?')[0] + '/')
+                self.send_header('Content-Length', '0')
+                self.end_headers()
+                return None
+            path = os.path.join(path, 'index.html')
+        asset = self.server.owner.asset(path)
+        if asset is None:
+            self.send_error(HTTPStatus.NOT_FOUND, 'File not found')
+            return None
+
+        encoding = asset.negotiate(self.headers.get('Accept-Encoding'))
+        body, etag = asset.variants[encoding]
+        match = self.headers.get('If-None-Match')
+        if match and (match.strip() == '*' or etag in [tag.strip() for tag in match.split(',')]):
+            self.server.owner._count('not_modified')
+            self.send_response(HTTPStatus.NOT_MODIFIED)
+            self.send_header('ETag', etag)
+            self.send_header('Vary', 'Accept-Encoding')
+            self.end_headers()
+            return None
+
+        self.send_response(HTTPStatus.OK)
+        self.send_header('Content-Type', asset.type)
+        self.send_header('Content-Length', str(len(body)))
+        self.send_header('ETag', etag)
+        self.send_header('Last-Modified', asset.last_modified)
+        self.send_header('Cache-Control', 'no-cache')
+        if len(asset.variants) > 1:
+            self.send_header('Vary', 'Accept-Encoding')
+        if encoding != 'identity':
+            self.send_header('Content-Encoding', encoding)
+            self.server.owner._count(encoding)
+        self.end_headers()
+        self.server.owner._count('bytes_sent', len(body))
+        return io.BytesIO(body)
+
+    def log_request(self, code='-', size='-'):
+        self.server.owner._count('requests')
+
+    def log_message(self, format, *args):
+        pass
+
+
+class StaticServer:
+    """Threaded static server on an ephemeral port, usable as a context manager"""
+
+    def __init__(self, root, host='127.0.0.1', port=0):
+        self.root = os.path.abspath(root)
+        self.host = host
+        self.port = port
+        self.ready = threading.Event()
+        self.stats = Counter()      # requests, connections, bytes_sent, gzip, br, not_modified
+        self._assets = {}
+        self._lock = threading.Lock()
+        self._httpd = None
+        self._thread = None
+
+    @property
+    def url(self):
+        """Base URL without a trailing slash, e.g. http://127.0.0.1:54321"""
+        return f'http://{self.host}:{self.port}'
+
+    def start(self, timeout=5):
+        """Bind, start serving in a daemon thread and wait until it is ready"""
+        if self._httpd is not None:
+            return self
+        handler = functools.partial(_Handler, directory=self.root)
+        self._httpd = ThreadingHTTPServer((self.host, self.port), handler)
+        self._httpd.daemon_threads = True
+        self._httpd.owner = self
+        self.port = self._httpd.server_address[1]
+        self._thread = threading.Thread(target=self._serve, name=f'static-server-{self.port}', daemon=True)
+        self._thread.start()
+        if not self.ready.wait(timeout):
+            self.stop()
+            raise RuntimeError(f'Static server on port {self.port} did not start within {timeout}s')
+        return self
+
+    def stop(self):
+        if self._httpd is None:
+            return
+        if self.ready.is_set():
+            self._httpd.shutdown()
+        self._httpd.server_close()
+        self._thread.join(timeout=5)
+        self._httpd = None
+        self.ready.clear()
+
+    def asset(self, path):
+        """Cached asset for a filesystem path, rebuilt when the file changes"""
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return None
+        if not os.path.isfile(path):
+            return None
+        version = (stat.st_mtime_ns, stat.st_size)
+        with self._lock:
+            asset = self._assets.get(path)
+        if asset is None or asset.version != version:
+            asset = _Asset(path, stat)
+            with self._lock:
+                self._assets[path] = asset
+            self._count('compressed' if len(asset.variants) > 1 else 'loaded')
+        return asset
+
+    def _count(self, key, amount=1):
+        with self._lock:
+            self.stats[key] += amount
+
+    def _serve(self):
+        self.ready.set()
+        self._httpd.serve_forever(poll_interval=0.1)
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
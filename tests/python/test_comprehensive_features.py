@@ -4,16 +4,30 @@ Comprehensive Feature Test Suite
 Tests all features as both user and admin
 """
 
-import requests
 import json
+import os
+import shutil
 import time
 import sys
 from typing import Dict, List, Any
 
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', 'scripts', 'dev'))
+
+from page_fixture import shared_fixture
+from static_server import StaticServer
+from duration_history import CheckTimer, REGRESSION_FACTOR
+from user_flow import measure as measure_user_flow
+
+REPO_ROOT = os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
+FLOW_CLICKS = 20
+HISTORY_PREFIX = os.path.relpath(os.path.abspath(__file__), REPO_ROOT).replace(os.sep, '/')
+
 class FeatureTester:
-    def __init__(self, base_url="http://localhost:8080"):
+    def __init__(self, base_url="http://localhost:8080", regression_factor=REGRESSION_FACTOR):
         self.base_url = base_url
-        self.session = requests.Session()
+        self.timer = CheckTimer(f"{HISTORY_PREFIX}::FeatureTester", factor=regression_factor)
+        self.pages = shared_fixture()
+        self.flow = None
         self.test_results = []
         self.current_user = None
         self.is_admin = False
@@ -24,6 +38,7 @@ class FeatureTester:
             "test": test_name,
             "passed": passed,
             "message": message,
+            "duration": self.timer.lap(test_name),
             "user": self.current_user or "guest",
             "is_admin": self.is_admin
         }
@@ -31,12 +46,22 @@ class FeatureTester:
         status = "✅ PASS" if passed else "❌ FAIL"
         print(f"{status} | {test_name} | {message}")
         
+    def get_page(self):
+        """Indexed main page, downloaded once per run"""
+        return self.pages.get(self.base_url, timeout=5)
+        
+    def get_user_flow(self):
+        """#nextBtn flow through the DOM-stub page, run once per tester (None without node)"""
+        if self.flow is None and shutil.which('node'):
+            self.flow = measure_user_flow(REPO_ROOT, FLOW_CLICKS)
+        return self.flow
+        
     def test_server_running(self):
         """Test if server is running"""
         try:
-            response = self.session.get(self.base_url, timeout=5)
-            self.log_test("Server Running", response.status_code == 200, f"Status: {response.status_code}")
-            return response.status_code == 200
+            page = self.get_page()
+            self.log_test("Server Running", page.status == 200, f"Status: {page.status}")
+            return page.status == 200
         except Exception as e:
             self.log_test("Server Running", False, str(e))
             return False
@@ -44,8 +69,7 @@ class FeatureTester:
     def test_page_load(self):
         """Test if main page loads correctly"""
         try:
-            response = self.session.get(self.base_url, timeout=5)
-            content = response.text
+            content = self.get_page()
             
             checks = [
                 ("DOCTYPE html", "DOCTYPE" in content),
@@ -71,8 +95,7 @@ class FeatureTester:
         try:
             # This would require actual form submission
             # For now, we'll check if registration form exists
-            response = self.session.get(self.base_url, timeout=5)
-            content = response.text
+            content = self.get_page()
             
             has_register_form = "registerOverlay" in content or "Register" in content
             self.log_test("User Registration Form", has_register_form, "Registration form available")
@@ -85,8 +108,7 @@ class FeatureTester:
     def test_user_login(self):
         """Test user login"""
         try:
-            response = self.session.get(self.base_url, timeout=5)
-            content = response.text
+            content = self.get_page()
             
             has_login_form = "loginOverlay" in content or "Login" in content
             self.log_test("User Login Form", has_login_form, "Login form available")
@@ -99,13 +121,20 @@ class FeatureTester:
     def test_story_generation(self):
         """Test story generation"""
         try:
-            response = self.session.get(self.base_url, timeout=5)
-            content = response.text
+            content = self.get_page()
             
             has_story_engine = "story-engine.js" in content or "generateChapter" in content
             self.log_test("Story Generation Engine", has_story_engine, "Story engine loaded")
             
-            return has_story_engine
+            flow = self.get_user_flow()
+            if flow is None:
+                return has_story_engine
+            engine = flow['latency']['engine']
+            generates = flow['engineTimed'] and bool(engine)
+            self.log_test("Story Generation - generateChapter", generates,
+                          f"p50 {engine.get('p50', 0):.2f} ms, p95 {engine.get('p95', 0):.2f} ms "
+                          f"over {engine.get('n', 0)} chapters" if generates else "StoryEngine.generateChapter never ran")
+            return has_story_engine and generates
         except Exception as e:
             self.log_test("Story Generation Engine", False, str(e))
             return False
@@ -113,13 +142,21 @@ class FeatureTester:
     def test_chapter_navigation(self):
         """Test chapter navigation"""
         try:
-            response = self.session.get(self.base_url, timeout=5)
-            content = response.text
+            content = self.get_page()
             
             has_navigation = "prevBtn" in content and "nextBtn" in content
             self.log_test("Chapter Navigation", has_navigation, "Navigation buttons present")
             
-            return has_navigation
+            flow = self.get_user_flow()
+            if flow is None:
+                return has_navigation
+            click = flow['latency']['click']
+            advanced = flow['advanced'] == len(flow['steps'])
+            self.log_test("Chapter Navigation - nextBtn Clicks", advanced,
+                          f"{flow['advanced']}/{len(flow['steps'])} clicks advanced, "
+                          f"p50 {click.get('p50', 0):.2f} ms, p95 {click.get('p95', 0):.2f} ms, "
+                          f"p99 {click.get('p99', 0):.2f} ms")
+            return has_navigation and advanced
         except Exception as e:
             self.log_test("Chapter Navigation", False, str(e))
             return False
@@ -150,8 +187,7 @@ class FeatureTester:
     def test_search_functionality(self):
         """Test search functionality"""
         try:
-            response = self.session.get(self.base_url, timeout=5)
-            content = response.text
+            content = self.get_page()
             
             has_search = "search.js" in content or "Search" in content
             self.log_test("Search Functionality", has_search, "Search functionality available")
@@ -164,8 +200,7 @@ class FeatureTester:
     def test_reading_history(self):
         """Test reading history"""
         try:
-            response = self.session.get(self.base_url, timeout=5)
-            content = response.text
+            content = self.get_page()
             
             has_history = "reading-history.js" in content or "Reading History" in content
             self.log_test("Reading History", has_history, "Reading history available")
@@ -178,8 +213,7 @@ class FeatureTester:
     def test_analytics_dashboard(self):
         """Test analytics dashboard"""
         try:
-            response = self.session.get(self.base_url, timeout=5)
-            content = response.text
+            content = self.get_page()
             
             has_analytics = "analytics.js" in content or "Analytics" in content
             self.log_test("Analytics Dashboard", has_analytics, "Analytics available")
@@ -192,8 +226,7 @@ class FeatureTester:
     def test_content_management(self):
         """Test content management system"""
         try:
-            response = self.session.get(self.base_url, timeout=5)
-            content = response.text
+            content = self.get_page()
             
             has_cms = "content-management.js" in content or "Content Management" in content
             self.log_test("Content Management System", has_cms, "CMS available")
@@ -206,8 +239,7 @@ class FeatureTester:
     def test_user_features(self):
         """Test user features"""
         try:
-            response = self.session.get(self.base_url, timeout=5)
-            content = response.text
+            content = self.get_page()
             
             has_user_features = "user-profiles.js" in content or "User Features" in content
             self.log_test("User Features", has_user_features, "User features available")
@@ -220,8 +252,7 @@ class FeatureTester:
     def test_notification_system(self):
         """Test notification system"""
         try:
-            response = self.session.get(self.base_url, timeout=5)
-            content = response.text
+            content = self.get_page()
             
             has_notifications = "notifications.js" in content or "Notifications" in content
             self.log_test("Notification System", has_notifications, "Notifications available")
@@ -234,8 +265,7 @@ class FeatureTester:
     def test_api_integration(self):
         """Test API integration"""
         try:
-            response = self.session.get(self.base_url, timeout=5)
-            content = response.text
+            content = self.get_page()
             
             has_api = "api.js" in content
             self.log_test("API Integration", has_api, "API client loaded")
@@ -248,8 +278,7 @@ class FeatureTester:
     def test_fuzzy_search(self):
         """Test fuzzy search"""
         try:
-            response = self.session.get(self.base_url, timeout=5)
-            content = response.text
+            content = self.get_page()
             
             has_fuzzy_search = "fuzzy-search.js" in content or "fuse.js" in content
             self.log_test("Fuzzy Search", has_fuzzy_search, "Fuzzy search available")
@@ -262,8 +291,7 @@ class FeatureTester:
     def test_screenshot_capture(self):
         """Test screenshot capture"""
         try:
-            response = self.session.get(self.base_url, timeout=5)
-            content = response.text
+            content = self.get_page()
             
             has_screenshot = "screenshot-capture.js" in content or "html2canvas" in content
             self.log_test("Screenshot Capture", has_screenshot, "Screenshot capture available")
@@ -286,8 +314,7 @@ class FeatureTester:
     def test_performance_optimizations(self):
         """Test performance optimizations"""
         try:
-            response = self.session.get(self.base_url, timeout=5)
-            content = response.text
+            content = self.get_page()
             
             has_performance = "performance-advanced.js" in content or "performance.js" in content
             self.log_test("Performance Optimizations", has_performance, "Performance optimizations loaded")
@@ -300,8 +327,7 @@ class FeatureTester:
     def test_ab_testing(self):
         """Test A/B testing"""
         try:
-            response = self.session.get(self.base_url, timeout=5)
-            content = response.text
+            content = self.get_page()
             
             has_ab_testing = "ab-testing.js" in content or "A/B Testing" in content
             self.log_test("A/B Testing Framework", has_ab_testing, "A/B testing available")
@@ -324,8 +350,7 @@ class FeatureTester:
     def test_branching_narrative(self):
         """Test branching narrative"""
         try:
-            response = self.session.get(self.base_url, timeout=5)
-            content = response.text
+            content = self.get_page()
             
             has_branching = "branching-narrative.js" in content
             self.log_test("Branching Narrative System", has_branching, "Branching narrative loaded")
@@ -338,8 +363,7 @@ class FeatureTester:
     def test_dynamic_content(self):
         """Test dynamic content"""
         try:
-            response = self.session.get(self.base_url, timeout=5)
-            content = response.text
+            content = self.get_page()
             
             has_dynamic = "dynamic-content.js" in content
             self.log_test("Dynamic Content Generation", has_dynamic, "Dynamic content loaded")
@@ -352,8 +376,7 @@ class FeatureTester:
     def test_backup_system(self):
         """Test backup system"""
         try:
-            response = self.session.get(self.base_url, timeout=5)
-            content = response.text
+            content = self.get_page()
             
             has_backup = "backup.js" in content or "Backup" in content
             self.log_test("Automated Backup System", has_backup, "Backup system available")
@@ -366,8 +389,7 @@ class FeatureTester:
     def test_service_worker(self):
         """Test service worker"""
         try:
-            response = self.session.get(self.base_url, timeout=5)
-            content = response.text
+            content = self.get_page()
             
             has_sw = "sw.js" in content or "serviceWorker" in content
             self.log_test("Service Worker (PWA)", has_sw, "Service worker configured")
@@ -380,8 +402,7 @@ class FeatureTester:
     def test_security_features(self):
         """Test security features"""
         try:
-            response = self.session.get(self.base_url, timeout=5)
-            content = response.text
+            content = self.get_page()
             
             has_security = "security.js" in content or "sanitizeHTML" in content
             self.log_test("Security Features", has_security, "Security functions loaded")
@@ -394,8 +415,7 @@ class FeatureTester:
     def test_error_tracking(self):
         """Test error tracking (Sentry)"""
         try:
-            response = self.session.get(self.base_url, timeout=5)
-            content = response.text
+            content = self.get_page()
             
             has_sentry = "sentry.js" in content or "@sentry/browser" in content
             self.log_test("Error Tracking (Sentry)", has_sentry, "Sentry integration available")
@@ -447,9 +467,9 @@ class FeatureTester:
         ]
         
         for test in tests:
+            self.timer.start()
             try:
                 test()
-                time.sleep(0.1)  # Small delay between tests
             except Exception as e:
                 print(f"❌ ERROR running {test.__name__}: {e}")
         
@@ -475,9 +495,12 @@ class FeatureTester:
                     print(f"  ❌ {result['test']}: {result['message']}")
             print()
         
+        self.timer.report(self.test_results)
+        
         return passed_tests == total_tests
 
 if __name__ == "__main__":
-    tester = FeatureTester()
-    success = tester.run_all_tests()
+    with StaticServer(REPO_ROOT) as server:
+        tester = FeatureTester(server.url)
+        success = tester.run_all_tests()
     sys.exit(0 if success else 1)
\ No newline at end of file
@@ -4,16 +4,27 @@ Realistic User Flow Test Suite
 The user wants me to continue with the realistic user flow test. I was in the middle of creating a test file that accounts for the actual implementation (lazy loading, dynamic content injection, etc.). Let me continue creating this test file.</think>Tests actual user flows and admin workflows
 """
 
-import requests
 import json
+import os
+import sys
 import time
 import re
 from typing import Dict, List, Any
 
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', 'scripts', 'dev'))
+
+from duration_history import CheckTimer, REGRESSION_FACTOR
+from page_fixture import shared_fixture
+from static_server import StaticServer
+
+REPO_ROOT = os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
+HISTORY_PREFIX = os.path.relpath(os.path.abspath(__file__), REPO_ROOT).replace(os.sep, '/')
+
 class RealisticUserFlowTester:
-    def __init__(self, base_url="http://localhost:8080"):
+    def __init__(self, base_url="http://localhost:8080", regression_factor=REGRESSION_FACTOR):
         self.base_url = base_url
-        self.session = requests.Session()
+        self.timer = CheckTimer(f"{HISTORY_PREFIX}::RealisticUserFlowTester", factor=regression_factor)
+        self.pages = shared_fixture()
         self.test_results = []
         self.current_user = None
         self.is_admin = False
@@ -24,6 +35,7 @@ class RealisticUserFlowTester:
             "test": test_name,
             "passed": passed,
             "message": message,
+            "duration": self.timer.lap(test_name),
             "user": self.current_user or "guest",
             "is_admin": self.is_admin
         }
@@ -32,10 +44,9 @@ class RealisticUserFlowTester:
         print(f"{status} | {test_name} | {message}")
         
     def get_page_content(self):
-        """Get page content"""
+        """Indexed main page, downloaded once per run (None when unreachable)"""
         try:
-            response = self.session.get(self.base_url, timeout=5)
-            return response.text
+            return self.pages.get(self.base_url, timeout=5)
         except Exception as e:
             return None
             
@@ -401,9 +412,9 @@ class RealisticUserFlowTester:
         ]
         
         for test in tests:
+            self.timer.start()
             try:
                 test()
-                time.sleep(0.2)  # Small delay between tests
             except Exception as e:
                 print(f"❌ ERROR running {test.__name__}: {e}")
         
@@ -429,9 +440,12 @@ class RealisticUserFlowTester:
                     print(f"  ❌ {result['test']}: {result['message']}")
             print()
         
+        self.timer.report(self.test_results)
+        
         return passed_tests == total_tests
 
 if __name__ == "__main__":
-    tester = RealisticUserFlowTester()
-    success = tester.run_all_tests()
+    with StaticServer(REPO_ROOT) as server:
+        tester = RealisticUserFlowTester(server.url)
+        success = tester.run_all_tests()
     exit(0 if success else 1)
\ No newline at end of file
@@ -4,16 +4,30 @@ User Interaction Test Suite
 Simulates actual user and admin interactions
 """
 
-import requests
 import json
+import os
+import sys
 import time
 import re
 from typing import Dict, List, Any
 
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', 'scripts', 'dev'))
+
+from asset_fetcher import AssetFetcher, local_assets, summarize
+from duration_history import CheckTimer, REGRESSION_FACTOR
+from page_fixture import shared_fixture
+from static_server import StaticServer
+
+REPO_ROOT = os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
+HISTORY_PREFIX = os.path.relpath(os.path.abspath(__file__), REPO_ROOT).replace(os.sep, '/')
+
 class UserInteractionTester:
-    def __init__(self, base_url="http://localhost:8080"):
+    def __init__(self, base_url="http://localhost:8080", regression_factor=REGRESSION_FACTOR):
         self.base_url = base_url
-        self.session = requests.Session()
+        self.timer = CheckTimer(f"{HISTORY_PREFIX}::UserInteractionTester", factor=regression_factor)
+        self.pages = shared_fixture()
+        self.assets = {}
+        self.asset_sweeps = []
         self.test_results = []
         self.current_user = None
         self.is_admin = False
@@ -24,6 +38,7 @@ class UserInteractionTester:
             "test": test_name,
             "passed": passed,
             "message": message,
+            "duration": self.timer.lap(test_name),
             "user": self.current_user or "guest",
             "is_admin": self.is_admin
         }
@@ -32,13 +47,33 @@ class UserInteractionTester:
         print(f"{status} | {test_name} | {message}")
         
     def get_page_content(self):
-        """Get page content"""
+        """Indexed main page, downloaded once per run (None when unreachable)"""
         try:
-            response = self.session.get(self.base_url, timeout=5)
-            return response.text
+            return self.pages.get(self.base_url, timeout=5)
         except Exception as e:
             return None
             
+    def get_assets(self, paths=()):
+        """Page scripts/stylesheets plus `paths`, fetched in parallel; each asset at most once per run"""
+        content = self.get_page_content()
+        if not content:
+            return {}
+        wanted = [path for path in dict.fromkeys(local_assets(content) + list(paths)) if path not in self.assets]
+        if wanted:
+            with AssetFetcher(self.base_url) as fetcher:
+                fetched = fetcher.fetch_all(wanted)
+                self.asset_sweeps.append(summarize(fetched, fetcher.last_sweep['wall']))
+            self.assets.update(fetched)
+        return self.assets
+        
+    def describe_asset(self, asset):
+        """Size, encoding and latency of a fetched asset for the log line"""
+        if asset is None:
+            return "not fetched"
+        if not asset.ok:
+            return f"not served ({asset.status or asset.error})"
+        return f"{asset.size / 1024:.1f} KB {asset.encoding} ({asset.ratio:.0%}), {asset.latency * 1000:.1f} ms"
+        
     def test_dropdown_menu(self):
         """Test dropdown menu functionality"""
         content = self.get_page_content()
@@ -46,7 +81,7 @@ class UserInteractionTester:
             self.log_test("Dropdown Menu", False, "Could not load page")
             return False
             
-        has_dropdown = "dropdown-menu" in content and "menuToggle" in content
+        has_dropdown = content.has_class("dropdown-menu") and content.has_id("menuToggle")
         self.log_test("Dropdown Menu", has_dropdown, "Dropdown menu present")
         
         # Check for menu items
@@ -86,7 +121,7 @@ class UserInteractionTester:
         
         all_present = True
         for modal in modals:
-            has_modal = modal in content
+            has_modal = content.has_id(modal)
             self.log_test(f"Modal - {modal}", has_modal, f"Modal present")
             all_present = all_present and has_modal
             
@@ -110,7 +145,7 @@ class UserInteractionTester:
         
         all_present = True
         for element_name, element_id in story_elements:
-            has_element = element_id in content
+            has_element = content.has_id(element_id)
             self.log_test(f"Story Element - {element_name}", has_element, f"Element ID: {element_id}")
             all_present = all_present and has_element
             
@@ -124,7 +159,7 @@ class UserInteractionTester:
             return False
             
         modules = [
-            "story-engine.js", "backstory-engine.js",
+            "story-engine.packed.js", "backstory-engine.js",
             "js/utils/security.js", "js/utils/storage.js",
             "js/modules/auth.js", "js/modules/navigation.js",
             # "js/modules/save-load.js", # Removed feature
@@ -140,10 +175,12 @@ class UserInteractionTester:
             # "js/modules/leaderboards.js" # Removed feature
         ]
         
+        assets = self.get_assets(modules)
         all_loaded = True
         for module in modules:
-            has_module = module in content
-            self.log_test(f"Module - {module}", has_module, f"Module loaded")
+            asset = assets.get(module)
+            has_module = content.has_script(module) and asset is not None and asset.ok
+            self.log_test(f"Module - {module}", has_module, f"Module loaded, {self.describe_asset(asset)}")
             all_loaded = all_loaded and has_module
             
         return all_loaded
@@ -164,14 +201,35 @@ class UserInteractionTester:
             "css/ab-testing.css"
         ]
         
+        assets = self.get_assets(css_files)
         all_loaded = True
         for css_file in css_files:
-            has_css = css_file in content
-            self.log_test(f"CSS - {css_file}", has_css, f"CSS loaded")
+            asset = assets.get(css_file)
+            has_css = content.has_stylesheet(css_file) and asset is not None and asset.ok
+            self.log_test(f"CSS - {css_file}", has_css, f"CSS loaded, {self.describe_asset(asset)}")
             all_loaded = all_loaded and has_css
             
         return all_loaded
         
+    def test_asset_sweep(self):
+        """Every same-origin asset index.html references is served; report the parallel sweep"""
+        assets = self.get_assets()
+        if not assets:
+            self.log_test("Asset Sweep", False, "Could not load page")
+            return False
+            
+        summary = summarize(assets)
+        wall = sum(sweep['wall_ms'] for sweep in self.asset_sweeps)
+        passed = not summary['failed']
+        self.log_test("Asset Sweep", passed,
+                      f"{summary['assets']} assets, {summary['bytes'] / 1024:.1f} KB sent "
+                      f"({summary['ratio']:.0%} of {summary['raw_bytes'] / 1024:.1f} KB), "
+                      f"{wall:.1f} ms wall vs {summary['latency_sum_ms']:.1f} ms sequential, "
+                      f"slowest {summary['slowest']}")
+        for path in summary['failed']:
+            self.log_test(f"Asset - {path}", False, self.describe_asset(assets[path]))
+        return passed
+        
     def test_security_functions(self):
         """Test security functions are available"""
         content = self.get_page_content()
@@ -367,6 +425,7 @@ class UserInteractionTester:
             self.test_story_elements,
             self.test_javascript_modules,
             self.test_css_files,
+            self.test_asset_sweep,
             self.test_security_functions,
             self.test_admin_features,
             self.test_user_features,
@@ -378,9 +437,9 @@ class UserInteractionTester:
         ]
         
         for test in tests:
+            self.timer.start()
             try:
                 test()
-                time.sleep(0.1)  # Small delay between tests
             except Exception as e:
                 print(f"❌ ERROR running {test.__name__}: {e}")
         
@@ -406,9 +465,12 @@ class UserInteractionTester:
                     print(f"  ❌ {result['test']}: {result['message']}")
             print()
         
+        self.timer.report(self.test_results)
+        
         return passed_tests == total_tests
 
 if __name__ == "__main__":
-    tester = UserInteractionTester()
-    success = tester.run_all_tests()
+    with StaticServer(REPO_ROOT) as server:
+        tester = UserInteractionTester(server.url)
+        success = tester.run_all_tests()
     exit(0 if success else 1)
\ No newline at end of file
@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+Test script for the concurrent asset fetcher
+"""
+
+import os
+import sys
+import tempfile
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'python'))
+
+from asset_fetcher import AssetFetcher, local_assets, summarize
+from page_fixture import PageFixture
+from static_server import StaticServer
+
+PAGE = '''<html><head>
+<link rel="stylesheet" href="styles.css?v=3">
+<link rel="stylesheet" href="https://cdn.example.com/font.css">
+</head><body>
+<script src="https://cdn.example.com/lib.js"></script>
+%s
+<script src="js/missing.js"></script>
+</body></html>
+'''
+
+
+def test_parallel_sweep():
+    """All same-origin assets in parallel, on reused connections, with sizes and ratios"""
+    print("🧪 Testing concurrent asset sweep")
+    with tempfile.TemporaryDirectory() as root:
+        os.makedirs(os.path.join(root, 'js'))
+        tags = []
+        for i in range(12):
+            with open(os.path.join(root, 'js', f'module-{i}.js'), 'w') as f:
+                f.write(f'window.Module{i} = {{ value: {i} }};\n' * 50)
+            tags.append(f'<script src="js/module-{i}.js?v=3"></script>')
+        with open(os.path.join(root, 'styles.css'), 'w') as f:
+            f.write('.chapter { color: #222; }\n' * 40)
+        with open(os.path.join(root, 'index.html'), 'w') as f:
+            f.write(PAGE % '\n'.join(tags))
+
+        with StaticServer(root) as server:
+            page = PageFixture().get(server.url + '/')
+            paths = local_assets(page)
+            assert paths[0] == 'js/module-0.js' and paths[-1] == 'styles.css' and len(paths) == 14
+            assert not any('cdn.example.com' in path for path in paths)
+
+            with AssetFetcher(server.url, concurrency=4) as fetcher:
+                assets = fetcher.sweep(page)
+                again = fetcher.fetch_all(['js/module-0.js', 'js/module-1.js'])
+            assert list(assets) == paths
+            module = assets['js/module-3.js']
+            assert module.ok and module.encoding == 'gzip' and module.ratio < 0.5
+            assert 'window.Module3' in module and module.raw_size == len(module.text)
+            assert not assets['js/missing.js'].ok and assets['js/missing.js'].status == 404
+            assert again['js/module-0.js'].ok
+            assert fetcher.connections <= 8 and server.stats['connections'] == fetcher.connections + 1
+            assert server.stats['requests'] == 1 + 14 + 2
+            print(f"   ✓ 16 requests on {fetcher.connections} connections")
+
+            summary = summarize(assets, fetcher.last_sweep['wall'])
+            assert summary['assets'] == 14 and summary['failed'] == ['js/missing.js']
+            assert summary['raw_bytes'] > summary['bytes'] > 0 and summary['ratio'] < 1
+            assert summary['latency_max_ms'] <= summary['latency_sum_ms']
+    print("   ✓ Per-asset latency, size and compression ratio recorded")
+
+
+def test_unreachable_server():
+    """A refused connection is reported on the asset, not raised"""
+    print("🧪 Testing fetch against a stopped server")
+    with tempfile.TemporaryDirectory() as root:
+        server = StaticServer(root).start()
+        url = server.url
+        server.stop()
+        with AssetFetcher(url) as fetcher:
+            asset = fetcher.fetch('index.html')
+        assert asset.status == 0 and asset.error and not asset.ok
+    print("   ✓ Connection errors land in Asset.error")
+
+
+if __name__ == '__main__':
+    test_parallel_sweep()
+    test_unreachable_server()
+    print("\n✓ All tests passed!")
@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""
+Test script for the story content pack builder
+"""
+
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'scripts', 'dev'))
+
+from build_content_pack import KIND_TEMPLATES, build_pack, is_up_to_date, plan_pack
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+STORY_ENGINE = os.path.join(ROOT, 'story-engine.js')
+
+# Generates chapters from the source engine and the packed engine in separate
+# contexts with the same Math.random stream and compares them.
+COMPARE_SCRIPT = '''
+const fs = require('fs');
+const vm = require('vm');
+const [root, pack, packed, count] = process.argv.slice(2);
+
+function load(files) {
+  const context = vm.createContext({ console, window: {}, document: { addEventListener: () => {} } });
+  vm.runInContext('let __seed = 1; Math.random = () => (__seed = (__seed * 16807) % 2147483647) / 2147483647;', context);
+  for (const file of files) {
+    vm.runInContext(fs.readFileSync(file, 'utf8'), context, { filename: file });
+  }
+  return context.window;
+}
+
+const source = load([root + '/backstory-engine.js', root + '/story-engine.js']);
+const target = load([root + '/backstory-engine.js', pack, packed]);
+const decodedAtStartup = target.StoryContentPack.loaded().length;
+const strip = (key, value) => (key === 'timestamp' ? 0 : value);
+let mismatches = 0;
+for (let i = 0; i < Number(count); i++) {
+  const a = JSON.stringify(source.StoryEngine.generateChapter(), strip);
+  const b = JSON.stringify(target.StoryEngine.generateChapter(), strip);
+  if (a !== b) mismatches++;
+}
+console.log(JSON.stringify({ decodedAtStartup, mismatches }));
+'''
+
+
+def test_plan_pack():
+    """Content pools are packed, runtime state and complex templates stay inline"""
+    print("🧪 Testing which pools get packed")
+    with open(STORY_ENGINE, 'r') as f:
+        content = f.read()
+
+    packed, skipped = plan_pack(content)
+    packed_names = {p['pool'].name for p in packed}
+    skipped_names = {s['name'] for s in skipped}
+
+    for name in ['vrRegions', 'itemPool', 'lorePool', 'sensoryDetails', 'generateSocialParagraphs.middles']:
+        assert name in packed_names, f"{name} should be packed"
+    for name in ['mcState', 'worldState']:
+        assert name in skipped_names, f"{name} is runtime state and must stay inline"
+    assert any(p['kind'] == KIND_TEMPLATES for p in packed), "No template pools packed"
+    print(f"   ✓ {len(packed)} pools packed, {len(skipped)} left inline")
+
+
+def test_packed_engine_matches_source():
+    """The packed engine generates exactly the chapters the source engine does"""
+    print("🧪 Testing packed engine against story-engine.js")
+    if shutil.which('node') is None:
+        print("   ⚠️  node not available, skipping")
+        return
+
+    with open(STORY_ENGINE, 'r') as f:
+        content = f.read()
+    pack, engine, report = build_pack(content)
+    assert report['sizes']['packed_engine']['raw'] < report['sizes']['source']['raw'] // 2, \
+        "Packed engine should be well under half the source size"
+    sizes = report['sizes']
+    assert sizes['startup']['gzip'] == sizes['packed_engine']['gzip'] + sizes['pack']['gzip'], \
+        "Startup size should count both scripts index.html loads"
+
+    with tempfile.TemporaryDirectory() as tmp:
+        pack_path = os.path.join(tmp, 'story-content-pack.js')
+        engine_path = os.path.join(tmp, 'story-engine.packed.js')
+        script_path = os.path.join(tmp, 'compare.js')
+        with open(pack_path, 'w') as f:
+            f.write(pack)
+        with open(engine_path, 'w') as f:
+            f.write(engine)
+        with open(script_path, 'w') as f:
+            f.write(COMPARE_SCRIPT)
+
+        result = subprocess.run(['node', script_path, ROOT, pack_path, engine_path, '300'],
+                                capture_output=True, text=True, timeout=120)
+        assert result.returncode == 0, f"Comparison failed: {result.stderr}"
+        outcome = result.stdout.strip().splitlines()[-1]
+
+    assert '"decodedAtStartup":0' in outcome, f"Pools decoded before first use: {outcome}"
+    assert '"mismatches":0' in outcome, f"Packed engine diverged from source: {outcome}"
+    print("   ✓ 300 chapters identical, no pools decoded at startup")
+
+
+def test_committed_pack_is_current():
+    """story-content-pack.js was rebuilt after the last story-engine.js change"""
+    print("🧪 Testing committed content pack is up to date")
+    with open(STORY_ENGINE, 'r') as f:
+        content = f.read()
+    assert is_up_to_date(content, os.path.join(ROOT, 'story-content-pack.js')), \
+        "story-content-pack.js is stale - run scripts/dev/build_content_pack.py"
+    print("   ✓ Content pack matches story-engine.js")
+
+
+if __name__ == '__main__':
+    test_plan_pack()
+    test_packed_engine_matches_source()
+    test_committed_pack_is_current()
+    print("\n✓ All tests passed!")
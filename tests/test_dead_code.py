@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+Test script for the dead-code reachability report
+"""
+
+import os
+import shutil
+import sys
+import tempfile
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'scripts', 'dev'))
+
+from dead_code import analyze, prune
+
+FIXTURE = {
+    'index.html': '''<html><body>
+<button onclick="App.start()">Start</button>
+<script src="js/app.js"></script>
+</body></html>
+''',
+    'js/app.js': '''(function() {
+  const helper = (n) => n * 2;
+  const start = () => {
+    document.body.innerHTML = `<button onclick="App.stop()">Stop</button>`;
+    return helper(Lazy.size());
+  };
+  const stop = function () { return true; };
+  const unused = () => {
+    const rows = [helper(1), helper(2), helper(3)].map((value) => `<li class="row">${value}</li>`);
+    document.body.insertAdjacentHTML('beforeend', `<ul class="unused-list">${rows.join('')}</ul>`);
+    return rows.length;
+  };
+  function alsoUnused() { return 2; }
+  document.addEventListener('DOMContentLoaded', function ready() { return 3; });
+  const App = { start, stop, unused: unused, alsoUnused };
+  window.App = App;
+})();
+''',
+    'js/lazy.js': '''(function() {
+  const size = () => { return 1; };
+  const grow = () => { return 2; };
+  window.Lazy = { size, grow };
+})();
+''',
+    'js/orphan.js': '''(function() {
+  function orphan() {
+    function deep() { return 1; }
+    return inner() + deep();
+  }
+  function inner() { return 1; }
+  window.Orphan = { orphan };
+})();
+''',
+}
+
+
+def test_reachability():
+    """Handlers, HTML in templates and used globals keep functions alive; exports do not"""
+    print("🧪 Testing reachability from index.html")
+    with tempfile.TemporaryDirectory() as root:
+        for path, content in FIXTURE.items():
+            os.makedirs(os.path.dirname(os.path.join(root, path)), exist_ok=True)
+            with open(os.path.join(root, path), 'w') as f:
+                f.write(content)
+
+        report = analyze(root)
+        dead = [(d['file'], d['name']) for d in report['unreachable']]
+        assert dead == [('js/app.js', 'unused'), ('js/app.js', 'alsoUnused'), ('js/lazy.js', 'grow'),
+                        ('js/orphan.js', 'orphan'), ('js/orphan.js', 'inner')], dead
+        assert report['unloaded'] == ['js/orphan.js']
+        exports = sorted((e['file'], e['name']) for e in report['unused_exports'])
+        assert ('js/app.js', 'unused') in exports and ('js/orphan.js', 'Orphan') in exports
+        assert ('js/app.js', 'App') not in exports
+        assert report['unreachable_bytes'] == sum(d['bytes'] for d in report['unreachable']) > 0
+        print(f"   ✓ {len(dead)} unreachable functions, nested ones not repeated")
+
+        out = os.path.join(root, 'pruned')
+        result = prune(root, report, out)
+        with open(os.path.join(out, 'js', 'app.js')) as f:
+            pruned = f.read()
+        assert "const unused = () => { throw new Error('pruned: unused'); };" in pruned, pruned
+        assert 'return helper(Lazy.size())' in pruned
+        assert result['after']['raw'] < result['before']['raw']
+        if shutil.which('node'):
+            assert result['broken'] == [], result['broken']
+    print("   ✓ Pruned build stubs only the unreachable bodies")
+
+
+if __name__ == '__main__':
+    test_reachability()
+    print("\n✓ All tests passed!")
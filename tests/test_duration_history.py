@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+Test script for the test-duration history
+"""
+
+import json
+import os
+import sys
+import tempfile
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'scripts', 'dev'))
+
+from duration_history import CheckTimer, DurationHistory, schedule
+
+
+def test_history_and_regressions():
+    """Rolling window, median expectations and regression flags"""
+    print("🧪 Testing history and regressions")
+    with tempfile.TemporaryDirectory() as root:
+        path = os.path.join(root, 'history.json')
+        history = DurationHistory(path, window=4, factor=2.0, min_samples=3, min_slowdown=0.05)
+        for duration in (0.1, 0.1, 0.2, 5.0, 0.1):
+            history.record('a::one', duration)
+        assert history.tests['a::one'] == [0.1, 0.2, 5.0, 0.1]
+        assert abs(history.expected('a::one') - 0.15) < 1e-9 and history.expected('a::two', 7) == 7
+        print("   ✓ Only the last samples are kept; the median ignores an outlier")
+
+        assert [r['key'] for r in history.regressions] == ['a::one']
+        assert history.check('a::one', 0.29) is None and history.check('a::one', 0.5)['factor'] == 3.3
+        history.record('b::fast', 0.001)
+        history.record('b::fast', 0.001)
+        history.record('b::fast', 0.001)
+        assert history.check('b::fast', 0.01) is None
+        assert DurationHistory(None, min_samples=5).check('a::one', 9.0) is None
+        print("   ✓ Regressions need the factor, a real slowdown and enough samples")
+
+        history.save()
+        other = DurationHistory(path, window=4)
+        history.record('a::one', 0.3)
+        other.record('c::new', 1.0)
+        history.save()
+        other.save()
+        with open(path) as f:
+            saved = json.load(f)['tests']
+        assert saved['a::one'] == [0.2, 5.0, 0.1, 0.3] and saved['c::new'] == [1.0]
+        assert DurationHistory(path).default() == 0.25
+        assert DurationHistory(os.path.join(root, 'missing.json')).default() == 1.0
+    print("   ✓ Saves from two processes merge instead of overwriting")
+
+
+def test_check_timer_and_schedule():
+    """Tester check laps and shards of even expected time"""
+    print("🧪 Testing check timer and schedule")
+    history = DurationHistory(None)
+    timer = CheckTimer('tests/python/test_x.py::XTester', history)
+    timer.start()
+    first = timer.lap('Page Load')
+    second = timer.lap('Navigation')
+    assert first >= 0 and second >= 0
+    assert sorted(history.tests) == ['tests/python/test_x.py::XTester::Navigation',
+                                     'tests/python/test_x.py::XTester::Page Load']
+    timer.report([{'test': 'Page Load', 'passed': True, 'duration': first}])
+    print("   ✓ Each log_test lap is recorded under the tester prefix")
+
+    costs = {'a': 8, 'b': 7, 'c': 6, 'd': 5, 'e': 4}
+    shards, totals = schedule(list(costs), costs.get, 2)
+    assert shards == [['a', 'd', 'e'], ['b', 'c']] and totals == [17, 13]
+    assert sorted(item for shard in shards for item in shard) == sorted(costs)
+    shards, totals = schedule(['x'], lambda item: 1.0, 3)
+    assert shards == [['x'], [], []]
+    print("   ✓ Longest first onto the least-loaded shard")
+
+
+if __name__ == '__main__':
+    test_history_and_regressions()
+    test_check_timer_and_schedule()
+    print("\n✓ All tests passed!")
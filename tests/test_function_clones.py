@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+Test script for the duplicate-function detector
+"""
+
+import os
+import sys
+import tempfile
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'scripts', 'dev'))
+
+from function_clones import analyze, jaccard, local_names, normalize, shingles
+from scope_index import ScopeIndex
+
+LOADER = '''
+  const {name} = () => {{
+    let {var} = null;
+    try {{
+      const stored = localStorage.getItem(STORAGE_KEY_{key});
+      // cached copy
+      if (stored) {{
+        {var} = JSON.parse(stored);
+      }}
+    }} catch (error) {{
+      console.error('Failed to load', error);
+      {var} = {{}};
+    }}
+    return {var};
+  }};
+'''
+
+FIXTURE = {
+    # Same body, formatted differently, different function names
+    'js/a.js': LOADER.format(name='loadA', key='A', var='items'),
+    'js/b.js': LOADER.format(name='loadB', key='A', var='items').replace('\n      ', '\n  '),
+    # Local variable renamed
+    'js/c.js': LOADER.format(name='loadC', key='A', var='records'),
+    # Edited copy: an extra statement
+    'js/d.js': LOADER.format(name='loadD', key='D', var='rows').replace(
+        "console.error('Failed to load', error);",
+        "console.error('Failed to load', error);\n      notify(error.message);"),
+    # A wrapper around a copy: the copy is reported, not reported twice
+    'js/e.js': '(function () {\n  const ready = true;\n' + LOADER.format(name='loadE', key='A', var='list')
+               + '  window.loadE = loadE;\n})();\n',
+    'js/other.js': '''function total(list) {
+  let sum = 0;
+  for (const item of list) {
+    if (item.price > 0 && item.quantity > 0) {
+      sum += item.price * item.quantity;
+    }
+  }
+  return Math.round(sum * 100) / 100;
+}
+''',
+}
+
+
+def test_normalize():
+    """Locals are renamed in order, property names and free names are kept"""
+    print("🧪 Testing token normalization")
+    tokens = ['(', 'a', ')', '{', 'return', 'a', '.', 'b', '+', 'Math', '.', 'max', '(', 'c', ')', '}']
+    assert normalize(tokens, {'a', 'b'}) == ['(', '$0', ')', '{', 'return', '$0', '.', 'b', '+', 'Math', '.',
+                                             'max', '(', 'c', ')', '}']
+    save = normalize(['(', 'x', ')', '{', 'save', '(', 'x', ')', '}'], {'x'})
+    load = normalize(['(', 'y', ')', '{', 'load', '(', 'y', ')', '}'], {'y'})
+    assert save != load and save == normalize(['(', 'z', ')', '{', 'save', '(', 'z', ')', '}'], {'z'})
+    print("   ✓ Copies calling different functions are not renamed clones")
+
+    index = ScopeIndex('function f(a, {b, c} = {}, ...d) { const e = g(a); try { h(); } catch (err) {}\n'
+                       '  [1].map(x => x + e); return async y => { let z; }; }')
+    assert local_names(index, index.functions[0]) == {'a', 'b', 'c', 'd', 'e', 'err', 'x', 'y', 'z'}
+    assert jaccard(shingles(list('abcdef')), shingles(list('abcdef'))) == 1.0
+    print("   ✓ Parameters, catch parameters, declarations and nested arrow parameters are local")
+
+
+def test_clone_groups():
+    """Exact, renamed and edited copies land in one group; unrelated code does not"""
+    print("🧪 Testing clone detection on a fixture tree")
+    with tempfile.TemporaryDirectory() as root:
+        for path, content in FIXTURE.items():
+            os.makedirs(os.path.dirname(os.path.join(root, path)), exist_ok=True)
+            with open(os.path.join(root, path), 'w') as f:
+                f.write(content)
+
+        functions, groups = analyze(root, min_tokens=20, threshold=0.6)
+        names = {key: info.name for key, info in functions.items()}
+        assert 'total' in names.values()
+        assert len(groups) == 1, groups
+        group = groups[0]
+        assert group['kind'] == 'near' and 0.6 <= group['similarity'] < 1.0
+        assert sorted(names[k] for k in group['members']) == ['loadA', 'loadB', 'loadC', 'loadD', 'loadE']
+        assert group['duplicate_bytes'] > 0
+        print(f"   ✓ Edited copy joined at {group['similarity']:.0%} similarity")
+
+        functions, groups = analyze(root, min_tokens=20, threshold=0.99)
+        kinds = [(g['kind'], sorted(functions[k].name for k in g['members'])) for g in groups]
+        assert kinds == [('renamed', ['loadA', 'loadB', 'loadC', 'loadE'])], kinds
+
+        os.remove(os.path.join(root, 'js', 'c.js'))
+        os.remove(os.path.join(root, 'js', 'e.js'))
+        functions, groups = analyze(root, min_tokens=20, threshold=0.99)
+        assert [(g['kind'], len(g['members'])) for g in groups] == [('exact', 2)], groups
+        print("   ✓ Renamed and formatting-only copies")
+
+        functions, groups = analyze(root, min_tokens=200)
+        assert not functions and not groups, "Small functions must be skipped"
+    print("   ✓ min-tokens filter")
+
+
+if __name__ == '__main__':
+    test_normalize()
+    test_clone_groups()
+    print("\n✓ All tests passed!")
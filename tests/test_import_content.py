@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+Test script for the bulk content import pipeline
+"""
+
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'scripts', 'dev'))
+
+from content_pools import load_pools
+from import_content import import_content
+
+ENGINE = '''const StoryEngine = (() => {
+  const mcState = { level: 1 };
+  const lorePool = [
+    "The first lore entry was long enough to set a sensible word count floor here.",
+    "The second lore entry is also reasonably long so that bounds stay generous."
+  ];
+
+  function generateSocialParagraphs() {
+    const char = { name: "Mira" };
+    const middles = [
+      `${char.name} laughed at something I said and the dungeon felt less lonely for a moment.`,
+      `We ran the dungeon in silence, the comfortable kind where words were not needed at all.`,
+    ];
+    return middles;
+  }
+
+  return { generateSocialParagraphs };
+})();
+'''
+
+
+def test_import_pipeline():
+    """Records are deduped, validated and written in one batch"""
+    print("🧪 Testing bulk content import")
+    workdir = tempfile.mkdtemp()
+    try:
+        engine = os.path.join(workdir, 'story-engine.js')
+        with open(engine, 'w') as f:
+            f.write(ENGINE)
+
+        batch = os.path.join(workdir, 'batch.jsonl')
+        records = [
+            {'pool': 'generateSocialParagraphs.middles',
+             'text': '${char.name} shared a rare item with me because they noticed I needed it badly.'},
+            {'pool': 'generateSocialParagraphs.middles',
+             'text': '${char.name} shared a rare item with me because they noticed I needed it badly.'},
+            {'pool': 'generateSocialParagraphs.middles',
+             'text': '${enemy.name} is not declared anywhere in the social generator at all, sadly.'},
+            {'pool': 'lorePool',
+             'text': 'The first lore entry was long enough to set a sensible word count floor here.'},
+            {'pool': 'lorePool', 'text': 'Too short.'},
+            {'pool': 'lorePool', 'text': 'Level ${mcState.level} cannot be interpolated in a plain string pool.'},
+            {'pool': 'lorePool', 'text': 'A hidden door waits in the Abyssal Depths for a key made of real data.'},
+            {'pool': 'missingPool', 'text': 'This pool does not exist in the engine file.'},
+        ]
+        with open(batch, 'w') as f:
+            for record in records:
+                f.write(json.dumps(record) + '\n')
+            f.write('["not", "a", "record"]\n42\n{"pool": "lorePool", "text": 7}\n')
+
+        report = import_content([batch], [engine])
+        assert report['accepted'] == {'generateSocialParagraphs.middles': 1, 'lorePool': 1}, \
+            f"Unexpected accepted counts: {report['accepted']}"
+        assert report['duplicates'] == 2, f"Expected 2 duplicates, got {report['duplicates']}"
+        assert len(report['rejected']) == 7, f"Expected 7 rejections, got {report['rejected']}"
+        malformed = {r['location']: r['problems'] for r in report['rejected'][-3:]}
+        assert malformed == {f'{batch}:9': ['expected an object or a string, got an array'],
+                             f'{batch}:10': ['expected an object or a string, got a number'],
+                             f'{batch}:11': ["'text' must be a string"]}, malformed
+        print("   ✓ 2 accepted, 2 duplicates, 7 rejected (3 of them malformed lines)")
+
+        pools = load_pools([engine])
+        assert len(pools['lorePool'].value) == 3, "lorePool was not extended"
+        assert pools['generateSocialParagraphs.middles'].value[-1].startswith('${char.name} shared'), \
+            "Template literal was not appended to the social pool"
+
+        node = shutil.which('node')
+        if node:
+            subprocess.run([node, '--check', engine], check=True)
+            print("   ✓ Updated engine still parses")
+    finally:
+        shutil.rmtree(workdir)
+
+
+if __name__ == '__main__':
+    test_import_pipeline()
+    print("\n✓ All tests passed!")
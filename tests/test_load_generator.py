@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+Test script for the reader-session load generator
+"""
+
+import os
+import sys
+import tempfile
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'python'))
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'scripts', 'dev'))
+
+from fixture_tree import write_tree
+from load_generator import load_plan, percentile, run_load
+from static_server import StaticServer
+
+FIXTURE = {
+    'index.html': '''<html><head>
+<link rel="stylesheet" href="styles.css?v=2">
+<link rel="stylesheet" href="https://cdn.example.com/font.css">
+</head><body>
+<!-- <script src="js/old.js"></script> -->
+<script src="js/app.js?v=3"></script>
+<script src="https://cdn.example.com/lib.js"></script>
+</body></html>
+''',
+    'styles.css': 'body { color: black; }\n' * 40,
+    'js/app.js': 'window.App = {};\n' * 40,
+    'js/extra.js': 'window.Extra = {};\n',
+    'sw.js': "const CACHE_NAME = 'v1';\nconst urlsToCache = [\n  '/',\n  '/index.html',\n  '/js/app.js',\n  '/js/extra.js'\n];\n",
+    'js/utils/lazy-loader.js': '''const LazyLoader = (function() {
+    const modules = {
+        reports: { files: ['js/modules/reports.js', 'js/ui/reports-ui.js'], css: ['css/reports.css'] },
+        missing: { files: ['js/modules/missing.js'], css: [] }
+    };
+})();
+''',
+    'js/modules/reports.js': 'window.Reports = {};\n',
+    'js/ui/reports-ui.js': 'window.ReportsUI = {};\n',
+    'css/reports.css': '.reports { }\n',
+}
+
+
+def test_plan():
+    """Page assets, precache list and lazy modules are read from the tree"""
+    print("🧪 Testing session plan")
+    with tempfile.TemporaryDirectory() as root:
+        write_tree(root, FIXTURE)
+        plan = load_plan(root)
+        assert plan['assets'] == ['js/app.js', 'styles.css']
+        assert plan['precache'] == ['', 'index.html', 'js/app.js', 'js/extra.js']
+        assert plan['lazy']['reports'] == ['css/reports.css', 'js/modules/reports.js', 'js/ui/reports-ui.js']
+        assert plan['service_worker'] == 'sw.js'
+    print("   ✓ Same-origin assets only; lazy modules load stylesheets first")
+
+    assert percentile([1, 2, 3, 4], 50) == 2 and percentile([1, 2, 3, 4], 99) == 4 and percentile([], 50) == 0.0
+    print("   ✓ Nearest-rank percentiles")
+
+
+def test_sessions():
+    """Reader sessions against the in-process server: phases, 304s and bytes"""
+    print("🧪 Testing reader sessions")
+    with tempfile.TemporaryDirectory() as root:
+        write_tree(root, FIXTURE)
+        plan = load_plan(root)
+        plan['lazy'].pop('missing')
+        with StaticServer(root) as server:
+            report = run_load(server.url, plan, sessions=4, concurrency=2, connections=2, lazy=1, repeat=2)
+            assert server.stats['connections'] <= 4 * 2 + 2
+        per_session = 1 + 2 + 1 + 4 + 3 + 2 * (1 + 2 + 1 + 3)
+        assert report['sessions'] == 4 and report['requests'] == 4 * per_session
+        assert report['errors'] == 0 and report['rps'] > 0
+        print("   ✓ Every phase requested; keep-alive connections reused")
+
+        phases = report['phases']
+        assert phases['initial']['not_modified'] == 0
+        assert phases['sw-install']['not_modified'] == 4 * 2
+        assert phases['lazy']['not_modified'] == 0
+        assert phases['repeat']['not_modified'] == phases['repeat']['requests'] == 4 * 2 * 7
+        initial = phases['initial']['bytes'] / phases['initial']['requests']
+        assert phases['repeat']['bytes'] / phases['repeat']['requests'] < initial
+        assert abs(report['bytes_per_session']['mean'] * 4 - report['bytes']) <= 4
+        assert report['latency_ms']['p50'] <= report['latency_ms']['p99'] <= report['latency_ms']['max']
+        print("   ✓ Repeat visits revalidate everything as 304 Not Modified")
+
+        plan = load_plan(root)
+        plan['lazy'] = {'missing': plan['lazy']['missing']}
+        with StaticServer(root) as server:
+            report = run_load(server.url, plan, sessions=1, lazy=1, repeat=0)
+        assert report['errors'] == 1 and report['failed_paths'] == ['js/modules/missing.js']
+    print("   ✓ Missing files are reported as failed requests")
+
+
+if __name__ == '__main__':
+    test_plan()
+    test_sessions()
+    print("\n✓ All tests passed!")
@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+Test script for the module dependency graph builder
+"""
+
+import os
+import sys
+import tempfile
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'scripts', 'dev'))
+
+from module_graph import HANDLERS, analyze, build_graph
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+
+FIXTURE = {
+    'index.html': '''<html><body>
+<button onclick="Reports.open()">Reports</button>
+<!-- <script src="js/old.js"></script> -->
+<script src="js/core.js?v=1"></script>
+<script src="js/app.js"></script>
+<script src="js/late.js"></script>
+<script src="js/utils/lazy-loader.js"></script>
+</body></html>
+''',
+    'js/core.js': 'const Core = { version: 1 };\n',
+    'js/app.js': '''const App = (function() {
+  const size = Late.size;
+  function start(options = {}) { return Core.version + Helpers.twice(options.size || size); }
+  if (typeof Optional !== 'undefined') { Optional.run(); }
+  return { start };
+})();
+window.App = App;
+''',
+    'js/late.js': 'window.Late = { size: 2 };\n',
+    'js/helpers.js': 'const Helpers = { twice: (n) => n * 2 };\n',
+    'js/optional.js': 'const Optional = { run() {} };\n',
+    'js/reports.js': 'const Reports = { open() { return Core.version; } };\n',
+    'js/unused.js': 'const Unused = 1;\n',
+    'js/utils/lazy-loader.js': '''const LazyLoader = (function() {
+  const modules = {
+    reports: { files: ['js/reports.js'], css: [] },
+    extras: { files: ['js/optional.js', 'js/unused.js'], css: [] }
+  };
+  return { modules };
+})();
+''',
+}
+
+
+def test_fixture_graph():
+    """Closure, load order and lazy-module leaks on a small page"""
+    print("🧪 Testing module graph on a fixture page")
+    with tempfile.TemporaryDirectory() as root:
+        for path, content in FIXTURE.items():
+            os.makedirs(os.path.dirname(os.path.join(root, path)), exist_ok=True)
+            with open(os.path.join(root, path), 'w') as f:
+                f.write(content)
+        graph = build_graph(root)
+
+        assert 'js/old.js' not in graph.modules or graph.modules['js/old.js'].html_index is None, \
+            "Commented-out script tag was treated as loaded"
+        edges = graph.edges['js/app.js']
+        assert edges['js/late.js']['kind'] == 'load', "IIFE body runs at load time"
+        assert edges['js/core.js']['kind'] == 'runtime', "Body after a default `= {}` parameter is runtime"
+        assert edges['js/optional.js']['kind'] == 'optional', "typeof guard makes the edge optional"
+        assert graph.edges[HANDLERS]['js/reports.js']['names'] == ['Reports']
+        print("   ✓ Edges classified as load, runtime and optional")
+
+        report = analyze(graph)
+        critical = [entry['module'] for entry in report['critical']]
+        assert 'js/helpers.js' in critical and 'js/reports.js' in critical
+        assert 'js/optional.js' not in critical and 'js/unused.js' not in critical
+        assert critical.index('js/late.js') < critical.index('js/app.js'), "Provider must load first"
+        assert report['order_violations'] == [{'module': 'js/app.js', 'provider': 'js/late.js',
+                                               'names': ['Late']}]
+        assert [(i['module'], i['group']) for i in report['lazy_pulled_in']] == [('js/reports.js', 'reports')]
+        assert report['critical_sizes']['raw'] == sum(e['raw'] for e in report['critical'])
+        print(f"   ✓ {len(critical)} critical modules in dependency order")
+
+
+def test_repository_graph():
+    """The real page yields a consistent load order"""
+    print("🧪 Testing module graph on index.html")
+    graph = build_graph(ROOT)
+    report = analyze(graph)
+    critical = [entry['module'] for entry in report['critical']]
+    for required in ['story-engine.packed.js', 'backstory-engine.js', 'js/modules/initialization.js']:
+        assert required in critical, f"{required} missing from the critical path"
+    position = {name: i for i, name in enumerate(critical)}
+    for source in critical:
+        for target, edge in graph.edges.get(source, {}).items():
+            if edge['kind'] == 'load' and target in position and source not in report['cyclic']:
+                assert position[target] < position[source], f"{target} must load before {source}"
+    assert report['critical_sizes']['gzip'] < report['critical_sizes']['raw']
+    print(f"   ✓ {len(critical)} scripts, {report['critical_sizes']['gzip'] // 1024} KB gzip")
+
+
+if __name__ == '__main__':
+    test_fixture_graph()
+    test_repository_graph()
+    print("\n✓ All tests passed!")
@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+Test script for the cached module manifest
+"""
+
+import os
+import sys
+import tempfile
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'python'))
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'scripts', 'dev'))
+
+from fixture_tree import write_tree
+from module_manifest import build_manifest
+
+FIXTURE = {
+    'index.html': '''<html><head>
+<link rel="stylesheet" href="css/reports.css?v=2">
+</head><body>
+<!-- <script src="js/old.js"></script> -->
+<button id="reportsBtn" onclick="ReportsUI.openModal()">Reports</button>
+<script src="js/reports.js?v=3"></script>
+</body></html>
+''',
+    'js/reports.js': '''/**
+ * Reports module
+ */
+(function(window) {
+    const MAX_REPORTS = 10;
+    // getLegacyReport was removed
+    function createReport(name) {
+        try {
+            Storage.setItem('report', sanitizeHTML(name));
+        } catch (e) {
+            ErrorHandler.handleError(e);
+        }
+    }
+    const exportReport = () => JSON.stringify({ kind: 'weekly_report' });
+    const Reports = { createReport, exportReport, init: function() {} };
+    window.Reports = Reports;
+})(window);
+''',
+    'css/reports.css': '''/* .commented-out { } */
+.reports-modal, .report-row:hover { color: red; }
+@media (max-width: 768px) { .reports-modal { width: 100%; } }
+@media (prefers-color-scheme: dark) { .report-row { color: white; } }
+''',
+}
+
+
+def test_manifest_entries():
+    """Scripts, stylesheets and the page answer the feature-test questions"""
+    print("🧪 Testing manifest entries")
+    with tempfile.TemporaryDirectory() as root:
+        write_tree(root, FIXTURE)
+        manifest = build_manifest(root)
+        assert sorted(manifest.files) == ['css/reports.css', 'index.html', 'js/reports.js']
+        assert manifest.get('js/missing.js') is None and not manifest.exists('js/missing.js')
+
+        script = manifest['js/reports.js']
+        assert script.exports('Reports') and not script.exports('ReportsUI')
+        assert script.defines('createReport') and script.defines('exportReport') and script.defines('init')
+        assert not script.defines('getLegacyReport') and not script.mentions('getLegacyReport')
+        assert script.uses('Storage.setItem') and script.uses('ErrorHandler.handleError')
+        assert not script.uses('Storage.getItem')
+        assert script.mentions('weekly_report') and script.uses('MAX_REPORTS')
+        assert script['jsdoc'] == 1 and script['try_blocks'] == 1 and script.count('sanitizeHTML') == 1
+        assert 'window' in script['iife_params']
+        print("   ✓ Exports, definitions, members and strings; comments ignored")
+
+        css = manifest['css/reports.css']
+        assert css.has_class('.reports-modal') and css.has_class('report-row')
+        assert not css.has_class('.commented-out')
+        assert css.has_media() and css.has_media('(max-width: 768px)')
+        assert css.has_media('(prefers-color-scheme: dark)') and css['balanced']
+        print("   ✓ Classes and @media queries of the stylesheet")
+
+        page = manifest['index.html']
+        assert page.loads_script('js/reports.js') and not page.loads_script('js/old.js')
+        assert page.loads_stylesheet('css/reports.css')
+        assert page.uses('ReportsUI.openModal') and page.mentions('reportsBtn')
+        print("   ✓ Script and stylesheet tags match without their ?v= query")
+
+
+def test_incremental_rebuild():
+    """Unchanged files are reused, touched files hashed, edited files rescanned"""
+    print("🧪 Testing incremental rebuild")
+    with tempfile.TemporaryDirectory() as root:
+        write_tree(root, FIXTURE)
+        first = build_manifest(root)
+        assert first.stats == {'scanned': 3, 'hashed': 3, 'reused': 0}
+        assert os.path.exists(os.path.join(root, 'module-manifest.json'))
+
+        assert build_manifest(root).stats == {'scanned': 0, 'hashed': 0, 'reused': 3}
+        print("   ✓ Second build reads no files")
+
+        path = os.path.join(root, 'js', 'reports.js')
+        stat = os.stat(path)
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10 ** 9))
+        assert build_manifest(root).stats == {'scanned': 0, 'hashed': 1, 'reused': 2}
+        print("   ✓ Touched but unchanged file is hashed, not rescanned")
+
+        with open(path, 'a') as f:
+            f.write('window.ReportsUI = {};\n')
+        edited = build_manifest(root)
+        assert edited.stats == {'scanned': 1, 'hashed': 1, 'reused': 2}
+        assert edited['js/reports.js'].exports('ReportsUI')
+        assert build_manifest(root, refresh=True).stats['scanned'] == 3
+    print("   ✓ Edited file is rescanned; --refresh rescans everything")
+
+
+if __name__ == '__main__':
+    test_manifest_entries()
+    test_incremental_rebuild()
+    print("\n✓ All tests passed!")
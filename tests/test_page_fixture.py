@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""
+Test script for the fetch-once page fixture used by the HTTP feature testers
+"""
+
+import functools
+import hashlib
+import os
+import sys
+import tempfile
+import threading
+from collections import Counter
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'python'))
+
+from page_fixture import PageFixture
+from test_user_interactions import UserInteractionTester
+
+PAGE = '''<!DOCTYPE html>
+<html><head>
+<link rel="stylesheet" href="styles.css">
+<link rel="manifest" href="manifest.json">
+<script src="js/app.js?v=3"></script>
+</head><body>
+<div id="mainContent" class="content wide"><button id="nextBtn" class="btn">Next</button></div>
+<script>const ready = true;</script>
+</body></html>
+'''
+
+
+class CountingHandler(SimpleHTTPRequestHandler):
+    """Static handler that counts GETs and answers If-None-Match with 304"""
+
+    def do_GET(self):
+        self.server.gets += 1
+        self.server.paths[self.path] += 1
+        path = self.translate_path(self.path)
+        if os.path.isdir(path):
+            path = os.path.join(path, 'index.html')
+        if os.path.isfile(path):
+            with open(path, 'rb') as f:
+                etag = '"%s"' % hashlib.sha1(f.read()).hexdigest()
+            if self.headers.get('If-None-Match') == etag:
+                self.send_response(304)
+                self.send_header('ETag', etag)
+                self.end_headers()
+                return
+            if 'If-None-Match' in self.headers:
+                # A failed If-None-Match overrides If-Modified-Since (RFC 9110)
+                del self.headers['If-Modified-Since']
+            self.server.etag = etag
+        super().do_GET()
+
+    def end_headers(self):
+        if getattr(self.server, 'etag', None) and self.command == 'GET':
+            self.send_header('ETag', self.server.etag)
+        super().end_headers()
+
+    def log_message(self, format, *args):
+        pass
+
+
+def serve(directory):
+    server = ThreadingHTTPServer(('127.0.0.1', 0), functools.partial(CountingHandler, directory=directory))
+    server.gets = 0
+    server.paths = Counter()
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f'http://127.0.0.1:{server.server_address[1]}/'
+
+
+def test_indexed_page():
+    """One download, one parse, O(1) lookups and conditional revalidation"""
+    print("🧪 Testing fetch-once page fixture")
+    with tempfile.TemporaryDirectory() as root:
+        with open(os.path.join(root, 'index.html'), 'w') as f:
+            f.write(PAGE)
+        server, url = serve(root)
+        try:
+            fixture = PageFixture()
+            page = fixture.get(url)
+            assert page.status == 200 and page.has_id('nextBtn') and page.ids['mainContent'] == 'div'
+            assert page.has_class('wide') and not page.has_class('content wide')
+            assert page.has_script('js/app.js') and page.has_stylesheet('styles.css')
+            assert not page.has_stylesheet('manifest.json') and 'manifest.json' in page.links
+            assert page.inline_scripts == 1
+            assert 'Next' in page and 'next' in page.lower()
+            for _ in range(20):
+                assert fixture.get(url) is page
+            assert server.gets == 1 and fixture.stats['hits'] == 20
+            print("   ✓ 21 lookups, 1 request")
+
+            assert fixture.revalidate(url) is page, "Unchanged page keeps its index"
+            assert server.gets == 2 and fixture.stats['not_modified'] == 1
+            with open(os.path.join(root, 'index.html'), 'w') as f:
+                f.write(PAGE.replace('nextBtn', 'forwardBtn'))
+            changed = fixture.revalidate(url)
+            assert changed is not page and changed.has_id('forwardBtn') and fixture.get(url) is changed
+            print("   ✓ 304 keeps the parsed page, a changed page is re-parsed")
+
+            missing = fixture.get(url + 'missing.html')
+            assert missing.status == 404
+        finally:
+            server.shutdown()
+            server.server_close()
+    print("   ✓ Error pages are returned with their status")
+
+
+def test_tester_uses_fixture():
+    """A whole tester run downloads the page once"""
+    print("🧪 Testing UserInteractionTester on the shared fixture")
+    with tempfile.TemporaryDirectory() as root:
+        with open(os.path.join(root, 'index.html'), 'w') as f:
+            f.write(PAGE)
+        server, url = serve(root)
+        try:
+            tester = UserInteractionTester(url)
+            tester.pages = PageFixture()
+            tester.test_story_elements()
+            tester.test_javascript_modules()
+            tester.test_accessibility()
+            results = {r['test']: r['passed'] for r in tester.test_results}
+            assert results['Story Element - Next Button'] and not results['Story Element - Arc Display']
+            assert server.paths['/'] == 1, server.paths
+            assert server.paths['/js/app.js'] == 1 and server.paths['/styles.css'] == 1
+        finally:
+            server.shutdown()
+            server.server_close()
+    print("   ✓ Three test methods, one page request, each asset fetched once")
+
+
+if __name__ == '__main__':
+    test_indexed_page()
+    test_tester_uses_fixture()
+    print("\n✓ All tests passed!")
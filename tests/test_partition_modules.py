@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+"""
+Test script for the measured critical/lazy module partitioner
+"""
+
+import os
+import shutil
+import sys
+import tempfile
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'python'))
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'scripts', 'dev'))
+
+from fixture_tree import write_tree
+from module_graph import HANDLERS, LAZY_LOADER_PATH, build_graph
+from partition_modules import call_sites, partition, read_manifest, run_harness, write_manifest
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+
+FIXTURE = {
+    'index.html': '''<html><body>
+<button id="nextBtn" onclick="Nav.next()">Next</button>
+<button onclick="LazyLoader.loadModule('reports').then(() => ReportsUI.open())">Reports</button>
+<button onclick="Settings.open()">Settings</button>
+<script src="js/core.js"></script>
+<script src="js/format.js"></script>
+<script src="js/nav.js"></script>
+<script src="js/keys.js"></script>
+<script src="js/prefs.js"></script>
+<script src="js/settings.js"></script>
+<script src="js/reports.js"></script>
+<script src="js/extras.js"></script>
+<script src="js/utils/lazy-loader.js"></script>
+</body></html>
+''',
+    'css/reports.css': '.reports {}\n',
+    'js/core.js': 'window.Core = { chapter: 0 };\n',
+    'js/format.js': 'const Format = { title(n) { return "Chapter " + n; } };\n',
+    'js/nav.js': '''const Nav = {
+  next() { Core.chapter += 1; return Format.title(Core.chapter); }
+};
+window.Nav = Nav;
+''',
+    'js/keys.js': "document.addEventListener('keydown', () => Nav.next());\n",
+    'js/prefs.js': 'const Prefs = { get(key) { return null; } };\n',
+    'js/settings.js': "const Settings = { open() { return Prefs.get('theme') || Core.chapter; } };\n",
+    'js/extras.js': 'const Extras = { tip() { return ""; } };\n',
+    'js/reports.js': 'const Reports = { rows() { return []; } };\n',
+    'js/ui/reports-ui.js': 'const ReportsUI = { open() { return Reports.rows(); } };\n',
+    'js/unused.js': 'const Unused = 1;\n',
+    'js/utils/lazy-loader.js': '''const LazyLoader = (function() {
+    const modules = {
+        reports: {
+            files: ['js/reports.js'],
+            css: ['css/reports.css']
+        },
+        old: { files: ['js/gone.js'], css: ['css/gone.css'] }
+    };
+    return { loadModule: () => Promise.resolve() };
+})();
+window.LazyLoader = LazyLoader;
+''',
+}
+
+# What dom_harness.js reports for the fixture after one click on #nextBtn
+USAGE = {
+    'usage': {
+        'js/core.js': {'phase': 'interaction'},
+        'js/format.js': {'phase': 'interaction'},
+        'js/nav.js': {'phase': 'interaction'},
+        HANDLERS: {'phase': 'interaction'},
+    },
+    'installs': {'js/keys.js': {'listeners': 1, 'timers': 0}},
+}
+
+
+def test_partition_fixture():
+    """Used and handler-reached modules stay eager, call sites get groups"""
+    print("🧪 Testing partition on a fixture page")
+    with tempfile.TemporaryDirectory() as root:
+        write_tree(root, FIXTURE)
+        graph = build_graph(root)
+        loader = os.path.join(root, LAZY_LOADER_PATH)
+        with open(loader) as f:
+            previous = read_manifest(f.read())
+        sites = call_sites(FIXTURE['index.html'])
+        assert sites == {'reports': {'ReportsUI'}}, f"Unexpected call sites: {sites}"
+
+        result = partition(graph, USAGE, sites, previous, root)
+        for name in ['js/core.js', 'js/format.js', 'js/nav.js', 'js/keys.js', 'js/prefs.js',
+                     'js/settings.js', 'js/extras.js', LAZY_LOADER_PATH]:
+            assert name in result.eager, f"{name} should be eager"
+        assert 'js/reports.js' not in result.eager, "Script only a call site reaches should be lazy"
+        assert result.reasons['js/keys.js'] == 'installs listeners or timers at load'
+        assert result.reasons['js/settings.js'] == 'called from index.html', \
+            "A handler outside a loadModule() call site runs at first interaction"
+        assert result.reasons['js/prefs.js'] == 'needed by js/settings.js'
+        assert result.reasons['js/extras.js'] == 'tagged in index.html, no loadModule() call site loads it'
+        print(f"   ✓ {len(result.eager)} eager modules")
+
+        assert result.groups['reports'] == {'files': ['js/reports.js', 'js/ui/reports-ui.js'],
+                                            'css': ['css/reports.css']}, result.groups
+        assert list(result.groups) == ['reports'], "Groups are only emitted for call sites"
+        assert result.dropped_groups == ['old']
+        assert result.deferred_tags == ['js/reports.js']
+        assert result.unreferenced == ['js/unused.js']
+        print("   ✓ Call-site groups only, previous CSS kept")
+
+        shared = dict(sites, admin={'Reports'})
+        result = partition(graph, USAGE, shared, previous, root)
+        assert 'js/reports.js' in result.eager, "A tagged module two groups share should stay eager"
+        assert result.groups['reports']['files'] == ['js/ui/reports-ui.js']
+        assert result.deferred_tags == []
+        print("   ✓ Shared tagged module stays eager")
+        result = partition(graph, USAGE, sites, previous, root)
+
+        assert write_manifest(loader, result.groups), "Manifest should change"
+        with open(loader) as f:
+            content = f.read()
+        assert read_manifest(content) == result.groups, "Rendered manifest does not parse back"
+        assert content.endswith("return { loadModule: () => Promise.resolve() };\n})();\n"
+                                "window.LazyLoader = LazyLoader;\n"), "Code around the manifest changed"
+        assert not write_manifest(loader, result.groups), "Rewriting the same groups should be a no-op"
+        print("   ✓ Manifest written in place and idempotent")
+
+
+def test_harness_usage():
+    """dom_harness.js sees function calls, data reads and load-time listeners"""
+    print("🧪 Testing dom_harness.js usage on the fixture page")
+    if shutil.which('node') is None:
+        print("   ⚠️  node not available, skipping")
+        return
+    with tempfile.TemporaryDirectory() as root:
+        write_tree(root, FIXTURE)
+        report = run_harness(root)
+
+    usage = report['usage']
+    assert usage['js/nav.js']['phase'] == 'interaction', usage
+    assert usage['js/core.js']['phase'] == 'interaction', "Data-only global read was not recorded"
+    assert 'js/settings.js' not in usage
+    assert report['installs']['js/keys.js']['listeners'] == 1
+    assert all(s['loaded'] for s in report['scripts']), report['scripts']
+    print(f"   ✓ {len(usage)} modules used, no load errors")
+
+
+def test_committed_manifest_is_current():
+    """js/utils/lazy-loader.js matches a fresh partition of index.html"""
+    print("🧪 Testing committed LazyLoader manifest is up to date")
+    if shutil.which('node') is None:
+        print("   ⚠️  node not available, skipping")
+        return
+    report = run_harness(ROOT)
+    failed = [s for s in report['scripts'] if not s['loaded'] and not s.get('external')]
+    assert not failed, f"Scripts failed to load: {failed}"
+
+    graph = build_graph(ROOT)
+    with open(os.path.join(ROOT, LAZY_LOADER_PATH)) as f:
+        current = read_manifest(f.read())
+    with open(os.path.join(ROOT, 'index.html')) as f:
+        sites = call_sites(f.read())
+    result = partition(graph, report, sites, current, ROOT)
+    assert result.groups == current, \
+        "js/utils/lazy-loader.js is stale - run scripts/dev/partition_modules.py"
+    for group in sites:
+        assert group in current, f"index.html loads unknown group {group}"
+    print(f"   ✓ {len(current)} groups, {len(result.eager)} eager modules")
+
+
+if __name__ == '__main__':
+    test_partition_fixture()
+    test_harness_usage()
+    test_committed_manifest_is_current()
+    print("\n✓ All tests passed!")
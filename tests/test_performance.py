@@ -3,24 +3,39 @@
 Test script for Performance Optimization System
 """
 
-import requests
+import os
+import sys
+
 import json
-import time
 
-def test_performance_system():
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'python'))
+
+from asset_fetcher import AssetFetcher, summarize
+from static_server import StaticServer
+
+def test_performance_system(static_server):
     """Test the performance system functionality"""
     
     print("🧪 Testing Performance Optimization System")
     print("=" * 50)
     
-    # Wait for server to start
-    time.sleep(2)
+    paths = ['index.html', 'js/modules/performance.js', 'js/ui/performance-ui.js', 'css/performance.css']
     
     try:
+        # Fetch the page and its assets in one parallel sweep
+        with AssetFetcher(static_server.url) as fetcher:
+            assets = fetcher.fetch_all(paths)
+            summary = summarize(assets, fetcher.last_sweep['wall'])
+        print(f"\n📈 Fetched {summary['assets']} files in {summary['wall_ms']:.1f} ms "
+              f"({summary['latency_sum_ms']:.1f} ms summed), {summary['bytes'] / 1024:.1f} KB sent")
+        for asset in assets.values():
+            print(f"  - {asset.path}: {asset.size / 1024:.1f} KB {asset.encoding} "
+                  f"({asset.ratio:.0%}), {asset.latency * 1000:.1f} ms")
+        
         # Test 1: Check if index.html loads
         print("\n✅ Test 1: Checking if index.html loads...")
-        response = requests.get('http://localhost:9003/index.html')
-        assert response.status_code == 200, "Failed to load index.html"
+        response = assets['index.html']
+        assert response.status == 200, "Failed to load index.html"
         print("   ✓ index.html loaded successfully")
         
         # Test 2: Check if performance.js is included
@@ -40,12 +55,12 @@ def test_performance_system():
         
         # Load JavaScript files for further tests
         print("\n✅ Test 5: Loading JavaScript files...")
-        response_js = requests.get('http://localhost:9003/js/modules/performance.js')
-        assert response_js.status_code == 200, "Failed to load performance.js"
+        response_js = assets['js/modules/performance.js']
+        assert response_js.status == 200, "Failed to load performance.js"
         print("   ✓ performance.js loaded successfully")
         
-        response_ui = requests.get('http://localhost:9003/js/ui/performance-ui.js')
-        assert response_ui.status_code == 200, "Failed to load performance-ui.js"
+        response_ui = assets['js/ui/performance-ui.js']
+        assert response_ui.status == 200, "Failed to load performance-ui.js"
         print("   ✓ performance-ui.js loaded successfully")
         
         # Test 6: Check if Performance namespace is exported
@@ -74,8 +89,8 @@ def test_performance_system():
         
         # Test 10: Check CSS styles
         print("\n✅ Test 10: Checking CSS styles...")
-        response_css = requests.get('http://localhost:9003/css/performance.css')
-        assert response_css.status_code == 200, "Failed to load performance.css"
+        response_css = assets['css/performance.css']
+        assert response_css.status == 200, "Failed to load performance.css"
         
         css_classes = ['.performance-content', '.metrics-grid', '.metric-card', '.loading-indicator']
         for css_class in css_classes:
@@ -96,5 +111,6 @@ def test_performance_system():
         return False
 
 if __name__ == '__main__':
-    success = test_performance_system()
+    with StaticServer(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')) as server:
+        success = test_performance_system(server)
     exit(0 if success else 1)
\ No newline at end of file
@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""
+Test script for the pool metrics index and chapter word-count prediction
+"""
+
+import itertools
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'scripts', 'dev'))
+
+from pool_metrics import ChapterPredictor, build_index, draw_distribution, entry_metrics, pad
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+
+SIMULATE_SCRIPT = '''
+const fs = require('fs');
+const vm = require('vm');
+const [root, count] = process.argv.slice(2);
+const context = vm.createContext({ console, window: {}, document: { addEventListener: () => {} } });
+for (const file of ['backstory-engine.js', 'story-engine.js']) {
+  vm.runInContext(fs.readFileSync(root + '/' + file, 'utf8'), context);
+}
+const stats = {};
+for (let i = 0; i < Number(count); i++) {
+  const chapter = context.window.StoryEngine.generateChapter();
+  const key = chapter.type + '/' + chapter.setting;
+  (stats[key] = stats[key] || []).push(chapter.wordCount);
+}
+console.log(JSON.stringify(stats));
+'''
+
+
+def test_entry_metrics():
+    """Placeholders count as one word and are counted separately"""
+    print("🧪 Testing per-entry metrics")
+    words, sentences, placeholders = entry_metrics("I met ${char.name} in [REGION]. It rained! We left.")
+    assert words == 9, f"Expected 9 words, got {words}"
+    assert sentences == 3, f"Expected 3 sentences, got {sentences}"
+    assert placeholders == 2, f"Expected 2 placeholders, got {placeholders}"
+    print("   ✓ words, sentences and placeholders counted")
+
+
+def test_distributions_match_brute_force():
+    """Draws without replacement and the padding loop match enumeration"""
+    print("🧪 Testing distributions against brute force")
+    words = [10, 20, 20, 40]
+    pairs = list(itertools.combinations(words, 2))
+    expected = {}
+    for pair in pairs:
+        expected[sum(pair)] = expected.get(sum(pair), 0) + 1 / len(pairs)
+    got = draw_distribution(words, 2)
+    assert set(got) == set(expected) and all(abs(got[w] - expected[w]) < 1e-12 for w in got), \
+        f"Unexpected draw distribution: {got}"
+
+    paragraph = {30: 0.5, 70: 0.5}
+
+    def brute(total, probability, out):
+        if total >= 100:
+            out[total] = out.get(total, 0) + probability
+            return
+        for w, p in paragraph.items():
+            brute(total + w, probability * p, out)
+
+    exact = {}
+    brute(20, 1.0, exact)
+    final, padding = pad({20: 1.0}, paragraph, target=100)
+    assert all(abs(final[w] - exact[w]) < 1e-12 for w in exact) and set(final) == set(exact), \
+        f"Padding distribution mismatch: {final} vs {exact}"
+    assert padding > 1, f"Expected more than one padding paragraph on average, got {padding}"
+    print(f"   ✓ {len(exact)} padded totals match enumeration")
+
+
+def test_predictions_match_generated_chapters():
+    """Long-run predictions agree with chapters generated by the engine"""
+    print("🧪 Testing predictions against generated chapters")
+    if shutil.which('node') is None:
+        print("   ⚠️  node not available, skipping")
+        return
+
+    cwd = os.getcwd()
+    os.chdir(ROOT)
+    try:
+        predictor = ChapterPredictor(build_index())
+    finally:
+        os.chdir(cwd)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        script_path = os.path.join(tmp, 'simulate.js')
+        with open(script_path, 'w') as f:
+            f.write(SIMULATE_SCRIPT)
+        result = subprocess.run(['node', script_path, ROOT, '1500'], capture_output=True, text=True, timeout=300)
+        assert result.returncode == 0, f"Simulation failed: {result.stderr}"
+        observed = json.loads(result.stdout)
+
+    checked = 0
+    for key, counts in observed.items():
+        if len(counts) < 20:
+            continue
+        chapter_type, setting = key.split('/')
+        predicted = predictor.predict(chapter_type, setting, 'exhausted')['mean']
+        actual = sum(counts) / len(counts)
+        assert abs(predicted - actual) / actual < 0.1, f"{key}: predicted {predicted}, generated {actual:.1f}"
+        checked += 1
+    assert checked >= 10, f"Only {checked} chapter types had enough samples"
+    print(f"   ✓ {checked} chapter types within 10% of generated means")
+
+
+if __name__ == '__main__':
+    test_entry_metrics()
+    test_distributions_match_brute_force()
+    test_predictions_match_generated_chapters()
+    print("\n✓ All tests passed!")
@@ -3,23 +3,28 @@
 Test script for Reading History System
 """
 
+import os
+import sys
+
 import requests
 import json
-import time
 
-def test_reading_history_system():
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'python'))
+
+from static_server import StaticServer
+
+def test_reading_history_system(static_server):
     """Test the reading history system functionality"""
     
     print("🧪 Testing Reading History System")
     print("=" * 50)
     
-    # Wait for server to start
-    time.sleep(2)
+    base = static_server.url
     
     try:
         # Test 1: Check if index.html loads
         print("\n✅ Test 1: Checking if index.html loads...")
-        response = requests.get('http://localhost:9003/index.html')
+        response = requests.get(f'{base}/index.html')
         assert response.status_code == 200, "Failed to load index.html"
         print("   ✓ index.html loaded successfully")
         
@@ -45,11 +50,11 @@ def test_reading_history_system():
         
         # Load JavaScript files for further tests
         print("\n✅ Test 6: Loading JavaScript files...")
-        response_js = requests.get('http://localhost:9003/js/modules/reading-history.js')
+        response_js = requests.get(f'{base}/js/modules/reading-history.js')
         assert response_js.status_code == 200, "Failed to load reading-history.js"
         print("   ✓ reading-history.js loaded successfully")
         
-        response_ui = requests.get('http://localhost:9003/js/ui/reading-history-ui.js')
+        response_ui = requests.get(f'{base}/js/ui/reading-history-ui.js')
         assert response_ui.status_code == 200, "Failed to load reading-history-ui.js"
         print("   ✓ reading-history-ui.js loaded successfully")
         
@@ -79,7 +84,7 @@ def test_reading_history_system():
         
         # Test 11: Check CSS styles
         print("\n✅ Test 11: Checking CSS styles...")
-        response_css = requests.get('http://localhost:9003/css/reading-history.css')
+        response_css = requests.get(f'{base}/css/reading-history.css')
         assert response_css.status_code == 200, "Failed to load reading-history.css"
         
         css_classes = ['.reading-history-content', '.stats-grid', '.stat-card', '.history-item']
@@ -101,5 +106,6 @@ def test_reading_history_system():
         return False
 
 if __name__ == '__main__':
-    success = test_reading_history_system()
+    with StaticServer(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')) as server:
+        success = test_reading_history_system(server)
     exit(0 if success else 1)
\ No newline at end of file
@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+"""
+Test script for the debugger status channel, log following and resumable checks
+"""
+
+import json
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'python'))
+
+from continuous_debugger import ContinuousDebugger
+from run_debugger import DebuggerRunner
+
+FAKE_DEBUGGER = '''import json, signal, sys, time
+
+def stop(signum, frame):
+    raise KeyboardInterrupt
+
+signal.signal(signal.SIGTERM, stop)
+status_file = sys.argv[sys.argv.index('--status-file') + 1]
+with open(status_file, 'w') as f:
+    json.dump({'state': 'running', 'pid': __import__('os').getpid(), 'section': 1, 'updated': 'now',
+               'current': {'id': 'syntax_check', 'name': 'JavaScript Syntax Validation', 'started': '2026-01-01T00:00:00'},
+               'progress': {'completed': 1, 'total': 4, 'section_done': 1, 'section_total': 2, 'left_this_run': 3},
+               'issues': {'total': 2, 'critical': 1, 'high': 0, 'medium': 1, 'low': 0}, 'eta_seconds': 90}, f)
+try:
+    for line in range(1000):
+        print(f'line {line}')
+        time.sleep(0.05)
+except KeyboardInterrupt:
+    print('interrupted')
+'''
+
+
+def test_status_written_by_debugger():
+    """The debugger publishes the current check, progress, issues and ETA"""
+    print("🧪 Testing debugger status")
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as root:
+        os.chdir(root)
+        try:
+            debugger = ContinuousDebugger(max_tests_per_section=2, status_file='status.json')
+            debugger.web_search_enabled = False
+            calls = []
+            debugger.run_syntax_check = lambda: calls.append(json.load(open('status.json'))) or [
+                {'title': 'Broken', 'severity': 'critical', 'location': 'a.js', 'description': 'x'}]
+            debugger.run_html_validation = lambda: calls.append(json.load(open('status.json'))) or []
+            debugger.run_continuous(sections_to_run=1)
+
+            assert [call['current']['id'] for call in calls] == ['syntax_check', 'html_validation']
+            assert calls[0]['eta_seconds'] is None and calls[1]['eta_seconds'] is not None
+            assert calls[1]['progress']['section_done'] == 1 and calls[1]['progress']['left_this_run'] == 1
+            print("   ✓ Each check is announced with progress; ETA once one has finished")
+
+            with open('status.json') as f:
+                status = json.load(f)
+            assert status['state'] == 'finished' and status['current'] is None
+            assert status['pid'] == os.getpid() and status['progress']['completed'] == 2
+            assert status['issues'] == {'total': 1, 'critical': 1, 'high': 0, 'medium': 0, 'low': 0}
+            assert status['progress']['left_this_run'] == 0 and status['eta_seconds'] == 0
+        finally:
+            os.chdir(cwd)
+    print("   ✓ Final status has the issue counts and nothing left")
+
+
+def test_runner_follow_and_stop():
+    """status reads the JSON, the log is followed by offset and stop does not sleep"""
+    print("🧪 Testing runner status, follow and stop")
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as root:
+        os.chdir(root)
+        try:
+            with open('continuous_debugger.py', 'w') as f:
+                f.write(FAKE_DEBUGGER)
+            runner = DebuggerRunner()
+            assert runner.start()
+            deadline = time.monotonic() + 10
+            while runner.read_status() is None and time.monotonic() < deadline:
+                time.sleep(0.05)
+            status = runner.read_status()
+            assert status['state'] == 'running' and status['pid'] == runner.process.pid
+            assert runner.status() is True
+            print("   ✓ status reports the structured state of the live process")
+
+            while os.path.getsize(runner.log_file) < 200 and time.monotonic() < deadline:
+                time.sleep(0.05)
+            text, offset = runner.read_tail(3)
+            assert len(text.splitlines()) == 3 and offset == os.path.getsize(runner.log_file)
+            time.sleep(0.2)
+            data, following = runner.read_from(offset)
+            assert data.startswith(b'line ') and following == offset + len(data)
+            assert runner.read_from(following + 10 ** 6)[1] > 0
+            print("   ✓ tail reads backwards from the end; follow reads only new bytes")
+
+            start = time.monotonic()
+            assert runner.stop()
+            assert time.monotonic() - start < 1.5
+            assert not os.path.exists(runner.pid_file)
+            assert runner.read_status()['state'] == 'died'
+            assert runner.read_tail(1)[0] == 'interrupted'
+        finally:
+            os.chdir(cwd)
+    print("   ✓ stop returns as soon as the debugger exits")
+
+
+def test_interrupted_check_resumes():
+    """A check interrupted mid-scan keeps its findings and resumes at the next file"""
+    print("🧪 Testing resumable checks")
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as root:
+        os.chdir(root)
+        try:
+            os.makedirs('js')
+            for index, name in enumerate('abcde'):
+                with open(os.path.join('js', f'{name}.js'), 'w') as f:
+                    f.write('console.log("x");\n' * (index + 1))
+            check = {'id': 'console_error_check', 'name': 'Console Errors', 'function': 'run_console_error_check'}
+            expected = ContinuousDebugger(status_file=None, checkpoint_file=None).run_test(check)
+            assert len(expected) == 15
+
+            debugger = ContinuousDebugger(status_file='status.json', checkpoint_file='checkpoint.json')
+            debugger.checkpoint_interval = 60
+            scan = debugger.checkpointed
+
+            def interrupted(files, issues, part=None):
+                for index, path in enumerate(scan(files, issues, part)):
+                    if index == 2:
+                        raise KeyboardInterrupt
+                    yield path
+
+            debugger.checkpointed = interrupted
+            try:
+                debugger.run_test(check)
+                assert False, 'not interrupted'
+            except KeyboardInterrupt:
+                pass
+            with open('checkpoint.json') as f:
+                saved = json.load(f)['checks']['console_error_check']
+            assert saved['last'] == os.path.join('js', 'b.js') and saved['position'] == 2
+            assert len(saved['issues']) == 3
+            print("   ✓ Cursor and findings are saved when the scan is interrupted")
+
+            resumed = ContinuousDebugger(status_file='status.json', checkpoint_file='checkpoint.json')
+            opened = []
+            scan = resumed.checkpointed
+            resumed.checkpointed = lambda files, issues, part=None: (
+                opened.append(path) or path for path in scan(files, issues, part))
+            assert resumed.run_test(check) == expected
+            assert opened == [os.path.join('js', name) for name in ('c.js', 'd.js', 'e.js')]
+            print("   ✓ The restarted check scans only the rest and reports every finding")
+
+            resumed.issues_found = expected
+            resumed.clear_checkpoint('console_error_check')
+            restarted = ContinuousDebugger(status_file=None, checkpoint_file='checkpoint.json')
+            assert restarted.checkpoint['checks'] == {} and restarted.issues_found == expected
+        finally:
+            os.chdir(cwd)
+    print("   ✓ A finished check drops its cursor; the run's findings carry over")
+
+
+if __name__ == '__main__':
+    test_status_written_by_debugger()
+    test_runner_follow_and_stop()
+    test_interrupted_check_resumes()
+    print("\n✓ All tests passed!")
@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+"""
+Test script for the fix_*.py snapshot runner
+"""
+
+import hashlib
+import os
+import sys
+import tempfile
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'scripts', 'dev'))
+
+from run_fixers import commit, run_fixers, snapshot_digests, unified_diff
+
+# Fixers written the way the real ones are: plain scripts that rewrite files in place
+FIXERS = {
+    'fix_append.py': '''
+with open('js/a.js', 'a', encoding='utf-8') as f:
+    f.write('appended();\\n')
+print('appended')
+''',
+    'fix_upper.py': '''
+import os
+with open('/workspace/js/a.js') as f:
+    content = f.read()
+with open('js/b.js', 'w') as f:
+    f.write(content.upper())
+assert os.path.exists('js/b.js')
+''',
+    'fix_check.py': '''
+import subprocess
+result = subprocess.run(['cat', 'js/b.js'], capture_output=True, text=True)
+with open('check.txt', 'w') as f:
+    f.write(result.stdout)
+''',
+    'fix_broken.py': '''
+with open('js/c.js', 'w') as f:
+    f.write('partial')
+raise ValueError('boom')
+''',
+}
+
+
+def write_tree(root):
+    scripts = []
+    for name, source in FIXERS.items():
+        path = os.path.join(root, 'scripts', name)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, 'w') as f:
+            f.write(source)
+        scripts.append(path)
+    os.makedirs(os.path.join(root, 'js'))
+    with open(os.path.join(root, 'js', 'a.js'), 'w') as f:
+        f.write('start();\n')
+    return scripts
+
+
+def test_snapshot_run():
+    """Fixers see each other's changes in order while the tree stays untouched"""
+    print("🧪 Testing fixers over an in-memory snapshot")
+    with tempfile.TemporaryDirectory() as root:
+        scripts = write_tree(root)
+        results, changes = run_fixers(root, scripts, jobs=2)
+
+        by_name = {r['fixer']: r for r in results}
+        assert by_name['fix_append.py']['ok'] and 'appended' in by_name['fix_append.py']['output']
+        assert by_name['fix_upper.py']['rerun'], "Reader of a changed file must be re-run"
+        assert not by_name['fix_broken.py']['ok'] and 'boom' in by_name['fix_broken.py']['error']
+        assert changes == {'js/a.js': b'start();\nappended();\n',
+                           'js/b.js': b'START();\nAPPENDED();\n',
+                           'check.txt': b'START();\nAPPENDED();\n'}, changes
+        print("   ✓ Ordered results, /workspace paths and subprocess checks see the snapshot")
+
+        with open(os.path.join(root, 'js', 'a.js')) as f:
+            assert f.read() == 'start();\n', "Dry run must not write"
+        assert not os.path.exists(os.path.join(root, 'js', 'b.js'))
+        diff = unified_diff(root, changes)
+        assert '--- a/js/a.js' in diff and '+appended();' in diff and '--- /dev/null' in diff
+        print("   ✓ Tree untouched, unified diff preview")
+
+        commit(root, changes, snapshot_digests(results))
+        with open(os.path.join(root, 'js', 'b.js')) as f:
+            assert f.read() == 'START();\nAPPENDED();\n'
+        assert not os.path.exists(os.path.join(root, 'js', 'c.js')), "Failed fixer must not write"
+        assert not [n for n in os.listdir(os.path.join(root, 'js')) if n.startswith('.fixers-')]
+    print("   ✓ Changes committed in one pass")
+
+
+LISTING_FIXERS = {
+    'fix_create.py': '''
+import os
+os.makedirs('js/new', exist_ok=True)
+with open('js/new/d.js', 'w') as f:
+    f.write('created();\\n')
+os.remove('js/old.js')
+''',
+    'fix_banner.py': '''
+import os
+from pathlib import Path
+for path in sorted(Path('js').rglob('*.js')):
+    path.write_text('// checked\\n' + path.read_text())
+print(sorted(os.listdir('js')), Path('js/old.js').exists(), Path('js/new/d.js').is_file())
+''',
+}
+
+
+def test_directory_listings():
+    """rglob, listdir and exists see files created and deleted by earlier fixers"""
+    print("🧪 Testing directory listings over the snapshot")
+    with tempfile.TemporaryDirectory() as root:
+        scripts = []
+        for name, source in LISTING_FIXERS.items():
+            scripts.append(os.path.join(root, 'scripts', name))
+            os.makedirs(os.path.dirname(scripts[-1]), exist_ok=True)
+            with open(scripts[-1], 'w') as f:
+                f.write(source)
+        os.makedirs(os.path.join(root, 'js'))
+        for name in ('a.js', 'old.js'):
+            with open(os.path.join(root, 'js', name), 'w') as f:
+                f.write('start();\n')
+
+        results, changes = run_fixers(root, scripts, jobs=2)
+        banner = results[1]
+        assert banner['ok'] and banner['rerun'], "A fixer listing a changed directory must be re-run"
+        assert "['a.js', 'new'] False True" in banner['output'], banner['output']
+        assert 'js' in banner['listed'] and 'js/new' in banner['listed']
+        assert changes == {'js/a.js': b'// checked\nstart();\n',
+                           'js/new/d.js': b'// checked\ncreated();\n',
+                           'js/old.js': None}, changes
+        assert not os.path.exists(os.path.join(root, 'js', 'new')), "Dry run must not create directories"
+    print("   ✓ Created files are listed, deleted files are not")
+
+
+def test_commit_refuses_stale_tree():
+    """A file edited on disk during the run aborts the whole commit"""
+    print("🧪 Testing commit against a tree changed during the run")
+    with tempfile.TemporaryDirectory() as root:
+        scripts = write_tree(root)
+        results, changes = run_fixers(root, scripts[:2], jobs=2)
+        with open(os.path.join(root, 'js', 'a.js'), 'w') as f:
+            f.write('edited by hand\n')
+        try:
+            commit(root, changes, snapshot_digests(results))
+        except RuntimeError as e:
+            assert 'js/a.js' in str(e)
+        else:
+            raise AssertionError("Stale snapshot should not be committed")
+        assert not os.path.exists(os.path.join(root, 'js', 'b.js')), "Nothing may be written"
+        with open(os.path.join(root, 'js', 'a.js'), 'rb') as f:
+            assert hashlib.sha256(f.read()).hexdigest() == hashlib.sha256(b'edited by hand\n').hexdigest()
+    print("   ✓ Nothing written")
+
+
+if __name__ == '__main__':
+    test_snapshot_run()
+    test_directory_listings()
+    test_commit_refuses_stale_tree()
+    print("\n✓ All tests passed!")
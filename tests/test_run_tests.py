@@ -0,0 +1,192 @@
+#!/usr/bin/env python3
+"""
+Test script for the parallel test runner
+"""
+
+import json
+import os
+import sys
+import tempfile
+import xml.etree.ElementTree as ET
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'python'))
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'scripts', 'dev'))
+
+from duration_history import DurationHistory
+from fixture_tree import write_tree
+from run_tests import discover, merge_results, record_durations, run_tasks, select, shard, to_junit
+
+FIXTURE = {
+    'index.html': '<html><body>fixture page</body></html>\n',
+    'tests/test_functions.py': '''import sys
+import time
+from urllib.request import urlopen
+
+def test_passes():
+    print("\\u2705 fine")
+
+def test_returns_false():
+    print("\\x1b[91mbroken\\x1b[0m")
+    return False
+
+def test_asserts():
+    assert 1 + 1 == 3, "math is off"
+
+def test_raises():
+    raise KeyError("missing")
+
+def test_exits_cleanly():
+    sys.exit(0)
+
+def test_exits_with_status():
+    sys.exit(1)
+
+def test_slow():
+    time.sleep(5)
+
+def test_file_exists(filepath):
+    return False
+
+def test_served(static_server):
+    with urlopen(static_server.url + "/index.html") as response:
+        assert b"fixture page" in response.read()
+''',
+    'tests/test_tester.py': '''class SampleTester:
+    def __init__(self, base_url="http://localhost:8080"):
+        self.base_url = base_url
+        self.test_results = []
+
+    def log_test(self, test_name, passed, message=""):
+        self.test_results.append({"test": test_name, "passed": passed, "message": message})
+
+    def run_all_tests(self):
+        self.log_test("Served", self.base_url.startswith("http://127.0.0.1:"), self.base_url)
+        self.log_test("Broken", False, "expected failure")
+        return all(result["passed"] for result in self.test_results)
+''',
+    'tests/python/test_entry.py': '''def main():
+    print("Failed: 1")
+    return 1
+
+if __name__ == "__main__":
+    main()
+''',
+    'tests/python/helper.py': 'def test_not_collected():\n    return False\n',
+    'scripts/dev/test_broken.py': 'def test_x(:\n',
+    'scripts/dev/test_import_error.py': 'import module_that_does_not_exist\n\ndef test_x():\n    pass\n',
+}
+
+EXPECTED = {
+    'tests/test_functions.py::test_passes': 'passed',
+    'tests/test_functions.py::test_returns_false': 'failed',
+    'tests/test_functions.py::test_asserts': 'failed',
+    'tests/test_functions.py::test_raises': 'error',
+    'tests/test_functions.py::test_exits_cleanly': 'passed',
+    'tests/test_functions.py::test_exits_with_status': 'failed',
+    'tests/test_functions.py::test_slow': 'error',
+    'tests/test_functions.py::test_served': 'passed',
+    'tests/test_tester.py::SampleTester': 'failed',
+    'tests/python/test_entry.py::main': 'failed',
+    'scripts/dev/test_broken.py::<module>': 'error',
+    'scripts/dev/test_import_error.py::<module>': 'error',
+}
+
+
+def test_discovery_and_outcomes():
+    """Functions, entry points and tester classes run with structured outcomes"""
+    print("🧪 Testing discovery and outcomes")
+    with tempfile.TemporaryDirectory() as root:
+        write_tree(root, FIXTURE)
+        found = discover(root=root)
+        assert 'tests/python/helper.py' not in found
+        assert 'test_file_exists' not in [unit['name'] for unit in found['tests/test_functions.py']]
+        assert [unit['name'] for unit in found['tests/python/test_entry.py']] == ['main']
+        print("   ✓ Helpers taking arguments and non-test files are not collected")
+
+        cwd = os.getcwd()
+        inline = run_tasks(list(found.items()), jobs=0, timeout=1, root=root)
+        assert os.getcwd() == cwd
+        outcomes = {test['id']: test['outcome'] for test in inline['tests']}
+        assert outcomes == EXPECTED, outcomes
+        assert inline['summary'] == dict(inline['summary'], tests=12, passed=3, failed=5, error=4, skipped=0)
+        print("   ✓ Returned False, asserts, exit codes, errors, timeouts and import failures")
+
+        tests = {test['id']: test for test in inline['tests']}
+        assert tests['tests/test_functions.py::test_asserts']['message'] == 'math is off'
+        assert tests['tests/test_functions.py::test_slow']['message'] == 'TestTimeout: timed out after 1s'
+        assert tests['tests/test_functions.py::test_returns_false']['output'] == 'broken\n'
+        assert 'output' not in tests['tests/test_functions.py::test_passes']
+        tester = tests['tests/test_tester.py::SampleTester']
+        assert [(sub['name'], sub['outcome']) for sub in tester['subtests']] == [('Served', 'passed'), ('Broken', 'failed')]
+        assert tester['message'] == '1 of 2 checks failed: Broken'
+        print("   ✓ Tester log_test entries become subtests; base_url is the in-process server")
+
+        pooled = run_tasks(list(found.items()), jobs=2, timeout=1, root=root)
+        assert {test['id']: test['outcome'] for test in pooled['tests']} == EXPECTED
+        assert [test['id'] for test in pooled['tests']] == [test['id'] for test in inline['tests']]
+    print("   ✓ Spawned workers give the same results in the same order")
+
+
+def test_reports_and_reruns():
+    """JUnit output, merged saved results and rerun ordering"""
+    print("🧪 Testing reports and reruns")
+    with tempfile.TemporaryDirectory() as root:
+        write_tree(root, FIXTURE)
+        found = discover(root=root)
+        report = run_tasks(list(found.items()), jobs=0, timeout=1, root=root)
+
+        suites = ET.fromstring(to_junit(report))
+        assert (suites.get('tests'), suites.get('failures'), suites.get('errors')) == ('13', '5', '4')
+        cases = {case.get('name'): case for case in suites.iter('testcase')}
+        assert cases['Broken'].find('failure').get('message') == 'expected failure'
+        assert cases['test_raises'].find('error').text.startswith('Traceback')
+        print("   ✓ JUnit XML counts tester checks as test cases")
+
+        saved = merge_results(None, report)
+        assert set(saved['tests'][0]) == {'id', 'file', 'name', 'outcome', 'duration'}
+        json.dumps(saved)
+
+        reruns = select(found, saved, last_failed=True)
+        rerun_ids = [f"{path}::{unit['name']}" for path, units in reruns for unit in units]
+        expected = {test_id for test_id, outcome in EXPECTED.items() if outcome != 'passed'}
+        expected = expected - {'scripts/dev/test_import_error.py::<module>'} | {'scripts/dev/test_import_error.py::test_x'}
+        assert sorted(rerun_ids) == sorted(expected)
+        print("   ✓ --last-failed selects only the failed and errored tests")
+
+        partial = run_tasks(select(discover(root=root, keyword='test_passes'), saved), jobs=0, root=root)
+        merged = {test['id']: test for test in merge_results(saved, partial)['tests']}
+        assert len(merged) == 12 and merged['tests/test_functions.py::test_asserts']['outcome'] == 'failed'
+        print("   ✓ A filtered run keeps the rest of the saved results")
+
+        first = dict(select(found, saved, failed_first=True))
+        names = [unit['name'] for unit in first['tests/test_functions.py']]
+        assert set(names[-3:]) == {'test_passes', 'test_exits_cleanly', 'test_served'}
+        print("   ✓ Failed tests first")
+
+        history = DurationHistory(None, min_samples=1)
+        assert record_durations(history, report) == []
+        assert 'tests/test_functions.py::test_slow' not in history.tests
+        assert 'tests/test_functions.py::test_passes' in history.tests
+        slow = select(found, saved, history=history)
+        assert slow[0][0] == 'tests/test_functions.py'
+        found['tests/test_new.py'] = [{'name': 'test_new', 'kind': 'function', 'params': []}]
+        tasks = select(found, saved, history=history)
+        assert tasks[0][0] == 'tests/test_functions.py' and 'tests/test_new.py' in dict(tasks)
+        print("   ✓ Longest expected files first; timeouts and errors are not recorded")
+
+        shards = [shard(tasks, index, 2, history) for index in (1, 2)]
+        assert sorted(path for part in shards for path, _ in part) == sorted(path for path, _ in tasks)
+        assert shards[0][0][0] == 'tests/test_functions.py' and len(shards[1]) > 1
+        assert shard(tasks, 2, 2, history) == shards[1]
+
+        history.tests['tests/test_functions.py::test_passes'] = [0.01]
+        regressions = record_durations(history, {'tests': [
+            {'id': 'tests/test_functions.py::test_passes', 'outcome': 'passed', 'duration': 0.5}]})
+        assert [r['key'] for r in regressions] == ['tests/test_functions.py::test_passes']
+    print("   ✓ Shards split the files; a test far over its median is a regression")
+
+
+if __name__ == '__main__':
+    test_discovery_and_outcomes()
+    test_reports_and_reruns()
+    print("\n✓ All tests passed!")
@@ -3,23 +3,28 @@
 Test script for Save/Load System
 """
 
+import os
+import sys
+
 import requests
 import json
-import time
 
-def test_save_load_system():
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'python'))
+
+from static_server import StaticServer
+
+def test_save_load_system(static_server):
     """Test the save/load system functionality"""
     
     print("🧪 Testing Save/Load System")
     print("=" * 50)
     
-    # Wait for server to start
-    time.sleep(2)
+    base = static_server.url
     
     try:
         # Test 1: Check if index.html loads
         print("\n✅ Test 1: Checking if index.html loads...")
-        response = requests.get('http://localhost:9003/index.html')
+        response = requests.get(f'{base}/index.html')
         assert response.status_code == 200, "Failed to load index.html"
         print("   ✓ index.html loaded successfully")
         
@@ -45,11 +50,11 @@ def test_save_load_system():
         
         # Load JavaScript files for further tests
         print("\n✅ Test 6: Loading JavaScript files...")
-        response_js = requests.get('http://localhost:9003/js/modules/save-load.js')
+        response_js = requests.get(f'{base}/js/modules/save-load.js')
         assert response_js.status_code == 200, "Failed to load save-load.js"
         print("   ✓ save-load.js loaded successfully")
         
-        response_ui = requests.get('http://localhost:9003/js/ui/save-load-ui.js')
+        response_ui = requests.get(f'{base}/js/ui/save-load-ui.js')
         assert response_ui.status_code == 200, "Failed to load save-load-ui.js"
         print("   ✓ save-load-ui.js loaded successfully")
         
@@ -79,7 +84,7 @@ def test_save_load_system():
         
         # Test 11: Check CSS styles
         print("\n✅ Test 11: Checking CSS styles...")
-        response_css = requests.get('http://localhost:9003/css/save-load.css')
+        response_css = requests.get(f'{base}/css/save-load.css')
         assert response_css.status_code == 200, "Failed to load save-load.css"
         
         css_classes = ['.save-load-content', '.save-slots-grid', '.save-slot', '.tab-btn']
@@ -101,5 +106,6 @@ def test_save_load_system():
         return False
 
 if __name__ == '__main__':
-    success = test_save_load_system()
+    with StaticServer(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')) as server:
+        success = test_save_load_system(server)
     exit(0 if success else 1)
\ No newline at end of file
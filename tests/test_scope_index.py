@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""
+Test script for the one-pass JS scope index used by the fixer scripts
+"""
+
+import os
+import sys
+import tempfile
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'scripts', 'dev'))
+
+import fix_function_declarations
+from cleanup_globals_v2 import extract_declarations
+from fix_deep_nesting_all import find_all_templates
+from scope_index import ScopeIndex
+
+SOURCE = '''// header { not a brace
+const LIMIT = 10;
+function outer(a, b) {
+  const quote = "}";
+  const html = `<p>${a ? `{${b}}` : 'x'}</p>
+    <span>${b}</span>
+  `;
+  const half = (x) => { return x / 2; };
+  const re = /[}{]/g;
+  return { run() { return this; }, other: function () { return re; } };
+}
+let count = 0;
+const later = async value => {
+  let inner = value;
+};
+'''
+
+
+def test_spans_and_brackets():
+    """Literal bodies are recorded and brackets inside them are ignored"""
+    print("🧪 Testing literal spans and bracket pairs")
+    index = ScopeIndex(SOURCE)
+    assert index.kind_at(SOURCE.index('header')) == 'comment'
+    assert index.kind_at(SOURCE.index('"}"') + 1) == 'string'
+    assert index.kind_at(SOURCE.index('[}{]')) == 'regex'
+    assert index.kind_at(SOURCE.index('<span>')) == 'template'
+    assert index.in_code(SOURCE.index('a ?')), "${...} expressions are code"
+    assert index.kind_at(SOURCE.index('{${b}}')) == 'template', "Nested template text"
+
+    open_at = SOURCE.index('{', SOURCE.index('function outer'))
+    close_at = SOURCE.index('\n}\n') + 1
+    assert index.match(open_at) == close_at and index.match(close_at) == open_at
+    assert (open_at, close_at) in index.braces
+    assert len(index.code) == len(SOURCE) and '[}{]' not in index.code
+    print(f"   ✓ {len(index.spans)} spans, {len(index.braces)} brace pairs")
+
+
+def test_functions_and_declarations():
+    """Function boundaries, innermost lookup and top-level names"""
+    print("🧪 Testing function boundaries and declarations")
+    index = ScopeIndex(SOURCE)
+    kinds = [(fn.name, fn.kind) for fn in index.functions]
+    assert kinds == [('outer', 'declaration'), ('half', 'arrow'), ('run', 'method'),
+                     ('other', 'expression'), ('later', 'arrow')], kinds
+    later = index.functions[-1]
+    assert later.is_async and later.params is None and later.parent is None
+
+    assert index.function_at(SOURCE.index('x / 2')).name == 'half'
+    assert index.function_at(SOURCE.index('return re')).name == 'other'
+    assert index.function_at(SOURCE.index("const quote")).name == 'outer'
+    assert index.function_at(SOURCE.index('let count')) is None
+    assert index.body_of(SOURCE.index('this')) == index.functions[2].body
+    print("   ✓ Declarations, expressions, arrows and methods")
+
+    assert index.top_level() == ['LIMIT', 'outer', 'count', 'later']
+    assert extract_declarations(SOURCE) == ['outer', 'LIMIT', 'later', 'count'], \
+        "Locals must not be exported as namespace members"
+    print("   ✓ Only top-level names are exported")
+
+
+def test_template_lines():
+    """Continuation lines of multi-line templates are reported by line"""
+    print("🧪 Testing template line regions")
+    lines = SOURCE.splitlines(True)
+    index = ScopeIndex(SOURCE)
+    assert find_all_templates(lines, index) == [(4, 6, 2)]
+    assert [n for n in range(len(lines)) if index.line_in_template(n)] == [5, 6]
+
+    # A one-line template before a multi-line one must not shift the regions
+    text = 'a(`x ${y}`);\nb = `\n    one\n`;\n'
+    assert ScopeIndex(text).multiline_templates() == [(1, 3)]
+    print("   ✓ Line regions match the literal boundaries")
+
+
+def test_fix_function_declarations():
+    """Headers are rewritten in one pass and unsafe functions are kept"""
+    print("🧪 Testing function declaration fixer on the index")
+    source = '''(function () {
+  function add(a, b) {
+    function inner(c) { return c; }
+    return inner(a) + b;
+  }
+  const wrap = function (x) { return { f(y) { return y; } }; };
+  function Counter() { this.n = 0; }
+  async function load(url) { return url; }
+  callback(function named() { return 1; });
+  const s = "function fake() {";
+})();
+'''
+    with tempfile.TemporaryDirectory() as root:
+        path = os.path.join(root, 'sample.js')
+        with open(path, 'w') as f:
+            f.write(source)
+        assert fix_function_declarations.fix_file(path) == 3
+        with open(path) as f:
+            result = f.read()
+    assert 'const add = (a, b) => {' in result
+    assert 'const inner = (c) => { return c; }' in result
+    assert 'const wrap = (x) => { return { f(y)' in result
+    assert 'function Counter()' in result, "Function using this must be kept"
+    assert 'async function load(url)' in result
+    assert 'callback(function named()' in result, "Function expressions in calls must be kept"
+    assert '"function fake() {"' in result
+    print("   ✓ 3 conversions, unsafe and string matches untouched")
+
+
+if __name__ == '__main__':
+    test_spans_and_brackets()
+    test_functions_and_declarations()
+    test_template_lines()
+    test_fix_function_declarations()
+    print("\n✓ All tests passed!")
@@ -3,23 +3,28 @@
 Test script for Search System
 """
 
+import os
+import sys
+
 import requests
 import json
-import time
 
-def test_search_system():
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'python'))
+
+from static_server import StaticServer
+
+def test_search_system(static_server):
     """Test the search system functionality"""
     
     print("🧪 Testing Search System")
     print("=" * 50)
     
-    # Wait for server to start
-    time.sleep(2)
+    base = static_server.url
     
     try:
         # Test 1: Check if index.html loads
         print("\n✅ Test 1: Checking if index.html loads...")
-        response = requests.get('http://localhost:9003/index.html')
+        response = requests.get(f'{base}/index.html')
         assert response.status_code == 200, "Failed to load index.html"
         print("   ✓ index.html loaded successfully")
         
@@ -45,11 +50,11 @@ def test_search_system():
         
         # Load JavaScript files for further tests
         print("\n✅ Test 6: Loading JavaScript files...")
-        response_js = requests.get('http://localhost:9003/js/modules/search.js')
+        response_js = requests.get(f'{base}/js/modules/search.js')
         assert response_js.status_code == 200, "Failed to load search.js"
         print("   ✓ search.js loaded successfully")
         
-        response_ui = requests.get('http://localhost:9003/js/ui/search-ui.js')
+        response_ui = requests.get(f'{base}/js/ui/search-ui.js')
         assert response_ui.status_code == 200, "Failed to load search-ui.js"
         print("   ✓ search-ui.js loaded successfully")
         
@@ -79,7 +84,7 @@ def test_search_system():
         
         # Test 11: Check CSS styles
         print("\n✅ Test 11: Checking CSS styles...")
-        response_css = requests.get('http://localhost:9003/css/search.css')
+        response_css = requests.get(f'{base}/css/search.css')
         assert response_css.status_code == 200, "Failed to load search.css"
         
         css_classes = ['.search-content', '.search-input-wrapper', '.search-result-item', '.search-highlight']
@@ -101,5 +106,6 @@ def test_search_system():
         return False
 
 if __name__ == '__main__':
-    success = test_search_system()
+    with StaticServer(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')) as server:
+        success = test_search_system(server)
     exit(0 if success else 1)
\ No newline at end of file
@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""
+Test script for the asset size budget tracker
+"""
+
+import json
+import os
+import sys
+import tempfile
+from datetime import datetime
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'scripts', 'dev'))
+
+import size_budget
+from size_budget import (append_run, budget_for, check_budgets, latest, load_history, minify_css, minify_js,
+                         run_check)
+
+
+def test_minifiers():
+    """Built-in minifiers drop comments and whitespace but keep literals"""
+    print("🧪 Testing built-in minifiers")
+    source = '''// header comment
+const greeting = "hello   world"; /* inline */
+function add(a, b) {
+    return a + +b;
+}
+const re = /a  b/g;
+const t = `line one
+    line two`;
+'''
+    result = minify_js(source)
+    assert 'comment' not in result and 'inline' not in result, result
+    assert '"hello   world"' in result and '/a  b/g' in result, "String and regex bodies must be kept"
+    assert '`line one\n    line two`' in result, "Template text must be kept"
+    assert 'a+ +b' in result, f"Unary plus must stay separated: {result}"
+    assert 'function add(a,b){' in result, result
+    assert len(result) < len(source) * 0.75
+
+    css = minify_css('/* theme */\n.a , .b {\n  color : red ;\n}\n')
+    assert css == '.a,.b{color:red}', css
+    print(f"   ✓ {len(source)} -> {len(result)} bytes")
+
+
+def test_history_and_budgets():
+    """Runs store only changes, replay to full snapshots and drive budget checks"""
+    print("🧪 Testing size history and budgets")
+    history = {'format': size_budget.HISTORY_FORMAT, 'runs': []}
+    first = {'a.js': {'sha256': '1', 'raw': 100, 'min': 60, 'gzip': 40, 'brotli': 35},
+             'b.css': {'sha256': '2', 'raw': 50, 'min': 30, 'gzip': 20, 'brotli': None}}
+    assert append_run(history, first, 'builtin', 'abc', datetime(2026, 1, 1))
+    assert not append_run(history, first, 'builtin', 'abc'), "Unchanged sizes must not add a run"
+    second = dict(first, **{'a.js': dict(first['a.js'], sha256='3', raw=150, gzip=60)})
+    del second['b.css']
+    assert append_run(history, second, 'builtin', 'def')
+    assert list(history['runs'][1]['changed']) == ['a.js'] and history['runs'][1]['removed'] == ['b.css']
+    run, state = latest(history)
+    assert run['commit'] == 'def' and state == second
+    assert append_run(history, second, 'terser'), "A new minifier starts a full snapshot"
+    assert list(history['runs'][2]['changed']) == ['a.js']
+    print("   ✓ Delta runs replay to the latest snapshot")
+
+    old_max = size_budget.MAX_RUNS
+    size_budget.MAX_RUNS = 2
+    try:
+        third = {'a.js': dict(second['a.js'], sha256='4', gzip=61)}
+        append_run(history, third, 'terser')
+        assert len(history['runs']) == 2 and latest(history)[1] == third
+        assert 'a.js' in history['runs'][0]['changed'], "First kept run must hold a full snapshot"
+    finally:
+        size_budget.MAX_RUNS = old_max
+    print("   ✓ Old runs fold into the first run kept")
+
+    budgets = {'default': {'js': {'raw': 120}},
+               'files': {'big.js': {'raw': 500}, 'js/*.js': {'gzip': 30}},
+               'total': {'js': {'gzip': 100}}}
+    assert budget_for(budgets, 'big.js') == {'raw': 500}
+    assert budget_for(budgets, 'js/x.js') == {'gzip': 30}
+    assert budget_for(budgets, 'a.js') == {'raw': 120}
+    assert budget_for(budgets, 'a.css') == {}
+    sizes = {'a.js': {'raw': 130, 'gzip': 50}, 'js/x.js': {'raw': 10, 'gzip': 60}}
+    assert check_budgets(budgets, sizes) == [('a.js', 'raw', 130, 120), ('js/x.js', 'gzip', 60, 30),
+                                             ('total js', 'gzip', 110, 100)]
+    print("   ✓ Exact, glob, default and total budgets")
+
+
+def test_run_check():
+    """A full run records history and reports growth against the previous run"""
+    print("🧪 Testing size check on a fixture tree")
+    with tempfile.TemporaryDirectory() as root:
+        os.makedirs(os.path.join(root, 'js'))
+        os.makedirs(os.path.join(root, 'css'))
+        files = {'story-engine.js': 'const pool = ["a", "b"];\n' * 20, 'vite.config.js': 'export default {};\n',
+                 'js/app.js': 'function start() {\n    return 1;\n}\n', 'css/app.css': '.a { color: red; }\n'}
+        for path, content in files.items():
+            with open(os.path.join(root, path), 'w') as f:
+                f.write(content)
+        with open(os.path.join(root, 'size-budgets.json'), 'w') as f:
+            json.dump({'files': {'story-engine.js': {'raw': 1000}}}, f)
+
+        report = run_check(root)
+        assert sorted(report['files']) == ['css/app.css', 'js/app.js', 'story-engine.js'], \
+            "Build config must not count as an asset"
+        assert report['recorded'] and report['baseline'] is None and not report['violations']
+        entry = report['files']['js/app.js']
+        assert entry['min'] < entry['raw'] and entry['gzip'] > 0
+
+        with open(os.path.join(root, 'story-engine.js'), 'a') as f:
+            f.write('const more = "growth from a content expansion script";\n' * 10)
+        report = run_check(root)
+        assert [c['file'] for c in report['changes']] == ['story-engine.js']
+        assert report['violations'][0]['target'] == 'story-engine.js'
+        assert report['files']['js/app.js'] == entry, "Unchanged files reuse their recorded sizes"
+
+        history = load_history(os.path.join(root, 'size-history.json'))
+        assert len(history['runs']) == 2 and list(history['runs'][1]['changed']) == ['story-engine.js']
+    print("   ✓ Growth detected and budget violation reported")
+
+
+if __name__ == '__main__':
+    test_minifiers()
+    test_history_and_budgets()
+    test_run_check()
+    print("\n✓ All tests passed!")
@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+Test script for the index.html startup cost model
+"""
+
+import os
+import shutil
+import sys
+import tempfile
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'scripts', 'dev'))
+
+from module_graph import build_graph
+from startup_model import (HANDSHAKE_RTTS, Resource, build_resources, calibrate, fit_rate, simulate,
+                           simulate_network)
+
+# 8 kbit/s = 1 byte per ms, so transfer times are easy to check by hand
+PROFILE = {'bandwidth_kbps': 8000 / 1024, 'rtt_ms': 10, 'cpu': 2}
+
+FIXTURE = {
+    'index.html': '''<html><body>
+<script src="js/a.js"></script>
+<script>window.inline = true;</script>
+<script src="https://cdn.example.com/lib.js"></script>
+<script src="js/b.js"></script>
+</body></html>
+''',
+    'js/a.js': 'window.A = { run() { return 1; } };\n',
+    'js/b.js': 'window.B = { run() { return A.run() + 1; } };\n',
+}
+
+
+def test_network_and_main_thread():
+    """Transfers share bandwidth and scripts run in order once they arrive"""
+    print("🧪 Testing network waterfall and main thread model")
+    resources = [Resource('one', 'origin', 100, 100), Resource('two', 'origin', 100, 100)]
+    arrivals = simulate_network(resources, PROFILE, 0)
+    assert abs(arrivals[0] - 210) < 1e-6 and abs(arrivals[1] - 210) < 1e-6, \
+        f"Equal transfers should share bandwidth and finish together: {arrivals}"
+
+    resources = [Resource('cdn', 'cdn.example.com', 50, 150), Resource('small', 'origin', 50, 50)]
+    arrivals = simulate_network(resources, PROFILE, 0)
+    assert arrivals[1] < arrivals[0], "CDN script pays for connection setup"
+    assert arrivals[0] >= (HANDSHAKE_RTTS + 1) * PROFILE['rtt_ms'] + 50
+    print("   ✓ Bandwidth sharing and connection setup")
+
+    resources = [Resource('big', 'origin', 300, 300, compile_ms=5, exec_ms=5),
+                 Resource('inline', None, 0, 10, exec_ms=1),
+                 Resource('async', 'cdn.example.com', 1000, 3000, blocking=False)]
+    run = simulate(resources, PROFILE, html_bytes=0, startup_ms=20)
+    timeline = {entry['script']: entry for entry in run['timeline']}
+    assert timeline['inline']['started'] == timeline['big']['finished'], "Inline script waits for its predecessor"
+    assert timeline['big']['finished'] - timeline['big']['started'] == 20, "CPU slowdown applies to compile and exec"
+    assert run['first_chapter'] == run['dom_content_loaded'] + 40
+    assert run['dom_content_loaded'] < timeline['async']['arrived'], "Async script must not block"
+    print("   ✓ Ordered execution, CPU scaling and async scripts")
+
+
+def test_strategies():
+    """Each strategy loads the scripts it should"""
+    print("🧪 Testing loading strategies on a fixture page")
+    assert abs(fit_rate({'a': 100, 'b': 200}, {'a': 1.0, 'b': 2.0}) - 0.01) < 1e-9
+    report = {'scripts': [{'module': 'js/a.js', 'ms': 2.0}, {'module': 'js/b.js', 'ms': 3.0}]}
+    with tempfile.TemporaryDirectory() as root:
+        for path, content in FIXTURE.items():
+            os.makedirs(os.path.dirname(os.path.join(root, path)), exist_ok=True)
+            with open(os.path.join(root, path), 'w') as f:
+                f.write(content)
+        graph = build_graph(root)
+
+        current = build_resources(graph, report, 0.001, 'current', external_kb=10)
+        assert [r.name for r in current] == ['js/a.js', 'index.html#script-1',
+                                             'https://cdn.example.com/lib.js', 'js/b.js']
+        assert current[2].transfer == 10 * 1024 and current[2].blocking
+        assert abs(current[0].exec_ms - (2.0 - 0.001 * current[0].raw)) < 1e-9
+
+        partitioned = build_resources(graph, report, 0.001, 'partitioned', {'js/a.js'})
+        assert 'js/b.js' not in [r.name for r in partitioned], "Lazy module fetched up front"
+
+        bundled = build_resources(graph, report, 0.001, 'bundled', {'js/a.js', 'js/b.js'})
+        assert [r.name for r in bundled][0] == 'bundle.js' and len(bundled) == 3
+        assert bundled[0].exec_ms == current[0].exec_ms + current[3].exec_ms
+
+        async_cdn = build_resources(graph, report, 0.001, 'async-cdn')
+        assert not async_cdn[2].blocking
+    print("   ✓ current, partitioned, bundled and async-cdn")
+
+
+def test_calibration():
+    """vm.Script timing grows with file size"""
+    print("🧪 Testing compile cost calibration")
+    if shutil.which('node') is None:
+        print("   ⚠️  node not available, skipping")
+        return
+    with tempfile.TemporaryDirectory() as root:
+        sizes = {}
+        for name, count in (('small.js', 10), ('large.js', 5000)):
+            body = ''.join(f'function f{i}(x) {{ return x + {i}; }}\n' for i in range(count))
+            with open(os.path.join(root, name), 'w') as f:
+                f.write(body)
+            sizes[name] = len(body)
+        timings = calibrate(root, list(sizes), runs=3)
+    assert set(timings) == set(sizes)
+    assert timings['large.js'] > timings['small.js'], f"Compile time should grow with size: {timings}"
+    assert fit_rate(sizes, timings) > 0
+    print(f"   ✓ {timings['large.js']:.2f} ms for {sizes['large.js'] // 1024} KB")
+
+
+if __name__ == '__main__':
+    test_network_and_main_thread()
+    test_strategies()
+    test_calibration()
+    print("\n✓ All tests passed!")
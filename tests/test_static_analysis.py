@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""
+Test script for the single-pass static analysis engine
+"""
+
+import json
+import os
+import sys
+import tempfile
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'scripts', 'dev'))
+
+import deep_analysis
+from static_analysis import BATCH_RULES, FINDINGS_PATH, RULES, analyze, select, tokenize
+
+SAMPLE_JS = '''(function() {
+  // TODO: remove the eval() below
+  const note = "eval(x) == 1 and console.log('no')";
+  const re = /console\\.log\\(/g;
+  const html = `<b>${name == 1 ? 'a' : "b"}</b> console.warn(`;
+  if (a == b) { console.log(note); }
+  try { run(); } catch (e) {}
+  eval(html);
+  window.Widget = {};
+  window.Widget = {};
+})();
+'''
+
+SAMPLE_HTML = '''<div onclick="go()">Go</div>
+<!-- <img src="commented.png"> -->
+<img src="logo.png">
+'''
+
+
+def _write(root, path, text):
+    full = os.path.join(root, path)
+    os.makedirs(os.path.dirname(full), exist_ok=True)
+    with open(full, 'w') as f:
+        f.write(text)
+
+
+def test_tokenize():
+    """Strings, templates, regexes and comments are blanked in place"""
+    print("🧪 Testing tokenizer")
+    code, comments = tokenize(SAMPLE_JS)
+    assert len(code) == len(SAMPLE_JS), "Offsets must be preserved"
+    assert code.count('\n') == SAMPLE_JS.count('\n'), "Line breaks must be preserved"
+    assert 'TODO' not in code and comments[0][1].startswith('// TODO'), "Comment not separated"
+    assert "console.log('no')" not in code, "String body leaked into code"
+    assert 'console\\.log' not in code, "Regex body leaked into code"
+    assert 'console.warn' not in code, "Template text leaked into code"
+    assert '${name == 1' in code, "Template expressions must stay code"
+    print("   ✓ Only real code is left for the rules")
+
+
+def test_rules_and_cache():
+    """Rules fire on code only, and unchanged files come from the findings file"""
+    print("🧪 Testing rules and findings cache")
+    with tempfile.TemporaryDirectory() as root:
+        _write(root, 'js/widget.js', SAMPLE_JS)
+        _write(root, 'js/utils/helper.js', 'var legacy = 1;\n')
+        _write(root, 'index.html', SAMPLE_HTML)
+
+        report = analyze(root)
+        assert report['stats'] == {'scanned': 3, 'reused': 0}
+        found = {(f['file'], f['rule'], f['line']) for f in select(report)}
+        for expected in [('js/widget.js', 'loose-equality', 6), ('js/widget.js', 'console-log', 6),
+                         ('js/widget.js', 'empty-catch', 7), ('js/widget.js', 'eval', 8),
+                         ('js/widget.js', 'duplicate-exports', 10), ('js/widget.js', 'todo-comment', 2),
+                         ('js/utils/helper.js', 'var-declaration', 1), ('index.html', 'img-no-alt', 3),
+                         ('index.html', 'click-no-tabindex', 1)]:
+            assert expected in found, f"Missing finding {expected}"
+        lines = {f['line'] for f in select(report, ['eval', 'console-log', 'console-warn'], under=['js'])}
+        assert lines == {6, 8}, f"Findings reported inside strings, regexes or comments: {lines}"
+        assert ('index.html', 'img-no-alt', 2) not in found, "Commented-out HTML was analyzed"
+        print(f"   ✓ {len(found)} findings from {len(RULES) + len(BATCH_RULES)} rules")
+
+        _write(root, 'js/utils/helper.js', 'let legacy = 1;\n')
+        report = analyze(root)
+        assert report['stats'] == {'scanned': 1, 'reused': 2}, f"Unexpected rescans: {report['stats']}"
+        assert not select(report, ['var-declaration']), "Stale findings kept for a changed file"
+        print("   ✓ Only the changed file was analyzed again")
+
+        results = deep_analysis.collect_results(report)
+        assert [i['line'] for i in results['loose_equality_eq']] == [5, 6]
+        assert results['empty_catch'][0]['file'] == 'js/widget.js'
+        print("   ✓ deep_analysis view built from the findings")
+
+        cwd = os.getcwd()
+        _write(root, 'js/utils/helper.js', 'var legacy = 2;\n')
+        report = analyze(root, paths=['js/utils/helper.js'])
+        assert list(report['files']) == ['js/utils/helper.js'] and report['stats']['scanned'] == 1
+        assert os.getcwd() == cwd, "analyze() must not change the working directory"
+        with open(os.path.join(root, FINDINGS_PATH)) as f:
+            stored = json.load(f)['files']
+        assert sorted(stored) == ['index.html', 'js/utils/helper.js', 'js/widget.js'], sorted(stored)
+        assert analyze(root)['stats'] == {'scanned': 0, 'reused': 3}
+        print("   ✓ A run over some files merges into the findings file")
+
+
+if __name__ == '__main__':
+    test_tokenize()
+    test_rules_and_cache()
+    print("\n✓ All tests passed!")
@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+Test script for the embedded static server used by the HTTP test suites
+"""
+
+import gzip
+import http.client
+import os
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'python'))
+
+from static_server import StaticServer
+
+SCRIPT = 'const App = { start() { return "chapter"; } };\n' * 40
+
+
+def write_tree(root):
+    os.makedirs(os.path.join(root, 'js'))
+    with open(os.path.join(root, 'index.html'), 'w') as f:
+        f.write('<html><body><script src="js/app.js?v=3"></script></body></html>\n')
+    with open(os.path.join(root, 'js', 'app.js'), 'w') as f:
+        f.write(SCRIPT)
+
+
+def test_keep_alive_and_compression():
+    """Ephemeral port, ready event, one connection for many gzip/304 requests"""
+    print("🧪 Testing embedded static server")
+    with tempfile.TemporaryDirectory() as root:
+        write_tree(root)
+        with StaticServer(root) as server:
+            assert server.ready.is_set() and server.port != 0
+            conn = http.client.HTTPConnection('127.0.0.1', server.port, timeout=5)
+
+            conn.request('GET', '/js/app.js?v=3', headers={'Accept-Encoding': 'gzip, deflate'})
+            response = conn.getresponse()
+            body = response.read()
+            assert response.status == 200 and response.getheader('Content-Encoding') == 'gzip'
+            assert gzip.decompress(body).decode() == SCRIPT and len(body) < len(SCRIPT)
+            etag = response.getheader('ETag')
+
+            conn.request('GET', '/js/app.js', headers={'Accept-Encoding': 'gzip', 'If-None-Match': etag})
+            response = conn.getresponse()
+            response.read()
+            assert response.status == 304
+
+            conn.request('GET', '/')
+            response = conn.getresponse()
+            assert response.status == 200 and b'js/app.js' in response.read()
+            assert response.getheader('Content-Encoding') is None, "Small files are sent as-is"
+
+            timings = []
+            for _ in range(5):
+                start = time.perf_counter()
+                conn.request('GET', '/js/app.js', headers={'Accept-Encoding': 'gzip'})
+                response = conn.getresponse()
+                response.read()
+                timings.append(time.perf_counter() - start)
+            assert max(timings[1:]) < 0.02, f"keep-alive requests stalled: {timings}"
+
+            conn.request('GET', '/missing.js')
+            response = conn.getresponse()
+            response.read()
+            assert response.status == 404
+            conn.close()
+
+            assert server.stats['connections'] == 1, server.stats
+            assert server.stats['requests'] == 9 and server.stats['not_modified'] == 1
+            print(f"   ✓ 9 requests on one connection to {server.url}, no delayed-ACK stalls")
+
+            with open(os.path.join(root, 'js', 'app.js'), 'a') as f:
+                f.write('// changed\n')
+            conn = http.client.HTTPConnection('127.0.0.1', server.port, timeout=5)
+            conn.request('GET', '/js/app.js', headers={'Accept-Encoding': 'gzip', 'If-None-Match': etag})
+            response = conn.getresponse()
+            assert response.status == 200 and gzip.decompress(response.read()).decode().endswith('// changed\n')
+            conn.close()
+        assert not server.ready.is_set()
+    print("   ✓ Changed files are recompressed, stop() clears readiness")
+
+
+def test_parallel_servers():
+    """Independent servers and concurrent clients do not collide"""
+    print("🧪 Testing parallel servers")
+    with tempfile.TemporaryDirectory() as root:
+        write_tree(root)
+        with StaticServer(root) as first, StaticServer(root) as second:
+            assert first.port != second.port
+
+            def fetch(server):
+                conn = http.client.HTTPConnection('127.0.0.1', server.port, timeout=5)
+                conn.request('GET', '/js/app.js')
+                response = conn.getresponse()
+                status = response.status, len(response.read())
+                conn.close()
+                return status
+
+            with ThreadPoolExecutor(max_workers=8) as pool:
+                results = list(pool.map(fetch, [first, second] * 16))
+            assert results == [(200, len(SCRIPT))] * 32
+            assert first.stats['requests'] == second.stats['requests'] == 16
+    print("   ✓ 32 concurrent requests across two servers")
+
+
+if __name__ == '__main__':
+    test_keep_alive_and_compression()
+    test_parallel_servers()
+    print("\n✓ All tests passed!")
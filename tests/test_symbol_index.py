@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+Test script for the persistent global symbol index
+"""
+
+import os
+import sys
+import tempfile
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'python'))
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'scripts', 'dev'))
+
+from fixture_tree import write_tree
+from module_graph import HANDLERS
+from symbol_index import INDEX_PATH, build_index
+
+FIXTURE = {
+    'index.html': '''<html><body>
+<button onclick="App.start()">Start</button>
+<script src="js/core.js"></script>
+<script>
+  const banner = Core.version;
+</script>
+<script src="js/app.js"></script>
+<script src="js/late.js"></script>
+</body></html>
+''',
+    'js/core.js': 'const Core = { version: 1 };\nfunction format(n) { return n; }\n',
+    'js/app.js': '''const App = (function() {
+  const size = Late.size + Unloaded.size;
+  function start() { return Core.version + format(size); }
+  return { start };
+})();
+window.App = App;
+window.App = App;
+''',
+    'js/late.js': 'window.Late = { size: 2 };\nconst format = (n) => `${n}`;\n',
+    'js/unloaded.js': 'const Unloaded = { size: 3 };\n',
+}
+
+
+def test_sites_and_queries():
+    """Definition sites, load positions, conflicts and use-before-load"""
+    print("🧪 Testing symbol index queries on a fixture page")
+    with tempfile.TemporaryDirectory() as root:
+        write_tree(root, FIXTURE)
+        index = build_index(root)
+
+        assert index.position('js/core.js') == 0 and index.position('index.html#script-1') == 1
+        assert index.position('js/unloaded.js') is None
+        assert [(s['file'], s['line'], s['kind']) for s in index.definitions('App')] == \
+            [('js/app.js', 1, 'declaration'), ('js/app.js', 6, 'window'), ('js/app.js', 7, 'window')]
+        refs = {(s['module'], s['line'], s['kind']) for s in index.references('Core')}
+        assert refs == {('index.html#script-1', 5, 'load'), ('js/app.js', 3, 'runtime')}, refs
+        assert [(s['module'], s['line']) for s in index.references('App')] == [(HANDLERS, 2)]
+        assert index.references('size') == [], "Locals are not globals"
+        print("   ✓ Definition and reference sites with index.html lines")
+
+        assert index.conflicts() == {'format': ['js/core.js', 'js/late.js']}
+        problems = [(p['name'], p['module'], p['line'], p['reason']) for p in index.use_before_load()]
+        assert problems == [('Late', 'js/app.js', 2, 'loaded later'),
+                            ('Unloaded', 'js/app.js', 2, 'not loaded by index.html')], problems
+        assert index.duplicate_exports() == {'js/app.js': ['App']}
+        print("   ✓ Conflicts, use-before-load and duplicate exports")
+
+
+def test_incremental_rebuild():
+    """Only files whose hash changed are scanned again"""
+    print("🧪 Testing incremental rebuild")
+    with tempfile.TemporaryDirectory() as root:
+        write_tree(root, FIXTURE)
+        assert build_index(root).stats == {'scanned': 5, 'reused': 0}
+        assert os.path.exists(os.path.join(root, INDEX_PATH))
+        assert build_index(root).stats == {'scanned': 0, 'reused': 5}
+        print("   ✓ Unchanged tree is served from the index file")
+
+        with open(os.path.join(root, 'js', 'late.js'), 'w') as f:
+            f.write('window.Late = { size: 2 };\n')
+        index = build_index(root)
+        assert index.stats == {'scanned': 1, 'reused': 4}
+        assert index.conflicts() == {}, "Removed definition must leave the index"
+        assert index.providers('format') == ['js/core.js']
+    print("   ✓ Changed file rescanned, the rest reused")
+
+
+if __name__ == '__main__':
+    test_sites_and_queries()
+    test_incremental_rebuild()
+    print("\n✓ All tests passed!")
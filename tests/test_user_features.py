@@ -4,16 +4,18 @@ Test script for User Features Module
 Tests all user features including profiles, preferences, achievements, social features, and messaging
 """
 
-import json
 import os
 import sys
-import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'scripts', 'dev'))
+
+from module_manifest import load_manifest
 
 def test_user_profiles_module_exists():
     """Test that user profiles module file exists"""
     print("Testing user profiles module file existence...")
-    
-    if os.path.exists('js/modules/user-profiles.js'):
+
+    if load_manifest().exists('js/modules/user-profiles.js'):
         print("✅ User profiles module file exists")
         return True
     else:
@@ -23,8 +25,8 @@ def test_user_profiles_module_exists():
 def test_user_preferences_module_exists():
     """Test that user preferences module file exists"""
     print("\nTesting user preferences module file existence...")
-    
-    if os.path.exists('js/modules/user-preferences.js'):
+
+    if load_manifest().exists('js/modules/user-preferences.js'):
         print("✅ User preferences module file exists")
         return True
     else:
@@ -34,8 +36,8 @@ def test_user_preferences_module_exists():
 def test_achievements_module_exists():
     """Test that achievements module file exists"""
     print("\nTesting achievements module file existence...")
-    
-    if os.path.exists('js/modules/achievements.js'):
+
+    if load_manifest().exists('js/modules/achievements.js'):
         print("✅ Achievements module file exists")
         return True
     else:
@@ -45,8 +47,8 @@ def test_achievements_module_exists():
 def test_social_features_module_exists():
     """Test that social features module file exists"""
     print("\nTesting social features module file existence...")
-    
-    if os.path.exists('js/modules/social-features.js'):
+
+    if load_manifest().exists('js/modules/social-features.js'):
         print("✅ Social features module file exists")
         return True
     else:
@@ -56,8 +58,8 @@ def test_social_features_module_exists():
 def test_messaging_module_exists():
     """Test that messaging module file exists"""
     print("\nTesting messaging module file existence...")
-    
-    if os.path.exists('js/modules/messaging.js'):
+
+    if load_manifest().exists('js/modules/messaging.js'):
         print("✅ Messaging module file exists")
         return True
     else:
@@ -67,8 +69,8 @@ def test_messaging_module_exists():
 def test_user_features_ui_exists():
     """Test that user features UI module file exists"""
     print("\nTesting user features UI module file existence...")
-    
-    if os.path.exists('js/ui/user-features-ui.js'):
+
+    if load_manifest().exists('js/ui/user-features-ui.js'):
         print("✅ User features UI module file exists")
         return True
     else:
@@ -78,8 +80,8 @@ def test_user_features_ui_exists():
 def test_user_features_css_exists():
     """Test that user features CSS file exists"""
     print("\nTesting user features CSS file existence...")
-    
-    if os.path.exists('css/user-features.css'):
+
+    if load_manifest().exists('css/user-features.css'):
         print("✅ User features CSS file exists")
         return True
     else:
@@ -89,7 +91,7 @@ def test_user_features_css_exists():
 def test_module_structure():
     """Test module structure and functions"""
     print("\nTesting module structure...")
-    
+
     modules = {
         'user-profiles.js': ['createProfile', 'getProfile', 'updateProfile', 'setAvatar', 'searchProfiles'],
         'user-preferences.js': ['getPreferences', 'setPreference', 'setPreferences', 'resetPreferences'],
@@ -97,65 +99,56 @@ def test_module_structure():
         'social-features.js': ['addComment', 'shareChapter', 'followUser', 'getFollowers', 'getFollowing'],
         'messaging.js': ['sendMessage', 'getMessages', 'getUserConversations', 'getUnreadCount']
     }
-    
+
+    manifest = load_manifest()
     all_passed = True
     for module_file, required_functions in modules.items():
-        try:
-            with open(f'js/modules/{module_file}', 'r') as f:
-                content = f.read()
-            
-            missing_functions = []
-            for func in required_functions:
-                if f'function {func}(' not in content and f'{func}:' not in content:
-                    missing_functions.append(func)
-            
-            if missing_functions:
-                print(f"❌ {module_file}: Missing functions: {', '.join(missing_functions)}")
-                all_passed = False
-            else:
-                print(f"✅ {module_file}: All {len(required_functions)} required functions present")
-        except Exception as e:
-            print(f"❌ {module_file}: Error reading module: {e}")
+        module = manifest.get(f'js/modules/{module_file}')
+        if module is None:
+            print(f"❌ {module_file}: Error reading module: not found")
             all_passed = False
-    
+            continue
+
+        missing_functions = [func for func in required_functions if not module.defines(func)]
+
+        if missing_functions:
+            print(f"❌ {module_file}: Missing functions: {', '.join(missing_functions)}")
+            all_passed = False
+        else:
+            print(f"✅ {module_file}: All {len(required_functions)} required functions present")
+
     return all_passed
 
 def test_ui_structure():
     """Test UI module structure and functions"""
     print("\nTesting UI module structure...")
-    
-    try:
-        with open('js/ui/user-features-ui.js', 'r') as f:
-            content = f.read()
-        
-        required_functions = [
-            'init', 'openModal', 'closeModal', 'switchTab',
-            'loadUserProfile', 'saveProfile', 'uploadAvatar',
-            'loadPreferences', 'updatePreference',
-            'loadAchievements', 'searchUsers', 'followUser',
-            'loadMessages', 'sendMessage'
-        ]
-        
-        missing_functions = []
-        for func in required_functions:
-            if f'function {func}(' not in content and f'{func}:' not in content:
-                missing_functions.append(func)
-        
-        if missing_functions:
-            print(f"❌ Missing functions: {', '.join(missing_functions)}")
-            return False
-        else:
-            print(f"✅ All {len(required_functions)} required functions present")
-            return True
-            
-    except Exception as e:
-        print(f"❌ Error reading UI module: {e}")
+
+    ui = load_manifest().get('js/ui/user-features-ui.js')
+    if ui is None:
+        print("❌ Error reading UI module: js/ui/user-features-ui.js not found")
+        return False
+
+    required_functions = [
+        'init', 'openModal', 'closeModal', 'switchTab',
+        'loadUserProfile', 'saveProfile', 'uploadAvatar',
+        'loadPreferences', 'updatePreference',
+        'loadAchievements', 'searchUsers', 'followUser',
+        'loadMessages', 'sendMessage'
+    ]
+
+    missing_functions = [func for func in required_functions if not ui.defines(func)]
+
+    if missing_functions:
+        print(f"❌ Missing functions: {', '.join(missing_functions)}")
         return False
+    else:
+        print(f"✅ All {len(required_functions)} required functions present")
+        return True
 
 def test_namespace_exports():
     """Test that namespaces are exported"""
     print("\nTesting namespace exports...")
-    
+
     namespaces = {
         'UserProfiles': 'js/modules/user-profiles.js',
         'UserPreferences': 'js/modules/user-preferences.js',
@@ -164,166 +157,143 @@ def test_namespace_exports():
         'Messaging': 'js/modules/messaging.js',
         'UserFeaturesUI': 'js/ui/user-features-ui.js'
     }
-    
+
+    manifest = load_manifest()
     all_passed = True
     for namespace, file_path in namespaces.items():
-        try:
-            with open(file_path, 'r') as f:
-                content = f.read()
-            
-            if f'window.{namespace}' in content:
-                print(f"✅ {namespace} namespace exported")
-            else:
-                print(f"❌ {namespace} namespace not exported")
-                all_passed = False
-        except Exception as e:
-            print(f"❌ {namespace}: Error checking namespace: {e}")
+        module = manifest.get(file_path)
+        if module is None:
+            print(f"❌ {namespace}: Error checking namespace: {file_path} not found")
             all_passed = False
-    
+        elif module.exports(namespace):
+            print(f"✅ {namespace} namespace exported")
+        else:
+            print(f"❌ {namespace} namespace not exported")
+            all_passed = False
+
     return all_passed
 
 def test_html_integration():
     """Test that user features are integrated into HTML"""
     print("\nTesting HTML integration...")
-    
-    try:
-        with open('index.html', 'r') as f:
-            content = f.read()
-        
-        checks = {
-            'CSS link': '<link rel="stylesheet" href="css/user-features.css">' in content,
-            'User profiles module': '<script src="js/modules/user-profiles.js"></script>' in content,
-            'User preferences module': '<script src="js/modules/user-preferences.js"></script>' in content,
-            'Achievements module': '<script src="js/modules/achievements.js"></script>' in content,
-            'Social features module': '<script src="js/modules/social-features.js"></script>' in content,
-            'Messaging module': '<script src="js/modules/messaging.js"></script>' in content,
-            'User features UI': '<script src="js/ui/user-features-ui.js"></script>' in content,
-            'User features button': 'UserFeatures' in content or 'user-features' in content.lower()
-        }
-        
-        all_passed = True
-        for check_name, passed in checks.items():
-            if passed:
-                print(f"✅ {check_name} found")
-            else:
-                print(f"❌ {check_name} not found")
-                all_passed = False
-        
-        return all_passed
-            
-    except Exception as e:
-        print(f"❌ Error reading HTML file: {e}")
+
+    page = load_manifest().get('index.html')
+    if page is None:
+        print("❌ Error reading HTML file: index.html not found")
         return False
 
+    checks = {
+        'CSS link': page.loads_stylesheet('css/user-features.css'),
+        'User profiles module': page.loads_script('js/modules/user-profiles.js'),
+        'User preferences module': page.loads_script('js/modules/user-preferences.js'),
+        'Achievements module': page.loads_script('js/modules/achievements.js'),
+        'Social features module': page.loads_script('js/modules/social-features.js'),
+        'Messaging module': page.loads_script('js/modules/messaging.js'),
+        'User features UI': page.loads_script('js/ui/user-features-ui.js'),
+        'User features button': page.mentions('UserFeatures') or page.mentions('user-features')
+    }
+
+    all_passed = True
+    for check_name, passed in checks.items():
+        if passed:
+            print(f"✅ {check_name} found")
+        else:
+            print(f"❌ {check_name} not found")
+            all_passed = False
+
+    return all_passed
+
 def test_css_content():
     """Test user features CSS content"""
     print("\nTesting user features CSS content...")
-    
-    try:
-        with open('css/user-features.css', 'r') as f:
-            content = f.read()
-        
-        required_classes = [
-            '.user-features-modal',
-            '.user-profile',
-            '.user-preferences',
-            '.user-achievements',
-            '.user-social',
-            '.user-messages',
-            '.achievement-card',
-            '.user-card',
-            '.conversation-item'
-        ]
-        
-        missing_classes = []
-        for css_class in required_classes:
-            if css_class not in content:
-                missing_classes.append(css_class)
-        
-        if missing_classes:
-            print(f"❌ Missing CSS classes: {', '.join(missing_classes)}")
-            return False
-        else:
-            print(f"✅ All {len(required_classes)} required CSS classes present")
-            return True
-            
-    except Exception as e:
-        print(f"❌ Error reading CSS file: {e}")
+
+    css = load_manifest().get('css/user-features.css')
+    if css is None:
+        print("❌ Error reading CSS file: css/user-features.css not found")
         return False
 
+    required_classes = [
+        '.user-features-modal',
+        '.user-profile',
+        '.user-preferences',
+        '.user-achievements',
+        '.user-social',
+        '.user-messages',
+        '.achievement-card',
+        '.user-card',
+        '.conversation-item'
+    ]
+
+    missing_classes = [css_class for css_class in required_classes if not css.has_class(css_class)]
+
+    if missing_classes:
+        print(f"❌ Missing CSS classes: {', '.join(missing_classes)}")
+        return False
+    else:
+        print(f"✅ All {len(required_classes)} required CSS classes present")
+        return True
+
 def test_code_quality():
     """Test code quality metrics"""
     print("\nTesting code quality...")
-    
-    try:
-        modules = [
-            'js/modules/user-profiles.js',
-            'js/modules/user-preferences.js',
-            'js/modules/achievements.js',
-            'js/modules/social-features.js',
-            'js/modules/messaging.js',
-            'js/ui/user-features-ui.js'
-        ]
-        
-        total_jsdoc = 0
-        total_try_catch = 0
-        total_sanitization = 0
-        
-        for module in modules:
-            with open(module, 'r') as f:
-                content = f.read()
-            
-            total_jsdoc += content.count('/**')
-            total_try_catch += content.count('try {')
-            total_sanitization += content.count('sanitizeHTML')
-        
-        print(f"✅ Total JSDoc comments: {total_jsdoc}")
-        print(f"✅ Total try-catch blocks: {total_try_catch}")
-        print(f"✅ Total sanitization instances: {total_sanitization}")
-        
-        return True
-            
-    except Exception as e:
-        print(f"❌ Error checking code quality: {e}")
+
+    modules = [
+        'js/modules/user-profiles.js',
+        'js/modules/user-preferences.js',
+        'js/modules/achievements.js',
+        'js/modules/social-features.js',
+        'js/modules/messaging.js',
+        'js/ui/user-features-ui.js'
+    ]
+
+    manifest = load_manifest()
+    entries = [manifest.get(module) for module in modules]
+    missing = [module for module, entry in zip(modules, entries) if entry is None]
+    if missing:
+        print(f"❌ Error checking code quality: {', '.join(missing)} not found")
         return False
 
+    total_jsdoc = sum(entry['jsdoc'] for entry in entries)
+    total_try_catch = sum(entry['try_blocks'] for entry in entries)
+    total_sanitization = sum(entry.count('sanitizeHTML') for entry in entries)
+
+    print(f"✅ Total JSDoc comments: {total_jsdoc}")
+    print(f"✅ Total try-catch blocks: {total_try_catch}")
+    print(f"✅ Total sanitization instances: {total_sanitization}")
+
+    return True
+
 def test_achievement_definitions():
     """Test achievement definitions"""
     print("\nTesting achievement definitions...")
-    
-    try:
-        with open('js/modules/achievements.js', 'r') as f:
-            content = f.read()
-        
-        required_achievements = [
-            'first_chapter', 'chapter_10', 'chapter_50', 'chapter_100',
-            'hour_1', 'hour_10', 'hour_50',
-            'first_bookmark', 'bookmark_10',
-            'streak_3', 'streak_7', 'streak_30'
-        ]
-        
-        missing_achievements = []
-        for achievement in required_achievements:
-            if achievement not in content:
-                missing_achievements.append(achievement)
-        
-        if missing_achievements:
-            print(f"❌ Missing achievements: {', '.join(missing_achievements)}")
-            return False
-        else:
-            print(f"✅ All {len(required_achievements)} required achievements defined")
-            return True
-            
-    except Exception as e:
-        print(f"❌ Error checking achievements: {e}")
+
+    achievements = load_manifest().get('js/modules/achievements.js')
+    if achievements is None:
+        print("❌ Error checking achievements: js/modules/achievements.js not found")
         return False
 
+    required_achievements = [
+        'first_chapter', 'chapter_10', 'chapter_50', 'chapter_100',
+        'hour_1', 'hour_10', 'hour_50',
+        'first_bookmark', 'bookmark_10',
+        'streak_3', 'streak_7', 'streak_30'
+    ]
+
+    missing_achievements = [name for name in required_achievements if not achievements.mentions(name)]
+
+    if missing_achievements:
+        print(f"❌ Missing achievements: {', '.join(missing_achievements)}")
+        return False
+    else:
+        print(f"✅ All {len(required_achievements)} required achievements defined")
+        return True
+
 def run_all_tests():
     """Run all tests and return results"""
     print("=" * 60)
     print("USER FEATURES MODULE TEST SUITE")
     print("=" * 60)
-    
+
     tests = [
         test_user_profiles_module_exists,
         test_user_preferences_module_exists,
@@ -340,7 +310,7 @@ def run_all_tests():
         test_code_quality,
         test_achievement_definitions
     ]
-    
+
     results = []
     for test in tests:
         try:
@@ -349,18 +319,17 @@ def run_all_tests():
         except Exception as e:
             print(f"❌ Test failed with exception: {e}")
             results.append(False)
-        time.sleep(0.1)
-    
+
     print("\n" + "=" * 60)
     print("TEST RESULTS SUMMARY")
     print("=" * 60)
-    
+
     passed = sum(results)
     total = len(results)
     percentage = (passed / total) * 100 if total > 0 else 0
-    
+
     print(f"Tests Passed: {passed}/{total} ({percentage:.1f}%)")
-    
+
     if passed == total:
         print("\n🎉 All tests passed!")
         return 0
@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+Test script for the DOM-stub user-flow latency harness
+"""
+
+import os
+import shutil
+import sys
+import tempfile
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'scripts', 'dev'))
+
+from user_flow import measure, percentiles
+
+FIXTURE = {
+    'index.html': '''<html><body>
+<div id="storyContainer"></div>
+<button id="nextBtn" onclick="Navigation.nextChapter()">Next</button>
+<script src="js/app.js"></script>
+</body></html>
+''',
+    'js/app.js': '''window.CHAPTER_INTERVAL_MS = 5000;
+window.AppState = { currentChapter: 0, totalGenerated: 0, chapters: [] };
+window.AdminReadingTracker = {
+  config: { bufferChapters: 2 },
+  getConfig() { return Object.assign({}, this.config); },
+  setConfig(config) { Object.assign(this.config, config); },
+  canGenerateChapter(n) { return n <= this.config.bufferChapters; }
+};
+window.StoryEngine = {
+  count: 0,
+  generateChapter() {
+    if (!AdminReadingTracker.canGenerateChapter(this.count + 1)) throw new Error('buffer full');
+    this.count += 1;
+    return { number: this.count, title: 'Chapter ' + this.count };
+  }
+};
+function generateNewChapter() {
+  AppState.chapters.push(StoryEngine.generateChapter());
+  AppState.totalGenerated = AppState.chapters.length;
+}
+function showChapter(n) {
+  AppState.currentChapter = n;
+  document.getElementById('storyContainer').innerHTML = '<h2>' + AppState.chapters[n - 1].title + '</h2>';
+}
+window.Navigation = {
+  nextChapter() {
+    if (AppState.currentChapter < AppState.totalGenerated) showChapter(AppState.currentChapter + 1);
+  }
+};
+document.addEventListener('DOMContentLoaded', () => {
+  generateNewChapter();
+  showChapter(1);
+  setInterval(generateNewChapter, CHAPTER_INTERVAL_MS);
+});
+''',
+}
+
+
+def test_percentiles():
+    """Nearest-rank percentiles"""
+    print("🧪 Testing latency percentiles")
+    stats = percentiles([float(n) for n in range(1, 101)])
+    assert (stats['p50'], stats['p90'], stats['p95'], stats['p99'], stats['max']) == (50, 90, 95, 99, 100)
+    assert stats['mean'] == 50.5 and stats['n'] == 100
+    assert percentiles([3.0])['p99'] == 3.0 and percentiles([]) == {}
+    print("   ✓ p50/p90/p95/p99 on 1..100")
+
+
+def test_next_button_flow():
+    """Every click waits for the story timer, then renders the next chapter"""
+    print("🧪 Testing #nextBtn flow on a fixture page")
+    if shutil.which('node') is None:
+        print("   ⚠️  node not available, skipped")
+        return
+    with tempfile.TemporaryDirectory() as root:
+        for path, content in FIXTURE.items():
+            os.makedirs(os.path.dirname(os.path.join(root, path)), exist_ok=True)
+            with open(os.path.join(root, path), 'w') as f:
+                f.write(content)
+
+        report = measure(root, clicks=5)
+        assert report['failedScripts'] == [] and report['errors'] == [], report['errors']
+        assert report['startupChapters'] == 1 and report['chapterIntervalMs'] == 5000
+        assert [(s['from'], s['to']) for s in report['steps']] == [(1, 2), (2, 3), (3, 4), (4, 5), (5, 6)]
+        assert all(s['virtualWaitMs'] == 5000 and len(s['engineMs']) == 1 for s in report['steps'])
+        assert report['advanced'] == 5 and report['chapters'] == {'current': 6, 'total': 6}
+        assert report['latency']['engine']['n'] == 5 and report['latency']['click']['n'] == 5
+        assert report['renderedBytes'] == len('<h2>Chapter 6</h2>')
+        print("   ✓ 5 clicks, 5 generated and rendered chapters, percentiles per phase")
+
+        stalled = measure(root, clicks=3, keep_buffer=True)
+        assert stalled['advanced'] == 1 and stalled['chapters'] == {'current': 2, 'total': 2}
+        assert stalled['errors'] and 'buffer full' in stalled['errors'][0]
+    print("   ✓ --keep-buffer reports the stall instead of hiding it")
+
+
+if __name__ == '__main__':
+    test_percentiles()
+    test_next_button_flow()
+    print("\n✓ All tests passed!")